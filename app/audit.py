@@ -1,20 +1,107 @@
 """Audit trail logger for LLM API calls."""
 
-import hashlib
+import atexit
+import gzip
+import io
 import json
+import os
+import queue
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from .payloads import PayloadStore, messages_digest, sha256
 from .provider.base import LLMResponse, Message
 
+try:
+    import zstandard
+except ImportError:  # Optional: pip install zstandard
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows: rotation is then only safe within one process
+    fcntl = None
+
+FSYNC_POLICIES = ("never", "batch", "close")
+COMPRESSION = ("auto", "zstd", "gzip", "none")
+
+_CLOSE = object()
+_WRITER_CHECK_S = 0.5  # How often blocked callers check that the writer thread is alive
+
 
 class AuditLogger:
-    """Log every LLM API call with usage and cost."""
+    """Log every LLM API call with usage and cost.
+
+    Records are serialized on the calling thread and handed to a single writer
+    thread through a bounded queue (callers block when it is full). The writer
+    appends whole batches with one ``write`` on an ``O_APPEND`` descriptor, so
+    each record is exactly one line even with several loggers on the same file.
+    Batches are written when ``batch_size`` records are pending, every
+    ``flush_interval`` seconds, on ``flush()`` and on ``close()`` (also run at
+    interpreter exit). ``fsync`` is ``"never"`` (leave it to the OS), ``"batch"``
+    (after every write) or ``"close"``.
+
+    With a ``payloads`` store, full messages and responses are also kept there,
+    keyed by the digests in the record.
 
-    def __init__(self, run_dir: Path):
+    With ``max_bytes`` and/or ``max_age_s`` the live ``calls.jsonl`` is rotated to
+    ``calls.NNNNNN.jsonl`` once it is that large or old; a background thread then
+    compresses the segment (zstd if installed, else gzip) and records its
+    aggregates in ``calls.index.json``. Read with ``iter_calls`` / ``call_totals``.
+    While rotating, every write, rotation and index update holds an exclusive
+    ``flock`` on ``calls.lock``, so loggers in several processes (sharded workers)
+    can share one live file; the size checked is the file's, not this logger's.
+    """
+
+    def __init__(
+        self,
+        run_dir: Path,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        queue_size: int = 10_000,
+        fsync: str = "close",
+        payloads: PayloadStore | None = None,
+        max_bytes: int | None = None,
+        max_age_s: float | None = None,
+        compression: str = "auto",
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync} (expected one of {', '.join(FSYNC_POLICIES)})")
+        if compression not in COMPRESSION:
+            raise ValueError(f"Unknown compression: {compression} (expected one of {', '.join(COMPRESSION)})")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("compression='zstd' needs the zstandard package")
         self.run_dir = run_dir
         self.calls_file = run_dir / "calls.jsonl"
         self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.payloads = payloads
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "gzip"
+        self.compression = compression
+
+        self.records_written = 0
+        self.batches_written = 0
+        self.segments_rotated = 0
+        self._sealers: list[threading.Thread] = []
+        self._error: Exception | None = None
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock_fd = _open_lock(self.calls_file) if max_bytes or max_age_s else None
+        self._open_live()
+        self._writer = threading.Thread(target=self._run, name=f"audit-writer-{run_dir.name}", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
 
     def log_call(
         self,
@@ -29,10 +116,13 @@ class AuditLogger:
         status: str = "ok",
         error: str | None = None,
     ):
-        """Append a call record to calls.jsonl."""
-        messages_str = json.dumps([{"role": m.role, "content": m.content} for m in messages])
-        messages_digest = hashlib.sha256(messages_str.encode()).hexdigest()
-        response_digest = hashlib.sha256(response.text.encode()).hexdigest() if response else None
+        """Queue a call record for calls.jsonl."""
+        messages_digest_in = messages_digest(messages)
+        response_digest = sha256(response.text.encode()) if response else None
+        if self.payloads is not None:
+            self.payloads.put_messages(messages, messages_digest_in)
+            if response:
+                self.payloads.put_response(response.text)
 
         record = {
             "ts": datetime.utcnow().isoformat(),
@@ -44,7 +134,7 @@ class AuditLogger:
             "seed": seed,
             "request_id": response.request_id if response else None,
             "latency_ms": response.latency_ms if response else 0,
-            "messages_digest_in": messages_digest,
+            "messages_digest_in": messages_digest_in,
             "response_digest_out": response_digest,
             "usage": (
                 {
@@ -61,6 +151,518 @@ class AuditLogger:
             "status": status,
             "error": error,
         }
+        self.write(record)
+
+    def write(self, record: dict):
+        """Queue one record (json.dumps escapes newlines, so it stays on one line)."""
+        if self._closed:
+            raise RuntimeError(f"AuditLogger for {self.calls_file} is closed")
+        self._put(json.dumps(record) + "\n")
+
+    def flush(self, timeout: float | None = None):
+        """Block until everything queued so far is written (or ``timeout`` seconds pass)."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._put(done)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done.wait(_WRITER_CHECK_S):
+            self._check_writer()
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+        self._raise_pending()
+
+    def close(self):
+        """Write what is pending, fsync per policy, stop the writer. Safe to call twice."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        while self._writer.is_alive():  # A stopped writer can't take _CLOSE; its error is raised below
+            try:
+                self._queue.put(_CLOSE, timeout=_WRITER_CHECK_S)
+                break
+            except queue.Full:
+                continue
+        self._writer.join()
+        os.close(self._fd)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+        for sealer in self._sealers:
+            sealer.join()
+        atexit.unregister(self.close)
+        self._raise_pending()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _raise_pending(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _check_writer(self):
+        """Raise the writer's error (or that it stopped) instead of waiting on it forever."""
+        if not self._writer.is_alive():
+            self._raise_pending()
+            raise RuntimeError(f"Audit writer for {self.calls_file} has stopped")
+
+    def _put(self, item):
+        """Queue an item, blocking while the queue is full but only as long as the writer runs."""
+        while True:
+            self._check_writer()
+            try:
+                self._queue.put(item, timeout=_WRITER_CHECK_S)
+                return
+            except queue.Full:
+                continue
+
+    def _run(self):
+        """Writer thread: run the loop, keeping any error for the next flush/close to raise."""
+        try:
+            self._loop()
+        except Exception as e:
+            self._error = e
+
+    def _loop(self):
+        """Writer loop: batch lines until size, interval or an explicit flush/close."""
+        pending: list[str] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None  # Interval elapsed
+
+            if isinstance(item, str):
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(pending) < self.batch_size:
+                    continue
+
+            if pending:
+                try:
+                    self._write_batch(pending)
+                except Exception as e:  # Not only OSError: keep writing, report on flush/close
+                    self._error = e
+                pending = []
+            deadline = None
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _CLOSE:
+                if self.fsync != "never":
+                    self._fsync()
+                return
+
+    def _open_live(self):
+        self._fd = os.open(self.calls_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        stat = os.fstat(self._fd)
+        self._inode = stat.st_ino
+        self._size = stat.st_size
+        self._opened_at = time.monotonic()
+
+    def _write_batch(self, lines: list[str]):
+        data = "".join(lines).encode()
+        try:
+            if self._lock_fd is None:
+                self._write(data)  # One O_APPEND write per batch: lines stay whole without a lock
+            else:
+                with _exclusive(self._lock_fd):
+                    # Another logger (maybe in another process) may have rotated the file under us
+                    try:
+                        live_inode = os.stat(self.calls_file).st_ino
+                    except FileNotFoundError:
+                        live_inode = None
+                    if live_inode != self._inode:
+                        os.close(self._fd)
+                        self._open_live()
+                    self._write(data)
+                    self._size = os.fstat(self._fd).st_size  # Every process's bytes, not just ours
+                    if self._due_for_rotation():
+                        self._rotate()
+        except OSError as e:
+            self._error = e
+            return
+        self.records_written += len(lines)
+        self.batches_written += 1
+
+    def _write(self, data: bytes):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view) :]
+        if self.fsync == "batch":
+            os.fsync(self._fd)
+
+    def _due_for_rotation(self) -> bool:
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        return bool(self.max_age_s) and time.monotonic() - self._opened_at >= self.max_age_s
+
+    def _rotate(self):
+        """Rename the live file to the next segment and hand it to a sealer thread.
+
+        Runs under the ``calls.lock`` flock, so the next sequence number from the
+        directory listing and the rename are atomic across processes.
+        """
+        try:
+            if self.fsync != "never":
+                os.fsync(self._fd)
+            os.close(self._fd)
+            seq = max((n for n, _ in _segment_files(self.calls_file)), default=0) + 1
+            raw = self.calls_file.with_name(f"{self.calls_file.stem}.{seq:06d}.jsonl")
+            os.replace(self.calls_file, raw)
+            inode = self._inode
+            self._open_live()
+        except OSError as e:
+            self._error = e
+            return
+        self.segments_rotated += 1
+        sealer = threading.Thread(target=self._seal, args=(raw, seq, inode), name=f"audit-seal-{seq}")
+        sealer.start()
+        self._sealers = [t for t in self._sealers if t.is_alive()] + [sealer]
+
+    def _seal(self, raw: Path, seq: int, inode: int):
+        """Compress a rotated segment and record its aggregates in the index."""
+        try:
+            totals = seal_segment(raw, self.compression)
+            totals.update({"seq": seq, "inode": inode})
+            _update_index(self.calls_file, totals)
+        except Exception as e:
+            self._error = e
+
+    def _fsync(self):
+        try:
+            os.fsync(self._fd)
+        except OSError as e:
+            self._error = e
+
+
+# Segment readers ----------------------------------------------------------
+
+
+_SEGMENT_LOCK = threading.Lock()
+_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _segment_files(calls_file: Path) -> list[tuple[int, Path]]:
+    """Rotated segments of a live JSONL file, oldest first (compressed copy preferred)."""
+    pattern = re.compile(rf"^{re.escape(calls_file.stem)}\.(\d{{6}})\.jsonl(\.gz|\.zst)?$")
+    found: dict[int, Path] = {}
+    if not calls_file.parent.exists():
+        return []
+    for path in calls_file.parent.iterdir():
+        m = pattern.match(path.name)
+        if m:
+            seq = int(m.group(1))
+            # The compressed file only appears once complete; the raw one is removed after
+            if seq not in found or m.group(2):
+                found[seq] = path
+    return sorted(found.items())
+
+
+def _index_path(calls_file: Path) -> Path:
+    return calls_file.with_name(f"{calls_file.stem}.index.json")
+
+
+def load_index(calls_file: Path) -> dict:
+    """The sidecar index of sealed segments ({"segments": [...]})."""
+    try:
+        with open(_index_path(calls_file)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"segments": []}
+
+
+def _open_lock(calls_file: Path) -> int:
+    return os.open(calls_file.with_name(f"{calls_file.stem}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+
+
+@contextmanager
+def _exclusive(lock_fd: int):
+    """Hold an exclusive flock on ``lock_fd`` (this process's lock where fcntl is missing).
+
+    flock locks belong to the open file, so two descriptors in one process exclude
+    each other just as two processes do.
+    """
+    if fcntl is None:
+        with _SEGMENT_LOCK:
+            yield
+        return
+    fcntl.flock(lock_fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+
+def _update_index(calls_file: Path, segment: dict):
+    lock_fd = _open_lock(calls_file)
+    try:
+        with _exclusive(lock_fd):
+            index = load_index(calls_file)
+            index["segments"] = [s for s in index["segments"] if s["seq"] != segment["seq"]] + [segment]
+            index["segments"].sort(key=lambda s: s["seq"])
+            tmp = _index_path(calls_file).with_suffix(".json.tmp")
+            with open(tmp, "w") as f:
+                json.dump(index, f, indent=2)
+            os.replace(tmp, _index_path(calls_file))
+    finally:
+        os.close(lock_fd)
+
+
+def _open_segment(path: Path):
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"Reading {path.name} needs the zstandard package")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True))
+    return open(path)
+
+
+def seal_segment(raw: Path, compression: str = "gzip") -> dict:
+    """Compress a rotated segment in place (raw file removed) and return its aggregates."""
+    totals = _empty_totals()
+    suffix = _SUFFIXES[compression]
+    target = raw.with_name(raw.name + suffix)
+    if not suffix:
+        with open(raw) as f:
+            for line in f:
+                _add_line(totals, line)
+    else:
+        tmp = raw.with_name(raw.name + suffix + ".tmp")
+        with open(raw, "rb") as src, open(tmp, "wb") as dst:
+            if compression == "gzip":
+                out = gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6)
+            else:
+                out = zstandard.ZstdCompressor(level=3).stream_writer(dst, closefd=False)
+            for line in src:
+                _add_line(totals, line)
+                out.write(line)
+            out.close()
+        os.replace(tmp, target)
+        raw.unlink()
+    totals["file"] = target.name
+    totals["bytes"] = target.stat().st_size
+    return totals
+
+
+def _open_listed_segment(calls_file: Path, seq: int, path: Path):
+    """Open segment ``seq`` as listed; if a writer sealed it since (raw file removed), open the sealed copy."""
+    try:
+        return _open_segment(path)
+    except FileNotFoundError:
+        sealed = dict(_segment_files(calls_file)).get(seq)
+        if sealed is None or sealed == path:
+            raise
+        return _open_segment(sealed)
+
+
+def _open_live_file(calls_file: Path):
+    """The live file, or None if there is none (or it is mid-rotation)."""
+    try:
+        return open(calls_file)
+    except FileNotFoundError:
+        return None
+
+
+def iter_calls(calls_file: Path) -> Iterator[dict]:
+    """Every record from the rotated segments (oldest first), then the live file."""
+    for seq, segment in _segment_files(calls_file):
+        with _open_listed_segment(calls_file, seq, segment) as f:
+            yield from (json.loads(line) for line in f if line.strip())
+    live = _open_live_file(calls_file)
+    if live is not None:
+        with live as f:
+            yield from (json.loads(line) for line in f if line.strip())
+
+
+def call_totals(calls_file: Path) -> dict:
+    """Records, tokens, cost and time range across all segments.
+
+    Sealed segments contribute their indexed aggregates; only the live file and
+    segments not yet indexed (still being compressed) are scanned.
+    """
+    totals = _empty_totals()
+    indexed = {s["seq"]: s for s in load_index(calls_file)["segments"]}
+    for seq, segment in _segment_files(calls_file):
+        if seq in indexed:
+            _merge(totals, indexed[seq])
+        else:
+            with _open_listed_segment(calls_file, seq, segment) as f:
+                for line in f:
+                    _add_line(totals, line)
+    live = _open_live_file(calls_file)
+    if live is not None:
+        with live as f:
+            for line in f:
+                _add_line(totals, line)
+    return totals
+
+
+class CallsTailer:
+    """Running ``call_totals`` for a calls.jsonl that is still being written.
+
+    Each ``poll`` reads only the bytes appended to the live file since the last
+    one; a partial last line is left for the next poll. The live file's inode is
+    remembered, so after a rotation (or truncation) the new file is read from the
+    start. Rotated segments are re-totalled, from the index where sealed, only
+    when the set of segments changes.
+    """
+
+    def __init__(self, calls_file: Path, chunk_size: int = 1 << 20):
+        self.calls_file = Path(calls_file)
+        self._follower = LineFollower(self.calls_file, chunk_size)
+        self._live = _empty_totals()
+        self._segments_key: tuple | None = None
+        self._segments = _empty_totals()
+
+    @property
+    def offset(self) -> int:
+        return self._follower.offset
+
+    def poll(self) -> dict:
+        """Totals across the segments and the live file, including any records appended since the last poll."""
+        # Segments first: a rotation between the two steps then undercounts until the
+        # next poll instead of counting the rotated file both as a segment and live
+        self._poll_segments()
+        self._poll_live()
+        totals = _empty_totals()
+        _merge(totals, self._segments)
+        _merge(totals, self._live)
+        return totals
+
+    def _poll_segments(self):
+        indexed = {s["seq"]: s for s in load_index(self.calls_file)["segments"]}
+        files = _segment_files(self.calls_file)
+        key = tuple((seq, path.name, seq in indexed) for seq, path in files)
+        if key == self._segments_key:
+            return
+        totals = _empty_totals()
+        try:
+            for seq, segment in files:
+                if seq in indexed:
+                    _merge(totals, indexed[seq])
+                else:
+                    with _open_segment(segment) as f:
+                        for line in f:
+                            _add_line(totals, line)
+        except FileNotFoundError:
+            return  # Sealed meanwhile; picked up by the next poll
+        self._segments, self._segments_key = totals, key
+
+    def _poll_live(self):
+        lines = self._follower.lines()
+        if self._follower.restarted:
+            self._live = _empty_totals()
+        for line in lines:
+            _add_line(self._live, line)
+
+
+class LineFollower:
+    """Complete lines appended to a file since the last read.
+
+    The file's inode is remembered, so after a rotation (or truncation) the new
+    file is read from the start; ``restarted`` tells the caller the lines no longer
+    continue the old file, and ``truncated`` that the same file was cut short (its
+    old content is gone, not moved to a rotated segment). A partial last line is
+    left for the next read. ``tail_bytes`` skips to the last that many bytes of
+    the file the first time it is opened, for readers that only need recent lines.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = 1 << 20, tail_bytes: int | None = None):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.tail_bytes = tail_bytes
+        self.inode: int | None = None
+        self.offset = 0
+        self.restarted = False
+        self.truncated = False
+        self._opened = False
+
+    def lines(self) -> Iterator[bytes]:
+        """Lines appended since the last call; sets ``restarted``/``truncated`` before returning."""
+        self.restarted = self.truncated = False
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            self.restarted = self.inode is not None
+            self.inode, self.offset = None, 0
+            return iter(())
+        stat = os.fstat(f.fileno())
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            self.truncated = stat.st_ino == self.inode and stat.st_size < self.offset
+            self.restarted = self.inode is not None or self.truncated
+            self.inode, self.offset = stat.st_ino, 0
+            first, self._opened = not self._opened, True
+            if first and self.tail_bytes is not None and stat.st_size > self.tail_bytes:
+                # Start at the first whole line within the tail
+                f.seek(stat.st_size - self.tail_bytes)
+                f.readline()
+                self.offset = f.tell()
+        return self._read(f)
+
+    def _read(self, f) -> Iterator[bytes]:
+        with f:
+            f.seek(self.offset)
+            pending = b""
+            while chunk := f.read(self.chunk_size):
+                pending += chunk
+                end = pending.rfind(b"\n") + 1
+                self.offset += end
+                yield from pending[:end].splitlines()
+                pending = pending[end:]
+
+
+def _empty_totals() -> dict:
+    return {
+        "records": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "cost_usd": 0.0,
+        "estimated": 0,
+        "errors": 0,
+        "first_ts": None,
+        "last_ts": None,
+    }
+
+
+def _add_line(totals: dict, line: str | bytes):
+    if not line.strip():
+        return
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError:
+        return
+    usage = record.get("usage") or {}
+    totals["records"] += 1
+    totals["prompt_tokens"] += int(usage.get("prompt_tokens") or 0)
+    totals["completion_tokens"] += int(usage.get("completion_tokens") or 0)
+    totals["total_tokens"] += int(usage.get("total_tokens") or 0)
+    if isinstance(record.get("cost_usd"), (int, float)):
+        totals["cost_usd"] += record["cost_usd"]
+    totals["estimated"] += bool(record.get("estimated"))
+    totals["errors"] += record.get("status") == "error"
+    _merge_ts(totals, record.get("ts"), record.get("ts"))
+
+
+def _merge(totals: dict, other: dict):
+    for key in ("records", "prompt_tokens", "completion_tokens", "total_tokens", "cost_usd", "estimated", "errors"):
+        totals[key] += other.get(key, 0)
+    _merge_ts(totals, other.get("first_ts"), other.get("last_ts"))
+
 
-        with open(self.calls_file, "a") as f:
-            f.write(json.dumps(record) + "\n")
+def _merge_ts(totals: dict, first: str | None, last: str | None):
+    if first and (totals["first_ts"] is None or first < totals["first_ts"]):
+        totals["first_ts"] = first
+    if last and (totals["last_ts"] is None or last > totals["last_ts"]):
+        totals["last_ts"] = last
@@ -0,0 +1,238 @@
+"""Filter and page through a run's evaluations without loading the run.
+
+``EvaluationBrowser`` keeps a SQLite sidecar (``evaluations.browse.sqlite``) next to
+``evaluations.jsonl`` with one row per evaluation (LOB, mean score, pass, number of
+hallucination flags) and one row per dimension score. Filters and pagination are
+SQL queries against it; only the records of the requested page are read, by byte
+offset, together with their linked summary and transcript.
+
+The sidecar follows the file like ``JsonlIndex``: evaluations appended by a running
+judge are indexed from where the last scan stopped, anything else (a rewrite, or a
+changed transcripts.jsonl, where the LOB comes from) rebuilds it.
+"""
+
+import json
+import sqlite3
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from .jsonl_index import JsonlIndex, file_state, only_appended
+from .judge.scoring import flag_count
+
+DEFAULT_LOW_THRESHOLD = 4.0  # Failing-dimension cutoff for dimensions without a rubric threshold
+_SCAN_BATCH = 1000  # Evaluations per LOB lookup / insert
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS evaluations (
+    call_id TEXT PRIMARY KEY,
+    lob TEXT,
+    avg_score REAL,
+    passed INTEGER NOT NULL,
+    flags INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    call_id TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (call_id, dimension)
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_lob ON evaluations(lob);
+CREATE INDEX IF NOT EXISTS idx_evaluations_avg ON evaluations(avg_score);
+CREATE INDEX IF NOT EXISTS idx_scores_dimension ON scores(dimension, score);
+"""
+
+
+@dataclass
+class BrowseFilter:
+    """Server-side filters; None means "any"."""
+
+    failing_dimension: str | None = None  # Scored below its threshold on this dimension
+    lob: str | None = None
+    min_score: float | None = None  # Bounds on the mean dimension score
+    max_score: float | None = None
+    hallucinated: bool | None = None  # True: at least one hallucination flag; False: none
+    passed: bool | None = None
+
+
+@dataclass
+class BrowseItem:
+    call_id: str
+    evaluation: dict
+    summary: dict | None = None
+    transcript: dict | None = None
+
+
+@dataclass
+class BrowsePage:
+    items: list[BrowseItem]
+    total: int  # Matches across all pages
+    page: int  # 0-based
+    page_size: int
+
+    @property
+    def pages(self) -> int:
+        return max(1, -(-self.total // self.page_size))
+
+
+def _score(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class EvaluationBrowser:
+    """Paginated, filtered access to ``<run_dir>/evaluations.jsonl`` and the records it links to."""
+
+    def __init__(
+        self,
+        run_dir: Path,
+        transcripts_path: Path,
+        thresholds: dict[str, float] | None = None,
+        low_threshold: float = DEFAULT_LOW_THRESHOLD,
+    ):
+        self.run_dir = Path(run_dir)
+        self.evaluations_path = self.run_dir / "evaluations.jsonl"
+        self.summaries_path = self.run_dir / "summaries.jsonl"
+        self.transcripts_path = Path(transcripts_path)
+        self.index_path = self.run_dir / "evaluations.browse.sqlite"
+        self.thresholds = thresholds or {}
+        self.low_threshold = low_threshold
+
+    @classmethod
+    def with_rubric(cls, run_dir: Path, transcripts_path: Path, rubric_config: dict) -> "EvaluationBrowser":
+        """Browser whose failing-dimension cutoffs are the rubric's ``min_threshold``s."""
+        thresholds = {d["name"]: float(d["min_threshold"]) for d in rubric_config.get("dimensions", [])}
+        return cls(run_dir, transcripts_path, thresholds)
+
+    # -------------------- Queries --------------------
+
+    def page(self, filters: BrowseFilter | None = None, page: int = 0, page_size: int = 20) -> BrowsePage:
+        """One page of matching evaluations (ordered by call_id) with their summary and transcript."""
+        where, params = self._where(filters or BrowseFilter())
+        with self._connect() as conn:
+            (total,) = conn.execute(f"SELECT COUNT(*) FROM evaluations e {where}", params).fetchone()
+            page = max(0, min(page, max(0, -(-total // page_size) - 1)))
+            keys = [
+                k
+                for (k,) in conn.execute(
+                    f"SELECT e.call_id FROM evaluations e {where} ORDER BY e.call_id LIMIT ? OFFSET ?",
+                    [*params, page_size, page * page_size],
+                )
+            ]
+
+        evaluations = JsonlIndex(self.evaluations_path).get_many(keys)
+        summaries = JsonlIndex(self.summaries_path).get_many(keys) if self.summaries_path.exists() else {}
+        transcripts = JsonlIndex(self.transcripts_path).get_many(keys) if self.transcripts_path.exists() else {}
+        items = [
+            BrowseItem(k, evaluations[k], summaries.get(k), transcripts.get(k)) for k in keys if k in evaluations
+        ]
+        return BrowsePage(items, total, page, page_size)
+
+    def count(self, filters: BrowseFilter | None = None) -> int:
+        where, params = self._where(filters or BrowseFilter())
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM evaluations e {where}", params).fetchone()[0]
+
+    def dimensions(self) -> list[str]:
+        with self._connect() as conn:
+            return [d for (d,) in conn.execute("SELECT DISTINCT dimension FROM scores ORDER BY dimension")]
+
+    def lobs(self) -> list[str]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT DISTINCT lob FROM evaluations WHERE lob IS NOT NULL ORDER BY lob")
+            return [lob for (lob,) in rows]
+
+    def _where(self, filters: BrowseFilter) -> tuple[str, list]:
+        clauses, params = [], []
+        if filters.failing_dimension is not None:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM scores s WHERE s.call_id = e.call_id AND s.dimension = ? AND s.score < ?)"
+            )
+            threshold = self.thresholds.get(filters.failing_dimension, self.low_threshold)
+            params += [filters.failing_dimension, threshold]
+        if filters.lob is not None:
+            clauses.append("e.lob = ?")
+            params.append(filters.lob)
+        if filters.min_score is not None:
+            clauses.append("e.avg_score >= ?")
+            params.append(filters.min_score)
+        if filters.max_score is not None:
+            clauses.append("e.avg_score <= ?")
+            params.append(filters.max_score)
+        if filters.hallucinated is not None:
+            clauses.append("e.flags > 0" if filters.hallucinated else "e.flags = 0")
+        if filters.passed is not None:
+            clauses.append("e.passed = ?")
+            params.append(int(filters.passed))
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    # -------------------- Maintenance --------------------
+
+    @contextmanager
+    def _connect(self):
+        """Connection to a sidecar that is current for evaluations.jsonl and transcripts.jsonl."""
+        with closing(sqlite3.connect(self.index_path)) as conn:
+            conn.executescript(_SCHEMA)
+            meta = dict(conn.execute("SELECT name, value FROM meta"))
+            stat = file_state(self.evaluations_path)
+            transcripts = json.dumps(file_state(self.transcripts_path), sort_keys=True)
+            old = json.loads(meta["evaluations"]) if "evaluations" in meta else {}
+            if old != stat or meta.get("transcripts") != transcripts:
+                if meta.get("transcripts") == transcripts and only_appended(self.evaluations_path, old, stat):
+                    offset = self._scan(conn, int(meta["offset"]))
+                else:
+                    conn.execute("DELETE FROM evaluations")
+                    conn.execute("DELETE FROM scores")
+                    offset = self._scan(conn, 0)
+                conn.execute("DELETE FROM meta")
+                meta = {"evaluations": json.dumps(stat, sort_keys=True), "transcripts": transcripts, "offset": offset}
+                conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+                conn.commit()
+            yield conn
+
+    def _scan(self, conn: sqlite3.Connection, start: int) -> int:
+        """Index complete lines from byte ``start``; returns where the next scan should begin."""
+        if not self.evaluations_path.exists():
+            return start
+        offset = start
+        batch = []
+        with open(self.evaluations_path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Being written; picked up by the next scan
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    evaluation = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(evaluation, dict) and evaluation.get("call_id") is not None:
+                    batch.append(evaluation)
+                if len(batch) >= _SCAN_BATCH:
+                    self._insert(conn, batch)
+                    batch = []
+        self._insert(conn, batch)
+        return offset
+
+    def _insert(self, conn: sqlite3.Connection, evaluations: list[dict]):
+        if not evaluations:
+            return
+        keys = [str(e["call_id"]) for e in evaluations]
+        transcripts = JsonlIndex(self.transcripts_path).get_many(keys) if self.transcripts_path.exists() else {}
+        rows, scores = [], []
+        for key, e in zip(keys, evaluations):
+            values = {dim: _score(v) for dim, v in (e.get("scores") or {}).items()}
+            values = {dim: v for dim, v in values.items() if v is not None}
+            avg = sum(values.values()) / len(values) if values else None
+            lob = (transcripts.get(key) or {}).get("lob")
+            rows.append((key, lob, avg, int(bool(e.get("overall_pass"))), flag_count(e.get("hallucination_flags"))))
+            scores += [(key, dim, s) for dim, s in values.items()]
+        # A repeated call_id (e.g. a re-judged item) replaces its earlier line
+        conn.executemany("DELETE FROM scores WHERE call_id = ?", [(k,) for k in keys])
+        conn.executemany("INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?)", scores)
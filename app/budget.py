@@ -0,0 +1,130 @@
+"""Spend and token budget shared by every provider call in a process."""
+
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from .cost import compute_cost
+from .provider.base import BaseProvider, LLMResponse, Message, ProviderError, Usage
+
+DEFAULT_MAX_OUTPUT_TOKENS = 4096  # What the adapters send when a caller passes no max_tokens
+
+
+class BudgetExceededError(ProviderError):
+    """A call was refused because it could take the run past its budget."""
+
+
+class BudgetLedger:
+    """Thread-safe running totals of spend and tokens against optional hard limits.
+
+    Every call reserves its worst case up front (estimated prompt tokens plus the
+    full ``max_tokens`` of output, priced with the model's registry pricing) and is
+    refused if spent + reserved + that worst case would pass a limit. The
+    reservation is settled to the response's actual usage when the call returns
+    (or released if it fails). Concurrent in-flight calls therefore can never take
+    the totals past a limit. Once a call has been refused the ledger is
+    ``exhausted`` and runners stop submitting work.
+
+    The ledger is in-process only: separate processes (such as shard workers on
+    one run) would each enforce the full limit, so the CLI refuses budgets
+    together with ``--shard-size``.
+    """
+
+    def __init__(self, max_cost: float | None = None, max_tokens: int | None = None):
+        self.max_cost = max_cost
+        self.max_tokens = max_tokens
+        self._lock = threading.Lock()
+        self._exhausted = threading.Event()
+
+        self.spent_cost = 0.0
+        self.spent_tokens = 0
+        self.reserved_cost = 0.0
+        self.reserved_tokens = 0
+        self.calls = 0
+        self.refused = 0
+        self.stop_reason: str | None = None
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted.is_set()
+
+    @contextmanager
+    def reserve(self, cost: float, tokens: int):
+        """Hold ``cost``/``tokens`` for one call, yielding a callback for the actual ``(cost, tokens)``."""
+        with self._lock:
+            reason = None
+            if self.max_cost is not None and self.spent_cost + self.reserved_cost + cost > self.max_cost:
+                reason = f"cost limit ${self.max_cost:.4f} (spent ${self.spent_cost:.4f})"
+            elif self.max_tokens is not None and self.spent_tokens + self.reserved_tokens + tokens > self.max_tokens:
+                reason = f"token limit {self.max_tokens} (spent {self.spent_tokens})"
+            if reason:
+                self.refused += 1
+                if self.stop_reason is None:
+                    self.stop_reason = reason
+                self._exhausted.set()
+                raise BudgetExceededError(f"Budget exhausted: {reason}")
+            self.reserved_cost += cost
+            self.reserved_tokens += tokens
+
+        settled = []
+        try:
+            yield settled.append
+        finally:
+            with self._lock:
+                self.reserved_cost -= cost
+                self.reserved_tokens -= tokens
+                if settled:
+                    actual_cost, actual_tokens = settled[0]
+                    self.spent_cost += actual_cost
+                    self.spent_tokens += actual_tokens
+                    self.calls += 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "max_cost": self.max_cost,
+                "max_tokens": self.max_tokens,
+                "spent_cost": self.spent_cost,
+                "spent_tokens": self.spent_tokens,
+                "calls": self.calls,
+                "refused": self.refused,
+                "exhausted": self.exhausted,
+                "stop_reason": self.stop_reason,
+            }
+
+    def save(self, path: Path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+class BudgetedProvider(BaseProvider):
+    """Route a provider's calls through a shared BudgetLedger."""
+
+    def __init__(self, inner: BaseProvider, ledger: BudgetLedger, pricing: dict | None = None):
+        super().__init__(inner.api_key, inner.model_id)
+        self.inner = inner
+        self.ledger = ledger
+        self.pricing = pricing or {}
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    def generate(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        seed: int | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        prompt_tokens = self.inner.estimate_tokens("".join(m.content for m in messages))
+        completion_tokens = max_tokens or DEFAULT_MAX_OUTPUT_TOKENS
+        worst = Usage(prompt_tokens, completion_tokens, prompt_tokens + completion_tokens)
+        with self.ledger.reserve(compute_cost(worst, self.pricing) or 0.0, worst.total_tokens) as settle:
+            response = self.inner.generate(messages, temperature=temperature, seed=seed, max_tokens=max_tokens)
+            if response.usage:
+                settle((compute_cost(response.usage, self.pricing) or 0.0, response.usage.total_tokens))
+            else:
+                settle((0.0, 0))
+            return response
@@ -3,8 +3,11 @@
 import argparse
 import json
 import os
+import shutil
 import sys
+import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -14,46 +17,94 @@ from dotenv import load_dotenv
 # ruff: noqa: E402
 load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env", override=True)
 
-from app.audit import AuditLogger
+from app.audit import AuditLogger, iter_calls
+from app.budget import BudgetedProvider, BudgetLedger
 from app.config import ModelRegistry, Settings
 from app.cost import compute_cost
+from app.forecast import HISTORY_MAX_CALLS, PhaseHistory, count_tokens, forecast
+from app.generate.runner import MAX_TOKENS as GENERATE_MAX_TOKENS
 from app.generate.runner import DatasetGenerator
+from app.governor import GovernedProvider, Governor, GovernorLimits
+from app.jsonl_index import JsonlIndex, iter_jsonl
+from app.judge.cache import JudgmentCache
+from app.judge.evidence import EvidenceConfig, EvidenceSelector
+from app.judge.lean import full_judge_reference
+from app.judge.prejudge import PreJudge
 from app.judge.runner import JudgeRunner
-from app.provider.anthropic import AnthropicProvider
-from app.provider.google import GoogleProvider
+from app.judge.sequential import SequentialConfig
+from app.payloads import DEFAULT_PAYLOAD_DIR, PayloadStore
+from app.pipeline import CallBudget, Pipeline, ThrottledProvider
 from app.provider.mock import MockProvider  # noqa: F401 - Used by test suite
-from app.provider.openai import OpenAIProvider
+from app.provider.registry import available_providers, create_provider
+from app.provider.replay import MISS_POLICIES, RecordingProvider, ReplayProvider
 from app.report.aggregate import generate_report
+from app.shard import LEASE_TTL_S, Shard, ShardMismatchError, ShardSet, ShardWorker
+from app.summarize.runner import MAX_TOKENS as SUMMARIZE_MAX_TOKENS
 from app.summarize.runner import SummarizeRunner
+from app.trace import NULL_TRACER, Tracer, load_trace, summarize_trace
 from app.tune.heuristics import format_diff, suggest_prompt_changes
+from app.tune.sweep import Candidate, PromptSweep, SweepConfig
+
+DEFAULT_JUDGE_CACHE = Path("data/cache/judgments.sqlite")
+DEFAULT_SWEEP_DIR = Path("data/sweeps")
 
 
 def get_provider(
     provider_name: str, model_size: str, settings: Settings, registry: ModelRegistry
 ):
-    """Factory function to create provider instances."""
+    """Factory function to create provider instances (the adapter's SDK is imported here)."""
     model_id = registry.get_model_id(provider_name, model_size)
+    api_key = getattr(settings, f"{provider_name}_api_key", None)
+    return create_provider(provider_name, model_id, api_key)
+
+
+def _provider_for(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
+    """Live provider, wrapped for --record, or a ReplayProvider for --replay."""
+    payloads = PayloadStore(Path(args.payload_dir))
+    if args.replay:
+        fallback = None
+        if args.replay_miss == "fallthrough":
+            fallback = _governed(args, get_provider(args.provider, args.model, settings, registry), settings, registry)
+        provider = ReplayProvider.from_runs(
+            [Path(r) for r in args.replay],
+            payloads,
+            model_id=registry.get_model_id(args.provider, args.model),
+            on_miss=args.replay_miss,
+            fallback=fallback,
+            reproduce_latency=args.replay_latency,
+        )
+        recorded = sum(len(v) for v in provider.recordings.values())
+        print(f"[replay] {recorded} recorded responses for {len(provider.recordings)} requests (miss: {args.replay_miss})")
+        if provider.unplayable:
+            print(f"[replay] {provider.unplayable} records skipped (response not in {payloads.root})")
+        return _budgeted(args, provider, registry)
+
+    provider = _governed(args, get_provider(args.provider, args.model, settings, registry), settings, registry)
+    if args.record:
+        provider = RecordingProvider(provider, payloads, run_dir / "recordings.jsonl")
+    return _budgeted(args, provider, registry)
+
+
+def _governed(args, provider, settings: Settings, registry: ModelRegistry):
+    """Route live calls through the machine-wide governor if models.yaml sets limits for the provider."""
+    limits = GovernorLimits.from_config(registry.get_limits(args.provider))
+    if limits is None or not settings.governor_db:
+        return provider
+    # In-process background jobs share a pid; give each its own fair share
+    job = args.progress.job_id if getattr(args, "progress", None) is not None else None
+    args.governor = Governor(Path(settings.governor_db), args.provider, limits, job=job)
+    print(
+        f"[governor] {args.provider}: at most {limits.max_concurrency or 'unlimited'} concurrent calls, "
+        f"{limits.tokens_per_min or 'unlimited'} tokens/min across all jobs on this machine"
+    )
+    return GovernedProvider(provider, args.governor)
 
-    if provider_name == "openai":
-        api_key = settings.openai_api_key or os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not set in environment")
-        return OpenAIProvider(api_key, model_id)
-
-    elif provider_name == "anthropic":
-        api_key = settings.anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY not set in environment")
-        return AnthropicProvider(api_key, model_id)
-
-    elif provider_name == "google":
-        api_key = settings.google_api_key or os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            raise ValueError("GOOGLE_API_KEY not set in environment")
-        return GoogleProvider(api_key, model_id)
 
-    else:
-        raise ValueError(f"Unknown provider: {provider_name}")
+def _budgeted(args, provider, registry: ModelRegistry):
+    """Charge the provider's calls to the process-wide --max-cost/--max-tokens ledger, if any."""
+    if getattr(args, "budget", None) is None:
+        return provider
+    return BudgetedProvider(provider, args.budget, registry.get_pricing(args.provider, args.model))
 
 
 def cmd_generate(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
@@ -62,7 +113,7 @@ def cmd_generate(args, settings: Settings, registry: ModelRegistry, run_dir: Pat
     data_dir = Path("data")
     transcripts_file = data_dir / "transcripts.jsonl"
 
-    provider = get_provider(args.provider, args.model, settings, registry)
+    provider = _provider_for(args, settings, registry, run_dir)
     generator = DatasetGenerator(provider, data_dir)
 
     # Check if dataset already exists
@@ -84,7 +135,7 @@ def cmd_generate(args, settings: Settings, registry: ModelRegistry, run_dir: Pat
                 f"[generate] Regenerating dataset (replacing {existing_count} existing transcripts)"
             )
             transcripts_file.unlink()
-            transcripts = generator.generate(n=n, workers=args.workers)
+            transcripts = generator.generate(n=n, workers=args.workers, progress=args.progress)
             generator.save(transcripts)
             print(f"[generate] ✓ Generated {len(transcripts)} new transcripts")
         elif existing_count >= n:
@@ -99,7 +150,7 @@ def cmd_generate(args, settings: Settings, registry: ModelRegistry, run_dir: Pat
             print(
                 f"[generate] Found {existing_count} existing transcripts, generating {delta} more to reach {n}"
             )
-            new_transcripts = generator.generate(n=delta, workers=args.workers)
+            new_transcripts = generator.generate(n=delta, workers=args.workers, progress=args.progress)
 
             # Load existing and append
             existing = []
@@ -121,7 +172,7 @@ def cmd_generate(args, settings: Settings, registry: ModelRegistry, run_dir: Pat
                 f"[generate] ✓ Added {delta} transcripts (total: {len(all_transcripts)})"
             )
     else:
-        transcripts = generator.generate(n=n, workers=args.workers)
+        transcripts = generator.generate(n=n, workers=args.workers, progress=args.progress)
         generator.save(transcripts)
         print(f"[generate] ✓ Generated {len(transcripts)} transcripts")
 
@@ -135,19 +186,15 @@ def cmd_summarize(args, settings: Settings, registry: ModelRegistry, run_dir: Pa
         print("[error] No transcripts found. Run 'generate' first.")
         sys.exit(1)
 
-    # Load transcripts
-    transcripts = []
-    with open(transcripts_file) as f:
-        for line in f:
-            transcripts.append(json.loads(line))
-
-    print(f"[summarize] Loading {len(transcripts)} transcripts...")
+    # Stream transcripts from disk; the index gives the count without a parse
+    total = len(JsonlIndex(transcripts_file))
+    print(f"[summarize] Loading {total} transcripts...")
 
-    provider = get_provider(args.provider, args.model, settings, registry)
+    provider = _provider_for(args, settings, registry, run_dir)
     prompts_dir = Path("configs/prompts")
 
     # Set up audit logger and cost calculator
-    audit_logger = AuditLogger(run_dir)
+    audit_logger = _audit_logger(args, run_dir)
     model_pricing = registry.get_pricing(args.provider, args.model)
 
     runner = SummarizeRunner(
@@ -159,17 +206,45 @@ def cmd_summarize(args, settings: Settings, registry: ModelRegistry, run_dir: Pa
         model_pricing=model_pricing,
         temperature=settings.temperature,
         seed=settings.seed,
+        tracer=args.tracer,
+        budget=args.budget,
+        progress=args.progress,
     )
-    summaries = runner.run(transcripts, workers=args.workers)
-
-    # Save summaries to file
     output_file = run_dir / "summaries.jsonl"
-    with open(output_file, "w") as f:
-        for s in summaries:
-            f.write(json.dumps(s) + "\n")
+    if args.shard_size:
+        transcripts = JsonlIndex(transcripts_file)
+
+        def process(shard: Shard, work_path: Path):
+            found = transcripts.get_many(shard.keys)
+            with open(work_path, "w") as f:
+                shard_items = (found[k] for k in shard.keys if k in found)
+                for s in runner.iter_run(shard_items, workers=args.workers, total=len(found)):
+                    f.write(json.dumps(s) + "\n")
+
+        settings_used = {
+            "model": provider.model_id,
+            "system_prompt": runner.system_prompt,
+            "user_template": runner.user_template,
+            "temperature": runner.temperature,
+            "transcripts": transcripts.digest(),
+        }
+        count = _run_sharded(
+            args, run_dir, "summarize", transcripts.keys(), process, output_file, settings_used
+        )
+    else:
+        # Write each summary as it completes so memory stays flat on large datasets
+        count = 0
+        with open(output_file, "w") as f:
+            for s in runner.iter_run(iter_jsonl(transcripts_file), workers=args.workers, total=total):
+                f.write(json.dumps(s) + "\n")
+                f.flush()
+                count += 1
+    audit_logger.close()
+    if isinstance(provider, ReplayProvider):
+        print(f"[replay] {provider.hits} hits, {provider.misses} misses")
 
-    print(f"[summarize] ✓ Summarized {len(summaries)} transcripts")
-    print(f"[summarize] ✓ Saved {len(summaries)} summaries to {output_file}")
+    print(f"[summarize] ✓ Summarized {count} transcripts")
+    print(f"[summarize] ✓ Saved {count} summaries to {output_file}")
 
 
 def cmd_judge(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
@@ -182,60 +257,580 @@ def cmd_judge(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
         print("[error] No summaries found. Run 'summarize' first.")
         sys.exit(1)
 
-    # Load summaries first to know which call_ids we need
-    summaries = []
+    # Count summaries up front for progress lines; pairs are streamed from disk later
     with open(summaries_file) as f:
-        for line in f:
-            summaries.append(json.loads(line))
+        total = sum(1 for line in f if line.strip())
+    print(f"[judge] Evaluating {total} summaries...")
 
-    # Load only the transcripts that match the summaries (by call_id)
-    summary_call_ids = {s["call_id"] for s in summaries}
-    transcripts = []
-    with open(transcripts_file) as f:
-        for line in f:
-            transcript = json.loads(line)
-            if transcript["call_id"] in summary_call_ids:
-                transcripts.append(transcript)
+    provider = _provider_for(args, settings, registry, run_dir)
+    # Set up audit logger and cost calculator
+    audit_logger = _audit_logger(args, run_dir)
+    runner = _judge_runner(args, settings, registry, run_dir, provider, audit_logger)
+    cache = runner.cache
+    sequential = None
+    if args.sequential:
+        seq_kwargs = {
+            "precision": args.precision,
+            "dim_precision": args.dim_precision,
+            "confidence": args.confidence,
+            "min_items": args.min_items,
+            "seed": settings.seed or 0,
+        }
+        if args.baseline:
+            sequential = SequentialConfig.with_baseline(Path(args.baseline), **seq_kwargs)
+        else:
+            sequential = SequentialConfig(**seq_kwargs)
 
-    # Ensure transcripts and summaries are in the same order
-    transcript_dict = {t["call_id"]: t for t in transcripts}
-    transcripts = [
-        transcript_dict[s["call_id"]]
-        for s in summaries
-        if s["call_id"] in transcript_dict
-    ]
+    if args.shard_size:
+        if sequential is not None:
+            print("[error] --sequential needs one process to see every result; drop --shard-size")
+            sys.exit(1)
+        transcripts = JsonlIndex(transcripts_file)
+        summaries = JsonlIndex(summaries_file)
+
+        def process(shard: Shard, work_path: Path):
+            # The runner writes evaluations.jsonl (and stats sidecars) into its output_dir
+            runner.output_dir = work_path.with_suffix("")
+            runner.output_dir.mkdir(exist_ok=True)
+            found = summaries.get_many(shard.keys)
+            shard_transcripts = transcripts.get_many(found)
+            pairs = [(shard_transcripts[k], found[k]) for k in shard.keys if k in found and k in shard_transcripts]
+            for _ in runner.iter_run(pairs, total=len(pairs), workers=args.workers):
+                pass
+            os.replace(runner.output_dir / "evaluations.jsonl", work_path)
+            shutil.rmtree(runner.output_dir)
+
+        settings_used = {
+            "model": provider.model_id,
+            "mode": runner.phase,
+            "system_prompt": runner.system_prompt,
+            "user_template": runner.user_template,
+            "rubric": runner.rubric.config,
+            "temperature": runner.temperature,
+            "evidence": vars(runner.evidence.config) if runner.evidence else None,
+            "prejudge": runner.prejudge.auto_fail if runner.prejudge else None,
+            "summaries": summaries.digest(),
+            "transcripts": transcripts.digest(),
+        }
+        count = _run_sharded(
+            args, run_dir, "judge", summaries.keys(), process, run_dir / "evaluations.jsonl", settings_used
+        )
+        # Per-shard stats don't add up to a run-level sidecar; don't leave a stale one behind
+        for name in ("lean_judge.json", "evidence.json", "prejudge.json", "sequential.json"):
+            (run_dir / name).unlink(missing_ok=True)
+    else:
+        # The runner appends each evaluation to evaluations.jsonl as it completes
+        pairs = _judge_pairs(summaries_file, JsonlIndex(transcripts_file))
+        count = sum(1 for _ in runner.iter_run(pairs, total=total, workers=args.workers, sequential=sequential))
+    audit_logger.close()
+    if cache is not None:
+        cache.close()
+    if isinstance(provider, ReplayProvider):
+        print(f"[replay] {provider.hits} hits, {provider.misses} misses")
+
+    print(f"[judge] ✓ Evaluated {count} summaries")
+
+
+def _judge_runner(
+    args, settings: Settings, registry: ModelRegistry, run_dir: Path, provider, audit_logger: AuditLogger | None
+) -> JudgeRunner:
+    """JudgeRunner configured from the judge command's flags (cache, prejudge, lean, evidence)."""
+    cache = None
+    if not args.no_cache:
+        cache = JudgmentCache(
+            Path(args.cache_path), max_entries=args.cache_max_entries, max_age_days=args.cache_max_age_days
+        )
+    return JudgeRunner(
+        provider,
+        Path("configs/prompts"),
+        Path("configs/rubric.default.json"),
+        run_dir,
+        audit_logger=audit_logger,
+        cost_calculator=compute_cost,
+        model_pricing=registry.get_pricing(args.provider, args.model),
+        temperature=settings.temperature,
+        seed=settings.seed,
+        cache=cache,
+        prejudge=(
+            PreJudge(auto_fail=args.prejudge_auto_fail)
+            if args.prejudge or args.prejudge_auto_fail
+            else None
+        ),
+        mode="lean" if args.lean else "full",
+        lean_reference=full_judge_reference(Path("runs")) if args.lean else None,
+        evidence=_evidence_selector(args),
+        tracer=getattr(args, "tracer", NULL_TRACER),
+        budget=getattr(args, "budget", None),
+        progress=getattr(args, "progress", None),
+    )
+
+
+def _evidence_selector(args) -> EvidenceSelector | None:
+    """EvidenceSelector from --evidence/--evidence-top-k/--evidence-window, or None."""
+    if not args.evidence:
+        return None
+    return EvidenceSelector(EvidenceConfig(top_k=args.evidence_top_k, window=args.evidence_window))
 
-    print(f"[judge] Evaluating {len(summaries)} summaries...")
 
-    provider = get_provider(args.provider, args.model, settings, registry)
+def _run_sharded(
+    args, run_dir: Path, phase: str, keys: list[str], process, output_file: Path, settings_used: dict
+) -> int:
+    """Join a sharded run of ``phase`` as one worker; merge into ``output_file`` once all shards finish.
+
+    ``settings_used`` (prompts, model, input digests...) is fingerprinted into the manifest,
+    so a worker started with other inputs doesn't merge shards made for the old ones.
+    """
+    shard_set = ShardSet(run_dir, phase)
+    try:
+        planned = shard_set.plan(keys, args.shard_size, settings_used, reshard=args.reshard)
+    except ShardMismatchError as e:
+        print(f"[error] {e}")
+        sys.exit(1)
+    if planned:
+        print(f"[{phase}] Planned {len(shard_set.shards())} shards of up to {args.shard_size} items")
+    else:
+        print(f"[{phase}] Joining {len(shard_set.shards())} planned shards in {shard_set.root}")
+    worker = ShardWorker(shard_set, process, worker_id=args.worker_id, ttl=args.lease_ttl)
+    completed = worker.run()
+    count = shard_set.merge(output_file)
+    print(f"[{phase}] Worker {worker.worker_id} completed {len(completed)} shards; merged {count} lines")
+    return count
+
+
+def _judge_pairs(summaries_file: Path, transcripts: JsonlIndex, batch: int = 500):
+    """(transcript, summary) pairs in summary order, looking transcripts up a batch at a time."""
+    missing = 0
+    summaries = iter_jsonl(summaries_file)
+    while True:
+        chunk = list(islice(summaries, batch))
+        if not chunk:
+            break
+        found = transcripts.get_many(s["call_id"] for s in chunk)
+        for summary in chunk:
+            if summary["call_id"] in found:
+                yield found[summary["call_id"]], summary
+            else:
+                missing += 1
+    if missing:
+        print(f"[judge] Warning: {missing} summaries have no matching transcript and were skipped")
+
+
+def cmd_forecast(args, settings: Settings, registry: ModelRegistry):
+    """--dry-run: render the phase's real prompts and forecast tokens, cost and wall time.
+
+    No provider is created and no run directory is written.
+    """
+    transcripts_file = Path("data") / "transcripts.jsonl"
+    model_id = registry.get_model_id(args.provider, args.model)
+    pricing = registry.get_pricing(args.provider, args.model)
+    skipped = {}
+
+    if args.cmd == "generate":
+        n = args.N or settings.default_n
+        existing = len(JsonlIndex(transcripts_file)) if transcripts_file.exists() else 0
+        if existing >= n and not args.regenerate:
+            print(f"[forecast] generate: dataset already has {existing} transcripts (target: {n}); nothing to do")
+            return
+        calls = n if args.regenerate else n - existing
+        phase, max_tokens = "generate", GENERATE_MAX_TOKENS
+        prompts = [DatasetGenerator(None, Path("data")).build_messages(1)] * calls
+        # Generation isn't audited: existing transcripts are the best guide to output length
+        history = PhaseHistory(source="existing transcripts")
+        if existing:
+            for t in JsonlIndex(transcripts_file).first(HISTORY_MAX_CALLS):
+                history.completion_tokens.append(count_tokens(json.dumps(t, indent=2)))
+    elif args.cmd == "summarize":
+        if not transcripts_file.exists():
+            print("[error] No transcripts found. Run 'generate' first.")
+            sys.exit(1)
+        runner = SummarizeRunner(None, Path("configs/prompts"), Path("."))
+        phase, max_tokens = "summarize", SUMMARIZE_MAX_TOKENS
+        prompts = (runner.build_messages(t) for t in iter_jsonl(transcripts_file))
+        history = PhaseHistory.load(Path("runs"), phase, model_id)
+    else:
+        run_dir = Path(args.run) if args.run else _latest_run_with("summaries.jsonl")
+        if run_dir is None or not (run_dir / "summaries.jsonl").exists():
+            print("[error] No summaries found. Run 'summarize' first.")
+            sys.exit(1)
+        print(f"[cli] Using run: {run_dir.name}\n")
+        runner = _judge_runner(args, settings, registry, run_dir, None, None)
+        phase, max_tokens = runner.phase, runner.max_tokens
+
+        def judge_prompts():
+            for transcript, summary in _judge_pairs(run_dir / "summaries.jsonl", JsonlIndex(transcripts_file)):
+                messages, reason = runner.dry_run(transcript, summary, model_id)
+                if reason:
+                    skipped[reason] = skipped.get(reason, 0) + 1
+                else:
+                    yield messages
+
+        prompts = judge_prompts()
+        history = PhaseHistory.load(Path("runs"), phase, model_id)
+
+    result = forecast(
+        phase,
+        model_id,
+        prompts,
+        max_tokens,
+        pricing,
+        history,
+        workers=args.workers,
+        rate_per_s=args.rate,
+        skipped=skipped,
+    )
+    result.print_summary()
+    if args.cmd == "judge":
+        if runner.cache is not None:
+            runner.cache.close()
+        if args.lean:
+            print("[forecast] Lean mode: rationale follow-up calls are not included")
+        if args.sequential:
+            print("[forecast] Sequential mode may stop early; this is the cost of judging every summary")
+
+
+def cmd_run(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
+    """Stream generate → summarize → judge in one process, then write the report."""
+    data_dir = Path("data")
+    transcripts_file = data_dir / "transcripts.jsonl"
+
+    transcripts, total = None, None
+    if not args.N:
+        if not transcripts_file.exists():
+            print("[error] No transcripts found. Pass --N to generate them, or run 'generate' first.")
+            sys.exit(1)
+        # Streamed from disk; the index only supplies the count for progress output
+        transcripts, total = iter_jsonl(transcripts_file), len(JsonlIndex(transcripts_file))
+        print(f"[run] Streaming {total} transcripts...")
+
+    # Every stage's calls share one concurrency and rate budget
+    budget = CallBudget(args.workers, args.rate)
+    provider = ThrottledProvider(_provider_for(args, settings, registry, run_dir), budget)
     prompts_dir = Path("configs/prompts")
-    rubric_path = Path("configs/rubric.default.json")
+    audit_logger = _audit_logger(args, run_dir)
+    model_pricing = registry.get_pricing(args.provider, args.model)
 
-    # Set up audit logger and cost calculator
-    audit_logger = AuditLogger(run_dir)
+    cache = None
+    if not args.no_cache:
+        cache = JudgmentCache(Path(args.cache_path))
+
+    summarizer = SummarizeRunner(
+        provider,
+        prompts_dir,
+        run_dir,
+        audit_logger=audit_logger,
+        cost_calculator=compute_cost,
+        model_pricing=model_pricing,
+        temperature=settings.temperature,
+        seed=settings.seed,
+        tracer=args.tracer,
+        budget=args.budget,
+    )
+    judge = JudgeRunner(
+        provider,
+        prompts_dir,
+        Path("configs/rubric.default.json"),
+        run_dir,
+        audit_logger=audit_logger,
+        cost_calculator=compute_cost,
+        model_pricing=model_pricing,
+        temperature=settings.temperature,
+        seed=settings.seed,
+        cache=cache,
+        tracer=args.tracer,
+        budget=args.budget,
+    )
+    pipeline = Pipeline(
+        summarizer,
+        judge,
+        run_dir,
+        generator=DatasetGenerator(provider, data_dir) if args.N else None,
+        workers=args.workers,
+        queue_size=args.queue_size,
+        tracer=args.tracer,
+        budget=args.budget,
+    )
+    pipeline.run(transcripts, n=args.N or 0, total=total)
+    audit_logger.close()
+    if cache is not None:
+        cache.close()
+        print(f"[judge] Cache: {cache.hits} hits, {cache.misses} misses ({cache.path})")
+    if isinstance(provider.inner, ReplayProvider):
+        print(f"[replay] {provider.inner.hits} hits, {provider.inner.misses} misses")
+    cost = summarizer.total_cost + judge.total_cost
+    print(f"[run] {budget.calls} provider calls, {budget.wait_s:.1f}s spent waiting for a call slot, ${cost:.4f}")
+
+    cmd_report(args, settings, registry, run_dir)
+
+
+def cmd_sweep(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
+    """Rank candidate summarizer prompts with successive halving."""
+    transcripts_file = Path("data") / "transcripts.jsonl"
+    if not transcripts_file.exists():
+        print("[error] No transcripts found. Run 'generate' first.")
+        sys.exit(1)
+    # Each round reads only the transcripts it adds
+    transcripts = JsonlIndex(transcripts_file)
+
+    prompts_dir = Path("configs/prompts")
+    prompt_files = [Path(p) for p in args.prompts]
+    if not args.no_baseline:
+        prompt_files.insert(0, prompts_dir / "summarizer.system.txt")
+    missing = [str(p) for p in prompt_files if not p.exists()]
+    if missing:
+        print(f"[error] Prompt file(s) not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    provider = _provider_for(args, settings, registry, run_dir)
+    audit_logger = _audit_logger(args, run_dir)
     model_pricing = registry.get_pricing(args.provider, args.model)
+    cache = None if args.no_cache else JudgmentCache(Path(args.cache_path))
+
+    candidates = []
+    for path in prompt_files:
+        name = "current" if path == prompts_dir / "summarizer.system.txt" and not args.no_baseline else path.stem
+        while name in {c.name for c in candidates}:
+            name += "_"
+        runner = SummarizeRunner(
+            provider,
+            prompts_dir,
+            run_dir,
+            audit_logger=audit_logger,
+            cost_calculator=compute_cost,
+            model_pricing=model_pricing,
+            temperature=settings.temperature,
+            seed=settings.seed,
+            system_prompt=path.read_text(),
+        )
+        candidates.append(Candidate(name, runner))
 
-    runner = JudgeRunner(
+    judge = JudgeRunner(
         provider,
         prompts_dir,
-        rubric_path,
+        Path("configs/rubric.default.json"),
         run_dir,
         audit_logger=audit_logger,
         cost_calculator=compute_cost,
         model_pricing=model_pricing,
         temperature=settings.temperature,
         seed=settings.seed,
+        cache=cache,
+    )
+    config = SweepConfig(
+        min_items=args.min_items,
+        eta=args.eta,
+        max_items=args.max_items,
+        confidence=args.confidence,
+        seed=args.seed if args.seed is not None else settings.seed or 0,
     )
-    evaluations = runner.run(transcripts, summaries, workers=args.workers)
+    PromptSweep(candidates, judge, run_dir, config=config, workers=args.workers).run(transcripts)
+    audit_logger.close()
+    if cache is not None:
+        cache.close()
+    cost = sum(c.summarizer.total_cost for c in candidates) + judge.total_cost
+    print(f"[sweep] Total cost: ${cost:.4f}")
 
-    # Save evaluations to file
-    output_file = run_dir / "evaluations.jsonl"
-    with open(output_file, "w") as f:
-        for e in evaluations:
-            f.write(json.dumps(e) + "\n")
 
-    print(f"[judge] ✓ Evaluated {len(evaluations)} summaries")
-    print(f"[judge] ✓ Saved {len(evaluations)} evaluations to {output_file}")
+def cmd_cache(args, settings: Settings, registry: ModelRegistry):
+    """Inspect, evict, warm, export or import the judgment cache."""
+    cache = JudgmentCache(Path(args.cache_path))
+
+    if args.cache_cmd == "stats":
+        for key, value in cache.stats().items():
+            print(f"[cache] {key}: {value}")
+
+    elif args.cache_cmd == "evict":
+        if args.max_entries is None and args.max_age_days is None:
+            print("[error] Pass --max-entries and/or --max-age-days")
+            sys.exit(1)
+        removed = cache.evict(max_entries=args.max_entries, max_age_days=args.max_age_days)
+        print(f"[cache] ✓ Evicted {removed} entries")
+
+    elif args.cache_cmd == "export":
+        count = cache.export_jsonl(Path(args.file))
+        print(f"[cache] ✓ Exported {count} entries to {args.file}")
+
+    elif args.cache_cmd == "import":
+        count = cache.import_jsonl(Path(args.file))
+        print(f"[cache] ✓ Imported {count} entries from {args.file}")
+
+    elif args.cache_cmd == "warm":
+        # Seed the cache from an existing run's summaries + evaluations, keyed against the
+        # CURRENT judge prompts and rubric; only items the run judged with exactly those
+        # messages and this model are stored.
+        run_dir = Path(args.run) if args.run else _latest_run_with("evaluations.jsonl")
+        if run_dir is None or not (run_dir / "evaluations.jsonl").exists():
+            print("[error] No run with evaluations found. Run 'judge' first or pass --run.")
+            sys.exit(1)
+
+        # Key through a JudgeRunner in the requested mode, so lean and evidence runs hit too
+        runner = JudgeRunner(
+            None,
+            Path("configs/prompts"),
+            Path("configs/rubric.default.json"),
+            run_dir,
+            temperature=settings.temperature,
+            cache=cache,
+            mode="lean" if args.lean else "full",
+            evidence=_evidence_selector(args),
+        )
+        model_id = registry.get_model_id(args.provider, args.model)
+        judged = runner.judged_calls(run_dir / "calls.jsonl")
+
+        summaries = {}
+        with open(run_dir / "summaries.jsonl") as f:
+            for line in f:
+                if line.strip():
+                    s = json.loads(line)
+                    summaries[s["call_id"]] = s
+        transcripts = JsonlIndex(Path("data") / "transcripts.jsonl").get_many(summaries)
+
+        stored = skipped = 0
+        with open(run_dir / "evaluations.jsonl") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                evaluation = json.loads(line)
+                summary = summaries.get(evaluation.get("call_id"))
+                transcript = transcripts.get(summary.get("transcript_id", summary["call_id"])) if summary else None
+                if transcript is not None and runner.warm_cache(
+                    transcript, summary, evaluation, model_id, judged
+                ):
+                    stored += 1
+                else:
+                    skipped += 1
+        print(f"[cache] ✓ Warmed {stored} entries from {run_dir.name} ({skipped} skipped)")
+
+    cache.close()
+
+
+def _audit_logger(args, run_dir: Path) -> AuditLogger:
+    """AuditLogger with --store-payloads and calls.jsonl rotation applied."""
+    return AuditLogger(
+        run_dir,
+        payloads=PayloadStore(Path(args.payload_dir)) if args.store_payloads else None,
+        max_bytes=int(args.audit_rotate_mb * 1024 * 1024) if args.audit_rotate_mb else None,
+        max_age_s=args.audit_rotate_hours * 3600 if args.audit_rotate_hours else None,
+    )
+
+
+def cmd_payload(args):
+    """Expand calls.jsonl records back to their full messages and responses."""
+    store = PayloadStore(Path(args.payload_dir))
+
+    if args.payload_cmd == "stats":
+        for key, value in store.stats().items():
+            print(f"[payload] {key}: {value}")
+        return
+
+    run_dir = Path(args.run) if args.run else _latest_run_with("calls.jsonl")
+    if run_dir is None or not (run_dir / "calls.jsonl").exists():
+        print("[error] No run with calls.jsonl found. Pass --run.")
+        sys.exit(1)
+
+    records = list(iter_calls(run_dir / "calls.jsonl"))
+    if args.line is not None:
+        records = records[args.line - 1 : args.line]
+    if args.digest:
+        records = [
+            r for r in records
+            if args.digest in (r.get("messages_digest_in"), r.get("response_digest_out"))
+        ]
+    if args.request_id:
+        records = [r for r in records if r.get("request_id") == args.request_id]
+    if args.phase:
+        records = [r for r in records if r.get("phase") == args.phase]
+    if not records:
+        print("[error] No matching call records.")
+        sys.exit(1)
+
+    missing = 0
+    for record in records:
+        expanded = store.expand(record)
+        missing += expanded["messages"] is None
+        print(json.dumps(expanded, indent=2))
+    if missing:
+        print(
+            f"[payload] {missing} record(s) have no stored messages (run with --store-payloads)",
+            file=sys.stderr,
+        )
+
+
+def cmd_trace_summary(args):
+    """Print where a traced run spent its time: phases, critical path, slowest items."""
+    run_dir = Path(args.run) if args.run else _latest_run_with("trace.json")
+    if run_dir is None or not (run_dir / "trace.json").exists():
+        print("[error] No traced run found. Run summarize/judge with --trace, or pass --run.")
+        sys.exit(1)
+
+    events = load_trace(run_dir / "trace.json")
+    summary = summarize_trace(events, top=args.top)
+    print(f"[trace] {run_dir / 'trace.json'}: {len(events)} spans (open in https://ui.perfetto.dev)\n")
+
+    print("Phases:")
+    for phase in summary["phases"]:
+        line = f"  {phase['name']:<16} wall {phase['wall_ms']:>10.1f} ms"
+        if phase["items"]:
+            line += (
+                f"  {phase['items']} items, service {phase['service_ms']:.1f} ms, "
+                f"queue wait {phase['queue_wait_ms']:.1f} ms, "
+                f"p50 {phase['item_p50_ms']:.1f} ms, max {phase['item_max_ms']:.1f} ms"
+            )
+        print(line)
+        for stage, ms in phase["stages_ms"].items():
+            share = ms / phase["service_ms"] if phase["service_ms"] else 0.0
+            print(f"      {stage:<14} {ms:>10.1f} ms  {share:>5.0%}")
+
+    print("\nCritical path:")
+    for span in summary["critical_path"]:
+        attrs = ", ".join(f"{k}={v}" for k, v in span["args"].items())
+        print(f"  {'  ' * span['depth']}{span['name']} {span['dur_ms']:.1f} ms" + (f" ({attrs})" if attrs else ""))
+
+    print(f"\nSlowest {len(summary['worst_items'])} items:")
+    for item in summary["worst_items"]:
+        stage = item["slowest_stage"]
+        print(
+            f"  {item['args'].get('call_id', item['name'])} [{item['phase']}] {item['dur_ms']:.1f} ms "
+            f"(queued {item['queue_wait_ms']:.1f} ms"
+            + (f", {stage[0]} {stage[1]:.1f} ms" if stage else "")
+            + ")"
+        )
+
+
+def cmd_monitor(args):
+    """Rolling request/token rates, latency percentiles, errors and cost burn from a run's calls.jsonl."""
+    # Needs numpy: only this command should pay for importing it
+    from app.monitor import CallsMonitor, format_snapshot
+
+    run_dir = Path(args.run) if args.run else _latest_run_with("calls.jsonl")
+    if run_dir is None:
+        print("[error] No run with calls.jsonl found. Pass --run.")
+        sys.exit(1)
+
+    monitor = CallsMonitor(run_dir, Path("data") / "transcripts.jsonl", window_s=args.window)
+    clear = sys.stdout.isatty() and not args.once
+    try:
+        while True:
+            monitor.poll()
+            view = format_snapshot(monitor.snapshot(), run_dir)
+            print(("\033[H\033[J" if clear else "") + view, flush=True)
+            if args.once:
+                return
+            time.sleep(args.interval)
+            if not clear:
+                print()
+    except KeyboardInterrupt:
+        pass
+
+
+def _latest_run_with(filename: str) -> Path | None:
+    """Most recent run directory containing the given artifact."""
+    runs_root = Path("runs")
+    if not runs_root.exists():
+        return None
+    for d in sorted([d for d in runs_root.iterdir() if d.is_dir()], reverse=True):
+        if (d / filename).exists():
+            return d
+    return None
 
 
 def cmd_tune(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
@@ -257,13 +852,11 @@ def cmd_tune(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
     # Choose tuning method
     if getattr(args, "use_llm", False):
         # LLM-assisted tuning
-        print(
-            f"[tune] Using LLM-assisted tuning (provider: {args.provider or 'openai'}, model: {args.model or 'small'})"
-        )
+        args.provider = args.provider or "openai"
+        args.model = args.model or "small"
+        print(f"[tune] Using LLM-assisted tuning (provider: {args.provider}, model: {args.model})")
 
-        provider = get_provider(
-            args.provider or "openai", args.model or "small", settings, registry
-        )
+        provider = _governed(args, get_provider(args.provider, args.model, settings, registry), settings, registry)
 
         # Load current prompt
         prompt_system = Path("configs/prompts/summarizer.system.txt")
@@ -335,6 +928,14 @@ def cmd_tune(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
             )
 
 
+def _load_sidecar(path: Path) -> dict | None:
+    """Load an optional JSON stats file written next to a run's artifacts."""
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
 def cmd_report(args, settings: Settings, registry: ModelRegistry, run_dir: Path):
     """Generate final report."""
     evaluations_file = run_dir / "evaluations.jsonl"
@@ -353,7 +954,15 @@ def cmd_report(args, settings: Settings, registry: ModelRegistry, run_dir: Path)
     print(f"[report] Generating report for {len(evaluations)} evaluations...")
 
     report_file = run_dir / "report.md"
-    generate_report(evaluations, calls_file, report_file)
+    generate_report(
+        evaluations,
+        calls_file,
+        report_file,
+        sequential=_load_sidecar(run_dir / "sequential.json"),
+        prejudge=_load_sidecar(run_dir / "prejudge.json"),
+        lean=_load_sidecar(run_dir / "lean_judge.json"),
+        evidence=_load_sidecar(run_dir / "evidence.json"),
+    )
 
     print(f"[report] ✓ Report saved to {report_file}")
 
@@ -364,15 +973,134 @@ def cmd_report(args, settings: Settings, registry: ModelRegistry, run_dir: Path)
     print("=" * 60)
 
 
-def main():
+def _add_shard_args(p: argparse.ArgumentParser):
+    p.add_argument(
+        "--run", help="Run directory to use (default: latest); sharded workers must agree on it"
+    )
+    p.add_argument(
+        "--shard-size",
+        type=int,
+        help="Split the work into shards of this many items claimed by any number of worker processes",
+    )
+    p.add_argument(
+        "--lease-ttl", type=float, default=LEASE_TTL_S, help="Seconds before an unrefreshed shard lease expires"
+    )
+    p.add_argument("--worker-id", help="Name of this worker in shard leases (default: host-pid)")
+    p.add_argument(
+        "--reshard",
+        action="store_true",
+        help="Discard shards planned for other items or settings and plan afresh (start one worker with it)",
+    )
+
+
+def _add_judge_mode_args(p: argparse.ArgumentParser):
+    p.add_argument(
+        "--lean",
+        action="store_true",
+        help="Scores-only first pass; fetch rationales only where they are needed",
+    )
+    p.add_argument(
+        "--evidence",
+        action="store_true",
+        help="Send only the transcript segments that support each summary field",
+    )
+    p.add_argument(
+        "--evidence-top-k", type=int, default=3, help="Segments retrieved per summary field"
+    )
+    p.add_argument(
+        "--evidence-window", type=int, default=1, help="Neighbouring segments kept around each hit"
+    )
+
+
+def _add_budget_args(p: argparse.ArgumentParser):
+    p.add_argument(
+        "--max-cost",
+        type=float,
+        help="Refuse provider calls that could take this command past $N (one process; not with --shard-size)",
+    )
+    p.add_argument(
+        "--max-tokens",
+        type=int,
+        help="Refuse provider calls that could take this command past N tokens (one process; not with --shard-size)",
+    )
+
+
+def _add_dry_run_arg(p: argparse.ArgumentParser):
+    p.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Forecast tokens, cost and wall time from the real prompts and past runs; call nothing",
+    )
+    p.add_argument(
+        "--rate", type=float, help="Provider requests per second to assume in the --dry-run wall time"
+    )
+
+
+def _at_least(minimum: int):
+    """argparse type: an int no smaller than ``minimum``."""
+
+    def parse(value: str) -> int:
+        n = int(value)
+        if n < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum} (got {n})")
+        return n
+
+    return parse
+
+
+def _add_payload_args(p: argparse.ArgumentParser, store: bool = True):
+    if store:
+        p.add_argument(
+            "--store-payloads",
+            action="store_true",
+            help="Keep full prompts and responses in the deduplicated payload store",
+        )
+        p.add_argument(
+            "--audit-rotate-mb",
+            type=float,
+            default=64,
+            help="Rotate and compress calls.jsonl past this size (0 disables)",
+        )
+        p.add_argument(
+            "--audit-rotate-hours", type=float, help="Also rotate calls.jsonl after this long"
+        )
+    p.add_argument(
+        "--payload-dir", default=str(DEFAULT_PAYLOAD_DIR), help="Payload store directory"
+    )
+    p.add_argument(
+        "--record",
+        action="store_true",
+        help="Record every provider response (recordings.jsonl + payload store) for replay",
+    )
+    p.add_argument(
+        "--replay",
+        nargs="+",
+        metavar="RUN_DIR",
+        help="Serve recorded responses from these runs instead of calling the provider",
+    )
+    p.add_argument(
+        "--replay-miss",
+        choices=MISS_POLICIES,
+        default="fail",
+        help="On a request with no recording: fail, call the live provider, or mock",
+    )
+    p.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="Sleep for each recorded latency_ms when replaying",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="call-summary-copilot", description="Eval-first LLM Copilot"
     )
     sub = parser.add_subparsers(dest="cmd", required=True)
+    providers = available_providers()
 
     p_gen = sub.add_parser("generate", help="Generate synthetic dataset")
     p_gen.add_argument(
-        "--provider", required=True, choices=["openai", "anthropic", "google"]
+        "--provider", required=True, choices=providers
     )
     p_gen.add_argument("--model", required=True, choices=["small", "large"])
     p_gen.add_argument(
@@ -389,30 +1117,161 @@ def main():
     p_gen.add_argument(
         "--workers", type=int, default=5, help="Number of concurrent workers"
     )
+    _add_payload_args(p_gen, store=False)
+    _add_budget_args(p_gen)
+    _add_dry_run_arg(p_gen)
 
     p_sum = sub.add_parser("summarize", help="Generate summaries")
     p_sum.add_argument(
-        "--provider", required=True, choices=["openai", "anthropic", "google"]
+        "--provider", required=True, choices=providers
     )
     p_sum.add_argument("--model", required=True, choices=["small", "large"])
     p_sum.add_argument(
         "--workers", type=int, default=5, help="Number of concurrent workers"
     )
+    _add_payload_args(p_sum)
+    _add_budget_args(p_sum)
+    _add_dry_run_arg(p_sum)
+    p_sum.add_argument(
+        "--trace", action="store_true", help="Record per-stage spans to the run's trace.json"
+    )
+    _add_shard_args(p_sum)
 
     p_judge = sub.add_parser("judge", help="Evaluate summaries")
     p_judge.add_argument(
-        "--provider", required=True, choices=["openai", "anthropic", "google"]
+        "--provider", required=True, choices=providers
     )
     p_judge.add_argument("--model", required=True, choices=["small", "large"])
     p_judge.add_argument(
         "--workers", type=int, default=5, help="Number of concurrent workers"
     )
+    _add_payload_args(p_judge)
+    _add_budget_args(p_judge)
+    _add_dry_run_arg(p_judge)
+    p_judge.add_argument(
+        "--trace", action="store_true", help="Record per-stage spans to the run's trace.json"
+    )
+    _add_shard_args(p_judge)
+    p_judge.add_argument(
+        "--no-cache", action="store_true", help="Always call the judge (skip cache)"
+    )
+    p_judge.add_argument(
+        "--cache-path", default=str(DEFAULT_JUDGE_CACHE), help="Judgment cache file"
+    )
+    p_judge.add_argument(
+        "--cache-max-entries", type=int, help="Evict LRU entries beyond this count"
+    )
+    p_judge.add_argument(
+        "--cache-max-age-days", type=float, help="Evict entries unused for this long"
+    )
+    p_judge.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Judge in random order and stop once estimates are precise enough",
+    )
+    p_judge.add_argument(
+        "--precision", type=float, default=0.05, help="Pass-rate CI half-width target"
+    )
+    p_judge.add_argument(
+        "--dim-precision",
+        type=float,
+        default=0.25,
+        help="Per-dimension mean CI half-width target",
+    )
+    p_judge.add_argument("--confidence", type=float, default=0.95)
+    p_judge.add_argument(
+        "--min-items", type=int, default=10, help="Never stop before this many items"
+    )
+    p_judge.add_argument(
+        "--baseline", help="Run directory to compare against (stop once conclusive)"
+    )
+    p_judge.add_argument(
+        "--prejudge",
+        action="store_true",
+        help="Run rule-based checks first and flag unsupported entities",
+    )
+    p_judge.add_argument(
+        "--prejudge-auto-fail",
+        action="store_true",
+        help="Fail hard-invalid summaries without an LLM call (implies --prejudge)",
+    )
+    _add_judge_mode_args(p_judge)
+
+    p_run = sub.add_parser(
+        "run", help="Stream generate → summarize → judge → report in one process"
+    )
+    p_run.add_argument(
+        "--provider", required=True, choices=providers
+    )
+    p_run.add_argument("--model", required=True, choices=["small", "large"])
+    p_run.add_argument(
+        "--N",
+        type=int,
+        help="Generate this many new transcripts and append them to the dataset (default: use the dataset)",
+    )
+    p_run.add_argument(
+        "--workers", type=int, default=5, help="Concurrent provider calls shared by all stages"
+    )
+    p_run.add_argument(
+        "--rate", type=float, help="Provider requests per second shared by all stages"
+    )
+    p_run.add_argument(
+        "--queue-size", type=int, help="Items buffered between stages (default: 2 x workers)"
+    )
+    _add_payload_args(p_run)
+    _add_budget_args(p_run)
+    p_run.add_argument(
+        "--no-cache", action="store_true", help="Always call the judge (skip cache)"
+    )
+    p_run.add_argument(
+        "--cache-path", default=str(DEFAULT_JUDGE_CACHE), help="Judgment cache file"
+    )
+    p_run.add_argument(
+        "--trace", action="store_true", help="Record per-stage spans to the run's trace.json"
+    )
+
+    p_sweep = sub.add_parser(
+        "sweep", help="Rank candidate summarizer prompts with successive halving"
+    )
+    p_sweep.add_argument(
+        "--prompts", nargs="+", required=True, metavar="FILE", help="Candidate summarizer system prompts"
+    )
+    p_sweep.add_argument(
+        "--no-baseline",
+        action="store_true",
+        help="Don't include the current summarizer.system.txt as a candidate",
+    )
+    p_sweep.add_argument(
+        "--provider", required=True, choices=providers
+    )
+    p_sweep.add_argument("--model", required=True, choices=["small", "large"])
+    p_sweep.add_argument(
+        "--workers", type=int, default=5, help="Number of concurrent workers"
+    )
+    p_sweep.add_argument(
+        "--min-items", type=_at_least(1), default=4, help="Transcripts per candidate in the first round"
+    )
+    p_sweep.add_argument(
+        "--eta", type=_at_least(2), default=2, help="Keep the top 1/eta candidates each round"
+    )
+    p_sweep.add_argument(
+        "--max-items", type=_at_least(1), help="Cap on transcripts per candidate (default: all)"
+    )
+    p_sweep.add_argument("--confidence", type=float, default=0.95)
+    p_sweep.add_argument("--seed", type=int, help="Transcript order seed (default: SEED)")
+    _add_payload_args(p_sweep)
+    p_sweep.add_argument(
+        "--no-cache", action="store_true", help="Always call the judge (skip cache)"
+    )
+    p_sweep.add_argument(
+        "--cache-path", default=str(DEFAULT_JUDGE_CACHE), help="Judgment cache file"
+    )
 
     p_tune = sub.add_parser("tune", help="Generate prompt tuning suggestions")
     p_tune.add_argument(
         "--use-llm", action="store_true", help="Use LLM-assisted tuning"
     )
-    p_tune.add_argument("--provider", choices=["openai", "anthropic", "google"])
+    p_tune.add_argument("--provider", choices=providers)
     p_tune.add_argument("--model", choices=["small", "large"])
     p_tune.add_argument(
         "--apply", action="store_true", help="Interactively apply suggestions to prompt"
@@ -427,18 +1286,106 @@ def main():
         "report", help="Generate final report"
     )  # No additional args needed
 
-    args = parser.parse_args()
+    p_cache = sub.add_parser("cache", help="Manage the judgment cache")
+    p_cache.add_argument(
+        "--cache-path", default=str(DEFAULT_JUDGE_CACHE), help="Judgment cache file"
+    )
+    cache_sub = p_cache.add_subparsers(dest="cache_cmd", required=True)
+    cache_sub.add_parser("stats", help="Show cache size and hit counts")
+    p_evict = cache_sub.add_parser("evict", help="Drop old or least-recently-used entries")
+    p_evict.add_argument("--max-entries", type=int)
+    p_evict.add_argument("--max-age-days", type=float)
+    p_export = cache_sub.add_parser("export", help="Export entries to JSONL")
+    p_export.add_argument("file")
+    p_import = cache_sub.add_parser("import", help="Import entries from JSONL")
+    p_import.add_argument("file")
+    p_warm = cache_sub.add_parser(
+        "warm", help="Seed the cache from an existing run's evaluations"
+    )
+    p_warm.add_argument("--run", help="Run directory (default: latest with evaluations)")
+    p_warm.add_argument(
+        "--provider", required=True, choices=providers
+    )
+    p_warm.add_argument("--model", required=True, choices=["small", "large"])
+    _add_judge_mode_args(p_warm)
+
+    p_payload = sub.add_parser("payload", help="Expand stored request/response payloads")
+    p_payload.add_argument(
+        "--payload-dir", default=str(DEFAULT_PAYLOAD_DIR), help="Payload store directory"
+    )
+    payload_sub = p_payload.add_subparsers(dest="payload_cmd", required=True)
+    payload_sub.add_parser("stats", help="Show payload store size")
+    p_expand = payload_sub.add_parser("expand", help="Print calls.jsonl records with full payloads")
+    p_expand.add_argument("--run", help="Run directory (default: latest with calls.jsonl)")
+    p_expand.add_argument("--line", type=int, help="1-based record number (rotated segments first)")
+    p_expand.add_argument("--digest", help="messages_digest_in or response_digest_out")
+    p_expand.add_argument("--request-id", help="Provider request ID")
+    p_expand.add_argument("--phase", help="Only records from this phase")
+
+    p_trace = sub.add_parser(
+        "trace-summary", help="Summarize a run's trace.json (critical path, slowest items)"
+    )
+    p_trace.add_argument("--run", help="Run directory (default: latest with trace.json)")
+    p_trace.add_argument("--top", type=int, default=5, help="Slowest items to list")
+
+    p_monitor = sub.add_parser(
+        "monitor", help="Live throughput, latency, error and cost rates from a run's calls.jsonl"
+    )
+    p_monitor.add_argument("--run", help="Run directory (default: latest with calls.jsonl)")
+    p_monitor.add_argument(
+        "--window", type=float, default=60.0, help="Rolling window in seconds"
+    )
+    p_monitor.add_argument(
+        "--interval", type=float, default=2.0, help="Seconds between refreshes"
+    )
+    p_monitor.add_argument("--once", action="store_true", help="Print one snapshot and exit")
+
+    return parser
+
+
+def run(args: argparse.Namespace):
+    """Run a parsed command; background jobs set ``args.progress`` before calling this."""
+    args.progress = getattr(args, "progress", None)
 
     # Load settings and model registry
     settings = Settings.from_env()
     registry_path = Path("configs/models.yaml")
     registry = ModelRegistry(registry_path)
 
+    # Cache and payload management don't operate on a (latest) run directory
+    if args.cmd == "cache":
+        cmd_cache(args, settings, registry)
+        return
+    if args.cmd == "payload":
+        cmd_payload(args)
+        return
+    if args.cmd == "trace-summary":
+        cmd_trace_summary(args)
+        return
+    if args.cmd == "monitor":
+        cmd_monitor(args)
+        return
+    if getattr(args, "dry_run", False):
+        cmd_forecast(args, settings, registry)
+        return
+    if args.cmd == "sweep":
+        # Kept out of runs/ so later commands don't pick the sweep up as the latest run
+        sweep_dir = DEFAULT_SWEEP_DIR / datetime.now().strftime("%Y%m%d_%H%M%S")
+        sweep_dir.mkdir(parents=True, exist_ok=True)
+        print(f"[cli] Sweep directory: {sweep_dir}\n")
+        cmd_sweep(args, settings, registry, sweep_dir)
+        return
+
     # Determine run directory
-    # For generate: always create new
+    # For generate and run: always create new
     # For other commands: use latest run if exists
     runs_root = Path("runs")
-    if args.cmd == "generate":
+    if args.cmd in ("summarize", "judge") and args.run:
+        # Pinned, e.g. so sharded workers on several machines share one run
+        run_dir = Path(args.run)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        print(f"[cli] Using run: {run_dir}\n")
+    elif args.cmd in ("generate", "run"):
         run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         run_dir = runs_root / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
@@ -473,17 +1420,60 @@ def main():
             print("[error] No runs directory found. Run 'generate' first.")
             sys.exit(1)
 
+    args.tracer = Tracer(run_dir / "trace.json") if getattr(args, "trace", False) else NULL_TRACER
+    args.budget = None
+    if getattr(args, "max_cost", None) is not None or getattr(args, "max_tokens", None) is not None:
+        if getattr(args, "shard_size", None):
+            # The ledger lives in this process; N shard workers could each spend the whole limit
+            print("[error] --max-cost/--max-tokens can't be combined with --shard-size (budgets are per process)")
+            sys.exit(1)
+        if args.max_cost is not None and not registry.get_pricing(args.provider, args.model):
+            # Unpriced calls would be charged $0 and the limit never reached
+            print(
+                f"[error] --max-cost needs pricing for {args.provider}/{args.model} in {registry_path}; "
+                "only --max-tokens can be enforced for this model"
+            )
+            sys.exit(1)
+        args.budget = BudgetLedger(max_cost=args.max_cost, max_tokens=args.max_tokens)
+
+    args.governor = None
+
     # Dispatch to command handlers
-    if args.cmd == "generate":
-        cmd_generate(args, settings, registry, run_dir)
-    elif args.cmd == "summarize":
-        cmd_summarize(args, settings, registry, run_dir)
-    elif args.cmd == "judge":
-        cmd_judge(args, settings, registry, run_dir)
-    elif args.cmd == "tune":
-        cmd_tune(args, settings, registry, run_dir)
-    elif args.cmd == "report":
-        cmd_report(args, settings, registry, run_dir)
+    try:
+        with args.tracer.span(args.cmd, "run", run=run_dir.name):
+            if args.cmd == "generate":
+                cmd_generate(args, settings, registry, run_dir)
+            elif args.cmd == "summarize":
+                cmd_summarize(args, settings, registry, run_dir)
+            elif args.cmd == "judge":
+                cmd_judge(args, settings, registry, run_dir)
+            elif args.cmd == "run":
+                cmd_run(args, settings, registry, run_dir)
+            elif args.cmd == "tune":
+                cmd_tune(args, settings, registry, run_dir)
+            elif args.cmd == "report":
+                cmd_report(args, settings, registry, run_dir)
+    finally:
+        # Saved even if the command stops early, next to whatever partial artifacts it wrote
+        if args.budget is not None:
+            args.budget.save(run_dir / "budget.json")
+            b = args.budget
+            print(
+                f"[budget] Spent ${b.spent_cost:.4f} and {b.spent_tokens} tokens in {b.calls} calls; "
+                f"{b.refused} refused" + (f" ({b.stop_reason})" if b.stop_reason else "")
+            )
+        if args.governor is not None:
+            g = args.governor
+            g.close()
+            if g.calls:
+                print(f"[governor] Waited {g.wait_s:.1f}s for slots over {g.calls} calls")
+    args.tracer.close()
+    if args.tracer.enabled:
+        print(f"[trace] Spans written to {run_dir / 'trace.json'} (python -m app.cli trace-summary)")
+
+
+def main():
+    run(build_parser().parse_args())
 
 
 if __name__ == "__main__":
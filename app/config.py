@@ -18,6 +18,7 @@ class Settings(BaseModel):
     default_workers: int = Field(default=5)
     temperature: float = Field(default=0.7)
     seed: int | None = Field(default=None)
+    governor_db: str = Field(default="data/governor.sqlite")
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -31,6 +32,7 @@ class Settings(BaseModel):
             default_workers=int(os.getenv("DEFAULT_WORKERS", "5")),
             temperature=float(os.getenv("TEMPERATURE", "0.7")),
             seed=int(os.getenv("SEED")) if os.getenv("SEED") else None,
+            governor_db=os.getenv("GOVERNOR_DB", "data/governor.sqlite"),
         )
 
 
@@ -101,3 +103,7 @@ class ModelRegistry:
     def get_pricing(self, provider: str, size: str) -> dict:
         """Get pricing info for cost calculation."""
         return self.get_model(provider, size).get("pricing", {})
+
+    def get_limits(self, provider: str) -> dict:
+        """Machine-wide call limits for a provider (shared by all its models)."""
+        return self.models.get(provider, {}).get("limits", {})
@@ -0,0 +1,186 @@
+"""Dry-run forecasts: tokens, cost and wall time for a phase without calling a provider."""
+
+import math
+import statistics
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .audit import iter_calls
+from .cost import compute_cost
+from .provider.base import Message, Usage
+
+try:
+    import tiktoken
+except ImportError:  # Optional: pip install tiktoken (otherwise ~4 characters per token)
+    tiktoken = None
+
+HISTORY_MAX_CALLS = 5000  # Most recent matching calls used per (phase, model)
+
+# Without history: assume half the output cap, and latency of a fixed overhead plus per output token
+DEFAULT_OUTPUT_FRACTION = 0.5
+DEFAULT_BASE_LATENCY_MS = 500.0
+DEFAULT_MS_PER_OUTPUT_TOKEN = 15.0
+
+
+_encoding = None
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken's cl100k_base if installed, else the 4-characters-per-token estimate."""
+    global _encoding
+    if tiktoken is None:
+        return len(text) // 4
+    if _encoding is None:
+        _encoding = tiktoken.get_encoding("cl100k_base")
+    return len(_encoding.encode(text, disallowed_special=()))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class PhaseHistory:
+    """Completion tokens and latency of past successful calls for one phase and model."""
+
+    completion_tokens: list[int] = field(default_factory=list)
+    latency_ms: list[float] = field(default_factory=list)
+    source: str = "past calls"
+
+    @classmethod
+    def load(cls, runs_root: Path, phase: str, model: str, limit: int = HISTORY_MAX_CALLS) -> "PhaseHistory":
+        """Scan runs (newest first) for calls.jsonl records matching ``phase`` and ``model``."""
+        history = cls()
+        if not runs_root.exists():
+            return history
+        for run_dir in sorted((d for d in runs_root.iterdir() if d.is_dir()), reverse=True):
+            for record in iter_calls(run_dir / "calls.jsonl"):
+                usage = record.get("usage")
+                if (
+                    record.get("phase") != phase
+                    or record.get("model") != model
+                    or record.get("status") != "ok"
+                    or not usage
+                    or record.get("estimated")
+                ):
+                    continue
+                history.completion_tokens.append(usage["completion_tokens"])
+                history.latency_ms.append(record.get("latency_ms") or 0.0)
+            if len(history.completion_tokens) >= limit:
+                break
+        return history
+
+    def __len__(self) -> int:
+        return len(self.completion_tokens)
+
+
+@dataclass
+class Forecast:
+    phase: str
+    model: str
+    items: int
+    calls: int
+    skipped: dict[str, int]  # Items that need no provider call, by reason (cached, rule-failed)
+    prompt_tokens: int
+    output_tokens: float  # Expected per call
+    output_tokens_p90: float
+    cost: float
+    cost_p90: float
+    latency_ms: float  # Expected per call
+    wall_s: float
+    workers: int
+    rate_per_s: float | None
+    history_calls: int
+    history_source: str
+    token_counter: str
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+    def print_summary(self):
+        tag = f"[forecast] {self.phase}"
+        skipped = ", ".join(f"{n} {reason}" for reason, n in self.skipped.items() if n)
+        print(
+            f"{tag}: {self.items} items → {self.calls} provider calls on {self.model}"
+            + (f" ({skipped})" if skipped else "")
+        )
+        per_call = self.prompt_tokens / self.calls if self.calls else 0
+        print(f"{tag}: prompt tokens {self.prompt_tokens:,} ({per_call:,.0f} per call, counted with {self.token_counter})")
+        if self.history_calls:
+            source = f"from {self.history_calls} {self.history_source}"
+        else:
+            source = "no history: assumed half the cap"
+        print(f"{tag}: output tokens ~{self.output_tokens:,.0f} per call (p90 {self.output_tokens_p90:,.0f}; {source})")
+        print(f"{tag}: cost ${self.cost:.4f} (p90 ${self.cost_p90:.4f})")
+        limits = f"{self.workers} workers" + (f", {self.rate_per_s:g} calls/s" if self.rate_per_s else "")
+        print(f"{tag}: wall time ~{_duration(self.wall_s)} with {limits} ({self.latency_ms / 1000:.1f}s per call)")
+
+
+def _duration(seconds: float) -> str:
+    if seconds < 120:
+        return f"{seconds:.0f}s"
+    if seconds < 7200:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def forecast(
+    phase: str,
+    model: str,
+    prompts: Iterable[list[Message]],
+    max_tokens: int,
+    pricing: dict,
+    history: PhaseHistory,
+    workers: int,
+    rate_per_s: float | None = None,
+    skipped: dict[str, int] | None = None,
+) -> Forecast:
+    """Price the given prompts (one provider call each) against the phase's history."""
+    calls = 0
+    prompt_tokens = 0
+    for messages in prompts:
+        calls += 1
+        prompt_tokens += sum(count_tokens(m.content) for m in messages)
+    if skipped is None:
+        skipped = {}
+
+    if history:
+        output = statistics.fmean(min(t, max_tokens) for t in history.completion_tokens)
+        output_p90 = min(_percentile(history.completion_tokens, 0.9), max_tokens)
+    else:
+        output = output_p90 = max_tokens * DEFAULT_OUTPUT_FRACTION
+    if history.latency_ms:
+        latency_ms = statistics.fmean(history.latency_ms)
+    else:
+        latency_ms = DEFAULT_BASE_LATENCY_MS + DEFAULT_MS_PER_OUTPUT_TOKEN * output
+
+    def price(output_per_call: float) -> float:
+        completion = round(output_per_call * calls)
+        return compute_cost(Usage(prompt_tokens, completion, prompt_tokens + completion), pricing) or 0.0
+
+    # Workers each run calls back to back; a rate limit caps the throughput on top of that
+    wall_s = math.ceil(calls / workers) * latency_ms / 1000 if calls else 0.0
+    if rate_per_s:
+        wall_s = max(wall_s, calls / rate_per_s)
+
+    return Forecast(
+        phase=phase,
+        model=model,
+        items=calls + sum(skipped.values()),
+        calls=calls,
+        skipped=skipped,
+        prompt_tokens=prompt_tokens,
+        output_tokens=output,
+        output_tokens_p90=output_p90,
+        cost=price(output),
+        cost_p90=price(output_p90),
+        latency_ms=latency_ms,
+        wall_s=wall_s,
+        workers=workers,
+        rate_per_s=rate_per_s,
+        history_calls=len(history),
+        history_source=history.source,
+        token_counter="tiktoken cl100k_base" if tiktoken is not None else "~4 chars/token",
+    )
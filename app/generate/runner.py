@@ -1,14 +1,21 @@
 """Dataset generator: create synthetic transcripts via LLM (verbose, simple, robust)."""
 
+import csv
 import json
+import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+from ..jsonl_index import iter_jsonl, write_jsonl
 from ..provider.base import BaseProvider, Message
 
+MAX_TOKENS = 8192  # Output cap per generation call
+
 # Expanded, more realistic few-shot examples (longer segments + richer flow).
 FEW_SHOT_EXAMPLES = r"""
 Example 1:
@@ -87,14 +94,23 @@ class DatasetGenerator:
 
     # -------------------- Public API --------------------
 
-    def generate(self, n: int = 50, workers: int = 5) -> list[dict]:
-        """Generate N synthetic transcripts (LLM-only; no fallbacks) with concurrent workers."""
+    def generate(self, n: int = 50, workers: int = 5, progress=None) -> list[dict]:
+        """Generate N synthetic transcripts (LLM-only; no fallbacks) with concurrent workers.
+
+        With a background job's ``progress``, completions are reported to it and
+        transcripts not yet started are skipped once the job is cancelled.
+        """
         print(f"[generate] Generating {n} synthetic transcripts with {workers} workers...")
         results: list[dict[str, Any]] = []
         completed_count = 0
+        failed_count = 0
+        if progress is not None:
+            progress.update("generate", 0, n)
 
-        def generate_one(idx: int) -> dict[str, Any]:
+        def generate_one(idx: int) -> dict[str, Any] | None:
             """Generate a single transcript."""
+            if progress is not None and progress.cancelled:
+                return None
             batch = self._call_llm_and_parse(1)
             return batch[0]
 
@@ -108,11 +124,16 @@ class DatasetGenerator:
                 idx = futures[future]
                 try:
                     transcript = future.result()
+                    if transcript is None:
+                        continue  # Cancelled before it started
                     results.append(transcript)
                     completed_count += 1
                     print(f"[generate] Progress: {completed_count}/{n} transcripts completed", flush=True)
                 except Exception as e:
+                    failed_count += 1
                     print(f"[generate] Warning: Failed to generate transcript {idx+1}: {e}", file=sys.stderr)
+                if progress is not None:
+                    progress.update("generate", completed_count, n, failed=failed_count)
 
         # Normalize all transcripts with sequential IDs
         normalized_results = []
@@ -121,39 +142,73 @@ class DatasetGenerator:
 
         return normalized_results
 
-    def save(self, transcripts: list[dict]):
-        """Save transcripts to JSONL and CSV."""
+    def generate_item(self, seq_num: int, timestamp: str | None = None) -> dict:
+        """Generate and normalize a single transcript (call_id ``TRA-<timestamp>-<seq_num>``)."""
+        return self._normalize(self._call_llm_and_parse(1)[0], seq_num, timestamp)
+
+    def save(self, transcripts: Iterable[dict]) -> int:
+        """Save transcripts to JSONL and CSV in one streaming pass; return how many were saved."""
         jsonl_path = self.output_dir / "transcripts.jsonl"
         csv_path = self.output_dir / "transcripts.csv"
+        count = 0
+
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            # Flatten for CSV as each transcript goes by
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["call_id", "lob", "segments_json", "duration_s"])
+
+            def rows() -> Iterator[dict]:
+                nonlocal count
+                for t in transcripts:
+                    writer.writerow(
+                        [
+                            t["call_id"],
+                            t["lob"],
+                            json.dumps(t["segments"], ensure_ascii=False),
+                            int(t["metadata"]["duration_s"]),
+                        ]
+                    )
+                    count += 1
+                    yield t
+
+            # Written together with its call_id offset index for random-access readers
+            write_jsonl(jsonl_path, rows())
+
+        print(f"[generate] Saved {count} transcripts to {jsonl_path} and {csv_path}")
+        return count
+
+    def existing_count(self) -> int:
+        """Transcripts in the saved dataset (0 if there is none)."""
+        jsonl_path = self.output_dir / "transcripts.jsonl"
+        if not jsonl_path.exists():
+            return 0
+        return sum(1 for _ in iter_jsonl(jsonl_path))
 
-        with open(jsonl_path, "w") as f:
-            for t in transcripts:
-                f.write(json.dumps(t, ensure_ascii=False) + "\n")
-
-        # Flatten for CSV
-        import pandas as pd
-
-        df = pd.DataFrame(
-            [
-                {
-                    "call_id": t["call_id"],
-                    "lob": t["lob"],
-                    "segments_json": json.dumps(t["segments"], ensure_ascii=False),
-                    "duration_s": int(t["metadata"]["duration_s"]),
-                }
-                for t in transcripts
-            ]
-        )
-        df.to_csv(csv_path, index=False)
+    def append(self, new_transcripts: Iterable[dict], timestamp: str) -> int:
+        """Add transcripts to the saved dataset; return the new total.
 
-        print(f"[generate] Saved {len(transcripts)} transcripts to {jsonl_path} and {csv_path}")
+        Existing transcripts are renumbered ``TRA-<timestamp>-001`` onwards, as
+        ``generate`` does when it tops a dataset up; ``new_transcripts`` must already be
+        numbered after them (from ``existing_count() + 1``). Both are streamed.
+        """
+        jsonl_path = self.output_dir / "transcripts.jsonl"
+        if not jsonl_path.exists():
+            return self.save(new_transcripts)
+        # Read the old dataset from a side file while the new one is written in its place
+        previous = jsonl_path.with_name("transcripts.previous.jsonl")
+        os.replace(jsonl_path, previous)
+        renumbered = (
+            {**t, "call_id": f"TRA-{timestamp}-{idx:03d}"} for idx, t in enumerate(iter_jsonl(previous), 1)
+        )
+        total = self.save(chain(renumbered, new_transcripts))
+        previous.unlink()
+        return total
 
     # -------------------- LLM glue --------------------
 
-    def _call_llm_and_parse(self, k: int) -> list[dict[str, Any]]:
-        """Ask the LLM for k transcripts; return list of raw dicts. Raises on failure."""
-        prompt = self._build_prompt(k)
-        messages = [
+    def build_messages(self, k: int = 1) -> list[Message]:
+        """The messages sent to the provider to generate ``k`` transcripts."""
+        return [
             Message(
                 role="system",
                 content=(
@@ -161,10 +216,14 @@ class DatasetGenerator:
                     "Honor the JSON schema exactly. Avoid PHI/PII; use placeholders where needed."
                 ),
             ),
-            Message(role="user", content=prompt),
+            Message(role="user", content=self._build_prompt(k)),
         ]
 
-        resp = self.provider.generate(messages, max_tokens=8192, temperature=0.8)
+    def _call_llm_and_parse(self, k: int) -> list[dict[str, Any]]:
+        """Ask the LLM for k transcripts; return list of raw dicts. Raises on failure."""
+        messages = self.build_messages(k)
+
+        resp = self.provider.generate(messages, max_tokens=MAX_TOKENS, temperature=0.8)
         raw_text = getattr(resp, "text", None) or getattr(resp, "content", "")
         if not raw_text or not isinstance(raw_text, str):
             raise RuntimeError("Empty or invalid LLM response")
@@ -217,7 +276,7 @@ Examples to mirror:
 
     # -------------------- Normalization --------------------
 
-    def _normalize(self, t: dict[str, Any], seq_num: int) -> dict[str, Any]:
+    def _normalize(self, t: dict[str, Any], seq_num: int, timestamp: str | None = None) -> dict[str, Any]:
         """Coerce to exact schema, fix timestamps, enforce allowed values, assign call_id."""
         lob = str(t.get("lob", "")).strip().title()
         if lob not in _ALLOWED_LOBS:
@@ -251,9 +310,10 @@ Examples to mirror:
             duration_s = last_ts
 
         # Assign normalized call_id with timestamp
-        from datetime import datetime
+        if timestamp is None:
+            from datetime import datetime
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         call_id = f"TRA-{timestamp}-{seq_num:03d}"
 
         return {
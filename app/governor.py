@@ -0,0 +1,295 @@
+"""Machine-wide provider limits shared by every process making provider calls.
+
+CLI commands, the jobs Streamlit spawns and the ``run`` pipeline each size their
+own thread pools with ``--workers``; the provider's rate limit is per account, so
+together they can overrun it. The governor is a small SQLite file that every
+governed provider call goes through:
+
+    slots     one row per in-flight call (provider, job, pid, reserved tokens)
+    waiters   calls waiting for a slot, refreshed while they wait
+    usage     tokens of calls finished in the last minute
+
+Limits come from the provider's ``limits`` entry in configs/models.yaml:
+``max_concurrency`` caps in-flight calls and ``tokens_per_min`` caps the tokens
+finished in the trailing minute plus those reserved by in-flight calls (prompt
+estimate + max_tokens, which is also what providers count against the limit).
+
+Sharing is fair between jobs (processes): while another job is waiting, a job
+holding its share (the limit divided by the number of active jobs) takes no new
+slot, so a late small job is not starved by a large one already filling the pool.
+With nobody else waiting, a job may use the whole limit. Slots of processes that
+died are reclaimed on the next acquire.
+
+Each thread keeps one connection to the file for all of its calls. A call that
+can't get a slot retries with exponential backoff (``poll_s`` doubling up to
+``max_poll_s``), so a crowd of waiters doesn't hammer the write lock.
+"""
+
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from .budget import DEFAULT_MAX_OUTPUT_TOKENS
+from .provider.base import BaseProvider, LLMResponse, Message
+
+DEFAULT_GOVERNOR_DB = Path("data/governor.sqlite")
+TOKEN_WINDOW_S = 60.0
+WAITER_TTL_S = 5.0  # A waiter not refreshed for this long no longer counts for fair sharing
+MAX_POLL_S = 1.0  # Longest backoff between a waiter's attempts; well under WAITER_TTL_S
+SLOT_TTL_S = 900.0  # A slot held this long is treated as leaked, even if its process is alive
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS slots (
+    id INTEGER PRIMARY KEY,
+    provider TEXT NOT NULL,
+    job TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    tokens INTEGER NOT NULL,
+    acquired_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    provider TEXT NOT NULL,
+    waiter TEXT NOT NULL,
+    job TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (provider, waiter)
+);
+CREATE TABLE IF NOT EXISTS usage (
+    provider TEXT NOT NULL,
+    at REAL NOT NULL,
+    tokens INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_usage_provider_at ON usage(provider, at);
+"""
+
+
+@dataclass
+class GovernorLimits:
+    max_concurrency: int | None = None
+    tokens_per_min: int | None = None
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> "GovernorLimits | None":
+        """Limits from a models.yaml ``limits`` entry; None if it sets none."""
+        config = config or {}
+        limits = cls(config.get("max_concurrency"), config.get("tokens_per_min"))
+        if limits.max_concurrency is None and limits.tokens_per_min is None:
+            return None
+        return limits
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+class Governor:
+    """Acquire provider call slots from the machine-wide governor file."""
+
+    def __init__(
+        self,
+        path: Path,
+        provider: str,
+        limits: GovernorLimits,
+        job: str | None = None,
+        poll_s: float = 0.05,
+        max_poll_s: float = MAX_POLL_S,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.provider = provider
+        self.limits = limits
+        self.pid = os.getpid()
+        self.job = job or f"pid-{self.pid}"
+        self.poll_s = poll_s
+        self.max_poll_s = max(max_poll_s, poll_s)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+
+        # Session stats
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.wait_s = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode; transactions are opened explicitly with BEGIN IMMEDIATE.
+        # Only the creating thread uses it; close() may run on another.
+        return sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def close(self):
+        """Close every thread's connection (the governor can't be used afterwards)."""
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @contextmanager
+    def slot(self, tokens: int = 0):
+        """Hold one call slot reserving ``tokens``; yields a callback for the call's actual tokens."""
+        t0 = time.perf_counter()
+        waiter = f"{self.job}:{threading.get_ident()}"
+        conn = self._conn()
+        delay = self.poll_s
+        while True:
+            now = time.time()
+            with self._transaction(conn):
+                self._purge(conn, now)
+                slot_id = self._try_take(conn, tokens, now)
+                if slot_id is None:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO waiters VALUES (?, ?, ?, ?, ?)",
+                        (self.provider, waiter, self.job, self.pid, now),
+                    )
+                else:
+                    conn.execute("DELETE FROM waiters WHERE provider = ? AND waiter = ?", (self.provider, waiter))
+            if slot_id is not None:
+                break
+            time.sleep(delay * (0.5 + random.random()))
+            delay = min(delay * 2, self.max_poll_s)
+        with self._lock:
+            self.calls += 1
+            self.wait_s += time.perf_counter() - t0
+
+        settled = []
+        try:
+            yield settled.append
+        finally:
+            with self._transaction(conn):
+                conn.execute("DELETE FROM slots WHERE id = ?", (slot_id,))
+                if settled:
+                    conn.execute("INSERT INTO usage VALUES (?, ?, ?)", (self.provider, time.time(), settled[0]))
+
+    def _purge(self, conn: sqlite3.Connection, now: float):
+        """Drop rows of dead processes, stale waiters and usage outside the token window."""
+        pids = {
+            pid
+            for (pid,) in conn.execute("SELECT pid FROM slots UNION SELECT pid FROM waiters").fetchall()
+            if pid != self.pid
+        }
+        for pid in pids:
+            if not _alive(pid):
+                conn.execute("DELETE FROM slots WHERE pid = ?", (pid,))
+                conn.execute("DELETE FROM waiters WHERE pid = ?", (pid,))
+        conn.execute("DELETE FROM slots WHERE acquired_at < ?", (now - SLOT_TTL_S,))
+        conn.execute("DELETE FROM waiters WHERE seen_at < ?", (now - WAITER_TTL_S,))
+        conn.execute("DELETE FROM usage WHERE at < ?", (now - TOKEN_WINDOW_S,))
+
+    def _try_take(self, conn: sqlite3.Connection, tokens: int, now: float) -> int | None:
+        """Insert a slot row if the limits and this job's fair share allow it."""
+        held = {
+            job: (count, reserved)
+            for job, count, reserved in conn.execute(
+                "SELECT job, COUNT(*), SUM(tokens) FROM slots WHERE provider = ? GROUP BY job", (self.provider,)
+            )
+        }
+        waiting = {
+            job
+            for (job,) in conn.execute("SELECT DISTINCT job FROM waiters WHERE provider = ?", (self.provider,))
+        }
+        others_waiting = bool(waiting - {self.job})
+        jobs = len(set(held) | waiting | {self.job})
+        my_count, my_reserved = held.get(self.job, (0, 0))
+
+        cap = self.limits.max_concurrency
+        if cap is not None:
+            if sum(count for count, _ in held.values()) >= cap:
+                return None
+            if others_waiting and my_count >= max(1, cap // jobs):
+                return None
+
+        tpm = self.limits.tokens_per_min
+        if tpm is not None:
+            (used,) = conn.execute(
+                "SELECT COALESCE(SUM(tokens), 0) FROM usage WHERE provider = ?", (self.provider,)
+            ).fetchone()
+            committed = used + sum(reserved for _, reserved in held.values())
+            # A single call bigger than the limit still runs, alone, rather than never
+            if committed and committed + tokens > tpm:
+                return None
+            if others_waiting and my_count and my_reserved + tokens > tpm / jobs:
+                return None
+
+        cur = conn.execute(
+            "INSERT INTO slots (provider, job, pid, tokens, acquired_at) VALUES (?, ?, ?, ?, ?)",
+            (self.provider, self.job, self.pid, tokens, now),
+        )
+        return cur.lastrowid
+
+    def snapshot(self) -> dict:
+        """In-flight calls and reserved tokens by job, plus waiting jobs and last-minute usage."""
+        conn = self._conn()
+        rows = conn.execute(
+            "SELECT job, COUNT(*), SUM(tokens) FROM slots WHERE provider = ? GROUP BY job", (self.provider,)
+        ).fetchall()
+        waiting = conn.execute(
+            "SELECT job, COUNT(*) FROM waiters WHERE provider = ? GROUP BY job", (self.provider,)
+        ).fetchall()
+        (used,) = conn.execute(
+            "SELECT COALESCE(SUM(tokens), 0) FROM usage WHERE provider = ? AND at >= ?",
+            (self.provider, time.time() - TOKEN_WINDOW_S),
+        ).fetchone()
+        return {
+            "in_flight": {job: {"calls": n, "tokens": t} for job, n, t in rows},
+            "waiting": dict(waiting),
+            "tokens_last_min": used,
+        }
+
+
+class GovernedProvider(BaseProvider):
+    """Route a provider's calls through the machine-wide Governor."""
+
+    def __init__(self, inner: BaseProvider, governor: Governor):
+        super().__init__(inner.api_key, inner.model_id)
+        self.inner = inner
+        self.governor = governor
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    def generate(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        seed: int | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        reserve = self.inner.estimate_tokens("".join(m.content for m in messages))
+        reserve += max_tokens or DEFAULT_MAX_OUTPUT_TOKENS
+        with self.governor.slot(reserve) as settle:
+            response = self.inner.generate(messages, temperature=temperature, seed=seed, max_tokens=max_tokens)
+            settle(response.usage.total_tokens if response.usage else reserve)
+            return response
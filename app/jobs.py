@@ -0,0 +1,255 @@
+"""Background jobs: pipeline phases run on threads inside a long-lived process (the Streamlit server).
+
+A job is a function taking a ``JobProgress``. Runners report to it as items
+complete (``update``) and stop submitting work once the job is ``cancelled``;
+in-flight calls finish and whatever was written so far stays on disk. Progress
+is published as structured ``JobEvent``s (started, progress with done/total,
+tokens, cost and ETA, then done/failed/cancelled) that a UI drains on each
+refresh, so nothing depends on the wording of printed progress lines.
+
+``cli_job`` wraps a CLI command line, so a job does exactly what the same
+command does in a terminal without starting a new interpreter. What the job's
+thread prints is kept in the job's ``log`` instead of the server's stdout.
+"""
+
+import itertools
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+MAX_EVENTS = 10_000  # Undrained events kept per job (oldest dropped first)
+MAX_LOG_LINES = 2_000
+
+
+@dataclass
+class JobEvent:
+    job_id: str
+    kind: str  # started | progress | done | failed | cancelled
+    ts: float
+    phase: str | None = None
+    done: int | None = None
+    total: int | None = None
+    failed: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+    eta_s: float | None = None
+    message: str | None = None
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class JobProgress:
+    """Passed to a job's function (and on to runners as ``progress``): report progress, check for cancel."""
+
+    def __init__(self, job: "Job"):
+        self._job = job
+        self._phase_started: dict[str, float] = {}
+
+    @property
+    def job_id(self) -> str:
+        return self._job.id
+
+    @property
+    def cancelled(self) -> bool:
+        return self._job._cancel.is_set()
+
+    def update(
+        self,
+        phase: str,
+        done: int,
+        total: int | None = None,
+        failed: int = 0,
+        tokens: int = 0,
+        cost: float = 0.0,
+    ):
+        """Publish a progress event; the ETA extrapolates from the phase's first update."""
+        now = time.monotonic()
+        started = self._phase_started.setdefault(phase, now)
+        eta = (now - started) / done * (total - done) if total and done else None
+        self._job._publish(
+            "progress", phase=phase, done=done, total=total, failed=failed, tokens=tokens, cost=cost, eta_s=eta
+        )
+
+
+class Job:
+    """One background job: its state, undrained events, latest progress per phase and output log."""
+
+    def __init__(self, job_id: str, name: str, fn: Callable[[JobProgress], object]):
+        self.id = job_id
+        self.name = name
+        self.state = "queued"
+        self.error: str | None = None
+        self.result = None
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.latest: dict[str, JobEvent] = {}  # Latest progress event per phase
+        self.log: deque[str] = deque(maxlen=MAX_LOG_LINES)
+        self._events: deque[JobEvent] = deque(maxlen=MAX_EVENTS)
+        self._lock = threading.Lock()
+        self._partial = ""
+        self._cancel = threading.Event()
+        self._fn = fn
+        self._thread = threading.Thread(target=self._run, name=f"job-{job_id}", daemon=True)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ("done", "failed", "cancelled")
+
+    def cancel(self):
+        """Ask the job to stop submitting work; it ends as "cancelled" once in-flight calls finish."""
+        self._cancel.set()
+
+    def drain(self) -> list[JobEvent]:
+        """Events published since the last drain, oldest first."""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the job finishes (or ``timeout``); True if it has."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _publish(self, kind: str, **fields):
+        event = JobEvent(self.id, kind, time.time(), **fields)
+        with self._lock:
+            self._events.append(event)
+            if kind == "progress":
+                self.latest[event.phase] = event
+
+    def _write(self, text: str):
+        with self._lock:
+            lines = (self._partial + text).split("\n")
+            self._partial = lines.pop()
+            self.log.extend(lines)
+
+    def _run(self):
+        self.state = "running"
+        self.started_at = time.time()
+        self._publish("started", message=self.name)
+        _OUTPUT.attach(self)
+        try:
+            self.result = self._fn(JobProgress(self))
+        except SystemExit as e:  # CLI commands exit on bad input
+            if e.code not in (None, 0):
+                self.error = f"exited with status {e.code}"
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            _OUTPUT.detach(self)
+            if self._partial:
+                self._write("\n")
+        self.finished_at = time.time()
+        if self.error is not None:
+            self.state = "failed"
+        elif self._cancel.is_set():
+            self.state = "cancelled"
+        else:
+            self.state = "done"
+        self._publish(self.state, message=self.error)
+
+
+class _ThreadOutput:
+    """Stand-in for sys.stdout/sys.stderr that sends a job thread's writes to its job's log."""
+
+    def __init__(self):
+        self._jobs: dict[int, Job] = {}
+        self._lock = threading.Lock()
+        self._stdout = self._stderr = None
+
+    def attach(self, job: Job):
+        with self._lock:
+            # (Re)install if something else has replaced the streams since
+            if not isinstance(sys.stdout, _Stream):
+                self._stdout, sys.stdout = sys.stdout, _Stream(self, "_stdout")
+            if not isinstance(sys.stderr, _Stream):
+                self._stderr, sys.stderr = sys.stderr, _Stream(self, "_stderr")
+            self._jobs[threading.get_ident()] = job
+
+    def detach(self, job: Job):
+        with self._lock:
+            self._jobs.pop(threading.get_ident(), None)
+
+    def job(self) -> Job | None:
+        return self._jobs.get(threading.get_ident())
+
+
+class _Stream:
+    def __init__(self, output: _ThreadOutput, attr: str):
+        self._output = output
+        self._attr = attr
+
+    def write(self, text: str) -> int:
+        job = self._output.job()
+        if job is None:
+            return getattr(self._output, self._attr).write(text)
+        job._write(text)
+        return len(text)
+
+    def flush(self):
+        if self._output.job() is None:
+            getattr(self._output, self._attr).flush()
+
+    def __getattr__(self, name):
+        return getattr(getattr(self._output, self._attr), name)
+
+
+_OUTPUT = _ThreadOutput()
+
+
+class JobManager:
+    """Start, list and cancel background jobs; one instance is shared by every UI session."""
+
+    def __init__(self, max_finished: int = 50):
+        self.max_finished = max_finished
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+
+    def submit(self, name: str, fn: Callable[[JobProgress], object]) -> Job:
+        """Start ``fn(progress)`` on a new thread and return its Job."""
+        with self._lock:
+            job = Job(f"job-{next(self._seq):04d}", name, fn)
+            self._jobs[job.id] = job
+            finished = [j for j in self._jobs.values() if j.finished]
+            for old in finished[: max(0, len(finished) - self.max_finished)]:
+                del self._jobs[old.id]
+        job._thread.start()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> list[Job]:
+        """Every job still tracked, newest first."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+    def running(self) -> list[Job]:
+        return [j for j in self.jobs() if not j.finished]
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.cancel()
+        return True
+
+
+def cli_job(argv: list[str]) -> Callable[[JobProgress], None]:
+    """A job function running ``python -m app.cli <argv>`` in-process, reporting to the job's progress."""
+
+    def run(progress: JobProgress):
+        from . import cli
+
+        args = cli.build_parser().parse_args(argv)
+        args.progress = progress
+        cli.run(args)
+
+    return run
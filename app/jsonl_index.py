@@ -0,0 +1,220 @@
+"""Byte-offset index for random access into JSONL datasets such as transcripts.jsonl."""
+
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS records (
+    key TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+"""
+
+_HEAD_BYTES = 64 * 1024  # Prefix hashed to tell an append from a rewrite
+_SQL_BATCH = 500  # Keys per IN (...) query
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_state(path: Path) -> dict:
+    """Size, mtime, inode and head hash of a file, as stored in index ``meta`` tables."""
+    path = Path(path)
+    if not path.exists():
+        return {"size": "0", "mtime_ns": "0", "inode": "0", "head": _sha256(b"")}
+    st = path.stat()
+    with open(path, "rb") as f:
+        head = f.read(_HEAD_BYTES)
+    return {"size": str(st.st_size), "mtime_ns": str(st.st_mtime_ns), "inode": str(st.st_ino), "head": _sha256(head)}
+
+
+def only_appended(path: Path, old: dict, new: dict) -> bool:
+    """True if the file only grew since ``old`` (a ``file_state``) was recorded."""
+    if not old or old["inode"] != new["inode"] or int(new["size"]) < int(old["size"]):
+        return False
+    if int(old["size"]) >= _HEAD_BYTES:
+        return old["head"] == new["head"]
+    # Small file: the old content is all head, compare it directly
+    with open(path, "rb") as f:
+        return _sha256(f.read(int(old["size"]))) == old["head"]
+
+
+class JsonlIndex:
+    """``key → (byte offset, length, SHA-256)`` for a JSONL file, in a SQLite sidecar.
+
+    The sidecar (``transcripts.index.sqlite`` next to ``transcripts.jsonl``) stores the
+    file's size, mtime, inode and a hash of its head. Every read checks them: a file that
+    only grew is indexed from the old end, anything else is re-indexed in full. Writers
+    that go through ``write_jsonl`` keep the index current without a rescan. Records are
+    read through mmap at their offsets and checked against their hash; lines without the
+    key field are skipped, and a repeated key points at its last line.
+    """
+
+    def __init__(self, path: Path, key: str = "call_id"):
+        self.path = Path(path)
+        self.key = key
+        self.index_path = self.path.with_name(f"{self.path.stem}.index.sqlite")
+
+    # -------------------- Reading --------------------
+
+    def get(self, key: str) -> dict | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, dict]:
+        """Records for the given keys (missing keys are absent from the result)."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        for attempt in range(2):
+            rows = []
+            with self._connect() as conn:
+                for i in range(0, len(keys), _SQL_BATCH):
+                    batch = keys[i : i + _SQL_BATCH]
+                    rows += conn.execute(
+                        f"SELECT key, offset, length, sha256 FROM records WHERE key IN ({','.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+            try:
+                return self._read(sorted(rows, key=lambda r: r[1]))
+            except ValueError:
+                if attempt:
+                    raise
+                self.rebuild()  # Changed underneath us within the same mtime tick
+        return {}
+
+    def keys(self) -> list[str]:
+        """All keys, sorted."""
+        with self._connect() as conn:
+            return [k for (k,) in conn.execute("SELECT key FROM records ORDER BY key")]
+
+    def first(self, limit: int) -> list[dict]:
+        """The records with the lowest keys (e.g. a stable sample of transcripts)."""
+        with self._connect() as conn:
+            keys = [k for (k,) in conn.execute("SELECT key FROM records ORDER BY key LIMIT ?", (limit,))]
+        found = self.get_many(keys)
+        return [found[k] for k in keys if k in found]
+
+    def digest(self) -> str:
+        """SHA-256 over every key and record hash, in key order (changes with any record's content)."""
+        h = hashlib.sha256()
+        with self._connect() as conn:
+            for key, digest in conn.execute("SELECT key, sha256 FROM records ORDER BY key"):
+                h.update(f"{key}\0{digest}\n".encode())
+        return h.hexdigest()
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def _read(self, rows: list[tuple]) -> dict[str, dict]:
+        if not rows:
+            return {}
+        found = {}
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for key, offset, length, digest in rows:
+                data = mm[offset : offset + length]
+                if _sha256(data) != digest:
+                    raise ValueError(f"{self.path}: record {key!r} changed since it was indexed")
+                found[key] = json.loads(data)
+        return found
+
+    # -------------------- Maintenance --------------------
+
+    @contextmanager
+    def _connect(self):
+        """Connection to an index that is current for the file (refreshed if needed)."""
+        with closing(sqlite3.connect(self.index_path)) as conn:
+            conn.executescript(_SCHEMA)
+            meta = dict(conn.execute("SELECT name, value FROM meta"))
+            stat = self._stat()
+            if meta != stat:
+                if self._appended(meta, stat):
+                    self._scan(conn, int(meta["size"]))
+                else:
+                    conn.execute("DELETE FROM records")
+                    self._scan(conn, 0)
+                self._store_meta(conn, stat)
+                conn.commit()
+            yield conn
+
+    def rebuild(self):
+        """Re-index the whole file."""
+        with closing(sqlite3.connect(self.index_path)) as conn:
+            conn.executescript(_SCHEMA)
+            conn.execute("DELETE FROM records")
+            self._scan(conn, 0)
+            self._store_meta(conn, self._stat())
+            conn.commit()
+
+    def _stat(self) -> dict:
+        return file_state(self.path)
+
+    def _appended(self, old: dict, new: dict) -> bool:
+        return only_appended(self.path, old, new)
+
+    def _scan(self, conn: sqlite3.Connection, start: int):
+        """Index every line from byte ``start`` to the end of the file."""
+        if not self.path.exists():
+            return
+        rows = []
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                record = line.rstrip(b"\r\n")
+                if record.strip():
+                    try:
+                        key = json.loads(record).get(self.key)
+                    except (json.JSONDecodeError, AttributeError):
+                        key = None
+                    if key is not None:
+                        rows.append((str(key), offset, len(record), _sha256(record)))
+                offset += len(line)
+        conn.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)", rows)
+
+    def _store_meta(self, conn: sqlite3.Connection, stat: dict):
+        conn.execute("DELETE FROM meta")
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", stat.items())
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Records of a JSONL file, one line at a time (blank lines skipped)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_jsonl(path: Path, records: Iterable[dict], key: str = "call_id") -> JsonlIndex:
+    """Write records as JSONL and record their offsets in the index as they are written."""
+    path = Path(path)
+    index = JsonlIndex(path, key)
+    rows = []
+    offset = 0
+    with open(path, "wb") as f:
+        for record in records:
+            data = json.dumps(record, ensure_ascii=False).encode()
+            if record.get(key) is not None:
+                rows.append((str(record[key]), offset, len(data), _sha256(data)))
+            f.write(data + b"\n")
+            offset += len(data) + 1
+        f.flush()
+        os.fsync(f.fileno())
+
+    with closing(sqlite3.connect(index.index_path)) as conn:
+        conn.executescript(_SCHEMA)
+        conn.execute("DELETE FROM records")
+        conn.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)", rows)
+        index._store_meta(conn, index._stat())
+        conn.commit()
+    return index
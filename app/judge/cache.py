@@ -0,0 +1,223 @@
+"""Persistent judgment cache: reuse evaluations for byte-identical judge inputs."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS judgments (
+    key TEXT PRIMARY KEY,
+    transcript_hash TEXT NOT NULL,
+    summary_hash TEXT NOT NULL,
+    rubric_hash TEXT NOT NULL,
+    prompt_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    temperature REAL NOT NULL,
+    evaluation TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_judgments_last_used ON judgments(last_used_at);
+"""
+
+_COLUMNS = [
+    "key",
+    "transcript_hash",
+    "summary_hash",
+    "rubric_hash",
+    "prompt_hash",
+    "model",
+    "temperature",
+    "evaluation",
+    "created_at",
+    "last_used_at",
+    "hits",
+]
+
+# Per-call fields that are re-stamped from the current summary on every hit
+_IDENTITY_FIELDS = ("call_id", "evaluation_id", "summary_id", "transcript_id")
+
+
+def content_hash(obj) -> str:
+    """Stable SHA-256 of a JSON-serializable object (or raw string)."""
+    if isinstance(obj, str):
+        data = obj
+    else:
+        data = json.dumps(obj, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class JudgmentKey:
+    """Hash components that uniquely identify a judge call's inputs."""
+
+    def __init__(
+        self,
+        transcript: dict,
+        summary: dict,
+        rubric_config: dict,
+        system_prompt: str,
+        user_template: str,
+        model: str,
+        temperature: float,
+    ):
+        self.transcript_hash = content_hash(transcript)
+        self.summary_hash = content_hash({k: v for k, v in summary.items() if k not in _IDENTITY_FIELDS})
+        self.rubric_hash = content_hash(rubric_config)
+        self.prompt_hash = content_hash(f"{system_prompt}\0{user_template}")
+        self.model = model
+        self.temperature = float(temperature)
+
+    @property
+    def digest(self) -> str:
+        """Combined cache key."""
+        parts = [
+            self.transcript_hash,
+            self.summary_hash,
+            self.rubric_hash,
+            self.prompt_hash,
+            self.model,
+            f"{self.temperature:.4f}",
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class JudgmentCache:
+    """SQLite-backed store of judge evaluations with LRU/age eviction.
+
+    Safe to share across the judge's worker threads; writes are serialized by a lock.
+    """
+
+    def __init__(self, path: Path, max_entries: int | None = None, max_age_days: float | None = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        # Session counters
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: JudgmentKey) -> dict | None:
+        """Return a stored evaluation, or None on miss."""
+        digest = key.digest
+        with self._lock:
+            row = self._conn.execute("SELECT evaluation FROM judgments WHERE key = ?", (digest,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE judgments SET last_used_at = ?, hits = hits + 1 WHERE key = ?", (time.time(), digest)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def contains(self, key: JudgmentKey) -> bool:
+        """Whether an evaluation is stored (no hit counted, recency untouched)."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM judgments WHERE key = ?", (key.digest,)).fetchone()
+        return row is not None
+
+    def put(self, key: JudgmentKey, evaluation: dict):
+        """Store an evaluation (identity fields are kept but re-stamped on read)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO judgments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (
+                    key.digest,
+                    key.transcript_hash,
+                    key.summary_hash,
+                    key.rubric_hash,
+                    key.prompt_hash,
+                    key.model,
+                    key.temperature,
+                    json.dumps(evaluation, ensure_ascii=False),
+                    now,
+                    now,
+                ),
+            )
+            self._conn.commit()
+
+    def evict(self, max_entries: int | None = None, max_age_days: float | None = None) -> int:
+        """Drop entries older than max_age_days, then least-recently-used beyond max_entries."""
+        max_entries = max_entries if max_entries is not None else self.max_entries
+        max_age_days = max_age_days if max_age_days is not None else self.max_age_days
+        removed = 0
+        with self._lock:
+            if max_age_days is not None:
+                cutoff = time.time() - max_age_days * 86400
+                removed += self._conn.execute("DELETE FROM judgments WHERE last_used_at < ?", (cutoff,)).rowcount
+            if max_entries is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM judgments WHERE key NOT IN "
+                    "(SELECT key FROM judgments ORDER BY last_used_at DESC LIMIT ?)",
+                    (max_entries,),
+                ).rowcount
+            self._conn.commit()
+        return removed
+
+    def stats(self) -> dict:
+        """Entry count, total stored hits and on-disk size."""
+        with self._lock:
+            count, hits, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0), MIN(created_at), MAX(last_used_at) FROM judgments"
+            ).fetchone()
+            models = dict(self._conn.execute("SELECT model, COUNT(*) FROM judgments GROUP BY model").fetchall())
+        return {
+            "path": str(self.path),
+            "entries": count,
+            "lifetime_hits": hits,
+            "oldest_created_at": oldest,
+            "newest_used_at": newest,
+            "by_model": models,
+            "size_bytes": self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def export_jsonl(self, out_file: Path) -> int:
+        """Write every entry as one JSON line; returns the number exported."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM judgments").fetchall()
+        with open(out_file, "w") as f:
+            for row in rows:
+                record = dict(zip(_COLUMNS, row))
+                record["evaluation"] = json.loads(record["evaluation"])
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return len(rows)
+
+    def import_jsonl(self, in_file: Path) -> int:
+        """Merge entries from an export; newer last_used_at wins on conflict."""
+        imported = 0
+        with self._lock, open(in_file) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                record["evaluation"] = json.dumps(record["evaluation"], ensure_ascii=False)
+                existing = self._conn.execute(
+                    "SELECT last_used_at FROM judgments WHERE key = ?", (record["key"],)
+                ).fetchone()
+                if existing and existing[0] >= record["last_used_at"]:
+                    continue
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO judgments ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    [record[c] for c in _COLUMNS],
+                )
+                imported += 1
+            self._conn.commit()
+        return imported
+
+    def close(self):
+        """Apply configured eviction and close the database."""
+        if self.max_entries is not None or self.max_age_days is not None:
+            self.evict()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,192 @@
+"""Evidence-window judging: BM25 over transcript segments, top-k windows per summary field."""
+
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+
+from ..summarize.schema import CallSummary
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Function words carry no retrieval signal and would match every segment
+_STOPWORDS = set(
+    "a an and are as at be been but by can could did do does for from had has have he her his i if in into "
+    "is it its me my no not of on or our she so that the their them they this to was we were what when "
+    "which who will with would you your".split()
+)
+
+# Summary fields retrieved against (every CallSummary field except the ID)
+EVIDENCE_FIELDS = [name for name in CallSummary.model_fields if name != "call_id"]
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word/number tokens without stopwords."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 over a small in-memory document list (one transcript's segments)."""
+
+    def __init__(self, docs: list[list[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.tfs = [Counter(doc) for doc in docs]
+        self.lengths = [len(doc) for doc in docs]
+        self.avg_len = sum(self.lengths) / len(docs) if docs else 0.0
+        df = Counter(term for tf in self.tfs for term in tf)
+        n = len(docs)
+        self.idf = {term: math.log(1 + (n - d + 0.5) / (d + 0.5)) for term, d in df.items()}
+
+    def scores(self, query: list[str]) -> list[float]:
+        """BM25 score of every document for a tokenized query."""
+        terms = [t for t in set(query) if t in self.idf]
+        out = []
+        for tf, length in zip(self.tfs, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / self.avg_len) if self.avg_len else self.k1
+            out.append(sum(self.idf[t] * tf[t] * (self.k1 + 1) / (tf[t] + norm) for t in terms if t in tf))
+        return out
+
+
+@dataclass
+class EvidenceConfig:
+    """Retrieval knobs for evidence-window judging."""
+
+    top_k: int = 3  # Segments retrieved per summary field
+    window: int = 1  # Neighbouring segments kept on each side of a hit
+    min_confidence: float = 0.6  # Min share of a field's transcript terms found in its windows
+    max_fraction: float = 0.8  # Send the full transcript if windows cover more than this
+
+
+@dataclass
+class EvidenceSelection:
+    """Segments chosen for one transcript/summary pair."""
+
+    indices: list[int]
+    total: int
+    fields: dict[str, list[int]] = field(default_factory=dict)
+    confidence: dict[str, float] = field(default_factory=dict)
+    fallback: str | None = None  # Reason the full transcript is sent instead
+
+    def to_dict(self) -> dict:
+        return {
+            "segments_sent": self.total if self.fallback else len(self.indices),
+            "segments_total": self.total,
+            "fallback": self.fallback,
+        }
+
+
+class EvidenceSelector:
+    """Pick the transcript windows that support each summary field.
+
+    Each ``CallSummary`` field is a BM25 query over the transcript's segments; the
+    top-k hits plus ``window`` neighbours on each side are sent to the judge with
+    their timestamps. When a field's terms occur in the transcript but mostly
+    outside its windows, retrieval is low-confidence and the full transcript is
+    sent instead.
+    """
+
+    def __init__(self, config: EvidenceConfig | None = None):
+        self.config = config or EvidenceConfig()
+        self._lock = threading.Lock()
+
+        # Session stats
+        self.evaluations = 0
+        self.fallbacks: Counter = Counter()
+        self.segments_sent = 0
+        self.segments_total = 0
+        self.chars_sent = 0
+        self.chars_full = 0
+
+    def select(self, transcript: dict, summary: dict) -> EvidenceSelection:
+        """Retrieve evidence windows for every summary field."""
+        cfg = self.config
+        segments = [seg for seg in transcript.get("segments", []) if isinstance(seg, dict)]
+        total = len(segments)
+        if total == 0:
+            return EvidenceSelection([], 0, fallback="no segments")
+
+        index = BM25Index([tokenize(str(seg.get("text", ""))) for seg in segments])
+        selection = EvidenceSelection([], total)
+        chosen: set[int] = set()
+        for name in EVIDENCE_FIELDS:
+            query = tokenize(str(summary.get(name) or ""))
+            if not query:
+                continue
+            scores = index.scores(query)
+            hits = sorted((i for i in range(total) if scores[i] > 0), key=lambda i: -scores[i])[: cfg.top_k]
+            windows = sorted(
+                {j for i in hits for j in range(max(0, i - cfg.window), min(total, i + cfg.window + 1))}
+            )
+            # Confidence: share of the field's transcript-grounded terms that its windows contain.
+            # Paraphrase and unsupported claims have no terms in the transcript and cost nothing.
+            terms = {t for t in query if t in index.idf}
+            if not terms:
+                continue
+            covered = set().union(*(index.tfs[j].keys() for j in windows))
+            selection.fields[name] = hits
+            selection.confidence[name] = len(terms & covered) / len(terms)
+            chosen.update(windows)
+
+        selection.indices = sorted(chosen)
+        low = [name for name, c in selection.confidence.items() if c < cfg.min_confidence]
+        if low:
+            selection.fallback = f"low confidence: {', '.join(low)}"
+        elif not selection.indices:
+            selection.fallback = "no matching segments"
+        elif len(selection.indices) > cfg.max_fraction * total:
+            selection.fallback = "windows cover most of the transcript"
+        return selection
+
+    def prompt_transcript(self, transcript: dict, selection: EvidenceSelection) -> dict:
+        """The transcript as shown to the judge: evidence windows, or the full transcript on fallback."""
+        if selection.fallback:
+            return transcript
+        segments = transcript.get("segments", [])
+        by_segment: dict[int, list[str]] = {}
+        for name, hits in selection.fields.items():
+            for i in hits:
+                by_segment.setdefault(i, []).append(name)
+        excerpt = [
+            {**segments[i], "supports": by_segment[i]} if i in by_segment else segments[i]
+            for i in selection.indices
+        ]
+        return {
+            "call_id": transcript.get("call_id"),
+            "lob": transcript.get("lob"),
+            "metadata": transcript.get("metadata", {}),
+            "note": (
+                f"Excerpt: {len(excerpt)} of {selection.total} segments, chosen as evidence for the summary fields "
+                "(see 'supports'); gaps between timestamps are omitted segments."
+            ),
+            "segments": excerpt,
+        }
+
+    def record(self, selection: EvidenceSelection, chars_sent: int, chars_full: int):
+        """Fold one selection into the session stats."""
+        with self._lock:
+            self.evaluations += 1
+            if selection.fallback:
+                self.fallbacks[selection.fallback.split(":")[0]] += 1
+            sent = selection.to_dict()
+            self.segments_sent += sent["segments_sent"]
+            self.segments_total += sent["segments_total"]
+            self.chars_sent += chars_sent
+            self.chars_full += chars_full
+
+    def stats(self) -> dict:
+        """Serializable session stats (written to evidence.json)."""
+        return {
+            "evaluations": self.evaluations,
+            "top_k": self.config.top_k,
+            "window": self.config.window,
+            "min_confidence": self.config.min_confidence,
+            "fallbacks": sum(self.fallbacks.values()),
+            "fallback_reasons": dict(self.fallbacks),
+            "segments_sent": self.segments_sent,
+            "segments_total": self.segments_total,
+            "transcript_chars_sent": self.chars_sent,
+            "transcript_chars_full": self.chars_full,
+            "transcript_reduction": 1 - self.chars_sent / self.chars_full if self.chars_full else None,
+        }
@@ -0,0 +1,78 @@
+"""Lean (two-tier) judging: scores-only first pass, rationales fetched on demand."""
+
+import threading
+from pathlib import Path
+
+from ..audit import iter_calls
+
+# Output budgets: a scores-only JSON object is ~60-120 tokens
+LEAN_MAX_TOKENS = 256
+RATIONALE_MAX_TOKENS = 1024
+
+
+class LeanJudgeStats:
+    """Per-pass call, output-token and latency totals for a lean judge run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.passes = {
+            "scores": {"calls": 0, "output_tokens": 0, "latency_ms": 0.0},
+            "rationales": {"calls": 0, "output_tokens": 0, "latency_ms": 0.0},
+        }
+        self.evaluations = 0
+        self.wall_s = 0.0
+
+    def record(self, pass_name: str, response):
+        """Fold one provider response into a pass's totals."""
+        with self._lock:
+            stats = self.passes[pass_name]
+            stats["calls"] += 1
+            stats["output_tokens"] += response.usage.completion_tokens if response.usage else 0
+            stats["latency_ms"] += response.latency_ms
+
+    def to_dict(self, reference: dict | None = None) -> dict:
+        """Serializable totals; with a full-mode reference, include the per-run reduction."""
+        out_tokens = sum(p["output_tokens"] for p in self.passes.values())
+        latency_ms = sum(p["latency_ms"] for p in self.passes.values())
+        result = {
+            "evaluations": self.evaluations,
+            "passes": self.passes,
+            "output_tokens": out_tokens,
+            "latency_ms": latency_ms,
+            "wall_s": self.wall_s,
+            "reference": reference,
+            "reduction": None,
+        }
+        if reference and self.evaluations:
+            expected_tokens = reference["output_tokens_per_call"] * self.evaluations
+            expected_latency = reference["latency_ms_per_call"] * self.evaluations
+            result["reduction"] = {
+                "output_tokens": 1 - out_tokens / expected_tokens if expected_tokens else None,
+                "latency": 1 - latency_ms / expected_latency if expected_latency else None,
+            }
+        return result
+
+
+def full_judge_reference(runs_root: Path, exclude: Path | None = None) -> dict | None:
+    """Average output tokens and latency of full-mode judge calls in the most recent run that has them."""
+    if not runs_root.exists():
+        return None
+    for run_dir in sorted([d for d in runs_root.iterdir() if d.is_dir()], reverse=True):
+        if exclude is not None and run_dir.resolve() == exclude.resolve():
+            continue
+        calls = tokens = 0
+        latency = 0.0
+        for record in iter_calls(run_dir / "calls.jsonl"):
+            if record.get("phase") != "judge" or record.get("status") != "ok":
+                continue
+            calls += 1
+            tokens += (record.get("usage") or {}).get("completion_tokens", 0)
+            latency += record.get("latency_ms") or 0.0
+        if calls:
+            return {
+                "run": run_dir.name,
+                "calls": calls,
+                "output_tokens_per_call": tokens / calls,
+                "latency_ms_per_call": latency / calls,
+            }
+    return None
@@ -0,0 +1,221 @@
+"""Deterministic pre-judge checks: catch invalid summaries and unsupported entities before the LLM."""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from ..summarize.schema import CallSummary
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_ENTITY_RE = re.compile(r"[A-Za-z0-9$#][A-Za-z0-9$#/.:,\-]*")
+_DIGITS_RE = re.compile(r"\d+(?:,\d{3})*(?:\.\d+)?")
+
+# Spelled-out numbers and month names that transcripts use instead of digits
+_NUMBER_WORDS = {
+    w: str(i)
+    for i, w in enumerate(
+        "zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen "
+        "fifteen sixteen seventeen eighteen nineteen twenty".split()
+    )
+}
+_NUMBER_WORDS.update(
+    {"thirty": "30", "forty": "40", "fifty": "50", "sixty": "60", "seventy": "70", "eighty": "80",
+     "ninety": "90", "hundred": "100", "thousand": "1000"}
+)
+_NUMBER_WORDS.update(
+    {w: str(i) for i, w in enumerate(
+        "first second third fourth fifth sixth seventh eighth ninth tenth".split(), 1)}
+)
+_NUMBER_WORDS.update(
+    {m: str(i) for i, m in enumerate(
+        "january february march april may june july august september october november december".split(), 1)}
+)
+
+# Summary fields that must never be empty (besides call_id)
+_REQUIRED_FIELDS = [name for name in CallSummary.model_fields if name != "call_id"]
+_ID_FIELDS = {"call_id", "summary_id", "transcript_id"}
+
+
+def _norm_number(group: str) -> str | None:
+    """Normalize a digit group ("1,250" -> "1250", "007" -> "7"); all-zero groups carry no signal."""
+    group = group.replace(",", "")
+    if "." in group:
+        whole, frac = group.split(".", 1)
+        frac = frac.rstrip("0")
+        group = f"{whole.lstrip('0') or '0'}.{frac}" if frac else whole
+    group = group.lstrip("0")
+    return group or None
+
+
+def _norm_entity(token: str) -> str:
+    return token.strip(".,:;-").lstrip("$#").lower()
+
+
+class TranscriptIndex:
+    """Token, number and ID sets over a transcript's segments for O(1) support lookups."""
+
+    def __init__(self, transcript: dict):
+        self.call_id = transcript.get("call_id")
+        self.words: set[str] = set()
+        self.numbers: set[str] = set()
+        self.entities: set[str] = set()
+
+        texts = [str(seg.get("text", "")) for seg in transcript.get("segments", []) if isinstance(seg, dict)]
+        texts.append(str(transcript.get("lob", "")))
+        for text in texts:
+            self._add(text)
+        # Segment timestamps and call duration support statements about timing
+        for seg in transcript.get("segments", []):
+            if isinstance(seg, dict):
+                self._add_numbers(str(seg.get("t", "")))
+        duration = (transcript.get("metadata") or {}).get("duration_s")
+        if isinstance(duration, int):
+            self.numbers.add(str(duration))
+            minutes, seconds = divmod(duration, 60)
+            self.numbers.update(n for n in (_norm_number(str(minutes)), _norm_number(str(seconds))) if n)
+
+    def _add(self, text: str):
+        lowered = text.lower()
+        for word in _WORD_RE.findall(lowered):
+            self.words.add(word)
+            if word in _NUMBER_WORDS:
+                self.numbers.add(_NUMBER_WORDS[word])
+        for token in _ENTITY_RE.findall(text):
+            if any(c.isdigit() for c in token):
+                self.entities.add(_norm_entity(token))
+        self._add_numbers(text)
+
+    def _add_numbers(self, text: str):
+        for group in _DIGITS_RE.findall(text):
+            normalized = _norm_number(group)
+            if normalized:
+                self.numbers.add(normalized)
+
+    def supports(self, token: str) -> bool:
+        """True if a numeric/ID token from a summary is grounded in the transcript."""
+        if _norm_entity(token) in self.entities:
+            return True
+        groups = [n for n in (_norm_number(g) for g in _DIGITS_RE.findall(token)) if n]
+        return all(g in self.numbers for g in groups)
+
+
+@dataclass
+class PreJudgeResult:
+    """Outcome of the rule checks for one summary."""
+
+    hard_failures: list[str] = field(default_factory=list)
+    hallucination_flags: list[str] = field(default_factory=list)
+
+    @property
+    def would_fail(self) -> bool:
+        return bool(self.hard_failures or self.hallucination_flags)
+
+    def to_dict(self) -> dict:
+        return {"hard_failures": self.hard_failures, "hallucination_flags": self.hallucination_flags}
+
+
+class PreJudge:
+    """Rule-based stage between SummarizeRunner and JudgeRunner.
+
+    Flags numbers, dates and IDs in the summary that never appear in the transcript,
+    and marks structurally invalid summaries (empty ``action_items``, mismatched
+    ``call_id``, missing schema fields). With ``auto_fail`` the judge skips the LLM
+    call for hard-invalid summaries.
+    """
+
+    def __init__(self, auto_fail: bool = False, max_indexes: int = 256):
+        self.auto_fail = auto_fail
+        # Recently used transcript indexes (a sweep checks several summaries per transcript)
+        self.max_indexes = max_indexes
+        self._indexes: OrderedDict[str, TranscriptIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Session stats
+        self.checked = 0
+        self.hard_invalid = 0
+        self.flagged = 0
+        self.calls_saved = 0
+        self.confusion = {"both_fail": 0, "both_pass": 0, "rules_only_fail": 0, "llm_only_fail": 0}
+
+    def index(self, transcript: dict) -> TranscriptIndex:
+        """Build (or reuse) the index for a transcript; keeps the ``max_indexes`` most recent."""
+        key = transcript.get("call_id")
+        with self._lock:
+            idx = self._indexes.get(key)
+            if idx is not None:
+                self._indexes.move_to_end(key)
+                return idx
+        idx = TranscriptIndex(transcript)
+        with self._lock:
+            self._indexes[key] = idx
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+        return idx
+
+    def check(self, transcript: dict, summary: dict) -> PreJudgeResult:
+        """Run all rules for one transcript/summary pair."""
+        result = PreJudgeResult()
+        idx = self.index(transcript)
+
+        if summary.get("call_id") != transcript.get("call_id"):
+            result.hard_failures.append(
+                f"call_id mismatch: summary {summary.get('call_id')!r} vs transcript {transcript.get('call_id')!r}"
+            )
+        missing = [name for name in _REQUIRED_FIELDS if name not in summary]
+        if missing:
+            result.hard_failures.append(f"missing fields: {', '.join(missing)}")
+        if "action_items" in summary and not str(summary.get("action_items") or "").strip():
+            result.hard_failures.append("empty action_items")
+
+        seen = set()
+        for key, value in summary.items():
+            if key in _ID_FIELDS or not isinstance(value, str):
+                continue
+            for token in _ENTITY_RE.findall(value):
+                token = token.strip(".,:;-")
+                if not any(c.isdigit() for c in token) or token in seen:
+                    continue
+                seen.add(token)
+                if not idx.supports(token):
+                    result.hallucination_flags.append(f"[rule] {key}: '{token}' not found in transcript")
+
+        with self._lock:
+            self.checked += 1
+            if result.hard_failures:
+                self.hard_invalid += 1
+            if result.hallucination_flags:
+                self.flagged += 1
+        return result
+
+    def record_skip(self):
+        """Count an LLM call avoided by auto-failing."""
+        with self._lock:
+            self.calls_saved += 1
+
+    def record_agreement(self, rules_fail: bool, llm_fail: bool):
+        """Compare the rule verdict with the LLM judge's own verdict."""
+        with self._lock:
+            if rules_fail and llm_fail:
+                self.confusion["both_fail"] += 1
+            elif not rules_fail and not llm_fail:
+                self.confusion["both_pass"] += 1
+            elif rules_fail:
+                self.confusion["rules_only_fail"] += 1
+            else:
+                self.confusion["llm_only_fail"] += 1
+
+    def stats(self) -> dict:
+        """Serializable session stats (written to prejudge.json)."""
+        compared = sum(self.confusion.values())
+        agreed = self.confusion["both_fail"] + self.confusion["both_pass"]
+        return {
+            "checked": self.checked,
+            "hard_invalid": self.hard_invalid,
+            "flagged": self.flagged,
+            "auto_fail": self.auto_fail,
+            "calls_saved": self.calls_saved,
+            "compared_with_llm": compared,
+            "agreement": agreed / compared if compared else None,
+            "confusion": dict(self.confusion),
+        }
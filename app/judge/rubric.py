@@ -3,6 +3,8 @@
 import json
 from pathlib import Path
 
+DEFAULT_RUBRIC_PATH = Path(__file__).resolve().parent.parent.parent / "configs" / "rubric.default.json"
+
 
 class Rubric:
     """Load and manage evaluation rubric."""
@@ -14,20 +16,32 @@ class Rubric:
         self.dimensions = self.config["dimensions"]
         self.gates = self.config["gates"]
 
+        # Precomputed once; check_gates runs for every evaluation
+        self._dims = [(d["name"], d["weight"], d["min_threshold"]) for d in self.dimensions]
+        self._total_weight = sum(d["weight"] for d in self.dimensions)
+        self._compiled = None
+
+    def compile(self):
+        """Vectorized form for bulk gate evaluation (see ``app.judge.scoring``)."""
+        if self._compiled is None:
+            from .scoring import CompiledRubric
+
+            self._compiled = CompiledRubric.from_config(self.config)
+        return self._compiled
+
     def check_gates(self, scores: dict[str, float], hallucination_flags: list[str]) -> bool:
         """Check if scores pass gate thresholds."""
         # Compute weighted average
-        total_weight = sum(d["weight"] for d in self.dimensions)
-        weighted_sum = sum(scores.get(d["name"], 0) * d["weight"] for d in self.dimensions)
-        avg_score = weighted_sum / total_weight if total_weight > 0 else 0
+        weighted_sum = sum(scores.get(name, 0) * weight for name, weight, _ in self._dims)
+        avg_score = weighted_sum / self._total_weight if self._total_weight > 0 else 0
 
         # Check avg threshold
         if avg_score < self.gates["avg_threshold"]:
             return False
 
         # Check per-dimension minimums
-        for dim in self.dimensions:
-            if scores.get(dim["name"], 0) < dim["min_threshold"]:
+        for name, _, min_threshold in self._dims:
+            if scores.get(name, 0) < min_threshold:
                 return False
 
         # Check hallucination flags
@@ -1,12 +1,26 @@
 """Judge runner: evaluate summaries against transcripts."""
 
 import json
+import random
+import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
-from ..provider.base import BaseProvider, Message, ProviderError
+from ..audit import iter_calls
+from ..budget import BudgetExceededError, BudgetLedger
+from ..payloads import messages_digest
+from ..provider.base import BaseProvider, Message, ProviderError, Usage
+from ..trace import NULL_TRACER
+from .cache import JudgmentCache, JudgmentKey
+from .evidence import EvidenceSelection, EvidenceSelector
+from .lean import LEAN_MAX_TOKENS, RATIONALE_MAX_TOKENS, LeanJudgeStats
+from .prejudge import PreJudge, PreJudgeResult
 from .rubric import Rubric
+from .sequential import SequentialConfig, SequentialEstimator
 
 
 class JudgeRunner:
@@ -23,6 +37,14 @@ class JudgeRunner:
         model_pricing: dict | None = None,
         temperature: float = 0.7,
         seed: int | None = None,
+        cache: JudgmentCache | None = None,
+        prejudge: PreJudge | None = None,
+        mode: str = "full",
+        lean_reference: dict | None = None,
+        evidence: EvidenceSelector | None = None,
+        tracer=None,
+        budget: BudgetLedger | None = None,
+        progress=None,
     ):
         self.provider = provider
         self.prompts_dir = prompts_dir
@@ -33,89 +55,296 @@ class JudgeRunner:
         self.model_pricing = model_pricing or {}
         self.temperature = temperature
         self.seed = seed
+        self.cache = cache
+        self.prejudge = prejudge
+        self.evidence = evidence
+        self.tracer = tracer or NULL_TRACER
+        self.budget = budget
+        self.progress = progress  # A background job's JobProgress: reports and cancellation
+        if mode not in ("full", "lean"):
+            raise ValueError(f"Unknown judge mode: {mode}")
+        self.mode = mode
+        self.phase = "judge_lean" if mode == "lean" else "judge"
+        self.lean_reference = lean_reference
+        self.lean_stats = LeanJudgeStats() if mode == "lean" else None
+        self.sequential_result: dict | None = None
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Load prompts
         with open(prompts_dir / "judge.system.txt") as f:
             self.system_prompt = f.read().strip()
-        with open(prompts_dir / "judge.user.txt") as f:
+        user_prompt_file = "judge.lean.user.txt" if mode == "lean" else "judge.user.txt"
+        with open(prompts_dir / user_prompt_file) as f:
             self.user_template = f.read().strip()
+        if mode == "lean":
+            with open(prompts_dir / "judge.rationale.user.txt") as f:
+                self.rationale_template = f.read().strip()
 
         # Session tracking
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cost = 0.0
+        self._totals_lock = threading.Lock()
+
+    def _track_usage(self, usage: Usage) -> float | None:
+        """Add a response's tokens (and cost) to the session totals; return the cost."""
+        cost = None
+        if self.cost_calculator and self.model_pricing:
+            cost = self.cost_calculator(usage, self.model_pricing)
+        with self._totals_lock:  # Called from every worker thread
+            self.total_input_tokens += usage.prompt_tokens
+            self.total_output_tokens += usage.completion_tokens
+            if cost:
+                self.total_cost += cost
+        return cost
+
+    def _parse_json(self, text: str) -> dict | None:
+        """Extract a JSON object from model output (fenced or bare); None if unparseable."""
+        raw_text = text.strip()
+
+        # Try to extract JSON from markdown code blocks or find JSON object
+        json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", raw_text, re.DOTALL)
+        if json_match:
+            json_str = json_match.group(1)
+        else:
+            # Try to find the JSON object (stop at first complete object)
+            json_match = re.search(r"\{.*\}", raw_text, re.DOTALL)
+            json_str = json_match.group(0) if json_match else raw_text
+
+        # Attempt to parse JSON with error handling
+        try:
+            return json.loads(json_str)
+        except json.JSONDecodeError:
+            # Try cleaning up common formatting issues
+            try:
+                return json.loads(re.sub(r"\s+", " ", json_str))
+            except json.JSONDecodeError:
+                return None
+
+    def _stamp_ids(self, evaluation: dict, transcript: dict, summary: dict):
+        """Attach call_id, evaluation_id, summary_id and transcript_id for traceability."""
+        evaluation["call_id"] = summary["call_id"]
+
+        # Extract the sequence number from transcript ID (e.g., TRA-20251002_122258-001 -> 001)
+        transcript_id = summary.get("transcript_id", transcript["call_id"])
+        seq_num = transcript_id.split("-")[-1] if "-" in transcript_id else "000"
+        evaluation["evaluation_id"] = f"EVA-{seq_num}"
+        evaluation["summary_id"] = summary.get("summary_id", f"SUM-{seq_num}")
+        evaluation["transcript_id"] = transcript_id
+
+    def _cache_key(self, transcript: dict, summary: dict, model_id: str | None = None) -> JudgmentKey:
+        """Build the judgment cache key for a transcript (as shown to the judge) and summary."""
+        return JudgmentKey(
+            transcript,
+            summary,
+            self.rubric.config,
+            self.system_prompt,
+            self.user_template,
+            model_id or self.provider.model_id,
+            self.temperature,
+        )
 
-    def run(self, transcripts: list[dict], summaries: list[dict], workers: int = 5) -> list[dict]:
-        """Evaluate summaries against transcripts with concurrent workers."""
-        pairs = list(zip(transcripts, summaries))
-        total_pairs = len(pairs)
-        print(f"[judge] Evaluating {total_pairs} summaries with {workers} workers...")
-        evaluations = []
-        completed_count = 0
-
-        def evaluate_one(transcript: dict, summary: dict) -> dict | None:
-            """Evaluate a single summary."""
-            user_prompt = self.user_template.format(
-                rubric=json.dumps(self.rubric.config, indent=2),
-                transcript_json=json.dumps(transcript, indent=2),
-                summary_json=json.dumps(summary, indent=2),
-            )
-
-            messages = [
-                Message(role="system", content=self.system_prompt),
-                Message(role="user", content=user_prompt),
-            ]
+    def judged_calls(self, calls_file: Path) -> set[tuple[str, str]]:
+        """``(model, messages digest)`` of a run's successful calls in this runner's phase and temperature."""
+        return {
+            (r["model"], r["messages_digest_in"])
+            for r in iter_calls(calls_file)
+            if r.get("phase") == self.phase and r.get("status") == "ok" and r.get("temperature") == self.temperature
+        }
+
+    def warm_cache(
+        self, transcript: dict, summary: dict, evaluation: dict, model_id: str, judged: set[tuple[str, str]]
+    ) -> bool:
+        """Store an earlier run's evaluation under the key this runner looks the pair up by.
+
+        The key follows the runner's mode: the lean or full user prompt, and in evidence
+        mode the excerpt the judge is shown. An evaluation is only stored if ``judged``
+        (see ``judged_calls``) holds a call with ``model_id`` and exactly the messages this
+        runner would send now, so verdicts from older prompts, rubrics, other models or
+        another mode are not passed off as current. Rule-failed items and error stubs are
+        not stored; pre-judge flags are stripped, since they are re-applied on every read.
+        """
+        if self.cache is None or evaluation.get("judged_by") == "rules":
+            return False
+        rationales = evaluation.get("rationales") or {}
+        if any(str(r).startswith("ERROR:") for r in rationales.values()):
+            return False
+        shown, _ = self._shown_transcript(transcript, summary)
+        messages = self._messages(json.dumps(shown, indent=2), summary)
+        if (model_id, messages_digest(messages)) not in judged:
+            return False
+        self.cache.put(self._cache_key(shown, summary, model_id), self._verdict(evaluation))
+        return True
+
+    @staticmethod
+    def _verdict(evaluation: dict) -> dict:
+        """The judge's own verdict: an evaluation without the pre-judge flags added on read."""
+        verdict = dict(evaluation)
+        prejudge = verdict.pop("prejudge", None)
+        if prejudge and prejudge.get("hallucination_flags"):
+            rule_flags = prejudge["hallucination_flags"]
+            flags = list(verdict.get("hallucination_flags") or [])
+            verdict["hallucination_flags"] = flags[: max(0, len(flags) - len(rule_flags))]
+        return verdict
+
+    def _apply_gates(self, evaluation: dict, prejudge: PreJudgeResult | None):
+        """Set overall_pass, folding in pre-judge rule flags when that stage is enabled."""
+        if prejudge is not None:
+            flags = evaluation.get("hallucination_flags") or []
+            if not isinstance(flags, list):
+                flags = [str(flags)]
+            llm_pass = self.rubric.check_gates(evaluation.get("scores", {}), flags)
+            self.prejudge.record_agreement(prejudge.would_fail, not llm_pass)
+            evaluation["hallucination_flags"] = flags + prejudge.hallucination_flags
+            evaluation["prejudge"] = prejudge.to_dict()
+
+        evaluation["overall_pass"] = self.rubric.check_gates(
+            evaluation.get("scores", {}), evaluation.get("hallucination_flags", [])
+        )
 
-            try:
-                # Call provider
+    def _rule_failed(self, transcript: dict, summary: dict, prejudge: PreJudgeResult) -> dict:
+        """Fail a hard-invalid summary without an LLM call."""
+        self.prejudge.record_skip()
+        evaluation = {
+            "scores": {},
+            "rationales": {},
+            "hallucination_flags": prejudge.hallucination_flags,
+            "overall_pass": False,
+            "suggested_prompt_changes": [],
+            "judged_by": "rules",
+            "prejudge": prejudge.to_dict(),
+        }
+        self._stamp_ids(evaluation, transcript, summary)
+        return {
+            "evaluation": evaluation,
+            "call_id": summary["call_id"],
+            "pass_emoji": "✗",
+            "avg_score": 0,
+            "tokens": 0,
+            "cost": None,
+            "error": None,
+            "rule_failed": "; ".join(prejudge.hard_failures),
+        }
+
+    def _shown_transcript(self, transcript: dict, summary: dict) -> tuple[dict, EvidenceSelection | None]:
+        """The transcript as the judge sees it: evidence windows in evidence mode, else as-is."""
+        if self.evidence is None:
+            return transcript, None
+        selection = self.evidence.select(transcript, summary)
+        return self.evidence.prompt_transcript(transcript, selection), selection
+
+    def _from_cache(
+        self,
+        transcript: dict,
+        summary: dict,
+        prejudge: PreJudgeResult | None,
+        shown: dict,
+        evidence: EvidenceSelection | None,
+    ) -> dict | None:
+        """Return a result built from a stored evaluation, or None on miss."""
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self._cache_key(shown, summary))
+        if cached is None:
+            return None
+
+        evaluation = dict(cached)
+        self._stamp_ids(evaluation, transcript, summary)
+        if evidence is not None:
+            evaluation["evidence"] = evidence.to_dict()
+        self._apply_gates(evaluation, prejudge)
+        scores = evaluation.get("scores", {})
+        return {
+            "evaluation": evaluation,
+            "call_id": summary["call_id"],
+            "pass_emoji": "✓" if evaluation["overall_pass"] else "✗",
+            "avg_score": sum(scores.values()) / len(scores) if scores else 0,
+            "tokens": 0,
+            "cost": None,
+            "error": None,
+            "cached": True,
+        }
+
+    @property
+    def max_tokens(self) -> int:
+        """Output cap for the scoring call."""
+        return LEAN_MAX_TOKENS if self.mode == "lean" else 2048
+
+    def _messages(self, transcript_json: str, summary: dict) -> list[Message]:
+        user_prompt = self.user_template.format(
+            rubric=json.dumps(self.rubric.config, indent=2),
+            transcript_json=transcript_json,
+            summary_json=json.dumps(summary, indent=2),
+        )
+        return [
+            Message(role="system", content=self.system_prompt),
+            Message(role="user", content=user_prompt),
+        ]
+
+    def dry_run(self, transcript: dict, summary: dict, model_id: str) -> tuple[list[Message], str | None]:
+        """The scoring-call messages for a pair, and why no call is needed ("rule-failed", "cached") if so.
+
+        Needs no provider (``model_id`` keys the cache lookup). Nothing is recorded: no
+        provider call, no cache hit counted, no prejudge or evidence stats.
+        """
+        shown, _ = self._shown_transcript(transcript, summary)
+        messages = self._messages(json.dumps(shown, indent=2), summary)
+        if self.prejudge is not None and self.prejudge.auto_fail:
+            if self.prejudge.check(transcript, summary).hard_failures:
+                return messages, "rule-failed"
+        if self.cache is not None and self.cache.contains(self._cache_key(shown, summary, model_id)):
+            return messages, "cached"
+        return messages, None
+
+    def evaluate_one(self, transcript: dict, summary: dict) -> dict | None:
+        """Evaluate a single summary."""
+        prejudge = None
+        if self.prejudge is not None:
+            with self.tracer.span("prejudge"):
+                prejudge = self.prejudge.check(transcript, summary)
+            if prejudge.hard_failures and self.prejudge.auto_fail:
+                return self._rule_failed(transcript, summary, prejudge)
+
+        with self.tracer.span("build_prompt"):
+            shown, evidence = self._shown_transcript(transcript, summary)
+            transcript_json = json.dumps(shown, indent=2)
+            if evidence is not None:
+                full_chars = len(transcript_json) if shown is transcript else len(json.dumps(transcript, indent=2))
+                self.evidence.record(evidence, len(transcript_json), full_chars)
+
+        with self.tracer.span("cache_lookup") as span:
+            cached = self._from_cache(transcript, summary, prejudge, shown, evidence)
+            span.set(hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        messages = self._messages(transcript_json, summary)
+
+        try:
+            # Call provider
+            with self.tracer.span("provider_call") as span:
                 response = self.provider.generate(
                     messages,
                     temperature=self.temperature,
                     seed=self.seed,
-                    max_tokens=2048,
+                    max_tokens=self.max_tokens,
                 )
-
-                # Parse response with robust JSON extraction
-                raw_text = response.text.strip()
-                
-                # Try to extract JSON from markdown code blocks or find JSON object
-                import re
-                json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', raw_text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    # Try to find the JSON object (stop at first complete object)
-                    json_match = re.search(r'\{.*\}', raw_text, re.DOTALL)
-                    if json_match:
-                        json_str = json_match.group(0)
-                    else:
-                        json_str = raw_text
-                
-                # Attempt to parse JSON with error handling
-                try:
-                    evaluation = json.loads(json_str)
-                except json.JSONDecodeError as e:
-                    # Try cleaning up common formatting issues
-                    cleaned = re.sub(r'\s+', ' ', json_str)
-                    try:
-                        evaluation = json.loads(cleaned)
-                    except json.JSONDecodeError:
-                        # Log error and skip this evaluation by returning None
-                        error_msg = f"JSON parse error: {str(e)[:100]}"
-                        return None  # Skip this evaluation
-                evaluation["call_id"] = summary["call_id"]
-
-                # Add evaluation_id, summary_id, and transcript_id for traceability
-                # Extract the sequence number from transcript ID (e.g., TRA-20251002_122258-001 -> 001)
-                transcript_id = summary.get("transcript_id", transcript["call_id"])
-                seq_num = transcript_id.split("-")[-1] if "-" in transcript_id else "000"
-                evaluation_id = f"EVA-{seq_num}"
-                evaluation["evaluation_id"] = evaluation_id
-                evaluation["summary_id"] = summary.get("summary_id", f"SUM-{seq_num}")
-                evaluation["transcript_id"] = transcript_id
-
-                # Normalize scores (handle both flat and nested formats)
+                span.set(provider_latency_ms=response.latency_ms)
+
+            if self.lean_stats is not None:
+                self.lean_stats.record("scores", response)
+
+            # Parse response with robust JSON extraction
+            with self.tracer.span("parse"):
+                evaluation = self._parse_json(response.text)
+            if evaluation is None:
+                return None  # Skip this evaluation
+            self._stamp_ids(evaluation, transcript, summary)
+            if evidence is not None:
+                evaluation["evidence"] = evidence.to_dict()
+
+            # Normalize scores (handle both flat and nested formats)
+            with self.tracer.span("normalize"):
                 scores = evaluation.get("scores", {})
                 if scores and isinstance(list(scores.values())[0], dict):
                     # LLM returned {"coverage": {"score": 4, "rationale": "..."}} format
@@ -140,27 +369,24 @@ class JudgeRunner:
                 if "rationales" not in evaluation:
                     evaluation["rationales"] = {}
 
-                # Check gates
-                evaluation["overall_pass"] = self.rubric.check_gates(
-                    evaluation.get("scores", {}), evaluation.get("hallucination_flags", [])
-                )
+            # Store the judge's own verdict; rule flags are re-applied on every read
+            if self.cache is not None:
+                with self.tracer.span("cache_write"):
+                    self.cache.put(self._cache_key(shown, summary), evaluation)
 
-                # Track tokens and cost
-                cost = None
-                if response.usage:
-                    self.total_input_tokens += response.usage.prompt_tokens
-                    self.total_output_tokens += response.usage.completion_tokens
+            # Check gates
+            with self.tracer.span("gate"):
+                self._apply_gates(evaluation, prejudge)
 
-                    if self.cost_calculator and self.model_pricing:
-                        cost = self.cost_calculator(response.usage, self.model_pricing)
-                        if cost:
-                            self.total_cost += cost
+            # Track tokens and cost
+            cost = self._track_usage(response.usage) if response.usage else None
 
-                # Log to audit trail
-                if self.audit_logger:
+            # Log to audit trail
+            if self.audit_logger:
+                with self.tracer.span("audit"):
                     self.audit_logger.log_call(
-                        phase="judge",
-                        provider=self.provider.__class__.__name__.replace("Provider", "").lower(),
+                        phase=self.phase,
+                        provider=self.provider.provider_name,
                         model=self.provider.model_id,
                         messages=messages,
                         response=response,
@@ -170,58 +396,26 @@ class JudgeRunner:
                         status="ok",
                     )
 
-                pass_emoji = "✓" if evaluation["overall_pass"] else "✗"
-                avg_score = (
-                    sum(evaluation["scores"].values()) / len(evaluation["scores"]) if evaluation.get("scores") else 0
-                )
-
-                return {
-                    "evaluation": evaluation,
-                    "call_id": summary["call_id"],
-                    "pass_emoji": pass_emoji,
-                    "avg_score": avg_score,
-                    "tokens": response.usage.total_tokens if response.usage else 0,
-                    "cost": cost,
-                    "error": None,
-                }
-
-            except (ProviderError, json.JSONDecodeError) as e:
-                # Log error
-                if self.audit_logger:
-                    self.audit_logger.log_call(
-                        phase="judge",
-                        provider=self.provider.__class__.__name__.replace("Provider", "").lower(),
-                        model=self.provider.model_id,
-                        messages=messages,
-                        response=None,
-                        temperature=self.temperature,
-                        seed=self.seed,
-                        cost_usd=None,
-                        status="error",
-                        error=str(e),
-                    )
+            pass_emoji = "✓" if evaluation["overall_pass"] else "✗"
+            avg_score = (
+                sum(evaluation["scores"].values()) / len(evaluation["scores"]) if evaluation.get("scores") else 0
+            )
 
-                # Create stub evaluation on error
-                stub_evaluation = {
-                    "call_id": summary["call_id"],
-                    "scores": {
-                        "coverage": 0,
-                        "factuality": 0,
-                        "actionability": 0,
-                        "structure_brevity": 0,
-                        "safety_compliance": 0,
-                    },
-                    "rationales": {
-                        dim: f"ERROR: {str(e)}"
-                        for dim in ["coverage", "factuality", "actionability", "structure_brevity", "safety_compliance"]
-                    },
-                    "hallucination_flags": [],
-                    "overall_pass": False,
-                    "suggested_prompt_changes": [],
-                }
+            return {
+                "evaluation": evaluation,
+                "call_id": summary["call_id"],
+                "pass_emoji": pass_emoji,
+                "avg_score": avg_score,
+                "tokens": response.usage.total_tokens if response.usage else 0,
+                "cost": cost,
+                "error": None,
+            }
 
+        except (ProviderError, json.JSONDecodeError) as e:
+            if isinstance(e, BudgetExceededError):
+                # Never sent: no audit record, and no stub evaluation to drag the scores down
                 return {
-                    "evaluation": stub_evaluation,
+                    "evaluation": None,
                     "call_id": summary["call_id"],
                     "pass_emoji": "✗",
                     "avg_score": 0,
@@ -230,65 +424,413 @@ class JudgeRunner:
                     "error": str(e),
                 }
 
-        # Use ThreadPoolExecutor for concurrent processing
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Submit all tasks
-            futures = {
-                executor.submit(evaluate_one, transcript, summary): (transcript, summary)
-                for transcript, summary in pairs
+            # Log error
+            if self.audit_logger:
+                self.audit_logger.log_call(
+                    phase=self.phase,
+                    provider=self.provider.provider_name,
+                    model=self.provider.model_id,
+                    messages=messages,
+                    response=None,
+                    temperature=self.temperature,
+                    seed=self.seed,
+                    cost_usd=None,
+                    status="error",
+                    error=str(e),
+                )
+
+            # Create stub evaluation on error
+            stub_evaluation = {
+                "call_id": summary["call_id"],
+                "scores": {
+                    "coverage": 0,
+                    "factuality": 0,
+                    "actionability": 0,
+                    "structure_brevity": 0,
+                    "safety_compliance": 0,
+                },
+                "rationales": {
+                    dim: f"ERROR: {str(e)}"
+                    for dim in ["coverage", "factuality", "actionability", "structure_brevity", "safety_compliance"]
+                },
+                "hallucination_flags": [],
+                "overall_pass": False,
+                "suggested_prompt_changes": [],
             }
 
-            # Collect results as they complete
-            for future in as_completed(futures):
-                transcript, summary = futures[future]
+            return {
+                "evaluation": stub_evaluation,
+                "call_id": summary["call_id"],
+                "pass_emoji": "✗",
+                "avg_score": 0,
+                "tokens": 0,
+                "cost": None,
+                "error": str(e),
+            }
+
+    def fetch_rationales(self, transcript: dict, summary: dict, evaluation: dict, dims: list[str]) -> bool:
+        """Second lean-mode pass: ask for rationales on selected dimensions only."""
+        shown, _ = self._shown_transcript(transcript, summary)
+        user_prompt = self.rationale_template.format(
+            rubric=json.dumps(self.rubric.config, indent=2),
+            transcript_json=json.dumps(shown, indent=2),
+            summary_json=json.dumps(summary, indent=2),
+            scores_json=json.dumps(evaluation.get("scores", {})),
+            flags_json=json.dumps(evaluation.get("hallucination_flags", [])),
+            dimensions=", ".join(dims),
+        )
+        messages = [
+            Message(role="system", content=self.system_prompt),
+            Message(role="user", content=user_prompt),
+        ]
+
+        try:
+            with self.tracer.span("provider_call") as span:
+                response = self.provider.generate(
+                    messages, temperature=self.temperature, seed=self.seed, max_tokens=RATIONALE_MAX_TOKENS
+                )
+                span.set(provider_latency_ms=response.latency_ms)
+        except ProviderError as e:
+            if self.audit_logger and not isinstance(e, BudgetExceededError):
+                self.audit_logger.log_call(
+                    phase="judge_rationale",
+                    provider=self.provider.provider_name,
+                    model=self.provider.model_id,
+                    messages=messages,
+                    response=None,
+                    temperature=self.temperature,
+                    seed=self.seed,
+                    cost_usd=None,
+                    status="error",
+                    error=str(e),
+                )
+            return False
+
+        self.lean_stats.record("rationales", response)
+        cost = self._track_usage(response.usage) if response.usage else None
+        if self.audit_logger:
+            self.audit_logger.log_call(
+                phase="judge_rationale",
+                provider=self.provider.provider_name,
+                model=self.provider.model_id,
+                messages=messages,
+                response=response,
+                temperature=self.temperature,
+                seed=self.seed,
+                cost_usd=cost,
+                status="ok",
+            )
+
+        # A malformed reply keeps the scores-only evaluation rather than failing the pass
+        try:
+            parsed = self._parse_json(response.text) or {}
+            rationales = parsed.get("rationales") or {}
+            fetched = {d: r for d, r in rationales.items() if d in dims}
+            changes = parsed.get("suggested_prompt_changes")
+        except (json.JSONDecodeError, TypeError, KeyError, AttributeError):
+            return False
+        evaluation.setdefault("rationales", {}).update(fetched)
+        if changes:
+            evaluation["suggested_prompt_changes"] = changes
+
+        # Store the completed verdict so a cache hit doesn't need this call again
+        if self.cache is not None:
+            shown, _ = self._shown_transcript(transcript, summary)
+            self.cache.put(self._cache_key(shown, summary), self._verdict(evaluation))
+        return True
+
+    def _rationale_pass(self, pairs: list[tuple[dict, dict]], evaluations: list[dict], workers: int):
+        """Fetch rationales for gate failures and for what summarize_failures will read."""
+        # Lean mode only: it gates with numpy, which the judge otherwise never imports
+        from ..tune.llm_assistant import rationale_targets
+
+        targets = rationale_targets(evaluations, self.rubric)
+        compiled = self.rubric.compile()
+        for i, evaluation in enumerate(evaluations):
+            if evaluation.get("overall_pass") or evaluation.get("judged_by") == "rules":
+                continue
+            # Gate failure: explain the low dimensions (all of them if none is low)
+            scores = evaluation.get("scores", {})
+            low = {d for d, v in scores.items() if isinstance(v, (int, float)) and v < compiled.threshold(d)}
+            targets.setdefault(i, set()).update(low or scores.keys())
+        for i, dims in targets.items():
+            dims -= set(evaluations[i].get("rationales") or {})  # e.g. a completed cached verdict
+
+        by_call_id = {summary["call_id"]: (transcript, summary) for transcript, summary in pairs}
+        jobs = [
+            (by_call_id[evaluations[i]["call_id"]], evaluations[i], sorted(dims))
+            for i, dims in targets.items()
+            if dims and evaluations[i].get("call_id") in by_call_id
+        ]
+        if not jobs:
+            return
+        print(f"[judge] Lean mode: fetching rationales for {len(jobs)}/{len(evaluations)} evaluations...")
+        with self.tracer.span("judge_rationale", "phase", items=len(jobs)), ThreadPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self.tracer.wrap(self.fetch_rationales, "rationale_item", call_id=e.get("call_id")), t, s, e, dims
+                )
+                for (t, s), e, dims in jobs
+            ]
+            fetched = 0
+            for future in futures:
                 try:
-                    result = future.result()
-                    completed_count += 1
-
-                    # Handle case where evaluate_one returns None (JSON parsing error)
-                    if result is None:
-                        print(
-                            f"  [{completed_count}/{total_pairs}] {summary.get('call_id', 'unknown')} → ERROR: JSON parsing failed",
-                            flush=True,
-                        )
-                        continue
-
-                    if result["error"]:
-                        print(
-                            f"  [{completed_count}/{total_pairs}] {result['call_id']} → ERROR: {result['error']}",
-                            flush=True,
-                        )
-                    else:
-                        cost_str = f"${result['cost']:.4f}" if result["cost"] else "$0.0000"
-                        print(
-                            f"  [{completed_count}/{total_pairs}] {result['call_id']} → {result['pass_emoji']} avg={result['avg_score']:.1f}, {result['tokens']} tokens, {cost_str}",
-                            flush=True,
-                        )
-
-                    if result is not None and "evaluation" in result:
-                        evaluations.append(result["evaluation"])
-
-                    # Print progress message for UI
-                    print(f"[judge] Progress: {completed_count}/{total_pairs} evaluations completed", flush=True)
-
-                except Exception as e:
-                    completed_count += 1
-                    print(
-                        f"  [{completed_count}/{total_pairs}] {summary['call_id']} → ERROR: {e}",
-                        file=sys.stderr,
-                        flush=True,
-                    )
+                    fetched += bool(future.result())
+                except Exception as e:  # One bad item keeps its scores-only evaluation
+                    print(f"[judge] Lean mode: rationale fetch failed: {e}", file=sys.stderr, flush=True)
+        print(f"[judge] Lean mode: fetched {fetched}/{len(jobs)} rationale sets")
+
+    def log_result(self, result: dict | None, summary: dict, completed_count: int, total_pairs: int) -> dict | None:
+        """Print a per-item progress line; return the evaluation to keep (if any)."""
+        # Handle case where evaluate_one returns None (JSON parsing error)
+        if result is None:
+            print(
+                f"  [{completed_count}/{total_pairs}] {summary.get('call_id', 'unknown')} → ERROR: JSON parsing failed",
+                flush=True,
+            )
+            return None
+
+        if result["error"]:
+            print(
+                f"  [{completed_count}/{total_pairs}] {result['call_id']} → ERROR: {result['error']}",
+                flush=True,
+            )
+        else:
+            cost_str = f"${result['cost']:.4f}" if result["cost"] else "$0.0000"
+            if result.get("rule_failed"):
+                cost_str += f" (rules: {result['rule_failed']})"
+            if result.get("cached"):
+                cost_str += " (cached)"
+            print(
+                f"  [{completed_count}/{total_pairs}] {result['call_id']} → {result['pass_emoji']} avg={result['avg_score']:.1f}, {result['tokens']} tokens, {cost_str}",
+                flush=True,
+            )
+
+        # Print progress message for UI
+        print(f"[judge] Progress: {completed_count}/{total_pairs} evaluations completed", flush=True)
+        return result.get("evaluation")
+
+    def _report(self, done: int, total: int | None, failed: int):
+        if self.progress is not None:
+            self.progress.update(
+                self.phase,
+                done,
+                total,
+                failed=failed,
+                tokens=self.total_input_tokens + self.total_output_tokens,
+                cost=self.total_cost,
+            )
+
+    def run(
+        self,
+        transcripts: list[dict],
+        summaries: list[dict],
+        workers: int = 5,
+        sequential: SequentialConfig | None = None,
+    ) -> list[dict]:
+        """Evaluate summaries against transcripts with concurrent workers (see ``iter_run``)."""
+        pairs = zip(transcripts, summaries)
+        total = min(len(transcripts), len(summaries))
+        return list(self.iter_run(pairs, total=total, workers=workers, sequential=sequential))
+
+    def iter_run(
+        self,
+        pairs: Iterable[tuple[dict, dict]],
+        total: int | None = None,
+        workers: int = 5,
+        sequential: SequentialConfig | None = None,
+        max_in_flight: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield evaluations as they complete, pulling (transcript, summary) pairs lazily.
+
+        At most ``max_in_flight`` (default ``2 * workers``) pairs are submitted at once
+        and each evaluation is appended to evaluations.jsonl as it is yielded, so memory
+        stays flat however long the input is. ``total`` is only used for progress lines.
+
+        With ``sequential`` set, pairs are judged in a seeded random order and judging
+        stops once the running confidence intervals meet the requested precision (or the
+        comparison against the baseline is conclusive). The shuffle needs the whole input
+        in memory. The outcome is kept on ``self.sequential_result`` and written to
+        ``sequential.json``. Lean mode holds evaluations back until the rationale pass
+        has filled them in.
+        """
+        if sequential is not None:
+            pairs = list(pairs)
+            total = len(pairs)
+        total_pairs = total if total is not None else "?"
+        print(f"[judge] Evaluating {total_pairs} summaries with {workers} workers...")
+        start_time = time.perf_counter()
+        completed_count = 0
+        failed_count = 0
+        written = 0
+        self._report(completed_count, total, failed_count)
+        held: list[tuple[tuple[dict, dict], dict]] = []  # Lean mode: waiting for rationales
+
+        estimator = None
+        if sequential is not None:
+            random.Random(sequential.seed).shuffle(pairs)
+            estimator = SequentialEstimator(sequential)
+            print(
+                f"[judge] Sequential mode: target ±{sequential.precision:.3f} pass rate, "
+                f"±{sequential.dim_precision:.2f} per dimension at {sequential.confidence:.0%} confidence"
+            )
 
-        # Save evaluations
         output_file = self.output_dir / "evaluations.jsonl"
-        with open(output_file, "w") as f:
-            for e in evaluations:
-                f.write(json.dumps(e) + "\n")
+        out = open(output_file, "w")
+
+        def write(evaluation: dict):
+            nonlocal written
+            out.write(json.dumps(evaluation) + "\n")
+            out.flush()
+            written += 1
+
+        # Use ThreadPoolExecutor for concurrent processing. In sequential mode only
+        # `workers` items are in flight, so stopping early wastes at most one window.
+        phase_span = self.tracer.span(self.phase, "phase", items=total_pairs, workers=workers)
+        try:
+            with phase_span, ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = {}
+                pair_iter = iter(pairs)
+                stop_reason = None
+
+                def submit_next() -> bool:
+                    if self.budget is not None and self.budget.exhausted:
+                        return False  # Leave the rest unsubmitted
+                    if self.progress is not None and self.progress.cancelled:
+                        return False
+                    pair = next(pair_iter, None)
+                    if pair is None:
+                        return False
+                    item = self.tracer.wrap(self.evaluate_one, "judge_item", call_id=pair[1].get("call_id"))
+                    pending[executor.submit(item, *pair)] = pair
+                    return True
+
+                window = workers if estimator is not None else max_in_flight or 2 * workers
+                for _ in range(window):
+                    if not submit_next():
+                        break
+
+                # Collect results as they complete, topping the window back up
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        transcript, summary = pending.pop(future)
+                        completed_count += 1
+                        evaluation = None
+                        try:
+                            result = future.result()
+                            evaluation = self.log_result(result, summary, completed_count, total_pairs)
+                            failed_count += result is None or bool(result["error"])
+                            if evaluation is not None and estimator is not None and not result["error"]:
+                                estimator.update(evaluation)
+                        except Exception as e:
+                            failed_count += 1
+                            print(
+                                f"  [{completed_count}/{total_pairs}] {summary['call_id']} → ERROR: {e}",
+                                file=sys.stderr,
+                                flush=True,
+                            )
+                        self._report(completed_count, total, failed_count)
+
+                        if estimator is not None and stop_reason is None:
+                            stop_reason = estimator.check()
+                            if stop_reason:
+                                print(f"[judge] Stopping early after {estimator.n} items: {stop_reason}", flush=True)
+                        if stop_reason is None:
+                            submit_next()
+
+                        if evaluation is None:
+                            continue
+                        if self.lean_stats is not None:
+                            held.append(((transcript, summary), evaluation))
+                        else:
+                            write(evaluation)
+                            yield evaluation
+
+            if self.budget is not None and self.budget.exhausted:
+                print(f"[judge] Budget exhausted ({self.budget.stop_reason}); stopped after {completed_count} items")
+            if self.progress is not None and self.progress.cancelled:
+                print(f"[judge] Cancelled; stopped after {completed_count} items")
+            if self.lean_stats is not None:
+                evaluations = [e for _, e in held]
+                self._rationale_pass([pair for pair, _ in held], evaluations, workers)
+                held.clear()
+                for evaluation in evaluations:
+                    write(evaluation)
+                    yield evaluation
+        finally:
+            out.close()
+
+        if self.lean_stats is not None:
+            self.lean_stats.evaluations = written
+            self.lean_stats.wall_s = time.perf_counter() - start_time
+            stats = self.lean_stats.to_dict(self.lean_reference)
+            with open(self.output_dir / "lean_judge.json", "w") as f:
+                json.dump(stats, f, indent=2)
+            line = (
+                f"[judge] Lean mode: {stats['output_tokens']} output tokens "
+                f"({stats['passes']['scores']['output_tokens']} scores + "
+                f"{stats['passes']['rationales']['output_tokens']} rationales)"
+            )
+            if stats["reduction"]:
+                line += (
+                    f", {stats['reduction']['output_tokens']:.0%} fewer output tokens and "
+                    f"{stats['reduction']['latency']:.0%} less judge latency than full mode "
+                    f"(ref. {stats['reference']['run']})"
+                )
+            print(line)
+        else:
+            (self.output_dir / "lean_judge.json").unlink(missing_ok=True)
+
+        if self.evidence is not None:
+            stats = self.evidence.stats()
+            with open(self.output_dir / "evidence.json", "w") as f:
+                json.dump(stats, f, indent=2)
+            line = (
+                f"[judge] Evidence mode: {stats['segments_sent']}/{stats['segments_total']} segments sent, "
+                f"{stats['fallbacks']} full-transcript fallbacks"
+            )
+            if stats["transcript_reduction"] is not None:
+                line += f", transcript context {stats['transcript_reduction']:.0%} smaller"
+            print(line)
+        else:
+            (self.output_dir / "evidence.json").unlink(missing_ok=True)
+
+        if self.prejudge is not None:
+            stats = self.prejudge.stats()
+            with open(self.output_dir / "prejudge.json", "w") as f:
+                json.dump(stats, f, indent=2)
+            agreement = f"{stats['agreement']:.1%}" if stats["agreement"] is not None else "n/a"
+            print(
+                f"[judge] Pre-judge: {stats['hard_invalid']} hard-invalid, {stats['flagged']} flagged, "
+                f"{stats['calls_saved']} LLM calls saved, agreement with LLM judge {agreement}"
+            )
+        else:
+            (self.output_dir / "prejudge.json").unlink(missing_ok=True)
+
+        if estimator is None:
+            # Don't let a stale sequential summary leak into this run's report
+            (self.output_dir / "sequential.json").unlink(missing_ok=True)
+        else:
+            self.sequential_result = estimator.result(total=total_pairs, stop_reason=stop_reason)
+            with open(self.output_dir / "sequential.json", "w") as f:
+                json.dump(self.sequential_result, f, indent=2)
+            print(
+                f"[judge] Sequential: judged {self.sequential_result['judged']}/{total_pairs}, "
+                f"pass rate {self.sequential_result['pass_rate']:.1%} "
+                f"(CI {self.sequential_result['pass_rate_ci'][0]:.1%}–{self.sequential_result['pass_rate_ci'][1]:.1%})"
+            )
 
-        print(f"\n[judge] ✓ Saved {len(evaluations)} evaluations to {output_file}")
+        # Make calls.jsonl complete before anything reads it
+        if self.audit_logger:
+            self.audit_logger.flush()
+
+        print(f"\n[judge] ✓ Saved {written} evaluations to {output_file}")
         print(
             f"[judge] Session totals: {self.total_input_tokens} in + {self.total_output_tokens} out = "
             f"{self.total_input_tokens + self.total_output_tokens} tokens, ${self.total_cost:.4f}"
         )
-
-        return evaluations
+        if self.cache is not None:
+            print(f"[judge] Cache: {self.cache.hits} hits, {self.cache.misses} misses ({self.cache.path})")
@@ -0,0 +1,171 @@
+"""Vectorized rubric scoring: compiled weight/threshold vectors and bulk gate evaluation."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_MIN_THRESHOLD = 4.0  # Low-score cutoff for dimensions the rubric doesn't define
+
+
+@dataclass
+class GateResult:
+    """Bulk gate evaluation for N evaluations over D rubric dimensions."""
+
+    weighted_avg: np.ndarray  # (N,) weighted average score
+    pass_mask: np.ndarray  # (N,) bool, all gates passed
+    below_min: np.ndarray  # (N, D) bool, dimension under its min_threshold
+    dim_fail_counts: np.ndarray  # (D,) number of evaluations under each min_threshold
+
+
+@dataclass(frozen=True)
+class CompiledRubric:
+    """Rubric flattened into vectors so N evaluations can be gated in one pass."""
+
+    names: tuple[str, ...]
+    weights: np.ndarray  # (D,) normalized to sum to 1
+    thresholds: np.ndarray  # (D,)
+    avg_threshold: float
+    no_critical_failures: bool
+
+    @classmethod
+    def from_config(cls, config: dict) -> "CompiledRubric":
+        dims = config["dimensions"]
+        weights = np.array([d["weight"] for d in dims], dtype=np.float64)
+        total = weights.sum()
+        return cls(
+            names=tuple(d["name"] for d in dims),
+            weights=weights / total if total > 0 else np.zeros_like(weights),
+            thresholds=np.array([d["min_threshold"] for d in dims], dtype=np.float64),
+            avg_threshold=float(config["gates"]["avg_threshold"]),
+            no_critical_failures=bool(config["gates"].get("no_critical_failures", False)),
+        )
+
+    def evaluate(self, scores: np.ndarray, flag_counts: np.ndarray | None = None) -> GateResult:
+        """Gate an (N, D) score matrix whose columns follow ``self.names``.
+
+        Missing scores (NaN) count as 0, matching ``Rubric.check_gates``.
+        """
+        scores = np.nan_to_num(np.asarray(scores, dtype=np.float64), nan=0.0)
+        weighted_avg = scores @ self.weights
+        below_min = scores < self.thresholds
+        pass_mask = (weighted_avg >= self.avg_threshold) & ~below_min.any(axis=1)
+        if self.no_critical_failures and flag_counts is not None:
+            pass_mask &= np.asarray(flag_counts) == 0
+        return GateResult(
+            weighted_avg=weighted_avg,
+            pass_mask=pass_mask,
+            below_min=below_min,
+            dim_fail_counts=below_min.sum(axis=0),
+        )
+
+    def matrix(self, evaluations: list[dict]) -> "ScoreMatrix":
+        """Score matrix with columns in rubric order."""
+        return ScoreMatrix.from_evaluations(evaluations, dimensions=list(self.names))
+
+    def gate(
+        self, evaluations: list[dict], default_threshold: float = DEFAULT_MIN_THRESHOLD
+    ) -> tuple["ScoreMatrix", GateResult]:
+        """Score matrix (rubric dimensions first, then any others) and its gate result.
+
+        Only rubric dimensions gate ``pass_mask``; ``below_min`` also covers the extra
+        columns, under ``default_threshold``, so callers can still name them.
+        """
+        extras = {}
+        for e in evaluations:
+            for dim in e.get("scores", {}):
+                if dim not in self.names:
+                    extras.setdefault(dim, None)
+        matrix = ScoreMatrix.from_evaluations(evaluations, dimensions=[*self.names, *extras])
+        d = len(self.names)
+        result = self.evaluate(matrix.scores[:, :d], matrix.flag_counts)
+        if extras:
+            extra = matrix.scores[:, d:]
+            result.below_min = np.hstack([result.below_min, ~np.isnan(extra) & (extra < default_threshold)])
+            result.dim_fail_counts = result.below_min.sum(axis=0)
+        return matrix, result
+
+    def threshold(self, name: str, default: float = DEFAULT_MIN_THRESHOLD) -> float:
+        """A dimension's min_threshold, or ``default`` outside the rubric."""
+        return float(self.thresholds[self.names.index(name)]) if name in self.names else default
+
+
+def _as_score(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def flag_count(flags) -> int:
+    """Number of hallucination flags, whether stored as a list or a single truthy value."""
+    if isinstance(flags, list):
+        return len(flags)
+    return 1 if flags else 0
+
+
+class ScoreMatrix:
+    """Dimension scores from evaluation dicts as an (N, D) array (NaN where missing)."""
+
+    def __init__(self, names: list[str], scores: np.ndarray, passed: np.ndarray, flag_counts: np.ndarray):
+        self.names = names
+        self.scores = scores
+        self.passed = passed
+        self.flag_counts = flag_counts
+
+    @classmethod
+    def from_evaluations(cls, evaluations: list[dict], dimensions: list[str] | None = None) -> "ScoreMatrix":
+        """Build from evaluation dicts; columns default to dimensions in order of first appearance."""
+        if dimensions is None:
+            seen = {}
+            for e in evaluations:
+                for dim in e.get("scores", {}):
+                    seen.setdefault(dim, None)
+            dimensions = list(seen)
+        col = {dim: j for j, dim in enumerate(dimensions)}
+
+        scores = np.full((len(evaluations), len(dimensions)), np.nan)
+        passed = np.zeros(len(evaluations), dtype=bool)
+        flag_counts = np.zeros(len(evaluations), dtype=np.int64)
+        for i, e in enumerate(evaluations):
+            for dim, value in e.get("scores", {}).items():
+                j = col.get(dim)
+                if j is not None:
+                    scores[i, j] = _as_score(value)
+            passed[i] = bool(e.get("overall_pass", False))
+            flag_counts[i] = flag_count(e.get("hallucination_flags", []))
+        return cls(dimensions, scores, passed, flag_counts)
+
+    def __len__(self) -> int:
+        return self.scores.shape[0]
+
+    def dimension_stats(self, low_threshold: float = 4.0) -> dict[str, dict]:
+        """Per-dimension avg/min/max, number of scores present and number below ``low_threshold``."""
+        present = ~np.isnan(self.scores)
+        counts = present.sum(axis=0)
+        low = self.low_mask(low_threshold)
+        with np.errstate(invalid="ignore"):
+            sums = np.where(present, self.scores, 0.0).sum(axis=0)
+            mins = np.where(present, self.scores, np.inf).min(axis=0, initial=np.inf)
+            maxs = np.where(present, self.scores, -np.inf).max(axis=0, initial=-np.inf)
+        low_counts = low.sum(axis=0)
+        return {
+            dim: {
+                "avg": float(sums[j] / counts[j]),
+                "min": _plain(mins[j]),
+                "max": _plain(maxs[j]),
+                "count": int(counts[j]),
+                "low": int(low_counts[j]),
+            }
+            for j, dim in enumerate(self.names)
+            if counts[j] > 0
+        }
+
+    def low_mask(self, low_threshold: float = 4.0) -> np.ndarray:
+        """(N, D) bool mask of present scores below ``low_threshold``."""
+        return ~np.isnan(self.scores) & (self.scores < low_threshold)
+
+
+def _plain(x: float) -> int | float:
+    """Render whole-number scores as ints (as they appear in evaluations.jsonl)."""
+    x = float(x)
+    return int(x) if x.is_integer() else x
@@ -0,0 +1,200 @@
+"""Sequential evaluation: running confidence intervals and early-stopping rules."""
+
+import json
+import math
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import NormalDist
+
+MIN_BOOTSTRAP_N = 5  # Fewer values give no usable bootstrap interval
+
+
+def _z(confidence: float) -> float:
+    """Two-sided normal critical value for a confidence level."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(successes: int, n: int, confidence: float = 0.95) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if n == 0:
+        return 0.0, 1.0
+    z = _z(confidence)
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def bootstrap_mean_interval(
+    values: list[float],
+    confidence: float = 0.95,
+    n_resamples: int = 1000,
+    rng: random.Random | None = None,
+    min_n: int = MIN_BOOTSTRAP_N,
+) -> tuple[float, float] | None:
+    """Percentile bootstrap interval for the mean; None (unbounded) below ``min_n`` values.
+
+    A handful of values resamples to a handful of distinct means, so the percentile
+    interval is far too narrow (zero-width for a single value) to stop on.
+    """
+    if len(values) < max(min_n, 1):
+        return None
+    rng = rng or random.Random(0)
+    n = len(values)
+    means = sorted(sum(rng.choices(values, k=n)) / n for _ in range(n_resamples))
+    alpha = (1 - confidence) / 2
+    lo = means[int(alpha * (n_resamples - 1))]
+    hi = means[int(math.ceil((1 - alpha) * (n_resamples - 1)))]
+    return lo, hi
+
+
+def spent_confidence(confidence: float, look: int) -> float:
+    """Confidence for the ``look``-th (1-based) of an open-ended series of interim tests.
+
+    Spends alpha as ``alpha * 6 / (pi^2 * look^2)``, which sums to ``alpha`` over any
+    number of looks, so stopping at the first conclusive look keeps the overall error
+    rate at ``1 - confidence`` (an always-valid bound, unlike re-testing at a fixed alpha).
+    """
+    alpha = (1 - confidence) * 6 / (math.pi**2 * look**2)
+    return 1 - alpha
+
+
+@dataclass
+class SequentialConfig:
+    """Stopping rule for sequential judging."""
+
+    precision: float = 0.05  # Target half-width of the pass-rate interval
+    dim_precision: float = 0.25  # Target half-width of each dimension-mean interval
+    confidence: float = 0.95
+    min_items: int = 10
+    check_every: int = 5  # Re-run the (bootstrap) check every N judged items
+    bootstrap_resamples: int = 1000
+    seed: int = 0
+    baseline_pass_rate: float | None = None
+    baseline_items: int | None = None  # Size of the baseline run; None treats its pass rate as exact
+    baseline_dim_means: dict[str, float] = field(default_factory=dict)
+    baseline_name: str | None = None
+
+    @classmethod
+    def with_baseline(cls, baseline_run: Path, **kwargs) -> "SequentialConfig":
+        """Build a config whose baseline comes from another run's evaluations.jsonl."""
+        evaluations = []
+        with open(Path(baseline_run) / "evaluations.jsonl") as f:
+            for line in f:
+                if line.strip():
+                    evaluations.append(json.loads(line))
+        passed = sum(1 for e in evaluations if e.get("overall_pass", False))
+        dim_scores: dict[str, list[float]] = {}
+        for e in evaluations:
+            for dim, score in e.get("scores", {}).items():
+                dim_scores.setdefault(dim, []).append(score)
+        return cls(
+            baseline_pass_rate=passed / len(evaluations) if evaluations else None,
+            baseline_items=len(evaluations) or None,
+            baseline_dim_means={d: sum(v) / len(v) for d, v in dim_scores.items()},
+            baseline_name=Path(baseline_run).name,
+            **kwargs,
+        )
+
+
+class SequentialEstimator:
+    """Running pass-rate and per-dimension estimates with interval-based stopping."""
+
+    def __init__(self, config: SequentialConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.n = 0
+        self.passed = 0
+        self.dim_scores: dict[str, list[float]] = {}
+        self._last_checked = 0
+        self._looks = 0  # Baseline comparisons made so far; each spends part of alpha
+
+    def update(self, evaluation: dict):
+        """Fold one evaluation into the running estimates."""
+        self.n += 1
+        if evaluation.get("overall_pass", False):
+            self.passed += 1
+        for dim, score in evaluation.get("scores", {}).items():
+            if isinstance(score, (int, float)):
+                self.dim_scores.setdefault(dim, []).append(float(score))
+
+    def pass_rate_interval(self) -> tuple[float, float]:
+        return wilson_interval(self.passed, self.n, self.config.confidence)
+
+    def baseline_interval(self, confidence: float | None = None) -> tuple[float, float] | None:
+        """Wilson interval for the baseline pass rate; a point when its size is unknown."""
+        cfg = self.config
+        if cfg.baseline_pass_rate is None:
+            return None
+        if not cfg.baseline_items:
+            return cfg.baseline_pass_rate, cfg.baseline_pass_rate
+        passed = round(cfg.baseline_pass_rate * cfg.baseline_items)
+        return wilson_interval(passed, cfg.baseline_items, confidence or cfg.confidence)
+
+    def dim_intervals(self) -> dict[str, tuple[float, float] | None]:
+        return {
+            dim: bootstrap_mean_interval(
+                scores, self.config.confidence, self.config.bootstrap_resamples, self.rng
+            )
+            for dim, scores in self.dim_scores.items()
+        }
+
+    def check(self) -> str | None:
+        """Return a stop reason once a stopping rule is met, else None."""
+        cfg = self.config
+        if self.n < cfg.min_items or self.n - self._last_checked < cfg.check_every:
+            return None
+        self._last_checked = self.n
+
+        # Conclusive against baseline: the two intervals no longer overlap. Each look spends
+        # part of alpha, split between our interval and the baseline's own.
+        if cfg.baseline_pass_rate is not None:
+            self._looks += 1
+            look_confidence = 1 - (1 - spent_confidence(cfg.confidence, self._looks)) / 2
+            lo, hi = wilson_interval(self.passed, self.n, look_confidence)
+            b_lo, b_hi = self.baseline_interval(look_confidence)
+            if b_hi < lo:
+                return f"pass rate conclusively above baseline {cfg.baseline_pass_rate:.1%}"
+            if b_lo > hi:
+                return f"pass rate conclusively below baseline {cfg.baseline_pass_rate:.1%}"
+
+        lo, hi = self.pass_rate_interval()
+        if (hi - lo) / 2 > cfg.precision:
+            return None
+        dims = self.dim_intervals()
+        if any(ci is None or (ci[1] - ci[0]) / 2 > cfg.dim_precision for ci in dims.values()):
+            return None
+        return f"precision reached (pass rate ±{(hi - lo) / 2:.3f})"
+
+    def result(self, total: int, stop_reason: str | None) -> dict:
+        """Serializable summary of the final estimates."""
+        lo, hi = self.pass_rate_interval()
+        dims = self.dim_intervals()
+        cfg = self.config
+        return {
+            "judged": self.n,
+            "total": total,
+            "stopped_early": stop_reason is not None and self.n < total,
+            "stop_reason": stop_reason or "dataset exhausted",
+            "confidence": cfg.confidence,
+            "precision": cfg.precision,
+            "dim_precision": cfg.dim_precision,
+            "pass_rate": self.passed / self.n if self.n else 0.0,
+            "pass_rate_ci": [lo, hi],
+            "dimensions": {
+                dim: {"mean": sum(scores) / len(scores), "ci": list(dims[dim]) if dims[dim] else None}
+                for dim, scores in self.dim_scores.items()
+            },
+            "baseline": (
+                {
+                    "run": cfg.baseline_name,
+                    "pass_rate": cfg.baseline_pass_rate,
+                    "items": cfg.baseline_items,
+                    "pass_rate_ci": list(self.baseline_interval()),
+                }
+                if cfg.baseline_pass_rate is not None
+                else None
+            ),
+        }
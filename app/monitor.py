@@ -0,0 +1,323 @@
+"""Live request, token, latency, error and cost rates for a run, read incrementally from calls.jsonl.
+
+``CallsMonitor`` follows the run's live calls.jsonl (only bytes appended since the
+last poll are read) and adds each record to a fixed-size time bucket per
+(phase, model): calls, errors, rate-limited (429) errors, tokens, cost and a
+histogram of ``latency_ms`` over fixed log-spaced bins. Buckets that fall out of
+the window are dropped, so memory and the cost of a refresh depend on the window,
+not on how long the log is; p50/p95/p99 come from the merged histograms, to
+within one bin (about 10%). On a large existing log only the last ``tail_bytes``
+are read at start, which covers the window of any realistic run.
+
+Rotated segments are not read: they only hold calls older than the live file.
+"""
+
+import json
+import math
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from .audit import LineFollower
+from .jsonl_index import JsonlIndex
+
+DEFAULT_WINDOW_S = 60.0
+DEFAULT_BUCKET_S = 5.0
+DEFAULT_TAIL_BYTES = 64 << 20
+LATENCY_BOUNDS_MS = np.geomspace(10.0, 600_000.0, 116)  # Upper bin edges, ~10% apart
+# Items per phase: (input artifact, output artifact) in the run dir; None is the dataset
+PHASE_ARTIFACTS = {"summarize": (None, "summaries.jsonl"), "judge": ("summaries.jsonl", "evaluations.jsonl")}
+
+_RATE_LIMITED = re.compile(r"\b429\b|rate.?limit|resource.?exhausted|too many requests", re.IGNORECASE)
+
+
+def _timestamp(ts: str) -> float | None:
+    """calls.jsonl ``ts`` (naive UTC ISO format) as epoch seconds."""
+    try:
+        return datetime.fromisoformat(ts).replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    __slots__ = ("calls", "errors", "rate_limited", "tokens", "cost", "latency")
+
+    def __init__(self):
+        self.calls = self.errors = self.rate_limited = self.tokens = 0
+        self.cost = 0.0
+        self.latency = np.zeros(len(LATENCY_BOUNDS_MS) + 1, dtype=np.int64)
+
+    def merge(self, other: "_Bucket"):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.rate_limited += other.rate_limited
+        self.tokens += other.tokens
+        self.cost += other.cost
+        self.latency += other.latency
+
+
+@dataclass
+class WindowRates:
+    """One (phase, model)'s calls in the window; phase/model "all" is the total."""
+
+    phase: str
+    model: str
+    calls: int
+    errors: int
+    rate_limited: int
+    tokens: int
+    cost: float
+    span_s: float  # Seconds the rates are taken over (shorter than the window early in a run)
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+
+    @property
+    def requests_per_s(self) -> float:
+        return self.calls / self.span_s
+
+    @property
+    def tokens_per_s(self) -> float:
+        return self.tokens / self.span_s
+
+    @property
+    def cost_per_min(self) -> float:
+        return self.cost / self.span_s * 60
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+    @property
+    def rate_limited_rate(self) -> float:
+        return self.rate_limited / self.calls if self.calls else 0.0
+
+
+@dataclass
+class PhaseProgress:
+    phase: str
+    done: int
+    total: int
+    items_per_s: float | None
+
+    @property
+    def eta_s(self) -> float | None:
+        if self.done >= self.total:
+            return 0.0
+        if not self.items_per_s:
+            return None
+        return (self.total - self.done) / self.items_per_s
+
+
+@dataclass
+class MonitorSnapshot:
+    as_of: float  # Window end, epoch seconds
+    live: bool  # False when the run has been idle for a whole window (shown as of its last call)
+    window_s: float
+    rows: list[WindowRates]  # Per (phase, model), busiest first
+    total: WindowRates
+    progress: list[PhaseProgress]
+
+
+def _percentile(hist: np.ndarray, q: float) -> float | None:
+    n = int(hist.sum())
+    if not n:
+        return None
+    i = int(np.searchsorted(np.cumsum(hist), math.ceil(q * n)))
+    return float(LATENCY_BOUNDS_MS[min(i, len(LATENCY_BOUNDS_MS) - 1)])
+
+
+class CallsMonitor:
+    """Rolling-window rates over a run's calls.jsonl; ``poll`` reads what was appended, ``snapshot`` reports."""
+
+    def __init__(
+        self,
+        run_dir: Path,
+        transcripts_path: Path | None = None,
+        window_s: float = DEFAULT_WINDOW_S,
+        bucket_s: float = DEFAULT_BUCKET_S,
+        tail_bytes: int | None = DEFAULT_TAIL_BYTES,
+        chunk_size: int = 1 << 20,
+    ):
+        self.run_dir = Path(run_dir)
+        self.transcripts_path = Path(transcripts_path) if transcripts_path else None
+        self.window_s = window_s
+        self.bucket_s = bucket_s
+        self._follower = LineFollower(self.run_dir / "calls.jsonl", chunk_size, tail_bytes)
+        self._buckets: dict[int, dict[tuple[str, str], _Bucket]] = {}
+        self._first_ts: float | None = None
+        self._last_ts: float | None = None
+        self._items: dict[str, LineFollower] = {}
+        self._item_counts: dict[str, int] = {}
+        self._done_samples: dict[str, deque] = {}  # phase -> (time, done) per snapshot, for the item rate
+
+    def poll(self) -> int:
+        """Add records appended since the last poll to their buckets; returns how many were added."""
+        lines = self._follower.lines()
+        # A rotated file's records are still in the window; a truncated one's were discarded
+        if self._follower.truncated:
+            self._buckets.clear()
+            self._first_ts = self._last_ts = None
+        added = 0
+        for line in lines:
+            added += self._add(line)
+        if self._last_ts is not None:
+            oldest = self._bucket(self._last_ts - self.window_s) - 1
+            for key in [k for k in self._buckets if k < oldest]:
+                del self._buckets[key]
+        return added
+
+    def _bucket(self, ts: float) -> int:
+        return int(ts // self.bucket_s)
+
+    def _add(self, line: bytes) -> bool:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            return False
+        if not isinstance(record, dict):
+            return False
+        ts = _timestamp(record.get("ts"))
+        if ts is None:
+            return False
+        key = (record.get("phase") or "?", record.get("model") or "?")
+        bucket = self._buckets.setdefault(self._bucket(ts), {}).setdefault(key, _Bucket())
+        bucket.calls += 1
+        if record.get("status") == "error":
+            bucket.errors += 1
+            bucket.rate_limited += bool(_RATE_LIMITED.search(record.get("error") or ""))
+        else:
+            # Failed calls log latency 0; they would drag the percentiles down
+            latency = record.get("latency_ms")
+            if isinstance(latency, (int, float)):
+                bucket.latency[np.searchsorted(LATENCY_BOUNDS_MS, latency)] += 1
+        bucket.tokens += int((record.get("usage") or {}).get("total_tokens") or 0)
+        if isinstance(record.get("cost_usd"), (int, float)):
+            bucket.cost += record["cost_usd"]
+        self._first_ts = ts if self._first_ts is None else min(self._first_ts, ts)
+        self._last_ts = ts if self._last_ts is None else max(self._last_ts, ts)
+        return True
+
+    def snapshot(self, now: float | None = None) -> MonitorSnapshot:
+        """Rates over the window ending now, or at the last call if the run has been idle for a whole window."""
+        now = time.time() if now is None else now
+        live = self._last_ts is not None and now - self._last_ts <= self.window_s
+        end = now if live or self._last_ts is None else self._last_ts
+        start = end - self.window_s
+        span = self.window_s
+        if self._first_ts is not None and self._first_ts > start:
+            span = end - self._first_ts
+        span = max(span, self.bucket_s)
+
+        merged: dict[tuple[str, str], _Bucket] = {}
+        for index, buckets in self._buckets.items():
+            # Whole buckets: the window is aligned to bucket boundaries
+            if self._bucket(start) < index <= self._bucket(end):
+                for key, bucket in buckets.items():
+                    merged.setdefault(key, _Bucket()).merge(bucket)
+        rows = sorted(
+            (self._rates(phase, model, b, span) for (phase, model), b in merged.items()),
+            key=lambda r: -r.calls,
+        )
+        total = _Bucket()
+        for bucket in merged.values():
+            total.merge(bucket)
+        return MonitorSnapshot(
+            as_of=end,
+            live=live,
+            window_s=self.window_s,
+            rows=rows,
+            total=self._rates("all", "all", total, span),
+            progress=self._progress(rows, now),
+        )
+
+    def _rates(self, phase: str, model: str, b: _Bucket, span: float) -> WindowRates:
+        return WindowRates(
+            phase, model, b.calls, b.errors, b.rate_limited, b.tokens, b.cost, span,
+            _percentile(b.latency, 0.50), _percentile(b.latency, 0.95), _percentile(b.latency, 0.99),
+        )
+
+    # -------------------- Projected completion --------------------
+
+    def _count(self, name: str | None) -> int | None:
+        """Records in a run artifact (counted incrementally), or in the dataset for None."""
+        if name is None:
+            if self.transcripts_path is None or not self.transcripts_path.exists():
+                return None
+            return len(JsonlIndex(self.transcripts_path))
+        follower = self._items.setdefault(name, LineFollower(self.run_dir / name))
+        lines = follower.lines()
+        if follower.restarted:
+            self._item_counts[name] = 0
+        self._item_counts[name] = self._item_counts.get(name, 0) + sum(1 for line in lines if line.strip())
+        return self._item_counts[name] if (self.run_dir / name).exists() else None
+
+    def _progress(self, rows: list[WindowRates], now: float) -> list[PhaseProgress]:
+        """Items done/total for the phases seen in the window, with the rate their output grows at.
+
+        The rate comes from the output's growth across snapshots; until there are two, a
+        phase's successful calls per second stand in for it (one call per item).
+        """
+        progress = []
+        for phase, (source, output) in PHASE_ARTIFACTS.items():
+            calls = [r for r in rows if r.phase == phase]
+            if not calls:
+                continue
+            total, done = self._count(source), self._count(output)
+            if total is None:
+                continue
+            done = done or 0
+            samples = self._done_samples.setdefault(phase, deque())
+            samples.append((now, done))
+            while len(samples) > 2 and samples[0][0] < now - self.window_s:
+                samples.popleft()
+            (t0, d0), (t1, d1) = samples[0], samples[-1]
+            if t1 - t0 >= self.bucket_s and d1 > d0:
+                rate = (d1 - d0) / (t1 - t0)
+            else:
+                rate = sum(r.requests_per_s * (1 - r.error_rate) for r in calls) or None
+            progress.append(PhaseProgress(phase, done, total, rate))
+        return progress
+
+
+# -------------------- Terminal view --------------------
+
+
+def _ms(value: float | None) -> str:
+    if value is None:
+        return "—"
+    return f"{value / 1000:.1f}s" if value >= 1000 else f"{value:.0f}ms"
+
+
+def _duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "—"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{secs:02d}s"
+
+
+def format_snapshot(snapshot: MonitorSnapshot, run_dir: Path) -> str:
+    """The ``monitor`` command's table: one line per (phase, model), then totals and projected completion."""
+    as_of = datetime.fromtimestamp(snapshot.as_of, timezone.utc).strftime("%H:%M:%SZ")
+    state = "live" if snapshot.live else "idle, as of the last call"
+    lines = [f"[monitor] {run_dir} · {snapshot.window_s:.0f}s window · {as_of} ({state})", ""]
+    header = f"{'phase':<12} {'model':<26} {'req/s':>7} {'tok/s':>9} {'p50':>7} {'p95':>7} {'p99':>7}"
+    lines.append(header + f" {'err':>6} {'429':>6} {'$/min':>9}")
+    for r in [*snapshot.rows, snapshot.total] if snapshot.rows else []:
+        lines.append(
+            f"{r.phase:<12} {r.model[:26]:<26} {r.requests_per_s:>7.2f} {r.tokens_per_s:>9,.0f} "
+            f"{_ms(r.p50_ms):>7} {_ms(r.p95_ms):>7} {_ms(r.p99_ms):>7} "
+            f"{r.error_rate:>6.1%} {r.rate_limited_rate:>6.1%} {r.cost_per_min:>9.4f}"
+        )
+    if not snapshot.rows:
+        lines.append("(no calls in the window)")
+    for p in snapshot.progress:
+        rate = f"{p.items_per_s:.2f} items/s" if p.items_per_s else "rate unknown"
+        lines.append(f"\n{p.phase}: {p.done:,}/{p.total:,} items · {rate} · ETA {_duration(p.eta_s)}")
+    return "\n".join(lines)
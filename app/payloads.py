@@ -0,0 +1,160 @@
+"""Content-addressed store for full LLM request/response payloads."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+
+from .provider.base import Message
+
+DEFAULT_PAYLOAD_DIR = Path("data/payloads")
+
+# Content-defined chunking: a chunk ends after a line whose hash hits the mask, so
+# a transcript embedded in different prompts splits into the same chunks.
+_BOUNDARY_MASK = 0x7  # ~8 lines per chunk on average
+_MAX_CHUNK_LINES = 64
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def messages_digest(messages: list[Message]) -> str:
+    """Digest of a message list, as recorded in calls.jsonl (``messages_digest_in``)."""
+    messages_str = json.dumps([{"role": m.role, "content": m.content} for m in messages])
+    return sha256(messages_str.encode())
+
+
+def chunk_text(text: str) -> list[str]:
+    """Split text at content-defined line boundaries; chunks concatenate back to ``text``."""
+    chunks, current = [], []
+    for line in text.splitlines(keepends=True):
+        current.append(line)
+        boundary = zlib.crc32(line.encode()) & _BOUNDARY_MASK == 0
+        if boundary or len(current) >= _MAX_CHUNK_LINES:
+            chunks.append("".join(current))
+            current = []
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+class PayloadStore:
+    """Deduplicated, zlib-compressed blobs under ``objects/<2 hex>/<digest>``.
+
+    - Chunks of message content are stored by the SHA-256 of their text, so each
+      unique system prompt, transcript and rubric is stored once however many
+      prompts embed it.
+    - A message list is a small manifest of role + chunk digests, keyed by the
+      ``messages_digest_in`` AuditLogger records.
+    - A response is stored whole, keyed by ``response_digest_out``.
+    """
+
+    def __init__(self, root: Path = DEFAULT_PAYLOAD_DIR, level: int = 6):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.level = level
+        self._known: set[str] = set()
+        self._lock = threading.Lock()
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        # Session stats
+        self.written = 0
+        self.deduplicated = 0
+
+    def _path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return digest in self._known or self._path(digest).exists()
+
+    def put_blob(self, data: bytes, digest: str | None = None) -> str:
+        """Store bytes under their digest (no-op if already present)."""
+        digest = digest or sha256(data)
+        if self.has(digest):
+            with self._lock:
+                self._known.add(digest)
+                self.deduplicated += 1
+            return digest
+
+        path = self._path(digest)
+        path.parent.mkdir(exist_ok=True)
+        # Write-then-rename so concurrent writers and readers never see partial blobs
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(data, self.level))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._known.add(digest)
+            self.written += 1
+        return digest
+
+    def get_blob(self, digest: str) -> bytes:
+        """Return stored bytes; KeyError if the digest is unknown."""
+        try:
+            with open(self._path(digest), "rb") as f:
+                return zlib.decompress(f.read())
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+    def put_messages(self, messages: list[Message], digest: str | None = None) -> str:
+        """Store a message list (chunked) and return its messages digest."""
+        digest = digest or messages_digest(messages)
+        if self.has(digest):
+            with self._lock:
+                self.deduplicated += 1
+            return digest
+        manifest = {
+            "messages": [
+                {"role": m.role, "chunks": [self.put_blob(c.encode()) for c in chunk_text(m.content)]}
+                for m in messages
+            ]
+        }
+        return self.put_blob(json.dumps(manifest).encode(), digest)
+
+    def get_messages(self, digest: str) -> list[dict]:
+        """Reassemble a message list from its manifest."""
+        manifest = json.loads(self.get_blob(digest))
+        return [
+            {"role": m["role"], "content": "".join(self.get_blob(c).decode() for c in m["chunks"])}
+            for m in manifest["messages"]
+        ]
+
+    def put_response(self, text: str) -> str:
+        """Store response text; its digest is ``response_digest_out``."""
+        return self.put_blob(text.encode())
+
+    def get_response(self, digest: str) -> str:
+        return self.get_blob(digest).decode()
+
+    def expand(self, record: dict) -> dict:
+        """A calls.jsonl record with its full ``messages`` and ``response`` (None where not stored)."""
+        expanded = dict(record)
+        try:
+            expanded["messages"] = self.get_messages(record["messages_digest_in"])
+        except KeyError:
+            expanded["messages"] = None
+        digest = record.get("response_digest_out")
+        try:
+            expanded["response"] = self.get_response(digest) if digest else None
+        except KeyError:
+            expanded["response"] = None
+        return expanded
+
+    def stats(self) -> dict:
+        """Object count and on-disk size."""
+        objects = size = 0
+        for shard in self.objects_dir.iterdir():
+            if shard.is_dir():
+                for blob in shard.iterdir():
+                    if not blob.name.startswith(".tmp-"):
+                        objects += 1
+                        size += blob.stat().st_size
+        return {"path": str(self.root), "objects": objects, "bytes": size}
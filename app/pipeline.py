@@ -0,0 +1,342 @@
+"""Streaming pipeline: generate → summarize → judge connected by bounded queues."""
+
+import json
+import queue
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .budget import BudgetLedger
+from .generate.runner import DatasetGenerator
+from .jsonl_index import iter_jsonl
+from .judge.runner import JudgeRunner
+from .provider.base import BaseProvider, LLMResponse, Message
+from .summarize.runner import SummarizeRunner
+from .trace import NULL_TRACER, now_us
+
+_DONE = object()  # End-of-stream marker passed down the queues
+
+
+class CallBudget:
+    """Concurrency and request-rate limit shared by every stage's provider calls."""
+
+    def __init__(self, max_concurrency: int, rate_per_s: float | None = None):
+        self.max_concurrency = max_concurrency
+        self.rate_per_s = rate_per_s
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+        # Session stats
+        self.calls = 0
+        self.wait_s = 0.0
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the concurrent call slots, spaced to the request rate."""
+        t0 = time.perf_counter()
+        self._slots.acquire()
+        try:
+            if self.rate_per_s:
+                with self._lock:
+                    now = time.perf_counter()
+                    start = max(now, self._next_start)
+                    self._next_start = start + 1 / self.rate_per_s
+                if start > now:
+                    time.sleep(start - now)
+            with self._lock:
+                self.calls += 1
+                self.wait_s += time.perf_counter() - t0
+            yield
+        finally:
+            self._slots.release()
+
+
+class ThrottledProvider(BaseProvider):
+    """Route a provider's calls through a shared CallBudget."""
+
+    def __init__(self, inner: BaseProvider, budget: CallBudget):
+        super().__init__(inner.api_key, inner.model_id)
+        self.inner = inner
+        self.budget = budget
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    def generate(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        seed: int | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        with self.budget.slot():
+            return self.inner.generate(messages, temperature=temperature, seed=seed, max_tokens=max_tokens)
+
+
+@dataclass
+class StageStats:
+    """Per-stage counts and timing (busy_s sums item service time over workers)."""
+
+    items: int = 0
+    failed: int = 0
+    cancelled: int = 0  # Dropped unprocessed once the budget ran out
+    busy_s: float = 0.0
+    first_start: float | None = None
+    last_end: float | None = None
+
+    @property
+    def active_s(self) -> float:
+        """From the stage's first item starting to its last item finishing."""
+        if self.first_start is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+    def to_dict(self) -> dict:
+        return {
+            "items": self.items,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "busy_s": self.busy_s,
+            "active_s": self.active_s,
+        }
+
+
+@dataclass
+class PipelineResult:
+    """Item counts (the items themselves are in the run's JSONL files)."""
+
+    transcripts: int
+    summaries: int
+    evaluations: int
+    wall_s: float
+    stages: dict[str, StageStats] = field(default_factory=dict)
+
+
+class Pipeline:
+    """Run generate → summarize → judge with every item flowing on as soon as it is ready.
+
+    Each stage has ``workers`` threads reading a bounded queue, so a summary is
+    judged while later transcripts are still being summarized, and a slow stage
+    applies backpressure instead of buffering the whole dataset. Provider calls
+    from all stages share one CallBudget when the providers are wrapped in
+    ThrottledProvider. Once a shared BudgetLedger is exhausted, queued items are
+    drained without being processed. Artifacts are the same as the per-phase commands:
+    summaries.jsonl and evaluations.jsonl are appended as items complete, and
+    generated transcripts are spooled to the run directory and appended to the
+    dataset at the end (renumbered like ``generate`` tops a dataset up).
+    """
+
+    def __init__(
+        self,
+        summarizer: SummarizeRunner,
+        judge: JudgeRunner,
+        run_dir: Path,
+        generator: DatasetGenerator | None = None,
+        workers: int = 5,
+        queue_size: int | None = None,
+        tracer=None,
+        budget: BudgetLedger | None = None,
+    ):
+        self.summarizer = summarizer
+        self.judge = judge
+        self.run_dir = run_dir
+        self.generator = generator
+        self.workers = workers
+        self.queue_size = queue_size or 2 * workers
+        self.tracer = tracer or NULL_TRACER
+        self.budget = budget
+        self._lock = threading.Lock()
+
+    def run(
+        self, transcripts: Iterable[dict] | None = None, n: int = 0, total: int | None = None
+    ) -> PipelineResult:
+        """Stream ``transcripts`` (or ``n`` newly generated ones) through every stage.
+
+        ``total`` is only used for progress output; pass it when ``transcripts`` is an
+        iterator rather than a list.
+        """
+        generating = transcripts is None
+        if generating and self.generator is None:
+            raise ValueError("Pipeline needs a generator to generate transcripts")
+        if generating:
+            total = n
+        elif total is None:
+            total = len(transcripts)
+        print(
+            f"[run] Streaming {total} items through {'generate → ' if generating else ''}summarize → judge "
+            f"({self.workers} workers per stage, queue size {self.queue_size})"
+        )
+
+        start = time.perf_counter()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")  # For generated call_ids
+        root = self.tracer.current()
+        stages = {}
+        to_summarize: queue.Queue = queue.Queue(self.queue_size)
+        to_judge: queue.Queue = queue.Queue(self.queue_size)
+        counts = {"generate": 0, "summarize": 0, "judge": 0, "fed": 0, "summaries": 0, "evaluations": 0}
+        summaries_file = open(self.run_dir / "summaries.jsonl", "w")
+        evaluations_file = open(self.run_dir / "evaluations.jsonl", "w")
+        # New transcripts are numbered after the existing dataset, which keeps its records
+        existing = self.generator.existing_count() if generating else 0
+        spool_path = self.run_dir / "transcripts.generated.jsonl"
+        spool = open(spool_path, "w", encoding="utf-8") if generating else None
+
+        def generate(seq: int) -> dict:
+            transcript = self.generator.generate_item(existing + seq, timestamp)
+            with self._lock:
+                spool.write(json.dumps(transcript, ensure_ascii=False) + "\n")
+                counts["generate"] += 1
+                print(f"[generate] Progress: {counts['generate']}/{total} transcripts completed", flush=True)
+            return transcript
+
+        def summarize(transcript: dict) -> tuple[dict, dict] | None:
+            result = self.summarizer.summarize_one(transcript)
+            with self._lock:
+                counts["summarize"] += 1
+                done = counts["summarize"]
+                if result["error"]:
+                    print(f"  [{done}/{total}] {result['call_id']} → ERROR: {result['error']}", flush=True)
+                else:
+                    counts["summaries"] += 1
+                    summaries_file.write(json.dumps(result["summary"]) + "\n")
+                    summaries_file.flush()
+                print(f"[summarize] Progress: {done}/{total} summaries completed", flush=True)
+            return None if result["error"] else (transcript, result["summary"])
+
+        def judge(pair: tuple[dict, dict]) -> None:
+            result = self.judge.evaluate_one(*pair)
+            with self._lock:
+                counts["judge"] += 1
+                evaluation = self.judge.log_result(result, pair[1], counts["judge"], total)
+                if evaluation is not None:
+                    counts["evaluations"] += 1
+                    evaluations_file.write(json.dumps(evaluation) + "\n")
+                    evaluations_file.flush()
+
+        threads = []
+        errors: list[BaseException] = []  # Raised by the feeder; re-raised once every stage has stopped
+        if generating:
+            to_generate: queue.Queue = queue.Queue()
+            for seq in range(1, n + 1):
+                to_generate.put((seq, now_us()))
+            to_generate.put(_DONE)
+            threads.append(self._stage("generate", generate, to_generate, to_summarize, root, stages))
+        else:
+            threads.append(
+                threading.Thread(target=self._feed, args=(transcripts, to_summarize, counts, errors), daemon=True)
+            )
+        threads.append(self._stage("summarize", summarize, to_summarize, to_judge, root, stages))
+        threads.append(self._stage("judge", judge, to_judge, None, root, stages))
+
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            summaries_file.close()
+            evaluations_file.close()
+            if spool is not None:
+                spool.close()
+        if errors:
+            raise errors[0]
+
+        # Make calls.jsonl complete before anything reads it
+        for runner in (self.summarizer, self.judge):
+            if runner.audit_logger:
+                runner.audit_logger.flush()
+        if generating:
+            # Read back top to bottom, in the order they were generated
+            self.generator.append(iter_jsonl(spool_path), timestamp)
+            spool_path.unlink()
+
+        wall_s = time.perf_counter() - start
+        if self.budget is not None and self.budget.exhausted:
+            cancelled = ", ".join(f"{name} {s.cancelled}" for name, s in stages.items() if s.cancelled)
+            print(f"[run] Budget exhausted ({self.budget.stop_reason}); items cancelled: {cancelled or 'none'}")
+        active = ", ".join(f"{name} {s.active_s:.1f}s" for name, s in stages.items())
+        print(
+            f"[run] ✓ {counts['summaries']} summaries, {counts['evaluations']} evaluations in {wall_s:.1f}s wall "
+            f"(stages active: {active})"
+        )
+        return PipelineResult(
+            transcripts=counts["generate"] if generating else counts["fed"],
+            summaries=counts["summaries"],
+            evaluations=counts["evaluations"],
+            wall_s=wall_s,
+            stages=stages,
+        )
+
+    def _feed(self, items: Iterable, outbox: queue.Queue, counts: dict, errors: list):
+        try:
+            for item in items:
+                outbox.put((item, now_us()))
+                counts["fed"] += 1
+        except BaseException as e:  # e.g. a malformed line; the stages still need _DONE to stop
+            errors.append(e)
+        finally:
+            outbox.put(_DONE)
+
+    def _stage(self, name: str, fn, inbox: queue.Queue, outbox: queue.Queue | None, parent, stages: dict):
+        """Thread running ``workers`` copies of ``fn`` over ``inbox``; results (if any) go to ``outbox``."""
+        stats = stages[name] = StageStats()
+        live = [self.workers]
+
+        def work(phase):
+            while True:
+                entry = inbox.get()
+                if entry is _DONE:
+                    inbox.put(_DONE)  # Let sibling workers see it too
+                    break
+                payload, enqueued_us = entry
+                if self.budget is not None and self.budget.exhausted:
+                    # Drain the queue without calling anything so upstream stages finish
+                    with self._lock:
+                        stats.cancelled += 1
+                    continue
+                self.tracer.mark("queue_wait", "queue", enqueued_us, phase)
+                t0 = time.perf_counter()
+                try:
+                    with self.tracer.span(
+                        f"{name}_item", "item", parent=phase, queue_wait_ms=(now_us() - enqueued_us) / 1000
+                    ):
+                        out = fn(payload)
+                except Exception as e:
+                    out = None
+                    with self._lock:
+                        stats.failed += 1
+                    print(f"[{name}] Warning: item failed: {e}", file=sys.stderr, flush=True)
+                t1 = time.perf_counter()
+                with self._lock:
+                    stats.items += 1
+                    stats.busy_s += t1 - t0
+                    stats.first_start = t0 if stats.first_start is None else min(stats.first_start, t0)
+                    stats.last_end = t1 if stats.last_end is None else max(stats.last_end, t1)
+                if out is not None and outbox is not None:
+                    outbox.put((out, now_us()))
+
+            with self._lock:
+                live[0] -= 1
+                last = live[0] == 0
+            if last and outbox is not None:
+                outbox.put(_DONE)
+
+        def run_stage():
+            with self.tracer.span(name, "phase", parent=parent, workers=self.workers) as phase:
+                workers = [
+                    threading.Thread(target=work, args=(phase,), name=f"{name}-{i}", daemon=True)
+                    for i in range(self.workers)
+                ]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+
+        return threading.Thread(target=run_stage, name=name, daemon=True)
@@ -25,7 +25,7 @@ class AnthropicProvider(BaseProvider):
 
         Note: Anthropic requires system message to be passed separately from conversation messages.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Extract system message separately (Anthropic API requirement)
@@ -47,7 +47,7 @@ class AnthropicProvider(BaseProvider):
                 messages=conversation_msgs,
             )
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
             # Extract text from response
             text = response.content[0].text if response.content else ""
@@ -67,7 +67,7 @@ class AnthropicProvider(BaseProvider):
                 request_id=response.id,
                 latency_ms=latency_ms,
                 raw_response=(
-                    response.model_dump() if hasattr(response, "model_dump") else None
+                    response.model_dump() if self.keep_raw_response and hasattr(response, "model_dump") else None
                 ),
             )
 
@@ -32,7 +32,7 @@ class LLMResponse:
     usage: Usage
     request_id: str | None = None
     latency_ms: float = 0.0
-    raw_response: dict[str, Any] | None = None
+    raw_response: dict[str, Any] | None = None  # Only if the provider's keep_raw_response is set
 
 
 class ProviderError(Exception):
@@ -44,6 +44,10 @@ class ProviderError(Exception):
 class BaseProvider(ABC):
     """Base class for all LLM providers."""
 
+    # Attach the SDK's full response dump to each LLMResponse. Off by default: nothing
+    # in the pipeline reads it, and on long runs it is most of the memory per call.
+    keep_raw_response: bool = False
+
     def __init__(self, api_key: str, model_id: str):
         self.api_key = api_key
         self.model_id = model_id
@@ -59,6 +63,11 @@ class BaseProvider(ABC):
         """Generate a completion from messages."""
         pass
 
+    @property
+    def provider_name(self) -> str:
+        """Short name recorded in calls.jsonl (e.g. "openai")."""
+        return self.__class__.__name__.replace("Provider", "").lower()
+
     def estimate_tokens(self, text: str) -> int:
         """Rough token estimate (4 chars ≈ 1 token)."""
         return len(text) // 4
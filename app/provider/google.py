@@ -27,7 +27,7 @@ class GoogleProvider(BaseProvider):
         Note: Gemini combines system and user messages into a single prompt.
         We prepend the system message to the conversation.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Combine system message with first user message for Gemini
@@ -75,7 +75,7 @@ class GoogleProvider(BaseProvider):
                     ),
                 )
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
             # Extract text from response
             text = response.text if hasattr(response, "text") else ""
@@ -22,7 +22,7 @@ class OpenAIProvider(BaseProvider):
         max_tokens: int | None = None,
     ) -> LLMResponse:
         """Call OpenAI chat.completions.create API."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             response = self.client.chat.completions.create(
@@ -33,7 +33,7 @@ class OpenAIProvider(BaseProvider):
                 max_tokens=max_tokens or 4096,
             )
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
             # Extract usage from response
             usage = Usage(
@@ -49,7 +49,7 @@ class OpenAIProvider(BaseProvider):
                 usage=usage,
                 request_id=response.id,
                 latency_ms=latency_ms,
-                raw_response=response.model_dump() if hasattr(response, "model_dump") else None,
+                raw_response=response.model_dump() if self.keep_raw_response and hasattr(response, "model_dump") else None,
             )
 
         except Exception as e:
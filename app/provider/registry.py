@@ -0,0 +1,68 @@
+"""Provider registry: adapters are imported only when selected.
+
+Built-in adapters are listed by import path. In-house providers register under
+the ``call_summary_copilot.providers`` entry-point group, e.g. in their
+pyproject.toml::
+
+    [project.entry-points."call_summary_copilot.providers"]
+    acme = "acme_llm.provider:AcmeProvider"
+
+The class must subclass BaseProvider and take ``(api_key, model_id)``. Its
+API key is read from ``<NAME>_API_KEY`` unless it sets ``api_key_env``; its
+models still come from configs/models.yaml under the same name.
+"""
+
+import importlib
+import os
+from importlib.metadata import entry_points
+
+from .base import BaseProvider
+
+ENTRY_POINT_GROUP = "call_summary_copilot.providers"
+
+BUILTIN_PROVIDERS = {
+    "openai": "app.provider.openai:OpenAIProvider",
+    "anthropic": "app.provider.anthropic:AnthropicProvider",
+    "google": "app.provider.google:GoogleProvider",
+}
+
+
+def _plugins() -> dict:
+    """Entry points by name (metadata only; nothing is imported)."""
+    return {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def available_providers() -> list[str]:
+    """Built-in provider names first, then plugins, without importing any adapter."""
+    plugins = [name for name in sorted(_plugins()) if name not in BUILTIN_PROVIDERS]
+    return list(BUILTIN_PROVIDERS) + plugins
+
+
+def load_provider_class(name: str) -> type[BaseProvider]:
+    """Import and return the adapter class registered under ``name``."""
+    if name in BUILTIN_PROVIDERS:
+        module_name, _, attr = BUILTIN_PROVIDERS[name].partition(":")
+        cls = getattr(importlib.import_module(module_name), attr)
+    else:
+        plugin = _plugins().get(name)
+        if plugin is None:
+            raise ValueError(f"Unknown provider: {name} (available: {', '.join(available_providers())})")
+        cls = plugin.load()
+    if not (isinstance(cls, type) and issubclass(cls, BaseProvider)):
+        raise TypeError(f"Provider {name!r} ({cls!r}) is not a BaseProvider subclass")
+    return cls
+
+
+def api_key_env(name: str, cls: type[BaseProvider] | None = None) -> str:
+    """Environment variable holding the provider's API key."""
+    return getattr(cls, "api_key_env", None) or f"{name.upper()}_API_KEY"
+
+
+def create_provider(name: str, model_id: str, api_key: str | None = None) -> BaseProvider:
+    """Instantiate a provider, taking the API key from its environment variable if not given."""
+    cls = load_provider_class(name)
+    env = api_key_env(name, cls)
+    api_key = api_key or os.getenv(env)
+    if not api_key:
+        raise ValueError(f"{env} not set in environment")
+    return cls(api_key, model_id)
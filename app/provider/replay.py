@@ -0,0 +1,179 @@
+"""Record/replay providers for deterministic, offline pipeline reruns."""
+
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from ..audit import iter_calls, load_index
+from ..payloads import PayloadStore, messages_digest, sha256
+from .base import BaseProvider, LLMResponse, Message, ProviderError, Usage
+from .mock import MockProvider
+
+MISS_POLICIES = ("fail", "fallthrough", "mock")
+
+
+class RecordingProvider(BaseProvider):
+    """Wrap a live adapter and record every successful call for later replay.
+
+    Each call's messages and response go to the payload store; a line keyed by
+    the request fingerprint (``messages_digest_in``, as in calls.jsonl) is
+    appended to ``recordings.jsonl``.
+    """
+
+    def __init__(self, inner: BaseProvider, payloads: PayloadStore, recordings_file: Path):
+        super().__init__(inner.api_key, inner.model_id)
+        self.inner = inner
+        self.payloads = payloads
+        self.recordings_file = Path(recordings_file)
+        self.recordings_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    def generate(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        seed: int | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        response = self.inner.generate(messages, temperature=temperature, seed=seed, max_tokens=max_tokens)
+        fingerprint = self.payloads.put_messages(messages)
+        self.payloads.put_response(response.text)
+        record = {
+            "ts": datetime.utcnow().isoformat(),
+            "provider": self.inner.provider_name,
+            "model": self.inner.model_id,
+            "temperature": temperature,
+            "seed": seed,
+            "max_tokens": max_tokens,
+            "request_id": response.request_id,
+            "latency_ms": response.latency_ms,
+            "messages_digest_in": fingerprint,
+            "response_digest_out": sha256(response.text.encode()),
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens,
+            },
+            "usage_available": response.usage.usage_available,
+            "estimated": response.usage.estimated,
+            "status": "ok",
+        }
+        with self._lock, open(self.recordings_file, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        return response
+
+
+class ReplayProvider(BaseProvider):
+    """Serve responses recorded in earlier runs, matched on the request fingerprint.
+
+    Sources are ``recordings.jsonl`` (from ``RecordingProvider``) or ``calls.jsonl``
+    (from ``AuditLogger`` with a payload store); response bodies come from the
+    payload store. A fingerprint recorded several times (e.g. repeated judge calls
+    at temperature > 0) is served in recorded order, cycling.
+
+    On a miss: ``"fail"`` raises ProviderError, ``"fallthrough"`` calls
+    ``fallback`` (a live provider), ``"mock"`` answers with MockProvider.
+    With ``reproduce_latency`` each replayed call sleeps for its recorded
+    ``latency_ms`` so concurrency benchmarks see realistic timing.
+    """
+
+    def __init__(
+        self,
+        sources: list[Path],
+        payloads: PayloadStore,
+        model_id: str | None = None,
+        on_miss: str = "fail",
+        fallback: BaseProvider | None = None,
+        reproduce_latency: bool = False,
+    ):
+        if on_miss not in MISS_POLICIES:
+            raise ValueError(f"Unknown miss policy: {on_miss} (expected one of {', '.join(MISS_POLICIES)})")
+        if on_miss == "fallthrough" and fallback is None:
+            raise ValueError("on_miss='fallthrough' needs a fallback provider")
+        self.payloads = payloads
+        self.on_miss = on_miss
+        self.fallback = fallback
+        self.reproduce_latency = reproduce_latency
+        self._lock = threading.Lock()
+        self._cursor: Counter = Counter()
+
+        self.recordings: dict[str, list[dict]] = {}
+        self.unplayable = 0  # Records whose response body is not in the payload store
+        models: Counter = Counter()
+        for source in sources:
+            for record in iter_calls(Path(source)):
+                digest = record.get("response_digest_out")
+                if record.get("status", "ok") != "ok" or not digest:
+                    continue
+                if not payloads.has(digest):
+                    self.unplayable += 1
+                    continue
+                self.recordings.setdefault(record["messages_digest_in"], []).append(record)
+                models[record.get("model")] += 1
+
+        model_id = model_id or (models.most_common(1)[0][0] if models else "replay")
+        super().__init__("replay", model_id)
+        self._mock = MockProvider(model_id=model_id) if on_miss == "mock" else None
+
+        # Session stats
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_runs(cls, run_dirs: list[Path], payloads: PayloadStore, **kwargs) -> "ReplayProvider":
+        """Replay from run directories (their recordings.jsonl and calls.jsonl)."""
+        sources = []
+        for run_dir in map(Path, run_dirs):
+            for name in ("recordings.jsonl", "calls.jsonl"):
+                if (run_dir / name).exists() or load_index(run_dir / name)["segments"]:
+                    sources.append(run_dir / name)
+        return cls(sources, payloads, **kwargs)
+
+    def generate(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        seed: int | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        """Return the recorded response for these messages, or apply the miss policy."""
+        fingerprint = messages_digest(messages)
+        candidates = self.recordings.get(fingerprint)
+        if not candidates:
+            with self._lock:
+                self.misses += 1
+            if self.on_miss == "fallthrough":
+                return self.fallback.generate(messages, temperature=temperature, seed=seed, max_tokens=max_tokens)
+            if self.on_miss == "mock":
+                return self._mock.generate(messages, temperature=temperature, seed=seed, max_tokens=max_tokens)
+            raise ProviderError(f"Replay miss: no recording for request {fingerprint[:12]}")
+
+        with self._lock:
+            record = candidates[self._cursor[fingerprint] % len(candidates)]
+            self._cursor[fingerprint] += 1
+            self.hits += 1
+
+        latency_ms = record.get("latency_ms") or 0.0
+        if self.reproduce_latency and latency_ms:
+            time.sleep(latency_ms / 1000)
+
+        usage = record.get("usage") or {}
+        return LLMResponse(
+            text=self.payloads.get_response(record["response_digest_out"]),
+            usage=Usage(
+                prompt_tokens=usage.get("prompt_tokens", 0),
+                completion_tokens=usage.get("completion_tokens", 0),
+                total_tokens=usage.get("total_tokens", 0),
+                usage_available=record.get("usage_available", bool(usage)),
+                estimated=record.get("estimated", False),
+            ),
+            request_id=record.get("request_id"),
+            latency_ms=latency_ms,
+        )
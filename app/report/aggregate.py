@@ -1,59 +1,50 @@
 """Report aggregation and markdown generation."""
 
-import json
 from pathlib import Path
 
+from ..audit import call_totals
+from ..judge.rubric import DEFAULT_RUBRIC_PATH, Rubric
+
 
 def generate_report(
     evaluations: list[dict],
     calls_file: Path,
     output_file: Path,
+    sequential: dict | None = None,
+    prejudge: dict | None = None,
+    lean: dict | None = None,
+    evidence: dict | None = None,
+    rubric: Rubric | None = None,
 ):
-    """Generate a markdown report with pass-rate, dimension stats, and costs."""
-    total = len(evaluations)
-    passed = sum(1 for e in evaluations if e.get("overall_pass", False))
+    """Generate a markdown report with pass-rate, dimension stats, and costs.
+
+    ``sequential`` is the ``sequential.json`` written by a sequential judge run; when
+    given, the report includes how many items were judged and the final intervals.
+    ``prejudge`` is the ``prejudge.json`` stats from the rule-based pre-judge stage.
+    ``lean`` is the ``lean_judge.json`` stats from a two-tier (scores-first) judge run.
+    ``evidence`` is the ``evidence.json`` stats from evidence-window judging.
+    Pass/fail and failure modes come from ``rubric``'s gates (default rubric if omitted).
+    """
+    rubric = rubric or Rubric(DEFAULT_RUBRIC_PATH)
+    matrix, gates = rubric.compile().gate(evaluations)
+    total = len(matrix)
+    passed = int(gates.pass_mask.sum())
     pass_rate = (passed / total * 100) if total > 0 else 0
 
     # Dimension stats
-    dim_scores = {}
-    for eval in evaluations:
-        for dim, score in eval.get("scores", {}).items():
-            if dim not in dim_scores:
-                dim_scores[dim] = []
-            dim_scores[dim].append(score)
-
-    dim_stats = {
-        dim: {
-            "avg": sum(scores) / len(scores),
-            "min": min(scores),
-            "max": max(scores),
-        }
-        for dim, scores in dim_scores.items()
-    }
+    dim_stats = matrix.dimension_stats()
 
-    # Cost stats from calls.jsonl
-    total_cost = 0.0
-    total_tokens = 0
-    estimated_count = 0
-
-    if calls_file.exists():
-        with open(calls_file) as f:
-            for line in f:
-                call = json.loads(line)
-                if call.get("cost_usd"):
-                    total_cost += call["cost_usd"]
-                if call.get("usage"):
-                    total_tokens += call["usage"].get("total_tokens", 0)
-                if call.get("estimated", False):
-                    estimated_count += 1
-
-    # Top failure modes
-    failures = [e for e in evaluations if not e.get("overall_pass", False)]
-    failure_modes = {}
-    for fail in failures:
-        for dim, score in fail.get("scores", {}).items():
-            if score < 4.0:
-                failure_modes[dim] = failure_modes.get(dim, 0) + 1
+    # Cost stats from calls.jsonl (indexed aggregates for rotated segments)
+    call_stats = call_totals(calls_file)
+    total_cost = call_stats["cost_usd"]
+    total_tokens = call_stats["total_tokens"]
+    estimated_count = call_stats["estimated"]
+
+    # Top failure modes: dimensions under their threshold among failing evaluations
+    failing_low = gates.below_min & ~gates.pass_mask[:, None]
+    failure_modes = {
+        dim: int(count) for dim, count in zip(matrix.names, failing_low.sum(axis=0)) if count > 0
+    }
 
     # Write markdown report
     with open(output_file, "w") as f:
@@ -64,6 +55,87 @@ def generate_report(
         for dim, stats in dim_stats.items():
             f.write(f"- **{dim}:** avg={stats['avg']:.2f}, min={stats['min']}, max={stats['max']}\n")
 
+        if sequential:
+            f.write("\n## Sequential Evaluation\n\n")
+            f.write(
+                f"- **Judged:** {sequential['judged']}/{sequential['total']} "
+                f"({'stopped early' if sequential['stopped_early'] else 'full dataset'}: {sequential['stop_reason']})\n"
+            )
+            lo, hi = sequential["pass_rate_ci"]
+            conf = sequential["confidence"]
+            f.write(
+                f"- **Pass Rate:** {sequential['pass_rate']:.1%} ({conf:.0%} Wilson CI {lo:.1%}–{hi:.1%})\n"
+            )
+            for dim, stats in sequential["dimensions"].items():
+                if stats["ci"] is None:
+                    f.write(f"- **{dim}:** mean={stats['mean']:.2f} (too few scores for a bootstrap CI)\n")
+                    continue
+                d_lo, d_hi = stats["ci"]
+                f.write(f"- **{dim}:** mean={stats['mean']:.2f} ({conf:.0%} bootstrap CI {d_lo:.2f}–{d_hi:.2f})\n")
+            baseline = sequential.get("baseline")
+            if baseline:
+                b_ci = baseline.get("pass_rate_ci")
+                f.write(
+                    f"- **Baseline:** {baseline['run']} pass rate {baseline['pass_rate']:.1%}"
+                    + (f" ({conf:.0%} Wilson CI {b_ci[0]:.1%}–{b_ci[1]:.1%})" if b_ci else "")
+                    + "\n"
+                )
+
+        if prejudge:
+            f.write("\n## Pre-Judge Checks\n\n")
+            f.write(f"- **Checked:** {prejudge['checked']}\n")
+            f.write(f"- **Hard-invalid:** {prejudge['hard_invalid']}\n")
+            f.write(f"- **Unsupported-entity flags:** {prejudge['flagged']} summaries\n")
+            f.write(
+                f"- **LLM Calls Saved:** {prejudge['calls_saved']}"
+                + ("" if prejudge["auto_fail"] else " (auto-fail disabled)")
+                + "\n"
+            )
+            if prejudge["agreement"] is not None:
+                c = prejudge["confusion"]
+                f.write(
+                    f"- **Agreement with LLM Judge:** {prejudge['agreement']:.1%} of {prejudge['compared_with_llm']} "
+                    f"(both fail {c['both_fail']}, both pass {c['both_pass']}, "
+                    f"rules-only fail {c['rules_only_fail']}, LLM-only fail {c['llm_only_fail']})\n"
+                )
+
+        if lean:
+            f.write("\n## Lean Judge\n\n")
+            scores_pass, rationale_pass = lean["passes"]["scores"], lean["passes"]["rationales"]
+            f.write(
+                f"- **Scores Pass:** {scores_pass['calls']} calls, {scores_pass['output_tokens']:,} output tokens, "
+                f"{scores_pass['latency_ms'] / 1000:.1f}s total latency\n"
+            )
+            f.write(
+                f"- **Rationale Pass:** {rationale_pass['calls']} calls, {rationale_pass['output_tokens']:,} output tokens, "
+                f"{rationale_pass['latency_ms'] / 1000:.1f}s total latency\n"
+            )
+            if lean.get("reduction"):
+                ref = lean["reference"]
+                f.write(
+                    f"- **vs Full Judge:** {lean['reduction']['output_tokens']:.0%} fewer output tokens, "
+                    f"{lean['reduction']['latency']:.0%} less latency "
+                    f"(reference run {ref['run']}: {ref['output_tokens_per_call']:.0f} tokens, "
+                    f"{ref['latency_ms_per_call']:.0f} ms per call)\n"
+                )
+            else:
+                f.write("- No full-mode judge run found to compare against.\n")
+
+        if evidence:
+            f.write("\n## Evidence Windows\n\n")
+            f.write(
+                f"- **Segments Sent:** {evidence['segments_sent']:,} of {evidence['segments_total']:,} "
+                f"(top {evidence['top_k']} per field, ±{evidence['window']} window)\n"
+            )
+            if evidence["transcript_reduction"] is not None:
+                f.write(f"- **Transcript Context Reduction:** {evidence['transcript_reduction']:.1%}\n")
+            reasons = ", ".join(f"{r} {n}" for r, n in evidence["fallback_reasons"].items())
+            f.write(
+                f"- **Full-Transcript Fallbacks:** {evidence['fallbacks']} of {evidence['evaluations']}"
+                + (f" ({reasons})" if reasons else "")
+                + "\n"
+            )
+
         f.write("\n## Top Failure Modes\n\n")
         if failure_modes:
             for dim, count in sorted(failure_modes.items(), key=lambda x: -x[1]):
@@ -0,0 +1,293 @@
+"""Sharded runs: split a phase into shards that worker processes claim through lease files.
+
+Layout under ``<run_dir>/shards/<phase>/``::
+
+    manifest.json          shard ids, the call_ids in each and the plan's fingerprint
+                           (written once, atomically)
+    leases/<shard>.lease   held by one worker; its mtime is the heartbeat
+    out/<shard>.jsonl      finished shard output (renamed into place when complete)
+    work/                  in-progress output, one file or directory per shard attempt
+
+Workers only need a shared filesystem: any number of processes, on one machine or
+several, run the same command against the same run directory. Each claims shards it
+finds unleased (or whose lease has not been refreshed within the TTL), processes them
+and renames the output into place. Output is all-or-nothing per shard, so a worker that
+dies or loses its lease mid-shard never leaves partial results; the shard is simply
+picked up again. Once every shard has output, ``merge`` concatenates them in manifest
+order into the phase's usual file.
+
+The manifest records a fingerprint of the keys, shard size and the phase's settings
+(prompts, rubric, model, mode). A worker whose fingerprint differs refuses to join
+rather than merging output made for other inputs, unless asked to re-shard, which
+discards the old shard set and plans a fresh one.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+LEASE_TTL_S = 60.0  # A lease not refreshed for this long is considered abandoned
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class ShardMismatchError(RuntimeError):
+    """The run already has a shard plan for other keys or settings."""
+
+
+def plan_fingerprint(keys: list[str], shard_size: int, settings: dict | None = None) -> str:
+    """Digest of everything a shard's output depends on besides the worker."""
+    payload = json.dumps({"keys": keys, "shard_size": shard_size, "settings": settings or {}}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class Shard:
+    id: str
+    keys: list[str]
+
+
+class ShardSet:
+    """The manifest, leases and outputs of one phase's shards in a run directory."""
+
+    def __init__(self, run_dir: Path, phase: str):
+        self.run_dir = Path(run_dir)
+        self.phase = phase
+        self.root = self.run_dir / "shards" / phase
+        self.manifest_path = self.root / "manifest.json"
+        self.lease_dir = self.root / "leases"
+        self.out_dir = self.root / "out"
+        self.work_dir = self.root / "work"
+        self._shards: list[Shard] | None = None
+
+    def plan(self, keys: list[str], shard_size: int, settings: dict | None = None, reshard: bool = False) -> bool:
+        """Write the manifest unless another worker already has; True if this call wrote it.
+
+        An existing manifest must have been planned with the same keys, shard size and
+        ``settings``; otherwise this raises ShardMismatchError, or with ``reshard``
+        discards the old shard set (leases, outputs and all) and plans anew.
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        fingerprint = plan_fingerprint(keys, shard_size, settings)
+        if self.manifest_path.exists():
+            planned = self._manifest().get("fingerprint")
+            if planned == fingerprint:
+                self._mkdirs()
+                return False
+            if not reshard:
+                raise ShardMismatchError(
+                    f"{self.root} was planned for other items or settings; "
+                    "pass --reshard to discard its shards and start over"
+                )
+            self.reset()
+        self._mkdirs()
+        manifest = {
+            "phase": self.phase,
+            "items": len(keys),
+            "shard_size": shard_size,
+            "fingerprint": fingerprint,
+            "shards": [
+                {"id": f"shard-{i // shard_size:05d}", "keys": keys[i : i + shard_size]}
+                for i in range(0, len(keys), shard_size)
+            ],
+        }
+        tmp = self.root / f"manifest.{default_worker_id()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.link(tmp, self.manifest_path)  # Fails if another worker got there first
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def reset(self):
+        """Discard the whole shard set (moved aside first, so no one sees it half-deleted)."""
+        stale = self.root.with_name(f"{self.phase}.stale.{default_worker_id()}")
+        try:
+            os.replace(self.root, stale)
+        except FileNotFoundError:
+            return
+        shutil.rmtree(stale, ignore_errors=True)
+        self._shards = None
+
+    def _mkdirs(self):
+        for d in (self.lease_dir, self.out_dir, self.work_dir):
+            d.mkdir(parents=True, exist_ok=True)
+
+    def _manifest(self) -> dict:
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def shards(self) -> list[Shard]:
+        if self._shards is None:
+            self._shards = [Shard(s["id"], s["keys"]) for s in self._manifest()["shards"]]
+        return self._shards
+
+    def output_path(self, shard: Shard) -> Path:
+        return self.out_dir / f"{shard.id}.jsonl"
+
+    def pending(self) -> list[Shard]:
+        """Shards without finished output."""
+        return [s for s in self.shards() if not self.output_path(s).exists()]
+
+    def merge(self, out_path: Path) -> int:
+        """Concatenate every shard's output in manifest order into ``out_path``; return line count."""
+        missing = [s.id for s in self.pending()]
+        if missing:
+            raise RuntimeError(f"{len(missing)} shards not finished (first: {missing[0]})")
+        tmp = out_path.with_name(f"{out_path.name}.{default_worker_id()}.tmp")
+        lines = 0
+        with open(tmp, "wb") as out:
+            for shard in self.shards():
+                with open(self.output_path(shard), "rb") as f:
+                    for line in f:
+                        out.write(line)
+                        lines += 1
+        os.replace(tmp, out_path)  # Concurrent mergers write identical files; last one wins
+        return lines
+
+
+class Lease:
+    """Exclusive claim on one shard, refreshed by a heartbeat thread until released."""
+
+    def __init__(self, path: Path, worker_id: str, ttl: float = LEASE_TTL_S):
+        self.path = path
+        self.worker_id = worker_id
+        self.ttl = ttl
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._heartbeat, daemon=True)
+
+    @classmethod
+    def acquire(cls, path: Path, worker_id: str, ttl: float = LEASE_TTL_S) -> "Lease | None":
+        """Create the lease file, taking over an expired one; None if someone else holds it."""
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if not cls._take_over_expired(path, worker_id, ttl):
+                    return None
+                continue
+            with os.fdopen(fd, "w") as f:
+                json.dump({"worker": worker_id, "acquired": time.time()}, f)
+            lease = cls(path, worker_id, ttl)
+            lease._thread.start()
+            return lease
+        return None
+
+    @staticmethod
+    def _take_over_expired(path: Path, worker_id: str, ttl: float) -> bool:
+        """Move an expired lease aside; True if it was expired and is now gone."""
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return False
+            aside = path.with_name(f"{path.name}.expired.{worker_id}")
+            os.rename(path, aside)  # Only one of several racing workers wins the rename
+        except FileNotFoundError:
+            return True  # Released (or moved aside by someone else) meanwhile: try to create
+        # The lease may have been renewed between the stat and the rename: put it back
+        if time.time() - aside.stat().st_mtime < ttl:
+            try:
+                os.link(aside, path)
+            except FileExistsError:
+                pass
+            aside.unlink(missing_ok=True)
+            return False
+        aside.unlink(missing_ok=True)
+        return True
+
+    def held(self) -> bool:
+        try:
+            with open(self.path) as f:
+                return json.load(f).get("worker") == self.worker_id
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+    def release(self):
+        self._stop.set()
+        self._thread.join()
+        if self.held():
+            self.path.unlink(missing_ok=True)
+
+    def _heartbeat(self):
+        while not self._stop.wait(self.ttl / 4):
+            if not self.held():
+                self.lost = True
+                return
+            os.utime(self.path)
+
+
+class ShardWorker:
+    """Claim and process shards until every shard in the set has output.
+
+    ``process(shard, work_path)`` must write the shard's complete output to
+    ``work_path``; it is renamed into ``out/`` only if the lease was still held.
+    """
+
+    def __init__(
+        self,
+        shard_set: ShardSet,
+        process: Callable[[Shard, Path], None],
+        worker_id: str | None = None,
+        ttl: float = LEASE_TTL_S,
+        poll_s: float | None = None,
+    ):
+        self.shard_set = shard_set
+        self.process = process
+        self.worker_id = worker_id or default_worker_id()
+        self.ttl = ttl
+        self.poll_s = poll_s if poll_s is not None else min(2.0, ttl / 4)
+        self.completed: list[str] = []
+
+    def run(self) -> list[str]:
+        """Work until no shard is pending; return the ids of the shards this worker completed."""
+        tag = f"[{self.shard_set.phase}] Worker {self.worker_id}"
+        total = len(self.shard_set.shards())
+        while True:
+            pending = self.shard_set.pending()
+            if not pending:
+                break
+            claimed = False
+            for shard in pending:
+                lease = Lease.acquire(self.shard_set.lease_dir / f"{shard.id}.lease", self.worker_id, self.ttl)
+                if lease is None:
+                    continue
+                claimed = True
+                try:
+                    self._run_shard(shard, lease, tag)
+                finally:
+                    lease.release()
+                done = total - len(self.shard_set.pending())
+                print(f"[{self.shard_set.phase}] Shards: {done}/{total} completed", flush=True)
+            if not claimed:
+                # Everything left is leased by other workers: wait for them to finish or expire
+                time.sleep(self.poll_s)
+        return self.completed
+
+    def _run_shard(self, shard: Shard, lease: Lease, tag: str):
+        out_path = self.shard_set.output_path(shard)
+        if out_path.exists():
+            return  # Finished by a worker whose lease expired just before ours
+        work_path = self.shard_set.work_dir / f"{shard.id}.{self.worker_id}.jsonl"
+        print(f"{tag} claimed {shard.id} ({len(shard.keys)} items)", flush=True)
+        self.process(shard, work_path)
+        if lease.lost or not lease.held():
+            print(f"{tag} lost the lease on {shard.id}; discarding its output", flush=True)
+            work_path.unlink(missing_ok=True)
+            return
+        os.replace(work_path, out_path)
+        self.completed.append(shard.id)
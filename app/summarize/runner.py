@@ -3,12 +3,18 @@
 import json
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
-from ..provider.base import BaseProvider, Message, ProviderError
+from ..budget import BudgetExceededError, BudgetLedger
+from ..provider.base import BaseProvider, Message, ProviderError, Usage
+from ..trace import NULL_TRACER
 from .schema import CallSummary
 
+MAX_TOKENS = 1024  # Output cap per summary
+
 
 class SummarizeRunner:
     """Run summarization over a dataset."""
@@ -23,6 +29,10 @@ class SummarizeRunner:
         model_pricing: dict | None = None,
         temperature: float = 0.7,
         seed: int | None = None,
+        tracer=None,
+        budget: BudgetLedger | None = None,
+        system_prompt: str | None = None,
+        progress=None,
     ):
         self.provider = provider
         self.prompts_dir = prompts_dir
@@ -32,10 +42,15 @@ class SummarizeRunner:
         self.model_pricing = model_pricing or {}
         self.temperature = temperature
         self.seed = seed
+        self.tracer = tracer or NULL_TRACER
+        self.budget = budget
+        self.progress = progress  # A background job's JobProgress: reports and cancellation
 
-        # Load prompts
-        with open(prompts_dir / "summarizer.system.txt") as f:
-            self.system_prompt = f.read().strip()
+        # Load prompts (a prompt sweep passes each candidate system prompt directly)
+        if system_prompt is None:
+            with open(prompts_dir / "summarizer.system.txt") as f:
+                system_prompt = f.read()
+        self.system_prompt = system_prompt.strip()
         with open(prompts_dir / "summarizer.user.txt") as f:
             self.user_template = f.read().strip()
 
@@ -43,36 +58,49 @@ class SummarizeRunner:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cost = 0.0
+        self._totals_lock = threading.Lock()
 
-    def run(self, transcripts: list[dict], workers: int = 5) -> list[dict]:
-        """Generate summaries for all transcripts with concurrent workers."""
-        print(f"[summarize] Summarizing {len(transcripts)} transcripts with {workers} workers...")
-        summaries = []
-        completed_count = 0
+    def _track_usage(self, usage: Usage) -> float | None:
+        """Add a response's tokens (and cost) to the session totals; return the cost."""
+        cost = None
+        if self.cost_calculator and self.model_pricing:
+            cost = self.cost_calculator(usage, self.model_pricing)
+        with self._totals_lock:  # Called from every worker thread
+            self.total_input_tokens += usage.prompt_tokens
+            self.total_output_tokens += usage.completion_tokens
+            if cost:
+                self.total_cost += cost
+        return cost
 
-        def summarize_one(transcript: dict) -> dict | None:
-            """Summarize a single transcript."""
-            user_prompt = self.user_template.format(
-                transcript_json=json.dumps(transcript, indent=2),
-                schema=CallSummary.schema_text(),
-                example=CallSummary.example_summary()
-            )
+    def build_messages(self, transcript: dict) -> list[Message]:
+        """The exact messages sent to the provider for ``transcript``."""
+        user_prompt = self.user_template.format(
+            transcript_json=json.dumps(transcript, indent=2),
+            schema=CallSummary.schema_text(),
+            example=CallSummary.example_summary()
+        )
+        return [
+            Message(role="system", content=self.system_prompt),
+            Message(role="user", content=user_prompt),
+        ]
 
-            messages = [
-                Message(role="system", content=self.system_prompt),
-                Message(role="user", content=user_prompt),
-            ]
+    def summarize_one(self, transcript: dict) -> dict:
+        """Summarize a single transcript; errors are returned in the result, not raised."""
+        messages = self.build_messages(transcript)
 
-            try:
-                # Call provider
+        try:
+            # Call provider
+            with self.tracer.span("provider_call") as span:
                 response = self.provider.generate(
                     messages,
                     temperature=self.temperature,
                     seed=self.seed,
-                    max_tokens=1024,
+                    max_tokens=MAX_TOKENS,
                 )
+                span.set(provider_latency_ms=response.latency_ms)
 
-                # Parse response - extract JSON from potential markdown fences
+            # Parse response - extract JSON from potential markdown fences
+            with self.tracer.span("parse"):
                 raw_text = response.text.strip()
 
                 # Try to extract JSON from markdown code blocks
@@ -89,30 +117,23 @@ class SummarizeRunner:
 
                 summary = json.loads(json_str)
 
-                # Add summary_id and transcript_id for traceability
-                # Extract the sequence number from transcript ID (e.g., TRA-20251002_122258-001 -> 001)
-                transcript_id = transcript["call_id"]
-                seq_num = transcript_id.split("-")[-1] if "-" in transcript_id else "000"
-                summary_id = f"SUM-{seq_num}"
-                summary["summary_id"] = summary_id
-                summary["transcript_id"] = transcript_id
-
-                # Track tokens and cost
-                cost = None
-                if response.usage:
-                    self.total_input_tokens += response.usage.prompt_tokens
-                    self.total_output_tokens += response.usage.completion_tokens
-
-                    if self.cost_calculator and self.model_pricing:
-                        cost = self.cost_calculator(response.usage, self.model_pricing)
-                        if cost:
-                            self.total_cost += cost
-
-                # Log to audit trail
-                if self.audit_logger:
+            # Add summary_id and transcript_id for traceability
+            # Extract the sequence number from transcript ID (e.g., TRA-20251002_122258-001 -> 001)
+            transcript_id = transcript["call_id"]
+            seq_num = transcript_id.split("-")[-1] if "-" in transcript_id else "000"
+            summary_id = f"SUM-{seq_num}"
+            summary["summary_id"] = summary_id
+            summary["transcript_id"] = transcript_id
+
+            # Track tokens and cost
+            cost = self._track_usage(response.usage) if response.usage else None
+
+            # Log to audit trail
+            if self.audit_logger:
+                with self.tracer.span("audit"):
                     self.audit_logger.log_call(
                         phase="summarize",
-                        provider=self.provider.__class__.__name__.replace("Provider", "").lower(),
+                        provider=self.provider.provider_name,
                         model=self.provider.model_id,
                         messages=messages,
                         response=response,
@@ -122,73 +143,140 @@ class SummarizeRunner:
                         status="ok",
                     )
 
-                return {
-                    "summary": summary,
-                    "call_id": transcript["call_id"],
-                    "tokens": response.usage.total_tokens if response.usage else 0,
-                    "cost": cost,
-                    "error": None,
-                }
-
-            except (ProviderError, json.JSONDecodeError) as e:
-                # Log error
-                if self.audit_logger:
-                    self.audit_logger.log_call(
-                        phase="summarize",
-                        provider=self.provider.__class__.__name__.replace("Provider", "").lower(),
-                        model=self.provider.model_id,
-                        messages=messages,
-                        response=None,
-                        temperature=self.temperature,
-                        seed=self.seed,
-                        cost_usd=None,
-                        status="error",
-                        error=str(e),
-                    )
-                return {"summary": None, "call_id": transcript["call_id"], "tokens": 0, "cost": None, "error": str(e)}
+            return {
+                "summary": summary,
+                "call_id": transcript["call_id"],
+                "tokens": response.usage.total_tokens if response.usage else 0,
+                "cost": cost,
+                "error": None,
+            }
+
+        except (ProviderError, json.JSONDecodeError) as e:
+            # Log error (a call refused by the budget was never sent)
+            if self.audit_logger and not isinstance(e, BudgetExceededError):
+                self.audit_logger.log_call(
+                    phase="summarize",
+                    provider=self.provider.provider_name,
+                    model=self.provider.model_id,
+                    messages=messages,
+                    response=None,
+                    temperature=self.temperature,
+                    seed=self.seed,
+                    cost_usd=None,
+                    status="error",
+                    error=str(e),
+                )
+            return {"summary": None, "call_id": transcript["call_id"], "tokens": 0, "cost": None, "error": str(e)}
+
+    def _report(self, done: int, total: int | str, failed: int):
+        if self.progress is not None:
+            self.progress.update(
+                "summarize",
+                done,
+                total if isinstance(total, int) else None,
+                failed=failed,
+                tokens=self.total_input_tokens + self.total_output_tokens,
+                cost=self.total_cost,
+            )
+
+    def run(self, transcripts: list[dict], workers: int = 5) -> list[dict]:
+        """Generate summaries for all transcripts with concurrent workers."""
+        return list(self.iter_run(transcripts, workers=workers, total=len(transcripts)))
+
+    def iter_run(
+        self,
+        transcripts: Iterable[dict],
+        workers: int = 5,
+        total: int | None = None,
+        max_in_flight: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield summaries as they complete, pulling transcripts from ``transcripts`` lazily.
+
+        At most ``max_in_flight`` (default ``2 * workers``) transcripts are submitted at
+        once, so memory stays flat however long the input is. ``total`` is only used for
+        the progress lines.
+        """
+        total = total if total is not None else "?"
+        window = max_in_flight or 2 * workers
+        print(f"[summarize] Summarizing {total} transcripts with {workers} workers...")
+        completed_count = 0
+        failed_count = 0
+        self._report(completed_count, total, failed_count)
 
         # Use ThreadPoolExecutor for concurrent processing
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Submit all tasks
-            futures = {executor.submit(summarize_one, transcript): transcript for transcript in transcripts}
-
-            # Collect results as they complete
-            for future in as_completed(futures):
-                transcript = futures[future]
-                try:
-                    result = future.result()
+        with self.tracer.span("summarize", "phase", items=total, workers=workers), ThreadPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            pending = {}
+            transcript_iter = iter(transcripts)
+
+            def submit_next() -> bool:
+                if self.budget is not None and self.budget.exhausted:
+                    return False  # Leave the rest unsubmitted
+                if self.progress is not None and self.progress.cancelled:
+                    return False
+                transcript = next(transcript_iter, None)
+                if transcript is None:
+                    return False
+                item = self.tracer.wrap(self.summarize_one, "summarize_item", call_id=transcript["call_id"])
+                pending[executor.submit(item, transcript)] = transcript
+                return True
+
+            for _ in range(window):
+                if not submit_next():
+                    break
+
+            # Collect results as they complete, topping the window back up
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    transcript = pending.pop(future)
                     completed_count += 1
+                    summary = None
+                    try:
+                        result = future.result()
+                        if result["error"]:
+                            failed_count += 1
+                            print(
+                                f"  [{completed_count}/{total}] {result['call_id']} → ERROR: {result['error']}",
+                                flush=True,
+                            )
+                        else:
+                            cost_str = f"${result['cost']:.4f}" if result["cost"] else "$0.0000"
+                            print(
+                                f"  [{completed_count}/{total}] {result['call_id']} → {result['tokens']} tokens, {cost_str}",
+                                flush=True,
+                            )
+                            summary = result["summary"]
 
-                    if result["error"]:
-                        print(
-                            f"  [{completed_count}/{len(transcripts)}] {result['call_id']} → ERROR: {result['error']}",
-                            flush=True,
-                        )
-                    else:
-                        cost_str = f"${result['cost']:.4f}" if result["cost"] else "$0.0000"
+                        # Print progress message for UI
+                        print(f"[summarize] Progress: {completed_count}/{total} summaries completed", flush=True)
+
+                    except Exception as e:
+                        failed_count += 1
                         print(
-                            f"  [{completed_count}/{len(transcripts)}] {result['call_id']} → {result['tokens']} tokens, {cost_str}",
+                            f"  [{completed_count}/{total}] {transcript['call_id']} → ERROR: {e}",
+                            file=sys.stderr,
                             flush=True,
                         )
-                        summaries.append(result["summary"])
-
-                    # Print progress message for UI
-                    print(f"[summarize] Progress: {completed_count}/{len(transcripts)} summaries completed", flush=True)
+                    self._report(completed_count, total, failed_count)
+                    submit_next()
+                    if summary is not None:
+                        yield summary
 
-                except Exception as e:
-                    completed_count += 1
-                    print(
-                        f"  [{completed_count}/{len(transcripts)}] {transcript['call_id']} → ERROR: {e}",
-                        file=sys.stderr,
-                        flush=True,
-                    )
+        if self.budget is not None and self.budget.exhausted:
+            print(f"[summarize] Budget exhausted ({self.budget.stop_reason}); stopped after {completed_count} transcripts")
+        if self.progress is not None and self.progress.cancelled:
+            print(f"[summarize] Cancelled; stopped after {completed_count} transcripts")
 
-        return summaries
+        # Make calls.jsonl complete before anything reads it
+        if self.audit_logger:
+            self.audit_logger.flush()
 
     def save(self, summaries: list[dict], run_dir: Path):
         """Save summaries to output files."""
         out_file = run_dir / "summaries.jsonl"
-        with open(out_file, "w") as f:
+        with self.tracer.span("write", "phase", file=out_file.name), open(out_file, "w") as f:
             for summary in summaries:
                 f.write(json.dumps(summary, ensure_ascii=False) + "\n")
         print(f"[summarize] ✓ Saved {len(summaries)} summaries to {out_file}")
@@ -0,0 +1,269 @@
+"""Lightweight span tracing written as Chrome trace events (chrome://tracing, Perfetto)."""
+
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+_current: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+_ids = itertools.count(1)
+
+
+def now_us() -> float:
+    """Monotonic timestamp in microseconds (CLOCK_MONOTONIC: comparable across processes)."""
+    return time.perf_counter_ns() / 1000
+
+
+class Span:
+    """An open span; attributes set before it ends are exported as event args."""
+
+    __slots__ = ("name", "cat", "span_id", "parent_id", "start_us", "attrs")
+
+    def __init__(self, name: str, cat: str, parent: "Span | None", attrs: dict):
+        self.name = name
+        self.cat = cat
+        self.span_id = next(_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_us = now_us()
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """Record spans (run → phase → item → call/parse/normalize/gate/write) to a trace file.
+
+    The file is the Chrome trace-event JSON array format, one complete ("X")
+    event per line and no closing bracket, which trace viewers accept; several
+    processes (one per CLI command) can append to the same run's trace.
+    Spans nest through a context variable; work handed to a thread pool passes
+    its parent explicitly via ``wrap``, which also records the time the item
+    waited in the queue.
+    """
+
+    enabled = True
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        new_file = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = open(self.path, "a")
+        if new_file:
+            self._file.write("[\n")
+        self._emit({"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": f"pid {self.pid}"}})
+
+    @contextmanager
+    def span(self, name: str, cat: str = "stage", parent: Span | None = None, **attrs):
+        """Time a block; nests under the current span unless ``parent`` is given."""
+        span = Span(name, cat, parent if parent is not None else _current.get(), attrs)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=type(e).__name__)
+            raise
+        finally:
+            _current.reset(token)
+            self._end(span)
+
+    def current(self) -> Span | None:
+        return _current.get()
+
+    def wrap(self, fn, name: str, parent: Span | None = None, **attrs):
+        """Wrap ``fn`` for a thread pool: a queue-wait span from now until it starts, then an item span."""
+        parent = parent if parent is not None else _current.get()
+        submitted_us = now_us()
+
+        def run(*args, **kwargs):
+            started_us = now_us()
+            self.mark("queue_wait", "queue", submitted_us, parent)
+            with self.span(name, "item", parent=parent, queue_wait_ms=(started_us - submitted_us) / 1000, **attrs):
+                return fn(*args, **kwargs)
+
+        return run
+
+    def mark(self, name: str, cat: str, start_us: float, parent: Span | None = None, **attrs):
+        """Record an already-finished span from ``start_us`` (a ``now_us()`` reading) to now."""
+        parent_id = parent.span_id if parent is not None else None
+        self._emit_span(name, cat, start_us, now_us() - start_us, next(_ids), parent_id, attrs)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def _end(self, span: Span):
+        dur_us = now_us() - span.start_us
+        self._emit_span(span.name, span.cat, span.start_us, dur_us, span.span_id, span.parent_id, span.attrs)
+
+    def _emit_span(
+        self, name: str, cat: str, start_us: float, dur_us: float, span_id: int, parent_id: int | None, attrs: dict
+    ):
+        args = {**attrs, "span_id": span_id, "parent_id": parent_id}
+        self._emit(
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round(start_us, 1),
+                "dur": round(dur_us, 1),
+                "pid": self.pid,
+                "tid": threading.get_ident() % 1_000_000,
+                "args": args,
+            }
+        )
+
+    def _emit(self, event: dict):
+        line = json.dumps(event, default=str) + ",\n"
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+                self._file.flush()
+
+
+class NullTracer:
+    """Tracer stand-in when tracing is off: spans cost one context manager."""
+
+    enabled = False
+
+    @contextmanager
+    def span(self, name: str, cat: str = "stage", parent: Span | None = None, **attrs):
+        yield _NULL_SPAN
+
+    def current(self) -> Span | None:
+        return None
+
+    def wrap(self, fn, name: str, parent: Span | None = None, **attrs):
+        return fn
+
+    def mark(self, name: str, cat: str, start_us: float, parent: Span | None = None, **attrs):
+        pass
+
+    def close(self):
+        pass
+
+
+class _NullSpan:
+    def set(self, **attrs):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+NULL_TRACER = NullTracer()
+
+
+# Reading / summarizing ----------------------------------------------------
+
+
+def load_trace(path: Path) -> list[dict]:
+    """Complete ("X") events from a trace file (tolerates the open JSON array)."""
+    events = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip().rstrip(",")
+            if not line or line in ("[", "]"):
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn last line from an interrupted run
+            if event.get("ph") == "X":
+                events.append(event)
+    return events
+
+
+def summarize_trace(events: list[dict], top: int = 5) -> dict:
+    """Per-phase service vs queue time, the critical path and the slowest items."""
+    # Span ids are only unique within a process: key spans (and parents) by (pid, span_id)
+    def key(e: dict) -> tuple[int, int]:
+        return e["pid"], e["args"]["span_id"]
+
+    def parent(e: dict) -> tuple[int, int] | None:
+        parent_id = e["args"].get("parent_id")
+        return None if parent_id is None else (e["pid"], parent_id)
+
+    by_id = {key(e): e for e in events}
+    children: dict[tuple[int, int] | None, list[dict]] = {}
+    for e in events:
+        children.setdefault(parent(e), []).append(e)
+
+    def end(e: dict) -> float:
+        return e["ts"] + e["dur"]
+
+    phases = []
+    for phase in (e for e in events if e["cat"] == "phase"):
+        kids = children.get(key(phase), [])
+        items = [k for k in kids if k["cat"] == "item"]
+        queue = [k for k in kids if k["cat"] == "queue"]
+        stages: dict[str, float] = {}
+        for item in items:
+            for stage in children.get(key(item), []):
+                stages[stage["name"]] = stages.get(stage["name"], 0.0) + stage["dur"] / 1000
+        durations = sorted(i["dur"] / 1000 for i in items)
+        phases.append(
+            {
+                "name": phase["name"],
+                "pid": phase["pid"],
+                "wall_ms": phase["dur"] / 1000,
+                "items": len(items),
+                "service_ms": sum(durations),
+                "queue_wait_ms": sum(q["dur"] / 1000 for q in queue),
+                "item_p50_ms": durations[len(durations) // 2] if durations else 0.0,
+                "item_max_ms": durations[-1] if durations else 0.0,
+                "stages_ms": dict(sorted(stages.items(), key=lambda kv: -kv[1])),
+            }
+        )
+
+    # Critical path: walk back from each span's end through the children that
+    # finished last, each chain link ending before the next one started
+    critical = []
+
+    def walk(node: dict, depth: int):
+        critical.append(
+            {
+                "name": node["name"],
+                "cat": node["cat"],
+                "depth": depth,
+                "dur_ms": node["dur"] / 1000,
+                "args": _public(node["args"]),
+            }
+        )
+        # One pass over the children, latest-ending first: the horizon only moves
+        # back, so a child ending after it can never join the chain later
+        kids = sorted((k for k in children.get(key(node), []) if k["cat"] != "queue"), key=end, reverse=True)
+        chain, horizon = [], float("inf")
+        for k in kids:
+            if end(k) <= horizon:
+                chain.append(k)
+                horizon = k["ts"]
+        for link in reversed(chain):
+            walk(link, depth + 1)
+
+    for root in sorted(children.get(None, []), key=lambda e: e["ts"]):
+        walk(root, 0)
+
+    worst = []
+    for item in sorted((e for e in events if e["cat"] == "item"), key=lambda e: -e["dur"])[:top]:
+        stages = sorted(children.get(key(item), []), key=lambda s: -s["dur"])
+        worst.append(
+            {
+                "name": item["name"],
+                "phase": by_id.get(parent(item), {}).get("name"),
+                "dur_ms": item["dur"] / 1000,
+                "queue_wait_ms": item["args"].get("queue_wait_ms", 0.0),
+                "args": _public(item["args"]),
+                "slowest_stage": (stages[0]["name"], stages[0]["dur"] / 1000) if stages else None,
+            }
+        )
+    return {"phases": phases, "critical_path": critical, "worst_items": worst}
+
+
+def _public(args: dict) -> dict:
+    return {k: v for k, v in args.items() if k not in ("span_id", "parent_id", "queue_wait_ms")}
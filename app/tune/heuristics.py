@@ -1,37 +1,39 @@
 """Heuristic-based prompt tuning suggestions."""
 
+from ..judge.rubric import DEFAULT_RUBRIC_PATH, Rubric
 
-def suggest_prompt_changes(evaluations: list[dict]) -> list[str]:
-    """Analyze failure modes and suggest prompt changes."""
-    suggestions = []
 
-    # Aggregate low-scoring dimensions
-    dim_scores = {}
-    for eval in evaluations:
-        for dim, score in eval.get("scores", {}).items():
-            if dim not in dim_scores:
-                dim_scores[dim] = []
-            dim_scores[dim].append(score)
+def suggest_prompt_changes(evaluations: list[dict], rubric: Rubric | None = None) -> list[str]:
+    """Analyze failure modes and suggest prompt changes.
+
+    A dimension is weak when its average is under its ``rubric`` min_threshold
+    (default rubric if omitted); nothing is suggested when every evaluation passes the gates.
+    """
+    compiled = (rubric or Rubric(DEFAULT_RUBRIC_PATH)).compile()
+    matrix, gates = compiled.gate(evaluations)
+    if gates.pass_mask.all():
+        return ["No changes recommended; all dimensions meet thresholds."]
+    suggestions = []
 
-    # Compute averages
-    dim_avgs = {dim: sum(scores) / len(scores) for dim, scores in dim_scores.items()}
+    # Dimensions whose average is under their threshold, in one pass over the score matrix
+    weak = {dim for dim, stats in matrix.dimension_stats().items() if stats["avg"] < compiled.threshold(dim)}
 
     # Heuristic rules
-    if dim_avgs.get("coverage", 5) < 4.0:
+    if "coverage" in weak:
         suggestions.append("+ Add explicit instruction: 'Capture caller intent, completed actions, and pending items.'")
 
-    if dim_avgs.get("factuality", 5) < 4.0:
+    if "factuality" in weak:
         suggestions.append("+ Add constraint: 'Do not infer or assume information not present in the transcript.'")
         suggestions.append("- Remove any language encouraging interpretation")
 
-    if dim_avgs.get("structure_brevity", 5) < 4.0:
+    if "structure_brevity" in weak:
         suggestions.append("+ Add limit: 'Max 100 words' (currently 120)")
         suggestions.append("+ Add structure requirement: 'Use bullet points for next_steps'")
 
-    if dim_avgs.get("actionability", 5) < 4.0:
+    if "actionability" in weak:
         suggestions.append("+ Add requirement: 'Explicitly list any follow-up actions or deadlines.'")
 
-    if dim_avgs.get("safety_compliance", 5) < 4.0:
+    if "safety_compliance" in weak:
         suggestions.append("+ Add safety instruction: 'Flag any compliance concerns or sensitive data mentions.'")
 
     return suggestions if suggestions else ["No changes recommended; all dimensions meet thresholds."]
@@ -2,6 +2,7 @@
 
 import json
 
+from ..judge.rubric import DEFAULT_RUBRIC_PATH, Rubric
 from ..provider.base import BaseProvider, Message, ProviderError
 
 
@@ -9,13 +10,14 @@ def llm_suggest_changes(
     provider: BaseProvider,
     current_prompt: str,
     evaluations: list[dict],
+    rubric: Rubric | None = None,
 ) -> tuple[list[str], dict]:
     """Use an LLM to propose GENERIC prompt improvements based on evaluation patterns.
 
     Returns:
         (suggestions, metadata) where metadata includes usage/cost info
     """
-    failure_summary = summarize_failures(evaluations)
+    failure_summary = summarize_failures(evaluations, rubric)
 
     system_msg = """You are a prompt engineering expert. Your job is to improve prompts by identifying SYSTEMIC, GENERIC issues—not scenario-specific problems.
 
@@ -110,60 +112,68 @@ Return ONLY generic, reusable improvements. Return JSON only, no markdown fences
         return [f"⚠️ LLM tuner error: {str(e)}"], {}
 
 
-def summarize_failures(evaluations: list[dict]) -> str:
-    """Summarize common failure patterns with dimension-level analysis."""
-    failures = [e for e in evaluations if not e.get("overall_pass", True)]
+def summarize_failures(evaluations: list[dict], rubric: Rubric | None = None) -> str:
+    """Summarize common failure patterns with dimension-level analysis.
 
-    # Aggregate dimension scores across all evals
-    dim_scores = {}
-    dim_rationales = {}
-
-    for eval in evaluations:
-        for dim, score in eval.get("scores", {}).items():
-            if dim not in dim_scores:
-                dim_scores[dim] = []
-                dim_rationales[dim] = []
-            dim_scores[dim].append(score)
+    Failures and low scores follow ``rubric``'s gates and thresholds (default rubric if omitted).
+    """
+    import numpy as np  # Deferred: app.judge.runner imports this module
 
-            # Collect rationales for low scores
-            if score < 4.0:
-                rationale = eval.get("rationales", {}).get(dim, "")
-                if rationale:
-                    dim_rationales[dim].append(f"{eval.get('call_id', 'unknown')}: {rationale}")
+    compiled = (rubric or Rubric(DEFAULT_RUBRIC_PATH)).compile()
+    matrix, gates = compiled.gate(evaluations)
+    dim_stats = matrix.dimension_stats()
+    low = gates.below_min & ~np.isnan(matrix.scores)  # Scores present and under threshold
+    failures = int((~gates.pass_mask).sum())
 
     # Build summary
     summary_lines = []
 
     if failures:
-        summary_lines.append(f"Failed {len(failures)}/{len(evaluations)} evaluations")
+        summary_lines.append(f"Failed {failures}/{len(evaluations)} evaluations")
     else:
         summary_lines.append(f"All {len(evaluations)} evaluations passed")
 
     summary_lines.append("\nDimension Performance:")
-    for dim, scores in dim_scores.items():
-        avg = sum(scores) / len(scores)
-        min_score = min(scores)
-        max_score = max(scores)
-        fail_count = sum(1 for s in scores if s < 4.0)
-
-        status = "✓" if avg >= 4.0 else "⚠️"
-        summary_lines.append(f"  {status} {dim}: avg={avg:.1f} (range {min_score}-{max_score}, {fail_count} low)")
-
-        # Add sample rationales for low-scoring dimensions
-        if fail_count > 0 and dim_rationales.get(dim):
-            for rationale in dim_rationales[dim][:2]:  # Show up to 2 examples
-                summary_lines.append(f"     → {rationale}")
+    for j, dim in enumerate(matrix.names):
+        stats = dim_stats.get(dim)
+        if stats is None:
+            continue
+        avg = stats["avg"]
+        fail_count = int(low[:, j].sum())
+
+        status = "✓" if avg >= compiled.threshold(dim) else "⚠️"
+        summary_lines.append(f"  {status} {dim}: avg={avg:.1f} (range {stats['min']}-{stats['max']}, {fail_count} low)")
+
+        # Add sample rationales for low-scoring dimensions (up to 2 examples)
+        shown = 0
+        for i in np.flatnonzero(low[:, j]):
+            rationale = evaluations[i].get("rationales", {}).get(dim, "")
+            if rationale:
+                summary_lines.append(f"     → {evaluations[i].get('call_id', 'unknown')}: {rationale}")
+                shown += 1
+                if shown == 2:
+                    break
 
     # Hallucination flags
-    hallucination_count = 0
-    for e in evaluations:
-        flags = e.get("hallucination_flags", [])
-        if isinstance(flags, list):
-            hallucination_count += len(flags)
-        elif flags:  # If it's a bool and True
-            hallucination_count += 1
+    hallucination_count = int(matrix.flag_counts.sum())
 
     if hallucination_count > 0:
         summary_lines.append(f"\n⚠️ {hallucination_count} hallucination flags detected")
 
     return "\n".join(summary_lines)
+
+
+def rationale_targets(evaluations: list[dict], rubric: Rubric | None = None, per_dim: int = 2) -> dict[int, set[str]]:
+    """Evaluation index -> dimensions whose rationale ``summarize_failures`` will quote.
+
+    Mirrors its selection: the first ``per_dim`` low-scoring evaluations per dimension.
+    """
+    import numpy as np
+
+    matrix, gates = (rubric or Rubric(DEFAULT_RUBRIC_PATH)).compile().gate(evaluations)
+    low = gates.below_min & ~np.isnan(matrix.scores)
+    targets: dict[int, set[str]] = {}
+    for j, dim in enumerate(matrix.names):
+        for i in np.flatnonzero(low[:, j])[:per_dim]:
+            targets.setdefault(int(i), set()).add(dim)
+    return targets
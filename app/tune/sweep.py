@@ -0,0 +1,269 @@
+"""Prompt sweep: successive halving over candidate summarizer prompts."""
+
+import json
+import math
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..jsonl_index import JsonlIndex
+from ..judge.runner import JudgeRunner
+from ..judge.sequential import bootstrap_mean_interval, wilson_interval
+from ..summarize.runner import SummarizeRunner
+
+
+@dataclass
+class SweepConfig:
+    """Successive-halving schedule."""
+
+    min_items: int = 4  # Transcripts per candidate in the first round
+    eta: int = 2  # Keep the top 1/eta each round and multiply the sample by eta
+    max_items: int | None = None  # Cap on transcripts per candidate (default: all)
+    confidence: float = 0.95
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.eta < 2:
+            raise ValueError(f"eta must be at least 2 (got {self.eta}); eta=1 never drops a candidate")
+        if self.min_items < 1:
+            raise ValueError(f"min_items must be at least 1 (got {self.min_items})")
+        if self.max_items is not None and self.max_items < 1:
+            raise ValueError(f"max_items must be at least 1 (got {self.max_items})")
+
+
+@dataclass
+class Candidate:
+    """A summarizer prompt under test and the results gathered for it so far."""
+
+    name: str
+    summarizer: SummarizeRunner
+    scores: dict[str, float] = field(default_factory=dict)  # call_id -> average judge score
+    passed: dict[str, bool] = field(default_factory=dict)
+    summaries: list[dict] = field(default_factory=list)
+    evaluations: list[dict] = field(default_factory=list)
+    summary_errors: int = 0
+    judge_errors: int = 0
+    failed: int = 0  # Items that raised instead of returning a result
+    eliminated_round: int | None = None
+    attempted: set = field(default_factory=set)
+
+    @property
+    def mean(self) -> float:
+        return sum(self.scores.values()) / len(self.scores) if self.scores else 0.0
+
+
+class PromptSweep:
+    """Rank candidate summarizer prompts, spending samples where they matter.
+
+    Every round evaluates the surviving candidates on the same prefix of one
+    seeded transcript order, so comparisons are paired and later rounds only
+    summarize and judge the new transcripts. The bottom (1 - 1/eta) are dropped
+    each round until one candidate remains or the transcripts run out. A
+    summary the model fails to produce scores 0 (the prompt's fault); a failed
+    judge call, or an item that raises, is left out. The judge (and its
+    judgment cache) is shared by all candidates. Transcripts can come from a
+    JsonlIndex, in which case only each round's new ones are read from disk.
+    """
+
+    def __init__(
+        self,
+        candidates: list[Candidate],
+        judge: JudgeRunner,
+        output_dir: Path,
+        config: SweepConfig | None = None,
+        workers: int = 5,
+    ):
+        if len(candidates) < 2:
+            raise ValueError("A sweep needs at least two candidate prompts")
+        if len({c.name for c in candidates}) != len(candidates):
+            raise ValueError("Candidate names must be unique")
+        self.candidates = candidates
+        self.judge = judge
+        self.output_dir = output_dir
+        self.config = config or SweepConfig()
+        self.workers = workers
+        self.rounds: list[dict] = []
+        self._lock = threading.Lock()
+
+        # Session stats
+        self.summarize_calls = 0
+        self.judge_calls = 0
+        self.judge_cached = 0
+
+    def run(self, transcripts: list[dict] | JsonlIndex) -> list[dict]:
+        """Run the sweep and return the leaderboard (also written to sweep.json)."""
+        cfg = self.config
+        if isinstance(transcripts, JsonlIndex):
+            order, fetch = transcripts.keys(), transcripts.get_many
+        else:
+            by_id = {t["call_id"]: t for t in transcripts}
+            order, fetch = list(by_id), lambda ids: {i: by_id[i] for i in ids}
+        random.Random(cfg.seed).shuffle(order)
+        n_total = min(len(order), cfg.max_items or len(order))
+        if n_total == 0:
+            raise ValueError("No transcripts to sweep over")
+
+        alive = list(self.candidates)
+        n = min(max(cfg.min_items, 1), n_total)
+        round_no = 0
+        print(
+            f"[sweep] {len(alive)} candidates, up to {n_total} transcripts each; "
+            f"successive halving from {n} items (eta={cfg.eta})"
+        )
+        while True:
+            self._evaluate(alive, order[:n], fetch, round_no)
+            ranked = sorted(alive, key=lambda c: c.mean, reverse=True)
+            self.rounds.append(
+                {"round": round_no, "items": n, "means": {c.name: round(c.mean, 4) for c in ranked}}
+            )
+            print(
+                f"[sweep] Round {round_no} ({n} items): "
+                + ", ".join(f"{c.name} {c.mean:.2f}" for c in ranked)
+            )
+            if len(alive) == 1 or n >= n_total:
+                break
+            keep = max(1, math.ceil(len(alive) / cfg.eta))
+            for c in ranked[keep:]:
+                c.eliminated_round = round_no
+            print(f"[sweep] Dropping {', '.join(c.name for c in ranked[keep:])}")
+            alive = ranked[:keep]
+            n = min(n_total, n * cfg.eta)
+            round_no += 1
+
+        leaderboard = self.leaderboard()
+        self.save(leaderboard, n_total)
+        return leaderboard
+
+    def _evaluate(self, candidates: list[Candidate], call_ids: list[str], fetch, round_no: int):
+        """Summarize and judge every (candidate, transcript) pair not yet attempted."""
+        pending = [(c, i) for c in candidates for i in call_ids if i not in c.attempted]
+        if not pending:
+            return
+        transcripts = fetch(dict.fromkeys(i for _, i in pending))
+        jobs = [(c, transcripts[i]) for c, i in pending if i in transcripts]
+        for c, i in pending:
+            c.attempted.add(i)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._evaluate_one, c, t): (c, t) for c, t in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as e:  # One broken item must not abort the sweep
+                    candidate, transcript = futures[future]
+                    with self._lock:
+                        candidate.failed += 1
+                    print(
+                        f"[sweep] Warning: {candidate.name} on {transcript['call_id']} failed: {e}",
+                        file=sys.stderr,
+                        flush=True,
+                    )
+                print(f"[sweep] Progress: {done}/{len(jobs)} round {round_no} items completed", flush=True)
+
+    def _evaluate_one(self, candidate: Candidate, transcript: dict):
+        call_id = transcript["call_id"]
+        result = candidate.summarizer.summarize_one(transcript)
+        judged = None if result["error"] else self.judge.evaluate_one(transcript, result["summary"])
+
+        with self._lock:
+            self.summarize_calls += 1
+            if result["error"]:
+                candidate.summary_errors += 1
+                candidate.scores[call_id] = 0.0
+                candidate.passed[call_id] = False
+                return
+            candidate.summaries.append(result["summary"])
+            if judged is None or judged["error"]:
+                candidate.judge_errors += 1
+                return
+            if judged.get("cached"):
+                self.judge_cached += 1
+            else:
+                self.judge_calls += 1
+            candidate.evaluations.append(judged["evaluation"])
+            candidate.scores[call_id] = judged["avg_score"]
+            candidate.passed[call_id] = judged["evaluation"].get("overall_pass", False)
+
+    def leaderboard(self) -> list[dict]:
+        """Candidates ranked by how far they survived, then by mean score, with intervals."""
+        cfg = self.config
+        rng = random.Random(cfg.seed)
+        final_round = len(self.rounds)
+        ranked = sorted(
+            self.candidates,
+            key=lambda c: (final_round if c.eliminated_round is None else c.eliminated_round, c.mean),
+            reverse=True,
+        )
+        board = []
+        for rank, c in enumerate(ranked, 1):
+            scores = list(c.scores.values())
+            passes = sum(c.passed.values())
+            mean_ci = bootstrap_mean_interval(scores, cfg.confidence, rng=rng)
+            board.append(
+                {
+                    "rank": rank,
+                    "name": c.name,
+                    "items": len(scores),
+                    "mean_score": c.mean,
+                    "mean_score_ci": list(mean_ci) if mean_ci else None,
+                    "pass_rate": passes / len(c.passed) if c.passed else 0.0,
+                    "pass_rate_ci": list(wilson_interval(passes, len(c.passed), cfg.confidence)),
+                    "summary_errors": c.summary_errors,
+                    "judge_errors": c.judge_errors,
+                    "failed": c.failed,
+                    "eliminated_round": c.eliminated_round,
+                }
+            )
+        return board
+
+    def save(self, leaderboard: list[dict], n_total: int):
+        """Write sweep.json plus each candidate's summaries and evaluations."""
+        for c in self.candidates:
+            out_dir = self.output_dir / "sweep" / c.name
+            out_dir.mkdir(parents=True, exist_ok=True)
+            for name, rows in (("summaries.jsonl", c.summaries), ("evaluations.jsonl", c.evaluations)):
+                with open(out_dir / name, "w") as f:
+                    for row in rows:
+                        f.write(json.dumps(row) + "\n")
+
+        items_evaluated = sum(len(c.attempted) for c in self.candidates)
+        full_items = n_total * len(self.candidates)
+        result = {
+            "config": {
+                "min_items": self.config.min_items,
+                "eta": self.config.eta,
+                "max_items": n_total,
+                "confidence": self.config.confidence,
+                "seed": self.config.seed,
+            },
+            "rounds": self.rounds,
+            "leaderboard": leaderboard,
+            "items_evaluated": items_evaluated,
+            "items_full_sweep": full_items,
+            "summarize_calls": self.summarize_calls,
+            "judge_calls": self.judge_calls,
+            "judge_cached": self.judge_cached,
+        }
+        with open(self.output_dir / "sweep.json", "w") as f:
+            json.dump(result, f, indent=2)
+
+        print(f"\n[sweep] Leaderboard ({self.config.confidence:.0%} intervals):")
+        print(f"  {'#':>2}  {'candidate':<24} {'n':>4}  {'mean score':<22} {'pass rate':<24} status")
+        for row in leaderboard:
+            ci = row["mean_score_ci"]
+            mean_ci = f"[{ci[0]:.2f}, {ci[1]:.2f}]" if ci else "[n/a]"
+            plo, phi = row["pass_rate_ci"]
+            status = "finalist" if row["eliminated_round"] is None else f"dropped in round {row['eliminated_round']}"
+            print(
+                f"  {row['rank']:>2}  {row['name']:<24} {row['items']:>4}  "
+                f"{row['mean_score']:.2f} {mean_ci:<19}"
+                f"{row['pass_rate']:.0%} [{plo:.0%}, {phi:.0%}]{'':<8} {status}"
+            )
+        print(
+            f"[sweep] Evaluated {items_evaluated} of {full_items} candidate × transcript pairs "
+            f"({1 - items_evaluated / full_items:.0%} saved); {self.judge_cached} judgments from cache"
+        )
+        print(f"[sweep] ✓ Saved {self.output_dir / 'sweep.json'}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark: AuditLogger at a paced 10k records/s vs the old open/append/close per record.
+
+Usage: python benchmarks/bench_audit.py [--rate 10000] [--seconds 3] [--threads 8] [--fsync close]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.audit import FSYNC_POLICIES, AuditLogger
+from app.provider.base import LLMResponse, Message, Usage
+
+MESSAGES = [Message(role="system", content="Evaluate."), Message(role="user", content="x" * 2000)]
+RESPONSE = LLMResponse(text="{}" * 200, usage=Usage(prompt_tokens=600, completion_tokens=100, total_tokens=700))
+
+
+class UnbufferedAuditLogger(AuditLogger):
+    """The previous behaviour: open, append one line and close on every call, no lock."""
+
+    def __init__(self, run_dir: Path):
+        self.run_dir = run_dir
+        self.calls_file = run_dir / "calls.jsonl"
+        self.payloads = None
+        self._closed = False
+
+    def write(self, record: dict):
+        with open(self.calls_file, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def flush(self, timeout=None):
+        pass
+
+    def close(self):
+        pass
+
+
+def drive(logger: AuditLogger, rate: int, seconds: float, threads: int) -> tuple[list[float], float]:
+    """Log at a fixed aggregate rate from several threads; return per-call latencies and wall time."""
+    per_thread = int(rate * seconds / threads)
+    interval = threads / rate
+    latencies: list[list[float]] = [[] for _ in range(threads)]
+
+    def worker(k: int):
+        start = time.perf_counter()
+        for i in range(per_thread):
+            due = start + i * interval
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            t0 = time.perf_counter()
+            logger.log_call("judge", "mock", "mock-model", MESSAGES, RESPONSE, 0.0, None, None)
+            latencies[k].append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(k,)) for k in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    logger.close()
+    return sorted(x for lat in latencies for x in lat), time.perf_counter() - t0
+
+
+def report(name: str, latencies: list[float], wall_s: float, calls_file: Path):
+    lines = calls_file.read_text().splitlines()
+    valid = 0
+    for line in lines:
+        try:
+            json.loads(line)
+            valid += 1
+        except json.JSONDecodeError:
+            pass
+    p = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1e6  # noqa: E731
+    print(
+        f"{name:12s} {len(latencies) / wall_s:9,.0f} rec/s  p50 {p(0.5):7.1f} µs  p99 {p(0.99):8.1f} µs  "
+        f"max {latencies[-1] * 1e6:9.1f} µs  lines {valid:,}/{len(latencies):,} valid"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=10_000, help="Aggregate records per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="close")
+    args = parser.parse_args()
+
+    print(f"{args.rate:,} records/s for {args.seconds}s from {args.threads} threads\n")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old = UnbufferedAuditLogger(Path(tmpdir) / "old")
+        old.run_dir.mkdir()
+        report("per-record", *drive(old, args.rate, args.seconds, args.threads), old.calls_file)
+
+        new = AuditLogger(Path(tmpdir) / "new", fsync=args.fsync)
+        report("buffered", *drive(new, args.rate, args.seconds, args.threads), new.calls_file)
+        print(f"\nbuffered: {new.records_written:,} records in {new.batches_written:,} writes (fsync={args.fsync})")
+
+
+if __name__ == "__main__":
+    main()
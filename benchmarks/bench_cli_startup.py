@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark: cold-start time of each `python -m app.cli` subcommand.
+
+Each sample is a fresh interpreter running `<subcommand> --help`, i.e. module
+imports plus argument parsing and nothing else: the fixed cost the Streamlit
+app pays per button press. Provider SDK imports (paid only by commands that
+call a provider) are timed separately.
+
+Usage: python benchmarks/bench_cli_startup.py [--repeat 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+ADAPTERS = ["app.provider.openai", "app.provider.anthropic", "app.provider.google"]
+
+
+def subcommands() -> list[str]:
+    """Every top-level subcommand, taken from the CLI's own parser so new ones are timed too."""
+    from app.cli import build_parser
+
+    parser = build_parser()
+    sub = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    return list(sub.choices)
+
+
+def cold_start(argv: list[str], repeat: int) -> tuple[float, float]:
+    """Median and min wall time (ms) of a fresh interpreter running argv."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *argv], cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+        )
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    interpreter, _ = cold_start(["-c", "pass"], args.repeat)
+    print(f"{'interpreter':<28} {interpreter:8.0f} ms")
+    print(f"{'subcommand (--help)':<28} {'median':>8} {'min':>8} {'over bare python':>18}")
+    for cmd in subcommands():
+        median, best = cold_start(["-m", "app.cli", cmd, "--help"], args.repeat)
+        print(f"  {cmd:<26} {median:6.0f} ms {best:6.0f} ms {median - interpreter:15.0f} ms")
+
+    print(f"\n{'adapter import (on use)':<28} {'median':>8} {'min':>8}")
+    for module in ADAPTERS:
+        try:
+            median, best = cold_start(["-c", f"import {module}"], args.repeat)
+        except subprocess.CalledProcessError:
+            print(f"  {module:<26} (SDK not installed)")
+            continue
+        print(f"  {module:<26} {median:6.0f} ms {best:6.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark: evidence-window vs full-transcript judging (input tokens and judge agreement).
+
+Judges the same pairs twice, once with the full transcript and once with evidence
+windows, then reports input-token savings and how often the two verdicts agree.
+
+Usage:
+    python benchmarks/bench_evidence.py                       # synthetic pairs, mock judge
+    python benchmarks/bench_evidence.py --run runs/<id> --provider openai --model small
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.judge.evidence import EvidenceConfig, EvidenceSelector
+from app.judge.runner import JudgeRunner
+from app.provider.mock import MockProvider
+
+ROOT = Path(__file__).resolve().parent.parent
+PROMPTS_DIR = ROOT / "configs" / "prompts"
+RUBRIC_PATH = ROOT / "configs" / "rubric.default.json"
+
+FILLER = [
+    "Thanks for your patience while I look into that.",
+    "Can you confirm your date of birth for verification?",
+    "Okay, I see the account here on my screen.",
+    "Is there anything else I can help with on this topic?",
+    "Let me check the notes from the previous interaction.",
+    "I understand, that sounds frustrating.",
+]
+FACTS = [
+    ("caller", "I need a refill of {drug} sent to the {street} Street pharmacy.", "call_resolution",
+     "Refill of {drug} sent to {street} Street pharmacy."),
+    ("agent", "I will call you back on {day} to confirm the pickup.", "action_items",
+     "Agent to call back on {day} to confirm pickup."),
+    ("caller", "My plan changed to {plan} last month.", "context_preservation",
+     "Member recently moved to the {plan} plan."),
+    ("agent", "This call is recorded and I verified your identity with your member number.", "compliance_notes",
+     "Call recorded; identity verified with member number."),
+    ("caller", "You have been really helpful, thank you.", "quality_indicators",
+     "Caller thanked the agent; positive sentiment."),
+]
+
+
+def synthetic_pairs(n: int, segments: int, seed: int = 0) -> tuple[list[dict], list[dict]]:
+    """Long transcripts whose summary facts each sit in one segment."""
+    rng = random.Random(seed)
+    transcripts, summaries = [], []
+    for k in range(n):
+        values = {
+            "drug": rng.choice(["metformin", "lisinopril", "atorvastatin", "omeprazole"]),
+            "street": rng.choice(["Elm", "Main", "Oak", "Pine"]),
+            "day": rng.choice(["Monday", "Tuesday", "Thursday", "Friday"]),
+            "plan": rng.choice(["Gold PPO", "Silver HMO", "Bronze EPO"]),
+        }
+        turns = [("agent" if i % 2 else "caller", rng.choice(FILLER)) for i in range(segments)]
+        summary = {"call_id": f"TRA-BENCH-{k:04d}"}
+        for (speaker, text, field, claim), pos in zip(FACTS, rng.sample(range(segments), len(FACTS))):
+            turns[pos] = (speaker, text.format(**values))
+            summary[field] = claim.format(**values)
+        transcripts.append(
+            {
+                "call_id": summary["call_id"],
+                "lob": "Pharmacy",
+                "segments": [
+                    {"t": f"{i * 7 // 60:02d}:{i * 7 % 60:02d}", "speaker": s, "text": t}
+                    for i, (s, t) in enumerate(turns)
+                ],
+                "metadata": {"duration_s": segments * 7},
+            }
+        )
+        summaries.append(summary)
+    return transcripts, summaries
+
+
+def load_run(run_dir: Path, transcripts_file: Path) -> tuple[list[dict], list[dict]]:
+    """Pair a run's summaries with their transcripts."""
+    with open(transcripts_file) as f:
+        by_id = {t["call_id"]: t for t in map(json.loads, filter(str.strip, f))}
+    with open(run_dir / "summaries.jsonl") as f:
+        summaries = [s for s in map(json.loads, filter(str.strip, f)) if s.get("call_id") in by_id]
+    return [by_id[s["call_id"]] for s in summaries], summaries
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--run", type=Path, help="Run directory with summaries.jsonl (default: synthetic pairs)")
+    parser.add_argument("--transcripts", type=Path, default=Path("data/transcripts.jsonl"))
+    parser.add_argument("--n", type=int, default=50, help="Synthetic pairs")
+    parser.add_argument("--segments", type=int, default=40, help="Segments per synthetic transcript")
+    parser.add_argument("--provider", choices=["openai", "anthropic", "google"], help="Real judge (default: mock)")
+    parser.add_argument("--model", choices=["small", "large"], default="small")
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--window", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.run:
+        transcripts, summaries = load_run(args.run, args.transcripts)
+    else:
+        transcripts, summaries = synthetic_pairs(args.n, args.segments)
+
+    if args.provider:
+        from app.cli import get_provider
+        from app.config import ModelRegistry, Settings
+
+        provider = get_provider(args.provider, args.model, Settings(), ModelRegistry(ROOT / "configs" / "models.yaml"))
+    else:
+        provider = MockProvider()
+
+    selector = EvidenceSelector(EvidenceConfig(top_k=args.top_k, window=args.window))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        full = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, Path(tmpdir) / "full", temperature=0.0, seed=0)
+        full_evals = {e["call_id"]: e for e in full.run(transcripts, summaries, workers=args.workers)}
+        lean = JudgeRunner(
+            provider, PROMPTS_DIR, RUBRIC_PATH, Path(tmpdir) / "evidence", temperature=0.0, seed=0, evidence=selector
+        )
+        evidence_evals = {e["call_id"]: e for e in lean.run(transcripts, summaries, workers=args.workers)}
+
+    common = sorted(full_evals.keys() & evidence_evals.keys())
+    verdicts = sum(full_evals[c]["overall_pass"] == evidence_evals[c]["overall_pass"] for c in common)
+    diffs: dict[str, list[float]] = {}
+    for c in common:
+        for dim, score in full_evals[c].get("scores", {}).items():
+            other = evidence_evals[c].get("scores", {}).get(dim)
+            if isinstance(score, (int, float)) and isinstance(other, (int, float)):
+                diffs.setdefault(dim, []).append(abs(score - other))
+    stats = selector.stats()
+
+    print(f"\npairs:                    {len(common)}")
+    print(f"input tokens (full):      {full.total_input_tokens:,}")
+    print(f"input tokens (evidence):  {lean.total_input_tokens:,}")
+    if full.total_input_tokens:
+        print(f"input token reduction:    {1 - lean.total_input_tokens / full.total_input_tokens:.1%}")
+    print(f"segments sent:            {stats['segments_sent']:,} of {stats['segments_total']:,}")
+    print(f"fallbacks:                {stats['fallbacks']} {stats['fallback_reasons'] or ''}")
+    if common:
+        print(f"pass/fail agreement:      {verdicts / len(common):.1%}")
+    for dim, d in diffs.items():
+        exact = sum(1 for x in d if x == 0) / len(d)
+        print(f"  {dim:24s} mean |Δ| {sum(d) / len(d):.2f}, exact {exact:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark: call_id lookups in transcripts.jsonl, full scan vs the byte-offset index.
+
+Builds a synthetic dataset of --n transcripts (~2KB each) and times fetching a
+random sample of --lookups call_ids the way cmd_judge used to (parse every line)
+and through JsonlIndex, plus the one-off cost of indexing an unindexed file.
+
+Usage: python benchmarks/bench_jsonl_index.py [--n 50000] [--lookups 20]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.jsonl_index import JsonlIndex, write_jsonl
+
+
+def transcripts(n: int):
+    for i in range(1, n + 1):
+        yield {
+            "call_id": f"TRA-20250101_000000-{i:06d}",
+            "lob": "Benefits",
+            "segments": [{"t": f"00:{k:02d}", "speaker": "agent", "text": "word " * 40} for k in range(10)],
+            "metadata": {"duration_s": 300},
+        }
+
+
+def scan(path: Path, wanted: set) -> dict:
+    found = {}
+    with open(path) as f:
+        for line in f:
+            t = json.loads(line)
+            if t["call_id"] in wanted:
+                found[t["call_id"]] = t
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcripts.jsonl"
+        t0 = time.perf_counter()
+        index = write_jsonl(path, transcripts(args.n))
+        write_s = time.perf_counter() - t0
+        size_mb = path.stat().st_size / 1e6
+        print(f"{args.n} transcripts, {size_mb:.0f} MB (written with index in {write_s:.1f}s)")
+
+        wanted = {f"TRA-20250101_000000-{i:06d}" for i in random.Random(0).sample(range(1, args.n + 1), args.lookups)}
+
+        t0 = time.perf_counter()
+        by_scan = scan(path, wanted)
+        scan_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        by_index = index.get_many(wanted)
+        index_ms = (time.perf_counter() - t0) * 1000
+        assert by_index == by_scan
+
+        t0 = time.perf_counter()
+        index.get(next(iter(wanted)))
+        single_ms = (time.perf_counter() - t0) * 1000
+
+        index.index_path.unlink()
+        t0 = time.perf_counter()
+        cold = len(JsonlIndex(path))
+        build_s = time.perf_counter() - t0
+        assert cold == args.n
+
+        print(f"  full scan, {args.lookups} ids      {scan_ms:9.1f} ms")
+        print(f"  index get_many, {args.lookups} ids {index_ms:9.1f} ms  ({scan_ms / index_ms:.0f}x)")
+        print(f"  index get, 1 id           {single_ms:9.1f} ms")
+        print(f"  index rebuild (one-off)   {build_s * 1000:9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
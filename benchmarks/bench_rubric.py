@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Benchmark: bulk rubric gating at 1M evaluations vs per-evaluation check_gates.
+
+Usage: python benchmarks/bench_rubric.py [--n 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.judge.rubric import Rubric
+from app.judge.scoring import ScoreMatrix
+
+RUBRIC_PATH = Path(__file__).resolve().parent.parent / "configs" / "rubric.default.json"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--loop-sample", type=int, default=100_000, help="Rows timed with the Python loop")
+    args = parser.parse_args()
+
+    rubric = Rubric(RUBRIC_PATH)
+    compiled = rubric.compile()
+    rng = np.random.default_rng(0)
+    scores = rng.integers(1, 6, size=(args.n, len(compiled.names))).astype(np.float64)
+    flags = (rng.random(args.n) < 0.05).astype(np.int64)
+
+    t0 = time.perf_counter()
+    result = compiled.evaluate(scores, flags)
+    bulk_s = time.perf_counter() - t0
+
+    # Per-evaluation baseline on a sample, extrapolated to N
+    sample = min(args.loop_sample, args.n)
+    dicts = [dict(zip(compiled.names, row)) for row in scores[:sample].tolist()]
+    flag_lists = [["flag"] if f else [] for f in flags[:sample]]
+    t0 = time.perf_counter()
+    loop_pass = [rubric.check_gates(d, fl) for d, fl in zip(dicts, flag_lists)]
+    loop_s = (time.perf_counter() - t0) * args.n / sample
+    assert loop_pass == result.pass_mask[:sample].tolist(), "bulk and per-item gates disagree"
+
+    # Matrix construction from evaluation dicts (the report/tune path)
+    evaluations = [{"scores": d, "overall_pass": p} for d, p in zip(dicts, loop_pass)]
+    t0 = time.perf_counter()
+    ScoreMatrix.from_evaluations(evaluations).dimension_stats()
+    build_s = (time.perf_counter() - t0) * args.n / sample
+
+    print(f"evaluations:              {args.n:,}")
+    print(f"bulk evaluate():          {bulk_s * 1000:8.1f} ms")
+    print(f"check_gates loop (est.):  {loop_s * 1000:8.1f} ms  ({loop_s / bulk_s:.0f}x slower)")
+    print(f"matrix build+stats (est.):{build_s * 1000:8.1f} ms")
+    print(f"pass rate:                {result.pass_mask.mean():.2%}")
+    print(f"dim fail counts:          {dict(zip(compiled.names, result.dim_fail_counts.tolist()))}")
+
+
+if __name__ == "__main__":
+    main()
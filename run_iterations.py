@@ -3,6 +3,7 @@
 
 import subprocess
 import json
+import sys
 import time
 from pathlib import Path
 
@@ -78,25 +79,25 @@ def main():
         iteration_start = time.time()
         
         # Step 1: Judge current summaries
-        if not run_command(".venv/bin/python -m app.cli judge --provider openai --model small --workers 3", 
+        if not run_command(f"{sys.executable} -m app.cli judge --provider openai --model small --workers 3", 
                           f"Iteration {iteration}: Judge summaries"):
             print(f"❌ Iteration {iteration} failed at judge step")
             continue
             
         # Step 2: Generate report
-        if not run_command(".venv/bin/python -m app.cli report", 
+        if not run_command(f"{sys.executable} -m app.cli report", 
                           f"Iteration {iteration}: Generate report"):
             print(f"❌ Iteration {iteration} failed at report step")
             continue
             
         # Step 3: Tune prompt (with --apply to automatically apply suggestions)
-        if not run_command(".venv/bin/python -m app.cli tune --provider openai --model small --apply", 
+        if not run_command(f"{sys.executable} -m app.cli tune --provider openai --model small --apply", 
                           f"Iteration {iteration}: Tune and apply prompt improvements"):
             print(f"❌ Iteration {iteration} failed at tune step")
             continue
             
         # Step 4: Regenerate summaries with improved prompt
-        if not run_command(".venv/bin/python -m app.cli summarize --provider openai --model small --workers 3", 
+        if not run_command(f"{sys.executable} -m app.cli summarize --provider openai --model small --workers 3", 
                           f"Iteration {iteration}: Regenerate summaries with improved prompt"):
             print(f"❌ Iteration {iteration} failed at summarize step")
             continue
@@ -1,4 +1,5 @@
 import json
+import os
 import subprocess
 import time
 from html import escape as html_escape
@@ -14,6 +15,9 @@ BASE_DIR = Path(__file__).resolve().parent
 RUNS_DIR = BASE_DIR / "runs"
 DATA_DIR = BASE_DIR / "data"
 
+# Phases run in-process as background jobs and resolve data/ and runs/ like the CLI does
+os.chdir(BASE_DIR)
+
 
 def safe_load_jsonl(path: Path, limit: int = 2):
     items = []
@@ -31,99 +35,91 @@ def safe_load_jsonl(path: Path, limit: int = 2):
     return items
 
 
-def load_sample_transcripts(runs_dir: Path, limit: int = 2):
-    # Always load from the main data directory (the source of truth)
-    backup = DATA_DIR / "transcripts.jsonl"
-    if backup.exists():
-        # Load all items first to sort them
-        all_items = []
-        with backup.open() as f:
-            for line in f:
-                if line.strip():
-                    all_items.append(json.loads(line))
-        # Sort by call_id to ensure consistent order
-        all_items.sort(key=lambda x: x.get("call_id", ""))
-        return all_items[:limit]
-    return []
+def _file_sig(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a file: the cache key for anything parsed from it; None if missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
-def load_sample_summaries(runs_dir: Path, limit: int = 2):
-    if not runs_dir.exists():
-        return []
+# Cached loaders take the file's (mtime_ns, size) as arguments, so a rewritten or appended
+# file is a cache miss and an unchanged one is never parsed twice across reruns.
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _transcript_ids(path: str, mtime_ns: int, size: int) -> frozenset:
+    return frozenset(JsonlIndex(Path(path)).keys())
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _first_transcripts(path: str, mtime_ns: int, size: int, limit: int) -> list[dict]:
+    return JsonlIndex(Path(path)).first(limit)
 
-    # Load current transcript IDs
-    transcript_file = DATA_DIR / "transcripts.jsonl"
-    if not transcript_file.exists():
-        return []
 
-    current_transcript_ids = set()
-    with open(transcript_file) as f:
+@st.cache_data(max_entries=64, show_spinner=False)
+def _aligned_sample(path: str, mtime_ns: int, size: int, transcript_sig: tuple, limit: int) -> list[dict] | None:
+    """First ``limit`` items by transcript id; None unless they cover exactly the current transcripts."""
+    all_items = []
+    with open(path) as f:
         for line in f:
             if line.strip():
-                t = json.loads(line)
-                current_transcript_ids.add(t.get("call_id"))
-
-    # Find the most recent run with summaries that match EXACTLY the current transcripts
-    latest = sorted(runs_dir.glob("*/summaries.jsonl"), reverse=True)
-    for file_path in latest:
-        all_items = []
-        with file_path.open() as f:
-            for line in f:
-                if line.strip():
-                    all_items.append(json.loads(line))
+                all_items.append(json.loads(line))
 
-        # Check if ALL summary transcript_ids match current transcripts
-        summary_transcript_ids = {s.get("transcript_id", s.get("call_id")) for s in all_items}
+    # Only show if there's perfect alignment (same IDs, same count)
+    item_transcript_ids = {x.get("transcript_id", x.get("call_id")) for x in all_items}
+    if item_transcript_ids != _transcript_ids(str(DATA_DIR / "transcripts.jsonl"), *transcript_sig):
+        return None
+    # Sort by transcript_id to match transcript order
+    all_items.sort(key=lambda x: x.get("transcript_id", x.get("call_id", "")))
+    return all_items[:limit]
 
-        # Only show if there's perfect alignment (same IDs, same count)
-        if summary_transcript_ids == current_transcript_ids:
-            # Sort by transcript_id to match transcript order
-            all_items.sort(key=lambda x: x.get("transcript_id", x.get("call_id", "")))
-            return all_items[:limit]
 
-    # No matching run found - return empty to force user to run summarize
+def _latest_aligned(runs_dir: Path, artifact: str, limit: int) -> list[dict]:
+    """Sample from the most recent run whose ``artifact`` matches EXACTLY the current transcripts."""
+    if not runs_dir.exists():
+        return []
+    transcript_sig = _file_sig(DATA_DIR / "transcripts.jsonl")
+    if transcript_sig is None:
+        return []
+    for file_path in sorted(runs_dir.glob(f"*/{artifact}"), reverse=True):
+        sig = _file_sig(file_path)
+        if sig is None:
+            continue
+        items = _aligned_sample(str(file_path), *sig, transcript_sig, limit)
+        if items is not None:
+            return items
     return []
 
 
-def load_sample_evals(runs_dir: Path, limit: int = 2):
-    if not RUNS_DIR.exists():
-        return []
+def load_sample_transcripts(runs_dir: Path, limit: int = 2):
+    # Always load from the main data directory (the source of truth)
+    backup = DATA_DIR / "transcripts.jsonl"
+    sig = _file_sig(backup)
+    if sig is not None:
+        # Lowest call_ids first, read by offset instead of parsing the whole file
+        return _first_transcripts(str(backup), *sig, limit)
+    return []
 
-    # Load current transcript IDs
-    transcript_file = DATA_DIR / "transcripts.jsonl"
-    if not transcript_file.exists():
-        return []
 
-    current_transcript_ids = set()
-    with open(transcript_file) as f:
-        for line in f:
-            if line.strip():
-                t = json.loads(line)
-                current_transcript_ids.add(t.get("call_id"))
-
-    # Find the most recent run with evaluations that match EXACTLY the current transcripts
-    latest = sorted(RUNS_DIR.glob("*/evaluations.jsonl"), reverse=True)
-    for file_path in latest:
-        all_items = []
-        with file_path.open() as f:
-            for line in f:
-                if line.strip():
-                    all_items.append(json.loads(line))
-
-        # Check if ALL evaluation transcript_ids match current transcripts
-        eval_transcript_ids = {e.get("transcript_id", e.get("call_id")) for e in all_items}
+def load_sample_summaries(runs_dir: Path, limit: int = 2):
+    # No matching run found - return empty to force user to run summarize
+    return _latest_aligned(runs_dir, "summaries.jsonl", limit)
 
-        # Only show if there's perfect alignment (same IDs, same count)
-        if eval_transcript_ids == current_transcript_ids:
-            # Sort by transcript_id to match transcript order
-            all_items.sort(key=lambda x: x.get("transcript_id", x.get("call_id", "")))
-            return all_items[:limit]
 
+def load_sample_evals(runs_dir: Path, limit: int = 2):
     # No matching run found - return empty to force user to run judge
-    return []
+    return _latest_aligned(RUNS_DIR, "evaluations.jsonl", limit)
 
 
 # Import our modules
+from app.audit import CallsTailer
+from app.browse import BrowseFilter, EvaluationBrowser
+from app.jobs import Job, JobManager, cli_job
+from app.jsonl_index import JsonlIndex
+from app.judge.rubric import DEFAULT_RUBRIC_PATH, Rubric
+from app.monitor import CallsMonitor
 from app.ui.styles import CUSTOM_CSS
 
 # Page config
@@ -267,106 +263,266 @@ def run_cli_command(label: str, args: list[str]) -> bool:
 
 
 # ---------- Unified, compact one-page layout helpers ----------
+def calls_tailer(run_dir: Path) -> CallsTailer:
+    """The run's calls.jsonl tailer, kept across reruns so each refresh reads only new bytes."""
+    if "calls_tailers" not in st.session_state:
+        st.session_state.calls_tailers = {}
+    tailers: dict[str, CallsTailer] = st.session_state.calls_tailers
+    if run_dir.name not in tailers:
+        tailers[run_dir.name] = CallsTailer(run_dir / "calls.jsonl")
+    return tailers[run_dir.name]
+
+
 def update_session_totals_from_calls(run_dir: Path) -> None:
     try:
-        calls_path = run_dir / "calls.jsonl"
-        if not calls_path.exists():
-            return
-        if "accounted_offsets" not in st.session_state:
-            st.session_state.accounted_offsets = {}
-        offsets: dict[str, int] = st.session_state.accounted_offsets
+        if "accounted_totals" not in st.session_state:
+            st.session_state.accounted_totals = {}
+        accounted: dict[str, dict] = st.session_state.accounted_totals
         run_id = run_dir.name
-        start_idx = int(offsets.get(run_id, 0))
-        processed = 0
-        add_in = 0
-        add_out = 0
-        add_cost = 0.0
-        with calls_path.open() as f:
-            for i, line in enumerate(f):
-                if i < start_idx:
-                    continue
-                if not line.strip():
-                    continue
-                processed += 1
-                try:
-                    rec = json.loads(line)
-                    usage = rec.get("usage") or {}
-                    add_in += int(usage.get("prompt_tokens") or 0)
-                    add_out += int(usage.get("completion_tokens") or 0)
-                    c = rec.get("cost_usd")
-                    if isinstance(c, (int, float)):
-                        add_cost += float(c)
-                except Exception:
-                    continue
-        if processed:
-            st.session_state.session_totals["input_tokens"] += add_in
-            st.session_state.session_totals["output_tokens"] += add_out
-            st.session_state.session_totals["total_cost"] += add_cost
-            offsets[run_id] = start_idx + processed
+        totals = calls_tailer(run_dir).poll()
+        seen = accounted.get(run_id, {"prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0})
+        st.session_state.session_totals["input_tokens"] += totals["prompt_tokens"] - seen["prompt_tokens"]
+        st.session_state.session_totals["output_tokens"] += totals["completion_tokens"] - seen["completion_tokens"]
+        st.session_state.session_totals["total_cost"] += totals["cost_usd"] - seen["cost_usd"]
+        accounted[run_id] = totals
     except Exception:
         pass
 
 
+def calls_monitor(run_dir: Path, window_s: float) -> CallsMonitor:
+    """The run's rolling-window monitor, kept across reruns so each refresh reads only new calls."""
+    if "calls_monitors" not in st.session_state:
+        st.session_state.calls_monitors = {}
+    monitors: dict[tuple, CallsMonitor] = st.session_state.calls_monitors
+    key = (run_dir.name, window_s)
+    if key not in monitors:
+        monitors[key] = CallsMonitor(run_dir, DATA_DIR / "transcripts.jsonl", window_s=window_s)
+    return monitors[key]
+
+
+def _fmt_ms(value: float | None) -> str:
+    if value is None:
+        return "—"
+    return f"{value / 1000:.1f}s" if value >= 1000 else f"{value:.0f}ms"
+
+
+# Re-runs on its own timer without rerunning the page (st.fragment is experimental before 1.37)
+_fragment = getattr(st, "fragment", None) or st.experimental_fragment
+
+
+@_fragment(run_every=2)
+def live_monitor_panel() -> None:
+    run_dir = get_latest_run_dir(["calls.jsonl"])
+    if run_dir is None:
+        st.caption("Run a phase to see live throughput and latency.")
+        return
+    window_s = float(st.session_state.get("m_window", 60))
+    monitor = calls_monitor(run_dir, window_s)
+    monitor.poll()
+    snap = monitor.snapshot()
+    total = snap.total
+    state = "live" if snap.live else "idle — as of the last call"
+    st.caption(f"Run `{run_dir.name}` · last {window_s:.0f}s · {state}")
+    m1, m2, m3, m4, m5, m6 = st.columns(6)
+    m1.metric("Requests/s", f"{total.requests_per_s:.2f}")
+    m2.metric("Tokens/s", f"{total.tokens_per_s:,.0f}")
+    m3.metric("p95 latency", _fmt_ms(total.p95_ms))
+    m4.metric("Errors", f"{total.error_rate:.1%}")
+    m5.metric("429s", f"{total.rate_limited_rate:.1%}")
+    m6.metric("Cost burn", f"${total.cost_per_min:.4f}/min")
+    if snap.rows:
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {
+                        "phase": r.phase,
+                        "model": r.model,
+                        "req/s": round(r.requests_per_s, 2),
+                        "tokens/s": round(r.tokens_per_s),
+                        "p50": _fmt_ms(r.p50_ms),
+                        "p95": _fmt_ms(r.p95_ms),
+                        "p99": _fmt_ms(r.p99_ms),
+                        "errors": f"{r.error_rate:.1%}",
+                        "429s": f"{r.rate_limited_rate:.1%}",
+                        "$/min": round(r.cost_per_min, 4),
+                    }
+                    for r in snap.rows
+                ]
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+    for p in snap.progress:
+        eta = "—" if p.eta_s is None else f"{p.eta_s:.0f}s"
+        fraction = min(1.0, p.done / p.total) if p.total else 0.0
+        st.progress(fraction, text=f"{p.phase}: {p.done}/{p.total} · ETA {eta}")
+
+
+class LiveTicker:
+    """Cost and throughput of a running phase, from the calls appended to its run's calls.jsonl."""
+
+    def __init__(self, run_dir: Path | None, min_interval_s: float = 0.5):
+        self.tailer = calls_tailer(run_dir) if run_dir else None
+        self.base = self.tailer.poll() if self.tailer else None
+        self.min_interval_s = min_interval_s
+        self.started = time.monotonic()
+        self.last = 0.0
+        self.ph = st.empty()
+
+    def update(self) -> None:
+        now = time.monotonic()
+        if self.tailer is None or now - self.last < self.min_interval_s:
+            return
+        self.last = now
+        try:
+            totals = self.tailer.poll()
+        except Exception:
+            return
+        calls = totals["records"] - self.base["records"]
+        if not calls:
+            return
+        tokens = totals["total_tokens"] - self.base["total_tokens"]
+        cost = totals["cost_usd"] - self.base["cost_usd"]
+        elapsed = max(now - self.started, 1e-6)
+        self.ph.caption(
+            f"💰 ${cost:.4f} · {calls} calls ({calls / elapsed * 60:,.0f}/min) · "
+            f"{tokens:,} tokens ({tokens / elapsed:,.0f}/s)"
+            + (f" · {totals['errors'] - self.base['errors']} errors" if totals["errors"] > self.base["errors"] else "")
+        )
+
+
+@st.cache_resource
+def get_job_manager() -> JobManager:
+    """Background jobs live in the server process, shared by every session and surviving reruns."""
+    return JobManager()
+
+
+def start_phase_job(phase: str, label: str, argv: list[str]) -> None:
+    append_run_log("")
+    append_run_log(f"▶ {label}")
+    append_run_log(f"$ python -m app.cli {' '.join(argv)}")
+    if "phase_jobs" not in st.session_state:
+        st.session_state.phase_jobs = {}
+    st.session_state.phase_jobs[phase] = get_job_manager().submit(phase, cli_job(argv)).id
+
+
+def _progress_text(event, unit: str) -> str:
+    text = f"Progress: {event.done}/{event.total or '?'} {unit}"
+    if event.failed:
+        text += f" ({event.failed} failed)"
+    if event.cost:
+        text += f" · ${event.cost:.4f}"
+    if event.eta_s is not None and event.done < (event.total or 0):
+        text += f" · ETA {event.eta_s:.0f}s"
+    return text
+
+
+def watch_phase_job(phase: str, status_label: str, unit: str, calls_run_dir: Path | None) -> Job | None:
+    """Show this session's job for ``phase`` until it finishes; return it once finished.
+
+    The job runs on regardless of the page: a rerun (e.g. from the Cancel button)
+    only stops watching, and the next run of the page picks the job up again.
+    """
+    job_id = st.session_state.get("phase_jobs", {}).get(phase)
+    job = get_job_manager().get(job_id) if job_id else None
+    if job is None:
+        return None
+    with st.status(status_label, expanded=True) as status:
+        st.button("Cancel", key=f"cancel_{job.id}", on_click=job.cancel, disabled=job.finished)
+        ph = st.empty()
+        ticker = LiveTicker(calls_run_dir)
+        last = next(iter(job.latest.values()), None)
+        while True:
+            finished = job.finished  # Read before draining so the final events are included
+            for event in job.drain():
+                if event.kind == "progress":
+                    last = event
+            if last is not None:
+                ph.text(_progress_text(last, unit))
+            ticker.update()
+            if finished:
+                break
+            time.sleep(0.25)
+        del st.session_state.phase_jobs[phase]
+        for line in job.log:
+            append_run_log(line)
+        if job.state == "done":
+            status.update(label=f"✅ {phase.capitalize()} complete!", state="complete")
+        elif job.state == "cancelled":
+            st.warning(f"⏹ {phase.capitalize()} cancelled; partial results were kept")
+            status.update(label="⏹ Cancelled", state="error")
+        else:
+            last_err = "\n".join(list(job.log)[-10:])
+            st.error(f"❌ {phase.capitalize()} failed: {job.error}\n" + last_err)
+            status.update(label="❌ Failed", state="error")
+    return job
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _run_dirs(runs_dir: str, mtime_ns: int) -> list[str]:
+    """Run directory names, newest first; the listing only changes when runs/ itself does."""
+    return sorted((p.name for p in Path(runs_dir).iterdir() if p.is_dir()), reverse=True)
+
+
 def get_latest_run_dir(required_files: list[str] | None = None) -> Path | None:
     required_files = required_files or []
     if not RUNS_DIR.exists():
         return None
-    for run_path in sorted(RUNS_DIR.iterdir(), reverse=True):
-        if not run_path.is_dir():
-            continue
-        ok = True
-        for name in required_files:
-            if not (run_path / name).exists():
-                ok = False
-                break
-        if ok:
+    # Artifacts appear inside run dirs without touching runs/, so they are checked every time
+    for name in _run_dirs(str(RUNS_DIR), RUNS_DIR.stat().st_mtime_ns):
+        run_path = RUNS_DIR / name
+        if all((run_path / f).exists() for f in required_files):
             return run_path
     return None
 
 
-def load_evaluations_df(run_dir: Path) -> pd.DataFrame | None:
-    try:
-        evals_path = run_dir / "evaluations.jsonl"
-        if not evals_path.exists():
-            return None
+@st.cache_data(max_entries=16, show_spinner=False)
+def _evaluations_df(path: str, mtime_ns: int, size: int, transcript_sig: tuple) -> pd.DataFrame | None:
+    # Load evaluations
+    rows = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rows.append(json.loads(line))
 
-        # Load current transcript IDs to verify alignment
-        transcript_file = DATA_DIR / "transcripts.jsonl"
-        if not transcript_file.exists():
-            return None
+    if not rows:
+        return None
 
-        current_transcript_ids = set()
-        with open(transcript_file) as f:
-            for line in f:
-                if line.strip():
-                    t = json.loads(line)
-                    current_transcript_ids.add(t.get("call_id"))
+    # Verify all evaluations match current transcripts
+    eval_transcript_ids = {e.get("transcript_id", e.get("call_id")) for e in rows}
+    if eval_transcript_ids != _transcript_ids(str(DATA_DIR / "transcripts.jsonl"), *transcript_sig):
+        # Misalignment detected - return None to hide stale data
+        return None
 
-        # Load evaluations
-        rows = []
-        with evals_path.open() as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                rows.append(json.loads(line))
+    # Normalize to rows of dimensions (long format for the box plot), gated by the rubric
+    matrix, gates = Rubric(DEFAULT_RUBRIC_PATH).compile().gate(rows)
+    wide = pd.DataFrame(matrix.scores, columns=matrix.names)
+    wide["call_id"] = [e.get("call_id") for e in rows]
+    wide["passed"] = gates.pass_mask
+    return wide.melt(id_vars=["call_id", "passed"], var_name="dimension", value_name="score").dropna(
+        subset=["score"]
+    )
 
-        if not rows:
-            return None
 
-        # Verify all evaluations match current transcripts
-        eval_transcript_ids = {e.get("transcript_id", e.get("call_id")) for e in rows}
-        if eval_transcript_ids != current_transcript_ids:
-            # Misalignment detected - return None to hide stale data
-            return None
+def get_evaluation_browser(run_dir: Path) -> EvaluationBrowser | None:
+    """Browser over a run's evaluations; failing dimensions use the rubric's min_thresholds."""
+    rubric_path = Path("configs/rubric.default.json")
+    try:
+        rubric_config = json.loads(rubric_path.read_text()) if rubric_path.exists() else {}
+        return EvaluationBrowser.with_rubric(run_dir, DATA_DIR / "transcripts.jsonl", rubric_config)
+    except Exception:
+        return None
 
-        # Normalize to rows of dimensions
-        data = []
-        for e in rows:
-            call_id = e.get("call_id")
-            scores = e.get("scores", {})
-            for dim, score in scores.items():
-                data.append({"call_id": call_id, "dimension": dim, "score": score})
-        return pd.DataFrame(data)
+
+def load_evaluations_df(run_dir: Path) -> pd.DataFrame | None:
+    try:
+        evals_sig = _file_sig(run_dir / "evaluations.jsonl")
+        # Load current transcript IDs to verify alignment
+        transcript_sig = _file_sig(DATA_DIR / "transcripts.jsonl")
+        if evals_sig is None or transcript_sig is None:
+            return None
+        return _evaluations_df(str(run_dir / "evaluations.jsonl"), *evals_sig, transcript_sig)
     except Exception:
         return None
 
@@ -403,67 +559,21 @@ with st.container():
         n_samples = st.number_input("# Samples", min_value=1, max_value=200, value=10, step=5, key="u_n")
         regenerate_mode = st.checkbox("Regenerate (delete & replace)", value=False, key="u_regen")
         if st.button("Run Generate", key="u_btn_gen", type="primary", use_container_width=True):
-            gen_args = [
-                "python",
-                "-m",
-                "app.cli",
-                "generate",
-                "--provider",
-                provider_all,
-                "--model",
-                model_all,
-                "--N",
-                str(n_samples),
-            ]
+            gen_args = ["generate", "--provider", provider_all, "--model", model_all, "--N", str(n_samples)]
             if regenerate_mode:
                 gen_args.append("--regenerate")
-            with st.status(
-                f"Generating transcripts with {int(workers_all)} concurrent workers...", expanded=True
-            ) as status:
-                # Live progress (re-use existing logic)
-                append_run_log("")
-                append_run_log("▶ 1️⃣ Generate")
-                append_run_log(f"$ {' '.join(gen_args)}")
-                import re
-
-                progress_ph = st.empty()
-                progress_ph.text(f"Progress: 0/{n_samples}")
-                gen_args += ["--workers", str(int(workers_all))]
-                proc = subprocess.Popen(
-                    gen_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=str(BASE_DIR), bufsize=1
-                )
-                for line in iter(proc.stdout.readline, ""):
-                    if not line:
-                        break
-                    append_run_log(line.rstrip())
-                    if "Progress:" in line or "already has" in line:
-                        m = re.search(r"Progress: (\d+)/(\d+)", line)
-                        if m:
-                            progress_ph.text(f"Progress: {m.group(1)}/{m.group(2)} transcripts")
-                        m2 = re.search(r"already has (\d+) transcripts \(target: (\d+)\)", line)
-                        if m2:
-                            progress_ph.text(f"Progress: {m2.group(1)}/{m2.group(2)} transcripts (already exists)")
-                try:
-                    proc.wait(timeout=900)
-                except subprocess.TimeoutExpired:
-                    proc.kill()
-                    append_run_log("[error] Generate timed out after 900s")
-                err = proc.stderr.read()
-                if err:
-                    append_run_log(err.rstrip())
-                ok = proc.returncode == 0
-                if ok:
-                    st.success("✅ Generation complete!")
-                    status.update(label="✅ Generation complete!", state="complete")
-                    latest = get_latest_run_dir([])
-                    if latest:
-                        update_session_totals_from_calls(latest)
-                    time.sleep(0.5)
-                    st.rerun()
-                else:
-                    last_err = "\n".join((err or "").splitlines()[-10:])
-                    st.error("❌ Generation failed\n" + last_err)
-                    status.update(label="❌ Failed", state="error")
+            gen_args += ["--workers", str(int(workers_all))]
+            start_phase_job("generate", "1️⃣ Generate", gen_args)
+        job = watch_phase_job(
+            "generate", f"Generating transcripts with {int(workers_all)} concurrent workers...", "transcripts", None
+        )
+        if job is not None and job.state == "done":
+            st.success("✅ Generation complete!")
+            latest = get_latest_run_dir([])
+            if latest:
+                update_session_totals_from_calls(latest)
+            time.sleep(0.5)
+            st.rerun()
     with c2:
         st.markdown("**Live Samples: Transcripts**")
         st.markdown("<div style='margin-top:6px'></div>", unsafe_allow_html=True)
@@ -492,60 +602,23 @@ with st.container():
     c1, c2 = st.columns([1, 3])
     with c1:
         if st.button("Run Summarize", key="u_btn_sum", type="primary", use_container_width=True):
-            with st.status(
-                f"Generating summaries with {int(workers_all)} concurrent workers...", expanded=True
-            ) as status:
-                append_run_log("")
-                append_run_log("▶ 2️⃣ Summarize")
-                sum_args = [
-                    "python",
-                    "-m",
-                    "app.cli",
-                    "summarize",
-                    "--provider",
-                    provider_all,
-                    "--model",
-                    model_all,
-                    "--workers",
-                    str(int(workers_all)),
-                ]
-                append_run_log(f"$ {' '.join(sum_args)}")
-                import re
-
-                ph = st.empty()
-                ph.text("Progress: 0/? summaries")
-                p = subprocess.Popen(
-                    sum_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=str(BASE_DIR), bufsize=1
-                )
-                for line in iter(p.stdout.readline, ""):
-                    if not line:
-                        break
-                    append_run_log(line.rstrip())
-                    if "Progress:" in line:
-                        m = re.search(r"Progress: (\d+)/(\d+)", line)
-                        if m:
-                            ph.text(f"Progress: {m.group(1)}/{m.group(2)} summaries")
-                try:
-                    p.wait(timeout=1200)
-                except subprocess.TimeoutExpired:
-                    p.kill()
-                    append_run_log("[error] Summarize timed out after 1200s")
-                err = p.stderr.read()
-                if err:
-                    append_run_log(err.rstrip())
-                ok = p.returncode == 0
-                if ok:
-                    st.success("✅ Summarization complete!")
-                    status.update(label="✅ Summarization complete!", state="complete")
-                    latest = get_latest_run_dir(["summaries.jsonl"]) or get_latest_run_dir([])
-                    if latest:
-                        update_session_totals_from_calls(latest)
-                    time.sleep(0.5)
-                    st.rerun()
-                else:
-                    last_err = "\n".join((err or "").splitlines()[-10:])
-                    st.error("❌ Summarization failed\n" + last_err)
-                    status.update(label="❌ Failed", state="error")
+            sum_args = ["summarize", "--provider", provider_all, "--model", model_all]
+            sum_args += ["--workers", str(int(workers_all))]
+            start_phase_job("summarize", "2️⃣ Summarize", sum_args)
+        # Summarize writes into the latest run, as the CLI picks it
+        job = watch_phase_job(
+            "summarize",
+            f"Generating summaries with {int(workers_all)} concurrent workers...",
+            "summaries",
+            get_latest_run_dir([]),
+        )
+        if job is not None and job.state == "done":
+            st.success("✅ Summarization complete!")
+            latest = get_latest_run_dir(["summaries.jsonl"]) or get_latest_run_dir([])
+            if latest:
+                update_session_totals_from_calls(latest)
+            time.sleep(0.5)
+            st.rerun()
     with c2:
         st.markdown("**Live Samples: Summaries**")
         st.markdown("<div style='margin-top:6px'></div>", unsafe_allow_html=True)
@@ -578,60 +651,22 @@ with st.container():
     c1, c2 = st.columns([1, 3])
     with c1:
         if st.button("Run Judge", key="u_btn_judge", type="primary", use_container_width=True):
-            with st.status(
-                f"Evaluating summaries with {int(workers_all)} concurrent workers...", expanded=True
-            ) as status:
-                append_run_log("")
-                append_run_log("▶ 3️⃣ Judge")
-                judge_args = [
-                    "python",
-                    "-m",
-                    "app.cli",
-                    "judge",
-                    "--provider",
-                    provider_all,
-                    "--model",
-                    model_all,
-                    "--workers",
-                    str(int(workers_all)),
-                ]
-                append_run_log(f"$ {' '.join(judge_args)}")
-                import re
-
-                ph = st.empty()
-                ph.text("Progress: 0/? evaluations")
-                p = subprocess.Popen(
-                    judge_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=str(BASE_DIR), bufsize=1
-                )
-                for line in iter(p.stdout.readline, ""):
-                    if not line:
-                        break
-                    append_run_log(line.rstrip())
-                    if "Progress:" in line:
-                        m = re.search(r"Progress: (\d+)/(\d+)", line)
-                        if m:
-                            ph.text(f"Progress: {m.group(1)}/{m.group(2)} evaluations")
-                try:
-                    p.wait(timeout=1800)
-                except subprocess.TimeoutExpired:
-                    p.kill()
-                    append_run_log("[error] Judge timed out after 1800s")
-                err = p.stderr.read()
-                if err:
-                    append_run_log(err.rstrip())
-                ok = p.returncode == 0
-                if ok:
-                    st.success("✅ Evaluation complete!")
-                    status.update(label="✅ Evaluation complete!", state="complete")
-                    latest = get_latest_run_dir(["evaluations.jsonl"]) or get_latest_run_dir([])
-                    if latest:
-                        update_session_totals_from_calls(latest)
-                    time.sleep(0.5)
-                    st.rerun()
-                else:
-                    last_err = "\n".join((err or "").splitlines()[-10:])
-                    st.error("❌ Evaluation failed\n" + last_err)
-                    status.update(label="❌ Failed", state="error")
+            judge_args = ["judge", "--provider", provider_all, "--model", model_all]
+            judge_args += ["--workers", str(int(workers_all))]
+            start_phase_job("judge", "3️⃣ Judge", judge_args)
+        job = watch_phase_job(
+            "judge",
+            f"Evaluating summaries with {int(workers_all)} concurrent workers...",
+            "evaluations",
+            get_latest_run_dir(["summaries.jsonl"]),
+        )
+        if job is not None and job.state == "done":
+            st.success("✅ Evaluation complete!")
+            latest = get_latest_run_dir(["evaluations.jsonl"]) or get_latest_run_dir([])
+            if latest:
+                update_session_totals_from_calls(latest)
+            time.sleep(0.5)
+            st.rerun()
     with c2:
         st.markdown("**Live Samples: Evaluations**")
         st.markdown("<div style='margin-top:6px'></div>", unsafe_allow_html=True)
@@ -651,6 +686,80 @@ with st.container():
 
 st.divider()
 
+# Browse: filtered, paginated view over the latest run's evaluations (only the visible page is read)
+with st.container():
+    st.markdown("### 🔎 Browse Evaluations")
+    browse_run = get_latest_run_dir(["evaluations.jsonl"])
+    browser = get_evaluation_browser(browse_run) if browse_run else None
+    if browser is None:
+        st.caption("Run Judge to browse evaluations.")
+    else:
+        f1, f2, f3, f4 = st.columns(4)
+        with f1:
+            failing_dim = st.selectbox("Failing dimension", ["Any"] + browser.dimensions(), key="b_dim")
+        with f2:
+            lob = st.selectbox("LOB", ["Any"] + browser.lobs(), key="b_lob")
+        with f3:
+            score_range = st.slider("Mean score", 0.0, 5.0, (0.0, 5.0), step=0.1, key="b_score")
+        with f4:
+            flagged = st.selectbox("Hallucinations", ["Any", "Flagged", "None"], key="b_flags")
+        filters = BrowseFilter(
+            failing_dimension=None if failing_dim == "Any" else failing_dim,
+            lob=None if lob == "Any" else lob,
+            min_score=score_range[0] if score_range[0] > 0.0 else None,
+            max_score=score_range[1] if score_range[1] < 5.0 else None,
+            hallucinated={"Any": None, "Flagged": True, "None": False}[flagged],
+        )
+        # Back to the first page whenever the filters change
+        if st.session_state.get("b_filters") != filters:
+            st.session_state.b_filters = filters
+            st.session_state.b_page = 0
+        p1, p2, p3, p4 = st.columns([1, 1, 1, 3])
+        with p1:
+            page_size = st.selectbox("Per page", [10, 25, 50], key="b_page_size")
+        result = browser.page(filters, st.session_state.get("b_page", 0), page_size)
+        st.session_state.b_page = result.page
+        with p2:
+            st.markdown("<div style='height:28px'></div>", unsafe_allow_html=True)
+            if st.button("◀ Prev", key="b_prev", disabled=result.page == 0, use_container_width=True):
+                st.session_state.b_page = result.page - 1
+                st.rerun()
+        with p3:
+            st.markdown("<div style='height:28px'></div>", unsafe_allow_html=True)
+            if st.button("Next ▶", key="b_next", disabled=result.page + 1 >= result.pages, use_container_width=True):
+                st.session_state.b_page = result.page + 1
+                st.rerun()
+        with p4:
+            st.markdown("<div style='height:34px'></div>", unsafe_allow_html=True)
+            st.caption(f"{result.total:,} matching evaluations · page {result.page + 1} of {result.pages}")
+        for item in result.items:
+            e = item.evaluation
+            lob_label = (item.transcript or {}).get("lob", "N/A")
+            with st.expander(f"{'✅' if e.get('overall_pass') else '❌'} {item.call_id} · {lob_label}"):
+                ce, cs, ct = st.columns(3)
+                with ce:
+                    st.markdown("**Evaluation**")
+                    st.json(e.get("scores", {}))
+                    for flag in e.get("hallucination_flags") or []:
+                        st.warning(f"Hallucination: {flag}")
+                with cs:
+                    st.markdown("**Summary**")
+                    if item.summary:
+                        for field in ("intent", "resolution", "next_steps", "sentiment"):
+                            if field in item.summary:
+                                st.markdown(f"**{field.replace('_', ' ').title()}:** {item.summary[field]}")
+                    else:
+                        st.caption("No summary in this run.")
+                with ct:
+                    st.markdown("**Transcript**")
+                    if item.transcript:
+                        for s in item.transcript.get("segments", [])[:12]:
+                            st.markdown(f"**{s.get('speaker','?').title()}:** {s.get('text','')}")
+                    else:
+                        st.caption("Transcript not found.")
+
+st.divider()
+
 # 4) Improve & Report (graph left, prompt + diff right)
 st.markdown("### 4️⃣ Improve & Report")
 st.markdown(
@@ -811,6 +920,15 @@ with right:
 
 st.divider()
 
+# Live monitor: rolling rates from the latest run's calls.jsonl
+st.markdown("#### 📈 Live Monitor")
+st.selectbox(
+    "Window", [30, 60, 300, 900], index=1, key="m_window", format_func=lambda s: f"{s // 60}m" if s >= 60 else f"{s}s"
+)
+live_monitor_panel()
+
+st.divider()
+
 # Terminal Feed (single, consolidated)
 st.markdown("#### 🖥️ Terminal Feed")
 log_output = "\n".join(st.session_state.run_log).strip()
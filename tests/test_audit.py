@@ -0,0 +1,228 @@
+"""Test the buffered audit logger."""
+
+import gzip
+import json
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.audit import (
+    _CLOSE,
+    AuditLogger,
+    CallsTailer,
+    call_totals,
+    iter_calls,
+    load_index,
+)
+from app.provider.base import LLMResponse, Message, Usage
+
+
+def _log(logger: AuditLogger, n: int):
+    response = LLMResponse(
+        text="line one\nline two",
+        usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        latency_ms=1.0,
+    )
+    logger.log_call(
+        phase="judge",
+        provider="mock",
+        model="mock-model",
+        messages=[Message(role="user", content=f"prompt {n}\nwith a newline")],
+        response=response,
+        temperature=0.0,
+        seed=None,
+        cost_usd=None,
+    )
+
+
+def test_concurrent_writers_produce_one_record_per_line():
+    """Records from many threads and two loggers land whole, one per line."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        first = AuditLogger(run_dir, batch_size=32)
+        second = AuditLogger(run_dir, batch_size=7)
+
+        threads = [
+            threading.Thread(target=lambda lg=lg: [_log(lg, i) for i in range(500)])
+            for lg in (first, second) * 4
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        first.close()
+        second.close()
+
+        lines = (run_dir / "calls.jsonl").read_text().splitlines()
+        assert len(lines) == 4000
+        assert all(json.loads(line)["phase"] == "judge" for line in lines)
+        assert first.records_written + second.records_written == 4000
+
+
+def test_flush_makes_records_visible():
+    """flush() writes pending records before the batch or interval trigger."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = AuditLogger(Path(tmpdir), batch_size=1000, flush_interval=60, fsync="batch")
+        _log(logger, 0)
+        logger.flush()
+        assert len((Path(tmpdir) / "calls.jsonl").read_text().splitlines()) == 1
+        logger.close()
+        logger.close()
+        with pytest.raises(RuntimeError):
+            _log(logger, 1)
+
+
+def test_writer_errors_surface_instead_of_hanging():
+    """Any writer exception is raised by flush(); a dead writer fails flush/write/close fast."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = AuditLogger(Path(tmpdir), batch_size=1000, flush_interval=60)
+        write_batch = logger._write_batch
+
+        def broken(lines):
+            raise ValueError("bad batch")
+
+        logger._write_batch = broken
+        _log(logger, 0)
+        with pytest.raises(ValueError):
+            logger.flush()
+        logger._write_batch = write_batch  # The writer kept running
+        _log(logger, 1)
+        logger.flush()
+        assert len((Path(tmpdir) / "calls.jsonl").read_text().splitlines()) == 1
+
+        logger._queue.put(_CLOSE)  # Stop the writer behind the logger's back
+        logger._writer.join()
+        with pytest.raises(RuntimeError, match="stopped"):
+            _log(logger, 2)
+        with pytest.raises(RuntimeError, match="stopped"):
+            logger.flush()
+        logger.close()
+
+
+def test_unknown_fsync_policy_rejected():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with pytest.raises(ValueError):
+            AuditLogger(Path(tmpdir), fsync="sometimes")
+
+
+def test_rotation_compresses_segments_and_indexes_totals():
+    """Rotated segments are gzip'd and indexed; readers see every record once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        logger = AuditLogger(run_dir, batch_size=10, max_bytes=20_000, compression="gzip")
+        for i in range(205):
+            _log(logger, i)
+        logger.close()
+
+        calls_file = run_dir / "calls.jsonl"
+        segments = sorted(run_dir.glob("calls.*.jsonl.gz"))
+        assert len(segments) == logger.segments_rotated > 1
+        assert not list(run_dir.glob("calls.*.jsonl"))  # raw segments removed after sealing
+
+        records = list(iter_calls(calls_file))
+        assert len(records) == 205
+        assert [r["ts"] for r in records] == sorted(r["ts"] for r in records)
+
+        totals = call_totals(calls_file)
+        assert totals["records"] == 205
+        assert totals["total_tokens"] == 205 * 15
+        assert sum(s["records"] for s in load_index(calls_file)["segments"]) < 205
+
+        # Sealed segments are not re-read: totals come from the index
+        segments[0].write_bytes(b"corrupt")
+        assert call_totals(calls_file) == totals
+
+
+def test_loggers_sharing_a_run_rotate_safely():
+    """Several loggers on one calls.jsonl lock around writes and rotations; nothing is lost."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        loggers = [AuditLogger(run_dir, batch_size=5, max_bytes=8_000, compression="gzip") for _ in range(3)]
+        threads = [
+            threading.Thread(target=lambda lg=lg, k=k: [_log(lg, k * 1000 + i) for i in range(150)])
+            for k, lg in enumerate(loggers)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for logger in loggers:
+            logger.close()
+
+        calls_file = run_dir / "calls.jsonl"
+        records = list(iter_calls(calls_file))
+        assert len(records) == 450
+        seqs = [s["seq"] for s in load_index(calls_file)["segments"]]
+        assert seqs == sorted(set(seqs)) and len(seqs) == sum(lg.segments_rotated for lg in loggers)
+        # Each rotation saw the whole file, not one logger's share of it
+        assert calls_file.stat().st_size < 8_000 + 5 * 1_000
+
+
+def test_tailer_reads_only_new_bytes_across_rotations():
+    """Incremental totals match a full call_totals scan through partial lines and rotations."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        calls_file = run_dir / "calls.jsonl"
+        tailer = CallsTailer(calls_file, chunk_size=100)
+        assert tailer.poll()["records"] == 0
+
+        logger = AuditLogger(run_dir, batch_size=10, max_bytes=20_000, compression="gzip")
+        for i in range(25):
+            _log(logger, i)
+        logger.flush()
+        assert tailer.poll()["records"] == 25
+        offset = tailer.offset
+
+        # A half-written line is left for the next poll
+        line = calls_file.read_bytes().splitlines(keepends=True)[0]
+        with open(calls_file, "ab") as f:
+            f.write(line[:40])
+        assert tailer.poll()["records"] == 25 and tailer.offset == offset
+        with open(calls_file, "ab") as f:
+            f.write(line[40:])
+        assert tailer.poll()["records"] == 26
+
+        for i in range(180):
+            _log(logger, i)
+            if i % 20 == 0:
+                logger.flush()
+                tailer.poll()
+        logger.close()
+        assert logger.segments_rotated > 1
+        assert tailer.poll() == call_totals(calls_file)
+        assert tailer.poll()["records"] == 206
+
+
+def test_readers_follow_a_segment_sealed_after_listing(monkeypatch):
+    """A writer sealing a segment between a reader's listing and its open doesn't break the read."""
+    import app.audit as audit
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        logger = AuditLogger(run_dir, batch_size=1)
+        for i in range(3):
+            _log(logger, i)
+        logger.close()
+        calls_file = run_dir / "calls.jsonl"
+        raw = run_dir / "calls.000001.jsonl"
+        calls_file.rename(raw)
+        calls_file.write_text("")
+        segment_files = audit._segment_files
+
+        def listed_then_sealed(path):
+            listing = segment_files(path)
+            if raw.exists():
+                audit.seal_segment(raw)  # The writer seals (and removes raw) right after
+            return listing
+
+        monkeypatch.setattr(audit, "_segment_files", listed_then_sealed)
+        assert len(list(iter_calls(calls_file))) == 3
+
+        # Unseal it again for the same race in call_totals
+        sealed = run_dir / "calls.000001.jsonl.gz"
+        with gzip.open(sealed, "rb") as f:
+            raw.write_bytes(f.read())
+        sealed.unlink()
+        assert call_totals(calls_file)["records"] == 3
@@ -0,0 +1,85 @@
+"""Test the evaluation browser: server-side filters, pagination, linked records, incremental indexing."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from app.browse import BrowseFilter, EvaluationBrowser
+from app.jsonl_index import write_jsonl
+
+LOBS = ["Benefits", "Claims", "Billing"]
+
+
+def _id(n: int) -> str:
+    return f"TRA-20250101_000000-{n:03d}"
+
+
+def _evaluation(n: int) -> dict:
+    return {
+        "call_id": _id(n),
+        "scores": {"coverage": n % 5 + 1, "factuality": 5},
+        "hallucination_flags": ["made-up refund"] if n % 4 == 0 else [],
+        "overall_pass": n % 5 >= 3,
+    }
+
+
+def _run(tmp: Path, n: int) -> EvaluationBrowser:
+    transcripts = tmp / "transcripts.jsonl"
+    write_jsonl(transcripts, [{"call_id": _id(i), "lob": LOBS[i % 3], "segments": []} for i in range(n)])
+    run_dir = tmp / "run"
+    run_dir.mkdir()
+    write_jsonl(run_dir / "summaries.jsonl", [{"call_id": _id(i), "intent": f"intent {i}"} for i in range(n)])
+    write_jsonl(run_dir / "evaluations.jsonl", [_evaluation(i) for i in range(n)])
+    return EvaluationBrowser(run_dir, transcripts, thresholds={"coverage": 3.0})
+
+
+def test_filters_and_pages():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        browser = _run(Path(tmpdir), 60)
+        assert browser.dimensions() == ["coverage", "factuality"]
+        assert browser.lobs() == sorted(LOBS)
+
+        # coverage = n % 5 + 1 is under the rubric's 3.0 for n % 5 in (0, 1)
+        failing = browser.page(BrowseFilter(failing_dimension="coverage"), page=0, page_size=10)
+        assert failing.total == 24 and failing.pages == 3
+        assert all(item.evaluation["scores"]["coverage"] < 3 for item in failing.items)
+
+        combined = BrowseFilter(lob="Claims", hallucinated=True, min_score=3.0, max_score=4.0)
+        expected = [
+            _id(i)
+            for i in range(60)
+            if i % 3 == 1 and i % 4 == 0 and 3.0 <= ((i % 5 + 1) + 5) / 2 <= 4.0
+        ]
+        page = browser.page(combined, page_size=100)
+        assert [item.call_id for item in page.items] == expected
+        assert browser.count(BrowseFilter(hallucinated=False, passed=True)) == sum(
+            1 for i in range(60) if i % 4 and i % 5 >= 3
+        )
+
+        last = browser.page(BrowseFilter(), page=5, page_size=25)
+        assert last.page == 2 and len(last.items) == 10  # Clamped to the last page
+        item = last.items[0]
+        assert item.summary["intent"] == f"intent {50}"
+        assert item.transcript["lob"] == LOBS[50 % 3]
+
+
+def test_appended_evaluations_are_indexed_without_a_rebuild():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        browser = _run(Path(tmpdir), 10)
+        assert browser.count() == 10
+
+        with open(browser.evaluations_path, "a") as f:
+            f.write(json.dumps(_evaluation(10)) + "\n")
+            f.write(json.dumps(_evaluation(11))[:20])  # Line still being written
+        assert browser.count() == 11
+
+        with open(browser.evaluations_path, "a") as f:
+            f.write(json.dumps(_evaluation(11))[20:] + "\n")
+        assert browser.count() == 12
+
+        # A re-judged item replaces its earlier line rather than adding a row
+        rejudged = dict(_evaluation(0), scores={"coverage": 5, "factuality": 5})
+        with open(browser.evaluations_path, "a") as f:
+            f.write(json.dumps(rejudged) + "\n")
+        assert browser.count() == 12
+        assert browser.count(BrowseFilter(failing_dimension="coverage")) == 5  # 1, 5, 6, 10, 11
@@ -0,0 +1,113 @@
+"""Test the spend/token budget ledger and runners stopping when it runs out."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from app.budget import BudgetedProvider, BudgetExceededError, BudgetLedger
+from app.provider.base import Message
+from app.provider.mock import MockProvider
+from app.summarize.runner import SummarizeRunner
+
+ROOT = Path(__file__).parent.parent
+PROMPTS_DIR = ROOT / "configs" / "prompts"
+PRICING = {"input_per_1m": 150.0, "output_per_1m": 600.0}
+MESSAGES = [Message(role="system", content="Summarize."), Message(role="user", content="x" * 400)]
+
+
+def test_concurrent_calls_never_pass_the_limit():
+    ledger = BudgetLedger(max_cost=0.5)
+    provider = BudgetedProvider(MockProvider(), ledger, PRICING)
+
+    def call(_):
+        try:
+            provider.generate(MESSAGES, max_tokens=200)
+            return True
+        except BudgetExceededError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(call, range(200)))
+
+    assert any(results) and not all(results)
+    assert ledger.exhausted
+    assert ledger.spent_cost <= 0.5
+    assert ledger.calls == sum(results)
+    assert ledger.refused == results.count(False)
+    assert ledger.reserved_cost == pytest.approx(0) and ledger.reserved_tokens == 0
+
+
+def test_failed_call_releases_its_reservation():
+    class FailingProvider(MockProvider):
+        def generate(self, messages, temperature=0.7, seed=None, max_tokens=None):
+            raise RuntimeError("boom")
+
+    ledger = BudgetLedger(max_tokens=10_000)
+    with pytest.raises(RuntimeError):
+        BudgetedProvider(FailingProvider(), ledger).generate(MESSAGES, max_tokens=100)
+    assert ledger.reserved_tokens == 0 and ledger.spent_tokens == 0 and ledger.calls == 0
+
+
+def test_runner_stops_submitting_once_exhausted():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ledger = BudgetLedger(max_tokens=20_000)
+        runner = SummarizeRunner(
+            BudgetedProvider(MockProvider(), ledger), PROMPTS_DIR, Path(tmpdir), budget=ledger
+        )
+        pulled = []
+
+        def transcripts():
+            for i in range(1000):
+                pulled.append(i)
+                yield {"call_id": f"TRA-20250101_000000-{i:04d}", "lob": "Benefits", "segments": []}
+
+        summaries = list(runner.iter_run(transcripts(), workers=2))
+        assert ledger.exhausted
+        assert 0 < len(summaries) < 50
+        assert len(pulled) <= len(summaries) + 10  # Queued work past the limit was never submitted
+        assert ledger.spent_tokens <= 20_000
+
+
+def test_cli_refuses_a_budget_with_sharding():
+    """Each shard worker would enforce the whole per-process limit, so the combination is refused."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        proc = subprocess.run(
+            [sys.executable, "-m", "app.cli", "summarize", "--provider", "openai", "--model", "small",
+             "--shard-size", "2", "--max-cost", "1", "--run", "runs/shared"],
+            cwd=tmpdir, env={**os.environ, "PYTHONPATH": str(ROOT)}, capture_output=True, text=True, timeout=60,
+        )
+        assert proc.returncode == 1
+        assert "--shard-size" in proc.stdout
+        assert not (Path(tmpdir) / "runs" / "shared" / "summaries.jsonl").exists()
+
+
+def test_cli_refuses_a_cost_limit_for_an_unpriced_model():
+    """Without pricing every call costs $0, so --max-cost could never stop anything."""
+    import yaml
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cwd = Path(tmpdir)
+        shutil.copytree(ROOT / "configs", cwd / "configs")
+        models_file = cwd / "configs" / "models.yaml"
+        models = yaml.safe_load(models_file.read_text())
+        del models["openai"]["small"]["pricing"]
+        models_file.write_text(yaml.safe_dump(models))
+
+        def cli(*budget):
+            return subprocess.run(
+                [sys.executable, "-m", "app.cli", "summarize", "--provider", "openai", "--model", "small", "--run", "runs/r1",
+             *budget],
+                cwd=cwd, env={**os.environ, "PYTHONPATH": str(ROOT)}, capture_output=True, text=True, timeout=60,
+            )
+
+        proc = cli("--max-cost", "1")
+        assert proc.returncode == 1
+        assert "only --max-tokens can be enforced" in proc.stdout
+        # A token limit needs no pricing; it gets past the check (and stops later on the missing dataset)
+        assert "--max-tokens can be enforced" not in cli("--max-tokens", "1000").stdout
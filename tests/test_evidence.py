@@ -0,0 +1,83 @@
+"""Test evidence-window retrieval for the judge."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from app.judge.evidence import EvidenceConfig, EvidenceSelector
+from app.judge.runner import JudgeRunner
+from app.provider.mock import MockProvider
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+FILLER = "Let me pull that up for you, one moment please."
+
+TRANSCRIPT = {
+    "call_id": "TRA-20250101_000000-001",
+    "lob": "Pharmacy",
+    "segments": [{"t": f"00:{i * 5:02d}", "speaker": "agent", "text": FILLER} for i in range(12)],
+    "metadata": {"duration_s": 60},
+}
+TRANSCRIPT["segments"][2]["text"] = "I need a refill of metformin at the Elm Street pharmacy."
+TRANSCRIPT["segments"][9]["text"] = "I will call you back tomorrow to confirm pickup."
+
+SUMMARY = {
+    "call_id": TRANSCRIPT["call_id"],
+    "call_resolution": "Metformin refill requested at Elm Street pharmacy.",
+    "action_items": "Agent to call back tomorrow to confirm pickup.",
+    "context_preservation": "Refill of metformin.",
+    "compliance_notes": "",
+    "quality_indicators": "",
+}
+
+
+def test_selects_supporting_windows():
+    """Each field retrieves its supporting segment plus neighbours; the rest is omitted."""
+    selector = EvidenceSelector()
+    selection = selector.select(TRANSCRIPT, SUMMARY)
+    assert selection.fallback is None
+    assert selection.fields["call_resolution"][0] == 2
+    assert selection.fields["action_items"][0] == 9
+    assert {1, 2, 3, 8, 9, 10} <= set(selection.indices)
+    assert len(selection.indices) < len(TRANSCRIPT["segments"])
+
+    shown = selector.prompt_transcript(TRANSCRIPT, selection)
+    assert [s["t"] for s in shown["segments"]] == [TRANSCRIPT["segments"][i]["t"] for i in selection.indices]
+    assert "call_resolution" in shown["segments"][selection.indices.index(2)]["supports"]
+
+
+def test_scattered_evidence_falls_back_to_full_transcript():
+    """A field whose transcript terms mostly sit outside its windows is low confidence."""
+    selector = EvidenceSelector(EvidenceConfig(top_k=1, window=0))
+    summary = {**SUMMARY, "context_preservation": "Metformin refill; callback to confirm pickup."}
+    selection = selector.select(TRANSCRIPT, summary)
+    assert selection.fallback == "low confidence: context_preservation"
+    assert selector.prompt_transcript(TRANSCRIPT, selection) is TRANSCRIPT
+
+    # Paraphrase with no transcript terms is not a retrieval failure
+    summary = {**SUMMARY, "context_preservation": "Member enrolled with Aetna since 2019."}
+    assert selector.select(TRANSCRIPT, summary).fallback is None
+
+
+def test_runner_sends_excerpt_and_writes_stats():
+    """Evidence mode shrinks the judge prompt and records evidence.json."""
+    seen = []
+
+    class RecordingProvider(MockProvider):
+        def generate(self, messages, temperature=0.7, seed=None, max_tokens=None):
+            seen.append(messages[-1].content)
+            return super().generate(messages, temperature, seed, max_tokens)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        runner = JudgeRunner(RecordingProvider(), PROMPTS_DIR, RUBRIC_PATH, run_dir, evidence=EvidenceSelector())
+        evaluations = runner.run([TRANSCRIPT], [SUMMARY])
+
+        assert "Excerpt:" in seen[0]
+        assert seen[0].count(FILLER) < 10
+        assert evaluations[0]["evidence"]["segments_total"] == 12
+        with open(run_dir / "evidence.json") as f:
+            stats = json.load(f)
+        assert stats["fallbacks"] == 0
+        assert stats["transcript_reduction"] > 0
@@ -0,0 +1,115 @@
+"""Test --dry-run forecasts: history from calls.jsonl, cost and wall-time math, no provider calls."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from app.forecast import PhaseHistory, count_tokens, forecast
+from app.jsonl_index import write_jsonl
+from app.provider.base import Message
+
+ROOT = Path(__file__).parent.parent
+PRICING = {"input_per_1m": 1.0, "output_per_1m": 2.0}
+
+
+def _call(phase: str, model: str, completion: int, latency_ms: float, **extra) -> dict:
+    usage = {"prompt_tokens": 100, "completion_tokens": completion, "total_tokens": 100 + completion}
+    return {"phase": phase, "model": model, "status": "ok", "usage": usage, "latency_ms": latency_ms, **extra}
+
+
+def test_history_keeps_only_matching_successful_calls():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir) / "20250101_000000"
+        run_dir.mkdir()
+        records = [
+            _call("summarize", "m", 100, 1000),
+            _call("summarize", "m", 300, 3000),
+            _call("judge", "m", 999, 9000),
+            _call("summarize", "other", 999, 9000),
+            _call("summarize", "m", 999, 9000, status="error"),
+            _call("summarize", "m", 999, 9000, estimated=True),
+        ]
+        (run_dir / "calls.jsonl").write_text("".join(json.dumps(r) + "\n" for r in records))
+
+        history = PhaseHistory.load(Path(tmpdir), "summarize", "m")
+        assert history.completion_tokens == [100, 300]
+        assert history.latency_ms == [1000, 3000]
+
+
+def test_forecast_prices_prompts_against_history():
+    prompts = [[Message(role="user", content="x" * 400)]] * 10
+    history = PhaseHistory(completion_tokens=[100, 300], latency_ms=[1000.0, 3000.0])
+
+    result = forecast("summarize", "m", prompts, 1024, PRICING, history, workers=4, skipped={"cached": 2})
+    assert result.calls == 10 and result.items == 12
+    assert result.prompt_tokens == 10 * count_tokens("x" * 400)
+    assert result.output_tokens == 200
+    assert result.cost == pytest.approx((result.prompt_tokens * 1.0 + 2000 * 2.0) / 1_000_000)
+    assert result.wall_s == pytest.approx(3 * 2.0)  # ceil(10 / 4) rounds of 2s calls
+
+    limited = forecast("summarize", "m", prompts, 1024, PRICING, history, workers=4, rate_per_s=0.5)
+    assert limited.wall_s == pytest.approx(20.0)
+
+
+def test_forecast_without_history_assumes_half_the_cap():
+    result = forecast("judge", "m", [[Message(role="user", content="hi")]], 2048, PRICING, PhaseHistory(), workers=1)
+    assert result.output_tokens == result.output_tokens_p90 == 1024
+    assert result.history_calls == 0
+
+
+def test_cli_dry_run_calls_no_provider():
+    """Without API keys or --replay, a real call would fail; the dry run must not make one."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cwd = Path(tmpdir)
+        (cwd / "configs").symlink_to(ROOT / "configs")
+        (cwd / "data").mkdir()
+        write_jsonl(
+            cwd / "data" / "transcripts.jsonl",
+            [{"call_id": f"TRA-20250101_000000-{i:03d}", "lob": "Benefits", "segments": []} for i in range(5)],
+        )
+        env = {k: v for k, v in os.environ.items() if not k.endswith("_API_KEY")}
+        env["PYTHONPATH"] = str(ROOT)
+        out = subprocess.run(
+            [sys.executable, "-m", "app.cli", "summarize", "--provider", "openai", "--model", "small",
+             "--dry-run", "--workers", "2"],
+            cwd=cwd, env=env, capture_output=True, text=True, timeout=60,
+        )
+        assert out.returncode == 0, out.stdout + out.stderr
+        assert "5 items → 5 provider calls" in out.stdout
+        assert not (cwd / "runs").exists()
+
+
+def test_cli_judge_dry_run_counts_cached_pairs():
+    """After a judge run warms the cache, a judge dry run forecasts no calls for those pairs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cwd = Path(tmpdir)
+        (cwd / "configs").symlink_to(ROOT / "configs")
+        (cwd / "data").mkdir()
+        (cwd / "empty").mkdir()
+        write_jsonl(
+            cwd / "data" / "transcripts.jsonl",
+            [{"call_id": f"TRA-20250101_000000-{i:03d}", "lob": "Benefits",
+              "segments": [{"t": "00:00", "speaker": "agent", "text": f"Hello {i}"}]} for i in range(4)],
+        )
+        env = {k: v for k, v in os.environ.items() if not k.endswith("_API_KEY")}
+        env["PYTHONPATH"] = str(ROOT)
+        base = [sys.executable, "-m", "app.cli"]
+        model = ["--provider", "openai", "--model", "small"]
+        replay = ["--replay", "empty", "--replay-miss", "mock", "--run", "runs/r1"]
+        cache = ["--cache-path", str(cwd / "judgments.sqlite")]
+
+        def cli(*argv):
+            out = subprocess.run([*base, *argv], cwd=cwd, env=env, capture_output=True, text=True, timeout=60)
+            assert out.returncode == 0, out.stdout + out.stderr
+            return out.stdout
+
+        cli("summarize", *model, *replay)
+        assert "4 items → 4 provider calls" in cli("judge", *model, "--dry-run", "--run", "runs/r1", *cache)
+        cli("judge", *model, *replay, *cache)
+        out = cli("judge", *model, "--dry-run", "--run", "runs/r1", *cache)
+        assert "4 items → 0 provider calls" in out and "(4 cached)" in out
@@ -0,0 +1,158 @@
+"""Test the machine-wide governor: limits across processes, fair sharing, reclaiming dead slots."""
+
+import multiprocessing
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from app.governor import Governor, GovernorLimits
+
+
+def _hold_slots(path: str, job: str, calls: int, out):
+    """Worker process: make ``calls`` 50ms calls with 4 threads, recording start/end times."""
+    governor = Governor(Path(path), "openai", GovernorLimits(max_concurrency=3), job=job, poll_s=0.005)
+
+    def call(_):
+        with governor.slot():
+            start = time.time()
+            time.sleep(0.05)
+            out.put((start, time.time()))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(call, range(calls)))
+
+
+def test_concurrency_limit_holds_across_processes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = str(Path(tmpdir) / "governor.sqlite")
+        ctx = multiprocessing.get_context("spawn")
+        out = ctx.Queue()
+        procs = [ctx.Process(target=_hold_slots, args=(path, f"job{i}", 8, out)) for i in range(3)]
+        for p in procs:
+            p.start()
+        spans = [out.get(timeout=60) for _ in range(24)]
+        for p in procs:
+            p.join(timeout=60)
+            assert p.exitcode == 0
+
+        events = sorted([(s, 1) for s, _ in spans] + [(e, -1) for _, e in spans])
+        in_flight = peak = 0
+        for _, delta in events:
+            in_flight += delta
+            peak = max(peak, in_flight)
+        assert peak <= 3
+
+
+def test_waiting_job_gets_its_fair_share():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "governor.sqlite"
+        limits = GovernorLimits(max_concurrency=4)
+        big = Governor(path, "openai", limits, job="big", poll_s=0.005)
+        small = Governor(path, "openai", limits, job="small", poll_s=0.005)
+        stop = threading.Event()
+
+        def hog():
+            while not stop.is_set():
+                with big.slot():
+                    time.sleep(0.02)
+
+        hogs = [threading.Thread(target=hog) for _ in range(8)]
+        for t in hogs:
+            t.start()
+        time.sleep(0.1)
+
+        # With the pool full of "big", "small" still gets slots as big's calls finish
+        peak = []
+        active = [0]
+        lock = threading.Lock()
+
+        def small_call(_):
+            with small.slot():
+                with lock:
+                    active[0] += 1
+                    peak.append(active[0])
+                time.sleep(0.05)
+                with lock:
+                    active[0] -= 1
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(small_call, range(12)))
+        stop.set()
+        for t in hogs:
+            t.join()
+        assert max(peak) == 2  # Half of the 4 slots while both jobs want more
+
+
+def test_token_window_blocks_until_usage_ages_out(monkeypatch):
+    import app.governor as governor_module
+
+    monkeypatch.setattr(governor_module, "TOKEN_WINDOW_S", 0.3)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        governor = Governor(Path(tmpdir) / "g.sqlite", "openai", GovernorLimits(tokens_per_min=1000), poll_s=0.01)
+        with governor.slot(800) as settle:
+            settle(900)
+        t0 = time.perf_counter()
+        with governor.slot(500):
+            pass
+        assert time.perf_counter() - t0 >= 0.2
+        # A call bigger than the whole limit still runs once nothing else is in the window
+        time.sleep(0.35)
+        with governor.slot(5000):
+            pass
+
+
+def test_slots_of_dead_processes_are_reclaimed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "governor.sqlite"
+        governor = Governor(path, "openai", GovernorLimits(max_concurrency=1), poll_s=0.01)
+        ctx = multiprocessing.get_context("spawn")
+        dead = ctx.Process(target=time.sleep, args=(0,))
+        dead.start()
+        dead.join()
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "INSERT INTO slots (provider, job, pid, tokens, acquired_at) VALUES ('openai', 'gone', ?, 0, ?)",
+                (dead.pid, time.time()),
+            )
+        t0 = time.perf_counter()
+        with governor.slot():
+            assert governor.snapshot()["in_flight"] == {governor.job: {"calls": 1, "tokens": 0}}
+        assert time.perf_counter() - t0 < 1
+
+
+def test_waiters_back_off_and_threads_reuse_one_connection():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        governor = Governor(Path(tmpdir) / "g.sqlite", "openai", GovernorLimits(max_concurrency=1), poll_s=0.01)
+        attempts = []
+        try_take = governor._try_take
+
+        def counting(conn, tokens, now):
+            slot_id = try_take(conn, tokens, now)
+            attempts.append(slot_id)
+            return slot_id
+
+        governor._try_take = counting
+        release = threading.Event()
+
+        def holder():
+            with governor.slot():
+                release.wait()
+
+        t = threading.Thread(target=holder)
+        t.start()
+        while not attempts:
+            time.sleep(0.005)
+        threading.Timer(0.6, release.set).start()
+        for _ in range(3):
+            with governor.slot():
+                pass
+        t.join()
+
+        waits = attempts.count(None)
+        assert 0 < waits < 15  # A fixed 10ms poll would have retried ~60 times
+        assert len(governor._conns) == 2  # One per thread, reused for every call
+        governor.close()
+        assert governor._conns == []
@@ -0,0 +1,90 @@
+"""Test background jobs: structured progress events, captured output, cancel, in-process CLI commands."""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from app.jobs import JobManager, cli_job
+from app.jsonl_index import write_jsonl
+from app.provider.mock import MockProvider
+from app.summarize.runner import SummarizeRunner
+
+ROOT = Path(__file__).parent.parent
+PROMPTS_DIR = ROOT / "configs" / "prompts"
+
+
+def _transcripts(n: int):
+    return [{"call_id": f"TRA-20250101_000000-{i:04d}", "lob": "Benefits", "segments": []} for i in range(n)]
+
+
+def test_job_publishes_progress_and_keeps_its_output():
+    manager = JobManager()
+
+    def work(progress):
+        for i in range(1, 4):
+            print(f"step {i}")
+            progress.update("demo", i, 3, tokens=10 * i, cost=0.01 * i)
+        return "ok"
+
+    job = manager.submit("demo", work)
+    assert job.wait(timeout=10)
+    assert job.state == "done" and job.result == "ok"
+    assert list(job.log) == ["step 1", "step 2", "step 3"]
+
+    events = job.drain()
+    assert [e.kind for e in events] == ["started", "progress", "progress", "progress", "done"]
+    assert events[-2].done == 3 and events[-2].tokens == 30 and events[-2].eta_s == 0
+    assert job.latest["demo"].done == 3
+    assert job.drain() == []
+
+
+def test_failed_and_exiting_jobs_are_reported():
+    manager = JobManager()
+    boom = manager.submit("boom", lambda progress: 1 / 0)
+    exits = manager.submit("exit", lambda progress: exec("import sys; sys.exit(1)"))
+    assert boom.wait(10) and exits.wait(10)
+    assert boom.state == "failed" and "ZeroDivisionError" in boom.error
+    assert exits.state == "failed" and boom.drain()[-1].kind == "failed"
+
+
+def test_cancel_stops_a_running_phase():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = JobManager()
+        summaries = []
+
+        def work(progress):
+            runner = SummarizeRunner(MockProvider(), PROMPTS_DIR, Path(tmpdir), progress=progress)
+            summaries.extend(runner.iter_run(_transcripts(200), workers=2, total=200))
+
+        job = manager.submit("summarize", work)
+        while "summarize" not in job.latest or job.latest["summarize"].done < 4:
+            time.sleep(0.05)
+        assert manager.cancel(job.id)
+        assert job.wait(timeout=30)
+        assert job.state == "cancelled"
+        assert 4 <= len(summaries) < 20
+        assert job.latest["summarize"].total == 200 and job.latest["summarize"].eta_s > 0
+
+
+def test_cli_job_runs_a_command_in_process(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cwd = Path(tmpdir)
+        (cwd / "configs").symlink_to(ROOT / "configs")
+        (cwd / "data").mkdir()
+        (cwd / "empty").mkdir()
+        write_jsonl(cwd / "data" / "transcripts.jsonl", _transcripts(6))
+        monkeypatch.chdir(cwd)
+
+        argv = [
+            "summarize", "--provider", "openai", "--model", "small", "--workers", "3",
+            "--replay", "empty", "--replay-miss", "mock", "--run", "runs/job",
+        ]
+        job = JobManager().submit("summarize", cli_job(argv))
+        assert job.wait(timeout=60), list(job.log)
+        assert job.state == "done", (job.error, list(job.log))
+
+        lines = (cwd / "runs" / "job" / "summaries.jsonl").read_text().splitlines()
+        assert len(lines) == 6 and json.loads(lines[0])["transcript_id"].startswith("TRA-")
+        assert job.latest["summarize"].done == 6 and job.latest["summarize"].total == 6
+        assert any("[summarize] ✓ Summarized 6 transcripts" in line for line in job.log)
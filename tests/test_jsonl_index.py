@@ -0,0 +1,75 @@
+"""Test the call_id byte-offset index over JSONL datasets."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from app.jsonl_index import JsonlIndex, write_jsonl
+
+
+def _transcript(n: int, text: str = "Hello") -> dict:
+    return {
+        "call_id": f"TRA-20250101_000000-{n:03d}",
+        "lob": "Benefits",
+        "segments": [{"t": "00:00", "speaker": "agent", "text": f"{text} caller {n} — café"}],
+    }
+
+
+def test_write_and_lookup():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcripts.jsonl"
+        records = [_transcript(n) for n in (3, 1, 2)]
+        index = write_jsonl(path, records)
+
+        assert (Path(tmp) / "transcripts.index.sqlite").exists()
+        assert len(index) == 3
+        assert index.keys() == sorted(r["call_id"] for r in records)
+        assert index.get(records[0]["call_id"]) == records[0]
+        assert index.get("missing") is None
+        assert [t["call_id"] for t in index.first(2)] == [_transcript(1)["call_id"], _transcript(2)["call_id"]]
+        # Non-ASCII text is stored as UTF-8, matching the generator's ensure_ascii=False
+        assert "café" in path.read_text(encoding="utf-8")
+
+
+def test_append_is_indexed_incrementally():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcripts.jsonl"
+        write_jsonl(path, [_transcript(1), _transcript(2)])
+        with open(path, "a") as f:
+            f.write(json.dumps(_transcript(3)) + "\n")
+
+        index = JsonlIndex(path)
+        scanned = []
+        original = index._scan
+        index._scan = lambda conn, start: (scanned.append(start), original(conn, start))
+        assert index.get(_transcript(3)["call_id"]) == _transcript(3)
+        assert scanned == [len(path.read_bytes()) - len(json.dumps(_transcript(3))) - 1]
+
+
+def test_rewrite_without_index_triggers_rebuild():
+    """A file replaced by a plain writer (no index update) is re-indexed on the next read."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcripts.jsonl"
+        write_jsonl(path, [_transcript(n) for n in range(1, 4)])
+        with open(path, "w") as f:
+            for n in (2, 5):
+                f.write(json.dumps(_transcript(n, "Rewritten")) + "\n")
+
+        index = JsonlIndex(path)
+        assert index.keys() == [_transcript(2)["call_id"], _transcript(5)["call_id"]]
+        assert index.get(_transcript(2)["call_id"])["segments"][0]["text"].startswith("Rewritten")
+        assert index.get(_transcript(1)["call_id"]) is None
+
+
+def test_hash_mismatch_rebuilds(monkeypatch):
+    """An in-place edit the stat check misses is caught by the record hash."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "transcripts.jsonl"
+        index = write_jsonl(path, [_transcript(1), _transcript(2)])
+        stale = index._stat()
+        data = path.read_bytes().replace(b"Hello caller 2", b"Howdy caller 2")
+        path.write_bytes(data)
+        monkeypatch.setattr(JsonlIndex, "_stat", lambda self: stale)  # Looks unchanged
+
+        record = JsonlIndex(path).get(_transcript(2)["call_id"])
+        assert record["segments"][0]["text"].startswith("Howdy")
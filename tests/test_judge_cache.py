@@ -0,0 +1,142 @@
+"""Test the persistent judgment cache."""
+
+import tempfile
+from pathlib import Path
+
+from app.audit import AuditLogger
+from app.judge.cache import JudgmentCache
+from app.judge.evidence import EvidenceSelector
+from app.judge.runner import JudgeRunner
+from app.provider.mock import MockProvider
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+
+class CountingProvider(MockProvider):
+    """Mock provider that counts calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def generate(self, messages, temperature=0.7, seed=None, max_tokens=None):
+        self.calls += 1
+        return super().generate(messages, temperature, seed, max_tokens)
+
+
+def _pair(n: int) -> tuple[dict, dict]:
+    transcript = {
+        "call_id": f"TRA-20250101_000000-{n:03d}",
+        "lob": "Benefits",
+        "segments": [{"t": "00:00", "speaker": "agent", "text": f"Hello caller {n}"}],
+        "metadata": {"duration_s": 10},
+    }
+    summary = {
+        "call_id": transcript["call_id"],
+        "call_resolution": f"Resolved {n}",
+        "summary_id": f"SUM-{n:03d}",
+        "transcript_id": transcript["call_id"],
+    }
+    return transcript, summary
+
+
+def test_second_run_reuses_cached_evaluations():
+    """Identical inputs should be served from the cache without provider calls."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        pairs = [_pair(1), _pair(2)]
+        transcripts = [t for t, _ in pairs]
+        summaries = [s for _, s in pairs]
+
+        provider = CountingProvider()
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        runner = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run1", cache=cache)
+        first = runner.run(transcripts, summaries)
+        assert provider.calls == 2
+        assert cache.stats()["entries"] == 2
+
+        runner = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run2", cache=cache)
+        second = runner.run(transcripts, summaries)
+        assert provider.calls == 2
+        assert cache.hits == 2
+        assert sorted(e["call_id"] for e in second) == sorted(e["call_id"] for e in first)
+
+        # A changed summary is a miss
+        summaries[0] = {**summaries[0], "call_resolution": "Different"}
+        runner = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run3", cache=cache)
+        runner.run(transcripts, summaries)
+        assert provider.calls == 3
+
+
+def test_export_import_and_eviction():
+    """Entries survive an export/import round trip and LRU eviction trims the store."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        transcripts, summaries = zip(*[_pair(i) for i in range(3)])
+
+        cache = JudgmentCache(tmp_path / "a.sqlite")
+        runner = JudgeRunner(MockProvider(), PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run", cache=cache)
+        runner.run(list(transcripts), list(summaries))
+
+        export_file = tmp_path / "export.jsonl"
+        assert cache.export_jsonl(export_file) == 3
+
+        other = JudgmentCache(tmp_path / "b.sqlite")
+        assert other.import_jsonl(export_file) == 3
+        assert other.evict(max_entries=1) == 2
+        assert other.stats()["entries"] == 1
+
+
+def _judged_run(run_dir: Path, pairs, **kwargs) -> list[dict]:
+    """Judge ``pairs`` with a MockProvider, auditing the calls to run_dir/calls.jsonl."""
+    transcripts, summaries = (list(x) for x in zip(*pairs))
+    audit_logger = AuditLogger(run_dir)
+    evaluations = JudgeRunner(
+        MockProvider(), PROMPTS_DIR, RUBRIC_PATH, run_dir, audit_logger=audit_logger, **kwargs
+    ).run(transcripts, summaries)
+    audit_logger.close()
+    return evaluations
+
+
+def test_warmed_entries_hit_in_lean_and_evidence_mode():
+    """Warming keys each evaluation the way a runner in the target mode looks it up."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        pairs = [_pair(i) for i in range(2)]
+        mode = {"mode": "lean", "evidence": EvidenceSelector()}
+        evaluations = _judged_run(tmp_path / "old", pairs, **mode)
+
+        provider = CountingProvider()
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        warmer = JudgeRunner(None, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "old", cache=cache, **mode)
+        judged = warmer.judged_calls(tmp_path / "old" / "calls.jsonl")
+        for (transcript, summary), evaluation in zip(pairs, evaluations):
+            assert warmer.warm_cache(transcript, summary, evaluation, provider.model_id, judged)
+
+        runner = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "new", cache=cache, **mode)
+        runner.run([t for t, _ in pairs], [s for _, s in pairs])
+        assert cache.hits == 2
+
+
+def test_warm_skips_evaluations_judged_with_other_prompts_or_modes():
+    """A run judged with an older prompt, or in another mode, is not stored as current."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        pairs = [_pair(i) for i in range(2)]
+        evaluations = _judged_run(tmp_path / "old", pairs)
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        model_id = MockProvider().model_id
+
+        warmer = JudgeRunner(None, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "old", cache=cache)
+        judged = warmer.judged_calls(tmp_path / "old" / "calls.jsonl")
+        assert warmer.warm_cache(*pairs[0], evaluations[0], model_id, judged)
+        assert not warmer.warm_cache(*pairs[0], evaluations[0], "other-model", judged)
+
+        # The judge prompt changed since the run
+        warmer.system_prompt += "\nBe stricter."
+        assert not warmer.warm_cache(*pairs[1], evaluations[1], model_id, judged)
+
+        lean = JudgeRunner(None, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "old", cache=cache, mode="lean")
+        assert not lean.warm_cache(*pairs[1], evaluations[1], model_id, lean.judged_calls(tmp_path / "old" / "calls.jsonl"))
+        assert cache.stats()["entries"] == 1
@@ -0,0 +1,85 @@
+"""Test the two-tier (scores-only first) judge."""
+
+import tempfile
+from pathlib import Path
+
+from app.judge.cache import JudgmentCache
+from app.judge.runner import JudgeRunner
+from app.provider.mock import MockProvider
+from app.tune.llm_assistant import rationale_targets
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+
+def test_rationale_targets_mirror_summarize_failures():
+    """Only the first two low-scoring evaluations per dimension are selected."""
+    evaluations = [{"scores": {"coverage": 3, "factuality": 5}} for _ in range(4)]
+    assert rationale_targets(evaluations) == {0: {"coverage"}, 1: {"coverage"}}
+
+
+def test_lean_mode_fetches_rationales_for_failures_only():
+    """Passing evaluations keep scores only; gate failures get a second call."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir) / "run"
+        transcripts = [{"call_id": f"TRA-X-{i:03d}", "lob": "Benefits", "segments": []} for i in range(2)]
+        summaries = [{"call_id": t["call_id"]} for t in transcripts]
+
+        runner = JudgeRunner(
+            MockProvider(),
+            PROMPTS_DIR,
+            RUBRIC_PATH,
+            run_dir,
+            mode="lean",
+            lean_reference={"run": "ref", "calls": 1, "output_tokens_per_call": 400.0, "latency_ms_per_call": 100.0},
+        )
+        evaluations = runner.run(transcripts, summaries)
+
+        assert len(evaluations) == 2
+        # The mock's dimensions never satisfy the default rubric, so every evaluation fails the gates
+        assert all(e["rationales"] for e in evaluations)
+        stats = runner.lean_stats.to_dict(runner.lean_reference)
+        assert stats["passes"]["scores"]["calls"] == 2
+        assert stats["passes"]["rationales"]["calls"] == 2
+        assert stats["reduction"]["output_tokens"] > 0
+        assert (run_dir / "lean_judge.json").exists()
+
+
+class RationaleProvider(MockProvider):
+    """Mock provider that counts calls and can return malformed rationale replies."""
+
+    def __init__(self, malformed: str | None = None):
+        super().__init__()
+        self.malformed = malformed
+        self.calls = 0
+
+    def generate(self, messages, temperature=0.7, seed=None, max_tokens=None):
+        self.calls += 1
+        response = super().generate(messages, temperature, seed, max_tokens)
+        if self.malformed is not None and "explain the scores" in messages[-1].content.lower():
+            response.text = self.malformed
+        return response
+
+
+def test_malformed_rationales_keep_scores_and_completed_verdicts_are_cached():
+    """Bad rationale replies keep the scores-only evaluation; fetched rationales are cached."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        transcripts = [{"call_id": f"TRA-X-{i:03d}", "lob": "Benefits", "segments": []} for i in range(2)]
+        summaries = [{"call_id": t["call_id"]} for t in transcripts]
+
+        for reply in ('{"rationales": ["not", "a", "dict"]}', "[1, 2]", '{"rationales": null, "x": 1}'):
+            runner = JudgeRunner(RationaleProvider(reply), PROMPTS_DIR, RUBRIC_PATH, tmp_path / "bad", mode="lean")
+            evaluations = runner.run(transcripts, summaries)
+            assert len(evaluations) == 2 and all(e["scores"] for e in evaluations)
+
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        provider = RationaleProvider()
+        runner = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run1", cache=cache, mode="lean")
+        first = runner.run(transcripts, summaries)
+        assert provider.calls == 4  # Scores, then rationales, for each item
+
+        runner = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run2", cache=cache, mode="lean")
+        second = runner.run(transcripts, summaries)
+        assert provider.calls == 4
+        assert {e["call_id"]: e["rationales"] for e in second} == {e["call_id"]: e["rationales"] for e in first}
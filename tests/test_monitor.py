@@ -0,0 +1,144 @@
+"""Test the calls.jsonl monitor: rolling windows, latency percentiles, 429s, incremental reads, ETA."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from app.monitor import CallsMonitor, format_snapshot
+
+ROOT = Path(__file__).parent.parent
+T0 = 1_800_000_000.0  # Epoch seconds, on a bucket boundary
+
+
+def _call(at: float, phase: str = "summarize", latency_ms: float = 1000.0, **extra) -> dict:
+    ts = datetime.fromtimestamp(at, timezone.utc).replace(tzinfo=None).isoformat()
+    record = {
+        "ts": ts,
+        "phase": phase,
+        "model": "gpt-4o-mini",
+        "latency_ms": latency_ms,
+        "usage": {"prompt_tokens": 80, "completion_tokens": 20, "total_tokens": 100},
+        "cost_usd": 0.001,
+        "status": "ok",
+        "error": None,
+    }
+    record.update(extra)
+    return record
+
+
+def _append(path: Path, records: list[dict]):
+    with open(path, "a") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+
+
+def test_window_rates_and_percentiles():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        calls = run_dir / "calls.jsonl"
+        # Outside the window: must not count
+        _append(calls, [_call(T0 - 300 + i, latency_ms=50_000) for i in range(10)])
+        # 120 calls over the last 60s: latencies 100..11,900 ms, 6 errors of which 3 are 429s
+        records = [_call(T0 + i / 2, latency_ms=100.0 * (i + 1)) for i in range(114)]
+        records += [_call(T0 + 57 + i / 2, status="error", latency_ms=0, error="Error code: 429") for i in range(3)]
+        records += [_call(T0 + 58.5 + i / 2, status="error", latency_ms=0, error="timeout") for i in range(3)]
+        _append(calls, records)
+
+        monitor = CallsMonitor(run_dir, window_s=60, bucket_s=5)
+        assert monitor.poll() == 130
+        snap = monitor.snapshot(now=T0 + 59.9)
+        assert snap.live and len(snap.rows) == 1
+        r = snap.total
+        assert r.calls == 120 and r.errors == 6 and r.rate_limited == 3
+        assert r.requests_per_s == pytest.approx(2.0)
+        assert r.tokens_per_s == pytest.approx(200.0)
+        assert r.cost_per_min == pytest.approx(0.12)
+        # Bins are ~10% wide and report their upper edge
+        assert 5700 <= r.p50_ms <= 5700 * 1.1
+        assert 10_830 <= r.p95_ms <= 10_830 * 1.1
+        assert 11_300 <= r.p99_ms <= 11_300 * 1.1
+
+        # Later calls move the window; the old buckets drop out
+        _append(calls, [_call(T0 + 200 + i, phase="judge", latency_ms=300) for i in range(30)])
+        assert monitor.poll() == 30
+        snap = monitor.snapshot(now=T0 + 230)
+        assert [(row.phase, row.calls) for row in snap.rows] == [("judge", 30)]
+        assert max(monitor._buckets) - min(monitor._buckets) <= 60 / 5 + 1
+
+
+def test_idle_run_is_reported_as_of_its_last_call():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        _append(run_dir / "calls.jsonl", [_call(T0 + i) for i in range(20)])
+        monitor = CallsMonitor(run_dir, window_s=60)
+        monitor.poll()
+        snap = monitor.snapshot(now=T0 + 3600)
+        assert not snap.live and snap.total.calls == 20
+        assert snap.total.span_s == pytest.approx(19)  # The run is younger than the window
+
+
+def test_large_log_is_read_from_its_tail_then_incrementally():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        calls = run_dir / "calls.jsonl"
+        _append(calls, [_call(T0 - 3600 + i) for i in range(2000)])
+        monitor = CallsMonitor(run_dir, window_s=60, tail_bytes=20_000)
+        added = monitor.poll()
+        assert 0 < added < 200  # Only whole lines from the last 20 kB
+        _append(calls, [_call(T0 + i) for i in range(5)])
+        with open(calls, "a") as f:
+            f.write(json.dumps(_call(T0 + 5))[:30])  # Still being written
+        assert monitor.poll() == 5
+
+        calls.rename(run_dir / "calls.000001.jsonl")  # Rotated: the window keeps what was read
+        _append(calls, [_call(T0 + 10)])
+        assert monitor.poll() == 1
+        assert monitor.snapshot(now=T0 + 11).total.calls == 6
+
+        calls.write_text("")  # Truncated: its records are gone
+        assert monitor.poll() == 0
+        _append(calls, [_call(T0 + 12)])
+        assert monitor.poll() == 1
+        assert monitor.snapshot(now=T0 + 13).total.calls == 1
+
+
+def test_projected_completion_from_output_growth():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        _append(run_dir / "summaries.jsonl", [{"call_id": str(i)} for i in range(100)])
+        _append(run_dir / "evaluations.jsonl", [{"call_id": str(i)} for i in range(10)])
+        _append(run_dir / "calls.jsonl", [_call(T0 + i, phase="judge") for i in range(10)])
+        monitor = CallsMonitor(run_dir, window_s=60)
+        monitor.poll()
+        first = monitor.snapshot(now=T0 + 10)
+        (progress,) = first.progress
+        assert (progress.phase, progress.done, progress.total) == ("judge", 10, 100)
+        assert progress.items_per_s == pytest.approx(10 / 10)  # From the call rate until output grows
+
+        _append(run_dir / "evaluations.jsonl", [{"call_id": str(i)} for i in range(10, 40)])
+        (progress,) = monitor.snapshot(now=T0 + 20).progress
+        assert progress.done == 40
+        assert progress.items_per_s == pytest.approx(3.0)
+        assert progress.eta_s == pytest.approx(20.0)
+        assert "judge: 40/100 items" in format_snapshot(monitor.snapshot(now=T0 + 20), run_dir)
+
+
+def test_cli_monitor_once():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir) / "runs" / "20250101_000000"
+        run_dir.mkdir(parents=True)
+        now = datetime.now(timezone.utc).timestamp()
+        _append(run_dir / "calls.jsonl", [_call(now - 10 + i, latency_ms=250) for i in range(10)])
+        out = subprocess.run(
+            [sys.executable, "-m", "app.cli", "monitor", "--once"],
+            cwd=tmpdir, env={**os.environ, "PYTHONPATH": str(ROOT)}, capture_output=True, text=True, timeout=60,
+        )
+        assert out.returncode == 0, out.stdout + out.stderr
+        summarize = next(line for line in out.stdout.splitlines() if line.startswith("summarize"))
+        assert "(live)" in out.stdout and "0.0%" in summarize
+        assert summarize.split()[4].endswith("ms")  # p50 of 250ms calls, to within a bin
@@ -0,0 +1,49 @@
+"""Test the content-addressed payload store."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from app.audit import AuditLogger
+from app.payloads import PayloadStore, chunk_text
+from app.provider.base import LLMResponse, Message, Usage
+
+TRANSCRIPT = "\n".join(json.dumps({"t": f"00:{i:02d}", "text": f"segment {i}"}) for i in range(200))
+
+
+def test_chunks_reassemble_and_align_across_prompts():
+    """The same transcript embedded in two prompts yields mostly shared chunks."""
+    a = f"Summarize this transcript:\n{TRANSCRIPT}\nReturn JSON."
+    b = f"Evaluate the summary.\nRubric: ...\nTranscript:\n{TRANSCRIPT}\nSummary: {{}}"
+    assert "".join(chunk_text(a)) == a
+    shared = set(chunk_text(a)) & set(chunk_text(b))
+    assert sum(len(c) for c in shared) > 0.9 * len(TRANSCRIPT)
+
+
+def test_audit_records_expand_to_full_payloads():
+    """Logged calls expand back to their messages; repeated content is stored once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        store = PayloadStore(tmp_path / "payloads")
+        logger = AuditLogger(tmp_path / "run", payloads=store)
+        system = Message(role="system", content="You are a strict evaluator.\n" * 20)
+        objects = []
+        for n in range(3):
+            messages = [system, Message(role="user", content=f"Summary {n}\n{TRANSCRIPT}")]
+            response = LLMResponse(text=f'{{"n": {n}}}', usage=Usage(1, 1, 2))
+            logger.log_call("judge", "mock", "m", messages, response, 0.0, None, None)
+            objects.append(store.stats()["objects"])
+        logger.close()
+
+        # Later calls share the system prompt and nearly all transcript chunks
+        assert objects[0] > 20
+        assert objects[2] - objects[1] < 6
+
+        with open(tmp_path / "run" / "calls.jsonl") as f:
+            records = [json.loads(line) for line in f]
+        expanded = store.expand(records[2])
+        assert expanded["messages"][0]["content"] == system.content
+        assert expanded["messages"][1]["content"] == f"Summary 2\n{TRANSCRIPT}"
+        assert expanded["response"] == '{"n": 2}'
+
+        assert store.expand({"messages_digest_in": "0" * 64, "response_digest_out": None})["messages"] is None
@@ -0,0 +1,148 @@
+"""Test the streaming generate → summarize → judge pipeline."""
+
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from app.generate.runner import DatasetGenerator
+from app.judge.runner import JudgeRunner
+from app.pipeline import CallBudget, Pipeline, ThrottledProvider
+from app.provider.mock import MockProvider
+from app.summarize.runner import SummarizeRunner
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+
+class PeakProvider(MockProvider):
+    """MockProvider that records the most calls it ever had in flight."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def generate(self, messages, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            return super().generate(messages, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_pipeline_overlaps_stages_and_writes_artifacts():
+    """Stages run concurrently under one budget and leave the per-phase files behind."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir, run_dir = Path(tmpdir) / "data", Path(tmpdir) / "run"
+        run_dir.mkdir()
+        inner = PeakProvider()
+        budget = CallBudget(max_concurrency=3)
+        provider = ThrottledProvider(inner, budget)
+
+        pipeline = Pipeline(
+            SummarizeRunner(provider, PROMPTS_DIR, run_dir),
+            JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, run_dir),
+            run_dir,
+            generator=DatasetGenerator(provider, data_dir),
+            workers=3,
+        )
+        result = pipeline.run(n=6)
+
+        assert result.transcripts == result.summaries == result.evaluations == 6
+        assert inner.peak <= 3
+        assert budget.calls == 18
+        # Stages overlap: the run takes less than the stages back to back
+        assert result.wall_s < sum(s.active_s for s in result.stages.values())
+
+        for name, count in (("summaries.jsonl", 6), ("evaluations.jsonl", 6)):
+            lines = (run_dir / name).read_text().splitlines()
+            assert len(lines) == count
+        transcripts = [json.loads(line) for line in (data_dir / "transcripts.jsonl").read_text().splitlines()]
+        assert sorted(t["call_id"][-3:] for t in transcripts) == [f"{i:03d}" for i in range(1, 7)]
+        assert (data_dir / "transcripts.csv").exists()
+        assert not list(run_dir.glob("transcripts.generated*"))
+
+
+def test_pipeline_appends_generated_transcripts_to_the_dataset():
+    """Generating into an existing dataset keeps its records and numbers the new ones after them."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_dir, run_dir = Path(tmpdir) / "data", Path(tmpdir) / "run"
+        run_dir.mkdir()
+        provider = MockProvider()
+        generator = DatasetGenerator(provider, data_dir)
+        generator.save(generator.generate(n=3, workers=1))
+        old_lobs = [json.loads(line)["lob"] for line in (data_dir / "transcripts.jsonl").read_text().splitlines()]
+
+        pipeline = Pipeline(
+            SummarizeRunner(provider, PROMPTS_DIR, run_dir),
+            JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, run_dir),
+            run_dir,
+            generator=generator,
+            workers=2,
+        )
+        assert pipeline.run(n=2).transcripts == 2
+
+        transcripts = [json.loads(line) for line in (data_dir / "transcripts.jsonl").read_text().splitlines()]
+        ids = [t["call_id"] for t in transcripts]
+        assert [i[-3:] for i in ids[:3]] == ["001", "002", "003"]  # Old records first, in their order
+        assert sorted(i[-3:] for i in ids[3:]) == ["004", "005"]
+        assert len({i.rsplit("-", 1)[0] for i in ids}) == 1  # One timestamp for old and new
+        assert [t["lob"] for t in transcripts[:3]] == old_lobs
+        assert len((data_dir / "transcripts.csv").read_text().splitlines()) == 6
+        # The run's summaries point at the appended transcripts
+        summarized = {json.loads(line)["call_id"] for line in (run_dir / "summaries.jsonl").read_text().splitlines()}
+        assert summarized == set(ids[3:])
+        assert not (data_dir / "transcripts.previous.jsonl").exists()
+
+
+def test_call_budget_spaces_requests_to_rate():
+    budget = CallBudget(max_concurrency=4, rate_per_s=50)
+    start = time.perf_counter()
+    for _ in range(5):
+        with budget.slot():
+            pass
+    assert time.perf_counter() - start >= 4 / 50 * 0.9
+    assert budget.calls == 5
+
+
+def test_feeder_error_stops_the_pipeline_and_is_raised():
+    """An input iterator that raises ends the stages instead of leaving them waiting forever."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        provider = MockProvider()
+        pipeline = Pipeline(
+            SummarizeRunner(provider, PROMPTS_DIR, run_dir),
+            JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, run_dir),
+            run_dir,
+            workers=2,
+        )
+
+        def transcripts():
+            for i in range(3):
+                yield {"call_id": f"TRA-X-{i:03d}", "lob": "Benefits", "segments": [], "metadata": {}}
+            raise json.JSONDecodeError("Expecting value", "{", 0)
+
+        result = {}
+        thread = threading.Thread(
+            target=lambda: result.setdefault("error", _raises(lambda: pipeline.run(transcripts(), total=4))),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout=60)
+        assert not thread.is_alive()
+        assert isinstance(result["error"], json.JSONDecodeError)
+        assert len((run_dir / "summaries.jsonl").read_text().splitlines()) == 3
+
+
+def _raises(fn) -> BaseException | None:
+    try:
+        fn()
+    except BaseException as e:
+        return e
+    return None
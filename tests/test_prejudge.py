@@ -0,0 +1,83 @@
+"""Test deterministic pre-judge checks."""
+
+import tempfile
+from pathlib import Path
+
+from app.judge.prejudge import PreJudge
+from app.judge.runner import JudgeRunner
+from app.provider.mock import MockProvider
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+TRANSCRIPT = {
+    "call_id": "TRA-20250101_000000-001",
+    "lob": "Pharmacy",
+    "segments": [
+        {"t": "00:00", "speaker": "caller", "text": "My member ID ends in 4321 and I need a refill of 30 tablets."},
+        {"t": "00:09", "speaker": "agent", "text": "Done. The copay is $1,250 and it ships March 15, 2025."},
+    ],
+    "metadata": {"duration_s": 9},
+}
+
+
+def _summary(**overrides) -> dict:
+    summary = {
+        "call_id": TRANSCRIPT["call_id"],
+        "call_resolution": "Refill of 30 tablets processed; ships 03/15/2025.",
+        "action_items": "Pharmacy to ship the refill.",
+        "context_preservation": "Member ID ending 4321. Copay $1250.",
+        "compliance_notes": "None noted.",
+        "quality_indicators": "Call lasted 9 seconds.",
+    }
+    summary.update(overrides)
+    return summary
+
+
+def test_supported_entities_are_not_flagged():
+    """Numbers, dates and IDs present in the transcript should pass."""
+    result = PreJudge().check(TRANSCRIPT, _summary())
+    assert result.hard_failures == []
+    assert result.hallucination_flags == []
+
+
+def test_unsupported_entities_and_hard_failures():
+    """Fabricated numbers are flagged; empty action items and wrong call_id are hard failures."""
+    result = PreJudge().check(
+        TRANSCRIPT,
+        _summary(call_id="MOCK-001", action_items="  ", context_preservation="Claim CLM-88812 filed."),
+    )
+    assert any("CLM-88812" in f for f in result.hallucination_flags)
+    assert any("call_id mismatch" in f for f in result.hard_failures)
+    assert "empty action_items" in result.hard_failures
+
+
+def test_transcript_indexes_are_bounded():
+    """Only the most recently used transcript indexes are kept."""
+    prejudge = PreJudge(max_indexes=2)
+    transcripts = [{**TRANSCRIPT, "call_id": f"TRA-20250101_000000-{n:03d}"} for n in range(3)]
+    first = prejudge.index(transcripts[0])
+    prejudge.index(transcripts[1])
+    assert prejudge.index(transcripts[0]) is first  # Reused, and now most recent
+    prejudge.index(transcripts[2])
+    assert list(prejudge._indexes) == [transcripts[0]["call_id"], transcripts[2]["call_id"]]
+
+
+def test_auto_fail_skips_llm_call():
+    """Hard-invalid summaries should be failed without calling the provider."""
+
+    class FailingProvider(MockProvider):
+        def generate(self, *args, **kwargs):
+            raise AssertionError("provider should not be called")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir) / "run"
+        prejudge = PreJudge(auto_fail=True)
+        runner = JudgeRunner(FailingProvider(), PROMPTS_DIR, RUBRIC_PATH, run_dir, prejudge=prejudge)
+        evaluations = runner.run([TRANSCRIPT], [_summary(action_items="")])
+
+        assert len(evaluations) == 1
+        assert evaluations[0]["overall_pass"] is False
+        assert evaluations[0]["judged_by"] == "rules"
+        assert prejudge.stats()["calls_saved"] == 1
+        assert (run_dir / "prejudge.json").exists()
@@ -0,0 +1,54 @@
+"""Test lazy provider lookup and entry-point plugins."""
+
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from app.provider import registry
+from app.provider.mock import MockProvider
+
+ROOT = Path(__file__).parent.parent
+
+
+class AcmeProvider(MockProvider):
+    """Stand-in for an in-house adapter shipped in another package."""
+
+    api_key_env = "ACME_TOKEN"
+
+
+def test_cli_does_not_import_provider_sdks():
+    """Parsing a subcommand must not pay for openai/anthropic/google (or numpy) imports."""
+    code = (
+        "import sys; sys.argv = ['app.cli', 'report', '--help']\n"
+        "import app.cli\n"
+        "try:\n    app.cli.main()\nexcept SystemExit:\n    pass\n"
+        "print(sorted(m for m in ('openai', 'anthropic', 'google.generativeai', 'numpy') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_entry_point_plugin(monkeypatch):
+    """Plugins are listed after built-ins and loaded with their own key variable."""
+    plugin = EntryPoint(name="acme", value=f"{__name__}:AcmeProvider", group=registry.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(registry, "_plugins", lambda: {"acme": plugin})
+    monkeypatch.setenv("ACME_TOKEN", "secret")
+
+    assert registry.available_providers() == ["openai", "anthropic", "google", "acme"]
+    provider = registry.create_provider("acme", "acme-large")
+    assert isinstance(provider, AcmeProvider)
+    assert provider.api_key == "secret"
+    assert provider.provider_name == "acme"
+
+
+def test_unknown_provider_and_missing_key(monkeypatch):
+    monkeypatch.setattr(registry, "_plugins", lambda: {})
+    with pytest.raises(ValueError, match="Unknown provider"):
+        registry.load_provider_class("nope")
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+        registry.create_provider("openai", "gpt-4o-mini")
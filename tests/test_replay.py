@@ -0,0 +1,91 @@
+"""Test record/replay providers."""
+
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from app.audit import AuditLogger
+from app.judge.runner import JudgeRunner
+from app.payloads import PayloadStore
+from app.provider.base import Message, ProviderError
+from app.provider.mock import MockProvider
+from app.provider.replay import RecordingProvider, ReplayProvider
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+TRANSCRIPTS = [
+    {"call_id": f"TRA-20250101_000000-{i:03d}", "lob": "Benefits", "segments": [], "metadata": {}} for i in range(3)
+]
+SUMMARIES = [{"call_id": t["call_id"], "call_resolution": f"Resolved {i}"} for i, t in enumerate(TRANSCRIPTS)]
+
+
+class CountingProvider(MockProvider):
+    """Mock provider that counts calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def generate(self, messages, temperature=0.7, seed=None, max_tokens=None):
+        self.calls += 1
+        return super().generate(messages, temperature, seed, max_tokens)
+
+
+def test_replay_reproduces_recorded_run_offline():
+    """A recorded judge run replays to identical evaluations without provider calls."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        store = PayloadStore(tmp_path / "payloads")
+        live = CountingProvider()
+        recorder = RecordingProvider(live, store, tmp_path / "run1" / "recordings.jsonl")
+        assert recorder.provider_name == "counting"
+        first = JudgeRunner(recorder, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run1", temperature=0.0).run(
+            TRANSCRIPTS, SUMMARIES
+        )
+        assert live.calls == 3
+
+        replay = ReplayProvider.from_runs([tmp_path / "run1"], store)
+        assert replay.model_id == "mock-model"
+        second = JudgeRunner(replay, PROMPTS_DIR, RUBRIC_PATH, tmp_path / "run2", temperature=0.0).run(
+            TRANSCRIPTS, SUMMARIES
+        )
+        assert live.calls == 3
+        assert replay.hits == 3 and replay.misses == 0
+        key = lambda e: e["call_id"]  # noqa: E731
+        assert [e["scores"] for e in sorted(first, key=key)] == [e["scores"] for e in sorted(second, key=key)]
+
+
+def test_replay_from_audit_log_and_miss_policies():
+    """calls.jsonl + payloads is a replay source; misses fail, fall through or mock."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        store = PayloadStore(tmp_path / "payloads")
+        messages = [Message(role="user", content="rubric evaluate")]
+        response = MockProvider().generate(messages)
+        response.latency_ms = 50.0
+        logger = AuditLogger(tmp_path / "run", payloads=store)
+        logger.log_call("judge", "mock", "gpt-4o-mini", messages, response, 0.0, None, None)
+        logger.close()
+
+        replay = ReplayProvider.from_runs([tmp_path / "run"], store, reproduce_latency=True)
+        start = time.perf_counter()
+        replayed = replay.generate(messages)
+        assert time.perf_counter() - start >= 0.05
+        assert replayed.text == response.text
+        assert replayed.latency_ms == 50.0
+        assert replay.model_id == "gpt-4o-mini"
+
+        other = [Message(role="user", content="never recorded")]
+        with pytest.raises(ProviderError):
+            replay.generate(other)
+
+        live = CountingProvider()
+        fallthrough = ReplayProvider.from_runs([tmp_path / "run"], store, on_miss="fallthrough", fallback=live)
+        fallthrough.generate(other)
+        assert live.calls == 1 and fallthrough.misses == 1
+
+        mocked = ReplayProvider.from_runs([tmp_path / "run"], store, on_miss="mock")
+        assert mocked.generate(other).text
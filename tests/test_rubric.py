@@ -60,3 +60,58 @@ def test_gates_fail_hallucination():
     }
 
     assert rubric.check_gates(scores, ["Hallucinated claim ID"]) is False
+
+
+def test_compiled_rubric_matches_check_gates():
+    """Bulk gate evaluation should agree with per-evaluation check_gates."""
+    import numpy as np
+
+    from app.judge.scoring import ScoreMatrix
+
+    config_path = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+    rubric = Rubric(config_path)
+    compiled = rubric.compile()
+
+    evaluations = [
+        {"scores": {"call_resolution": 5, "action_items": 5, "context_preservation": 5,
+                    "compliance_notes": 5, "quality_indicators": 5}, "hallucination_flags": []},
+        {"scores": {"call_resolution": 5, "action_items": 3}, "hallucination_flags": []},
+        {"scores": {"call_resolution": 5, "action_items": 5, "context_preservation": 5,
+                    "compliance_notes": 5, "quality_indicators": 5}, "hallucination_flags": ["x"]},
+    ]
+    matrix = compiled.matrix(evaluations)
+    result = compiled.evaluate(matrix.scores, matrix.flag_counts)
+
+    expected = [rubric.check_gates(e["scores"], e["hallucination_flags"]) for e in evaluations]
+    assert result.pass_mask.tolist() == expected
+    assert result.dim_fail_counts[compiled.names.index("action_items")] == 1
+    assert np.isclose(result.weighted_avg[0], 5.0)
+
+    stats = ScoreMatrix.from_evaluations(evaluations).dimension_stats()
+    assert stats["action_items"] == {"avg": 13 / 3, "min": 3, "max": 5, "count": 3, "low": 1}
+    assert stats["quality_indicators"]["count"] == 2
+
+
+def test_report_and_tuning_use_rubric_gates():
+    """Report pass rate and failure modes follow the rubric, not the stored overall_pass."""
+    import tempfile
+
+    from app.report.aggregate import generate_report
+    from app.tune.llm_assistant import rationale_targets
+
+    rubric = Rubric(Path(__file__).parent.parent / "configs" / "rubric.default.json")
+    full = {"call_resolution": 5, "action_items": 5, "context_preservation": 5,
+            "compliance_notes": 5, "quality_indicators": 5}
+    evaluations = [
+        {"scores": full, "hallucination_flags": [], "overall_pass": False},  # Stale verdict
+        {"scores": {**full, "action_items": 3, "tone": 2}, "hallucination_flags": [], "overall_pass": True},
+    ]
+    matrix, gates = rubric.compile().gate(evaluations)
+    assert matrix.names[-1] == "tone"
+    assert gates.pass_mask.tolist() == [True, False]
+    assert rationale_targets(evaluations, rubric) == {1: {"action_items", "tone"}}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        report_file = Path(tmpdir) / "report.md"
+        generate_report(evaluations, Path(tmpdir) / "calls.jsonl", report_file, rubric=rubric)
+        assert "**Pass Rate:** 1/2" in report_file.read_text()
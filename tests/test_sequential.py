@@ -0,0 +1,80 @@
+"""Test sequential early-stopping evaluation."""
+
+import tempfile
+from pathlib import Path
+
+from app.judge.runner import JudgeRunner
+from app.judge.sequential import (
+    SequentialConfig,
+    SequentialEstimator,
+    bootstrap_mean_interval,
+    spent_confidence,
+    wilson_interval,
+)
+from app.provider.mock import MockProvider
+from app.report.aggregate import generate_report
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+
+def test_wilson_interval():
+    """Wilson interval should match the textbook value and stay within [0, 1]."""
+    lo, hi = wilson_interval(50, 100)
+    assert abs(lo - 0.4038) < 1e-3
+    assert abs(hi - 0.5962) < 1e-3
+    assert wilson_interval(0, 10)[0] < 1e-9
+
+
+def test_bootstrap_interval_brackets_mean():
+    """Bootstrap interval should contain the sample mean."""
+    values = [3, 4, 4, 5, 5, 5, 2, 4]
+    lo, hi = bootstrap_mean_interval(values)
+    assert lo <= sum(values) / len(values) <= hi
+    assert bootstrap_mean_interval([4.0]) is None  # Too few values to bound the mean
+
+
+def test_baseline_comparison_spends_alpha_and_counts_baseline_noise():
+    """Later looks use wider intervals, and a small baseline is not treated as exact."""
+    assert spent_confidence(0.95, 1) < spent_confidence(0.95, 10) < 1
+    assert sum(1 - spent_confidence(0.95, k) for k in range(1, 10_000)) < 0.05
+
+    def first_stop(config: SequentialConfig, passes: int, items: int) -> str | None:
+        estimator = SequentialEstimator(config)
+        for i in range(items):
+            estimator.update({"overall_pass": i < passes, "scores": {}})
+            reason = estimator.check()
+            if reason:
+                return reason
+        return None
+
+    kwargs = {"precision": 0.0, "min_items": 10, "check_every": 5}
+    exact = SequentialConfig(baseline_pass_rate=0.5, **kwargs)
+    assert "above baseline" in first_stop(exact, 40, 40)
+    # The same 50% from a 10-item baseline is too noisy to call
+    noisy = SequentialConfig(baseline_pass_rate=0.5, baseline_items=10, **kwargs)
+    assert first_stop(noisy, 40, 40) is None
+
+
+def test_sequential_run_stops_early():
+    """Constant judge scores should settle well before the dataset is exhausted."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir) / "run"
+        transcripts = [
+            {"call_id": f"TRA-X-{i:03d}", "lob": "Benefits", "segments": [], "metadata": {}} for i in range(40)
+        ]
+        summaries = [{"call_id": t["call_id"], "call_resolution": "ok"} for t in transcripts]
+
+        runner = JudgeRunner(MockProvider(), PROMPTS_DIR, RUBRIC_PATH, run_dir)
+        config = SequentialConfig(precision=0.2, dim_precision=0.25, min_items=5, check_every=1)
+        evaluations = runner.run(transcripts, summaries, workers=2, sequential=config)
+
+        result = runner.sequential_result
+        assert result["stopped_early"] is True
+        assert result["judged"] < len(transcripts)
+        assert len(evaluations) <= result["judged"] + 2  # at most one in-flight window
+        assert (run_dir / "sequential.json").exists()
+
+        report_file = run_dir / "report.md"
+        generate_report(evaluations, run_dir / "calls.jsonl", report_file, sequential=result)
+        assert "Sequential Evaluation" in report_file.read_text()
@@ -0,0 +1,129 @@
+"""Test sharded runs: leases, and several CLI worker processes sharing one run."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from app.jsonl_index import write_jsonl
+from app.shard import Lease, ShardMismatchError, ShardSet, ShardWorker
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_lease_is_exclusive_until_it_expires():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "shard-00000.lease"
+        first = Lease.acquire(path, "a", ttl=30)
+        assert first is not None and first.held()
+        assert Lease.acquire(path, "b", ttl=30) is None
+
+        # A crashed worker stops heartbeating; once the TTL passes the shard is free again
+        first._stop.set()
+        stale = time.time() - 60
+        os.utime(path, (stale, stale))
+        second = Lease.acquire(path, "b", ttl=30)
+        assert second is not None and second.held()
+        assert not first.held()
+        first.release()  # Must not delete the new owner's lease
+        assert path.exists()
+        second.release()
+        assert not path.exists()
+
+
+def test_worker_discards_output_after_losing_its_lease():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shard_set = ShardSet(Path(tmpdir), "summarize")
+        shard_set.plan(["a", "b", "c"], shard_size=2)
+
+        def process(shard, work_path):
+            if shard.id == "shard-00000":
+                # Another worker takes the shard over while this one is still busy
+                (shard_set.lease_dir / f"{shard.id}.lease").write_text(json.dumps({"worker": "other"}))
+            work_path.write_text("".join(json.dumps({"call_id": k}) + "\n" for k in shard.keys))
+
+        worker = ShardWorker(shard_set, process, worker_id="me", ttl=30)
+        for shard in shard_set.shards():
+            lease = Lease.acquire(shard_set.lease_dir / f"{shard.id}.lease", "me", ttl=30)
+            worker._run_shard(shard, lease, "[summarize]")
+            lease.release()
+        assert worker.completed == ["shard-00001"]
+        assert [s.id for s in shard_set.pending()] == ["shard-00000"]
+
+
+def test_cli_workers_share_a_sharded_run():
+    """Three processes split summarize and then judge; the merged files cover every item once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cwd = Path(tmpdir)
+        (cwd / "configs").symlink_to(ROOT / "configs")
+        (cwd / "data").mkdir()
+        (cwd / "empty").mkdir()
+        call_ids = [f"TRA-20250101_000000-{i:03d}" for i in range(1, 12)]
+        write_jsonl(
+            cwd / "data" / "transcripts.jsonl",
+            [{"call_id": c, "lob": "Benefits", "segments": [{"t": "00:00", "speaker": "agent", "text": "Hi"}]}
+             for c in call_ids],
+        )
+        env = {**os.environ, "PYTHONPATH": str(ROOT)}
+
+        def workers(phase: str):
+            cmd = [
+                sys.executable, "-m", "app.cli", phase, "--provider", "openai", "--model", "small",
+                "--replay", "empty", "--replay-miss", "mock", "--run", "runs/shared",
+                "--shard-size", "2", "--workers", "2",
+            ]
+            if phase == "judge":
+                cmd.append("--no-cache")
+            procs = [
+                subprocess.Popen([*cmd, "--worker-id", f"w{i}"], cwd=cwd, env=env,
+                                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+                for i in range(3)
+            ]
+            outputs = [p.communicate(timeout=120)[0] for p in procs]
+            assert all(p.returncode == 0 for p in procs), outputs
+            return outputs
+
+        run_dir = cwd / "runs" / "shared"
+        workers("summarize")
+        summaries = [json.loads(line) for line in (run_dir / "summaries.jsonl").read_text().splitlines()]
+        assert sorted(s["transcript_id"] for s in summaries) == call_ids
+
+        outputs = workers("judge")
+        evaluations = [json.loads(line) for line in (run_dir / "evaluations.jsonl").read_text().splitlines()]
+        assert sorted(e["call_id"] for e in evaluations) == call_ids
+        claimed = sum(out.count("claimed shard-") for out in outputs)
+        assert claimed == 6  # Every shard processed exactly once
+        assert not list((run_dir / "shards" / "judge" / "leases").iterdir())
+
+        # The same run judged in another mode must not reuse the finished full-mode shards
+        lean = [
+            sys.executable, "-m", "app.cli", "judge", "--provider", "openai", "--model", "small",
+            "--replay", "empty", "--replay-miss", "mock", "--run", "runs/shared",
+            "--shard-size", "2", "--no-cache", "--lean",
+        ]
+        out = subprocess.run(lean, cwd=cwd, env=env, capture_output=True, text=True, timeout=120)
+        assert out.returncode == 1 and "--reshard" in out.stdout
+        out = subprocess.run([*lean, "--reshard"], cwd=cwd, env=env, capture_output=True, text=True, timeout=120)
+        assert out.returncode == 0, out.stdout + out.stderr
+        assert out.stdout.count("claimed shard-") == 6
+
+
+def test_plan_refuses_a_manifest_for_other_inputs_unless_resharding():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shard_set = ShardSet(Path(tmpdir), "judge")
+        assert shard_set.plan(["a", "b", "c"], shard_size=2, settings={"prompt": "v1"})
+        (shard_set.out_dir / "shard-00000.jsonl").write_text("{}\n")
+        assert not ShardSet(Path(tmpdir), "judge").plan(["a", "b", "c"], shard_size=2, settings={"prompt": "v1"})
+
+        for keys, settings in ((["a", "b", "c"], {"prompt": "v2"}), (["a", "b", "d"], {"prompt": "v1"})):
+            with pytest.raises(ShardMismatchError):
+                ShardSet(Path(tmpdir), "judge").plan(keys, shard_size=2, settings=settings)
+
+        fresh = ShardSet(Path(tmpdir), "judge")
+        assert fresh.plan(["a", "b", "c"], shard_size=2, settings={"prompt": "v2"}, reshard=True)
+        assert len(fresh.pending()) == 2  # The old shard output went with the old plan
@@ -0,0 +1,58 @@
+"""Test that the runners stream: lazy input, bounded in-flight work, incremental output."""
+
+import tempfile
+from pathlib import Path
+
+from app.judge.runner import JudgeRunner
+from app.provider.mock import MockProvider
+from app.summarize.runner import SummarizeRunner
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+
+def _transcripts(n: int, pulled: list):
+    for i in range(n):
+        pulled.append(i)
+        yield {"call_id": f"TRA-20250101_000000-{i:04d}", "lob": "Benefits", "segments": []}
+
+
+def test_summarize_pulls_input_lazily():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runner = SummarizeRunner(MockProvider(), PROMPTS_DIR, Path(tmpdir))
+        pulled = []
+        results = runner.iter_run(_transcripts(10_000, pulled), workers=2, max_in_flight=4)
+
+        first = next(results)
+        assert first["transcript_id"].startswith("TRA-")
+        assert len(pulled) <= 5  # The window plus the refill before the first yield
+        results.close()
+        assert len(pulled) < 10
+
+
+def test_judge_writes_each_evaluation_as_it_is_yielded():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        runner = JudgeRunner(MockProvider(), PROMPTS_DIR, RUBRIC_PATH, run_dir)
+        pulled = []
+        pairs = ((t, {"call_id": t["call_id"]}) for t in _transcripts(1000, pulled))
+        results = runner.iter_run(pairs, total=1000, workers=2, max_in_flight=4)
+
+        next(results)
+        assert len(pulled) <= 5
+        assert len((run_dir / "evaluations.jsonl").read_text().splitlines()) == 1
+        next(results)
+        assert len((run_dir / "evaluations.jsonl").read_text().splitlines()) == 2
+        results.close()
+
+
+def test_run_still_returns_all_evaluations():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run_dir = Path(tmpdir)
+        transcripts = list(_transcripts(6, []))
+        summaries = [{"call_id": t["call_id"]} for t in transcripts]
+        evaluations = JudgeRunner(MockProvider(), PROMPTS_DIR, RUBRIC_PATH, run_dir).run(
+            transcripts, summaries, workers=2
+        )
+        assert len(evaluations) == 6
+        assert len((run_dir / "evaluations.jsonl").read_text().splitlines()) == 6
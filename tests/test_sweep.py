@@ -0,0 +1,101 @@
+"""Test the successive-halving prompt sweep."""
+
+import json
+import re
+import tempfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+from app.judge.cache import JudgmentCache
+from app.judge.runner import JudgeRunner
+from app.provider.base import LLMResponse, Usage
+from app.provider.mock import MockProvider
+from app.summarize.runner import SummarizeRunner
+from app.tune.sweep import Candidate, PromptSweep, SweepConfig
+
+PROMPTS_DIR = Path(__file__).parent.parent / "configs" / "prompts"
+RUBRIC_PATH = Path(__file__).parent.parent / "configs" / "rubric.default.json"
+
+
+class QualityProvider(MockProvider):
+    """Summaries carry the QUALITY=<q> of their system prompt; the judge scores q ± per-item noise."""
+
+    def generate(self, messages, temperature=0.7, seed=None, max_tokens=None):
+        system, user = messages[0].content, messages[1].content
+        if "QUALITY=" in system:
+            quality = int(re.search(r"QUALITY=(\d)", system).group(1))
+            call_id = re.search(r'"call_id":\s*"([^"]+)"', user).group(1)
+            text = json.dumps({"call_id": call_id, "intent": "x", "quality": quality})
+        else:
+            quality = int(re.search(r'"quality":\s*(\d)', user).group(1))
+            call_id = re.search(r'"call_id":\s*"([^"]+)"', user).group(1)
+            noise = (zlib.crc32(call_id.encode()) % 3 - 1) * 0.3
+            text = json.dumps({"scores": {"coverage": quality + noise}, "hallucination_flags": []})
+        return LLMResponse(text=text, usage=Usage(10, 10, 20))
+
+
+def test_successive_halving_keeps_best_prompt_and_saves_samples():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_dir = Path(tmpdir)
+        provider = QualityProvider()
+        transcripts = [{"call_id": f"TRA-X-{i:03d}", "lob": "Claims", "segments": []} for i in range(16)]
+
+        def candidates():
+            return [
+                Candidate(f"q{q}", SummarizeRunner(provider, PROMPTS_DIR, out_dir, system_prompt=f"Summarize. QUALITY={q}"))
+                for q in (1, 2, 3, 4)
+            ]
+
+        cache = JudgmentCache(out_dir / "judgments.sqlite")
+        judge = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, out_dir, cache=cache)
+
+        sweep = PromptSweep(candidates(), judge, out_dir, SweepConfig(min_items=4, eta=2), workers=4)
+        board = sweep.run(transcripts)
+
+        assert [row["name"] for row in board] == ["q4", "q3", "q2", "q1"]
+        assert board[0]["eliminated_round"] is None and board[0]["items"] == 16
+        assert board[-1]["eliminated_round"] == 0 and board[-1]["items"] == 4
+        lo, hi = board[0]["mean_score_ci"]
+        assert lo <= board[0]["mean_score"] <= hi
+
+        # 4x4 + 2x8 (4 new each) + 1x16 (8 new) = 16 + 8 + 8 pairs instead of 64
+        result = json.loads((out_dir / "sweep.json").read_text())
+        assert result["items_evaluated"] == 32
+        assert result["items_full_sweep"] == 64
+        assert (out_dir / "sweep" / "q4" / "evaluations.jsonl").exists()
+
+        # A rerun is judged entirely from the cache
+        rerun = PromptSweep(candidates(), judge, out_dir, SweepConfig(min_items=4, eta=2), workers=4)
+        rerun.run(transcripts)
+        assert rerun.judge_calls == 0 and rerun.judge_cached == 32
+        cache.close()
+
+
+def test_failed_items_are_counted_and_bad_schedules_rejected():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_dir = Path(tmpdir)
+        provider = QualityProvider()
+        transcripts = [{"call_id": f"TRA-X-{i:03d}", "lob": "Claims", "segments": []} for i in range(4)]
+        candidates = [
+            Candidate(f"q{q}", SummarizeRunner(provider, PROMPTS_DIR, out_dir, system_prompt=f"Summarize. QUALITY={q}"))
+            for q in (1, 2)
+        ]
+        summarize_one = candidates[0].summarizer.summarize_one
+
+        def flaky(transcript):
+            if transcript["call_id"] == "TRA-X-002":
+                raise RuntimeError("connection reset")
+            return summarize_one(transcript)
+
+        candidates[0].summarizer.summarize_one = flaky
+        judge = JudgeRunner(provider, PROMPTS_DIR, RUBRIC_PATH, out_dir)
+        board = PromptSweep(candidates, judge, out_dir, SweepConfig(min_items=4), workers=2).run(transcripts)
+        by_name = {row["name"]: row for row in board}
+        assert by_name["q1"]["failed"] == 1 and by_name["q1"]["items"] == 3
+        assert by_name["q2"]["failed"] == 0 and by_name["q2"]["items"] == 4
+
+    for bad in ({"eta": 1}, {"eta": 0}, {"min_items": 0}, {"max_items": 0}):
+        with pytest.raises(ValueError):
+            SweepConfig(**bad)